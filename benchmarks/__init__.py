@@ -0,0 +1,6 @@
+"""
+Benchmarks for Aurora Sun V1.
+
+Standalone performance scripts, run from the repository root:
+    python -m benchmarks.<script>
+"""
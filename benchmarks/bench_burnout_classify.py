@@ -0,0 +1,132 @@
+"""
+Burnout classification benchmark for Aurora Sun V1.
+
+Classifies a nightly batch of users from 14-day energy trajectories and
+compares:
+- scalar: previous behaviour. One segment query per user; statistics.variance
+  and slice scans per rule (the variance is recomputed by each _classify_*)
+- batch: classify_many(). One segment query per 500 users and one NumPy
+  feature pass for the whole batch
+- cached: classify_many() again with nothing new (every user a cache hit)
+
+Uses an in-memory SQLite users table; pass --url to measure against
+PostgreSQL.
+
+Usage:
+    python -m benchmarks.bench_burnout_classify
+    python -m benchmarks.bench_burnout_classify --users 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.models.base import Base
+from src.models.database import DatabaseConfig, create_engine
+from src.models.user import User
+from src.services.neurostate.burnout import BurnoutClassificationCache, BurnoutClassifier
+
+USERS = User.__table__
+SEGMENTS = ["AD", "AU", "AH", "NT"]
+VOLATILITY = 30.0 ** 2
+
+
+def trajectories(users: int, days: int = 14) -> dict[int, list[float]]:
+    rng = random.Random(7)
+    result = {}
+    for user_id in range(1, users + 1):
+        level, swing = rng.uniform(30, 80), rng.choice([5.0, 25.0])
+        result[user_id] = [max(0.0, min(100.0, level + rng.gauss(0, swing))) for _ in range(days)]
+    return result
+
+
+def scalar_rules(segment: str, t: list[float]) -> tuple[str, str]:
+    """The per-user path before vectorization (pattern and type)."""
+    pattern = "stable"
+    if statistics.variance(t) > VOLATILITY:
+        pattern = "volatile"
+    else:
+        recent = t[-7:]
+        early = sum(recent[:len(recent) // 2]) / (len(recent) // 2)
+        late = sum(recent[len(recent) // 2:]) / (len(recent) - len(recent) // 2)
+        pattern = "declining" if late < early - 30 else "recovering" if late > early + 30 else pattern
+
+    def autism() -> float:
+        if all(e < 40 for e in t[-7:]):
+            return 0.85
+        return 0.75 if pattern == "declining" and any(e < 30 for e in t[-3:]) else 0.6
+
+    def adhd() -> float:
+        if statistics.variance(t) > VOLATILITY and t[-1] < 30:
+            return 0.85
+        return 0.8 if max(t[-5:]) > 80 and min(t[-5:]) < 30 else 0.6
+
+    if segment == "AU":
+        return pattern, f"au {autism()}"
+    if segment == "AD":
+        return pattern, f"ad {adhd()}"
+    au, ad = autism(), adhd()
+    triple = (au > 0.7 and ad > 0.7) or (statistics.variance(t) > VOLATILITY and t[-1] < 40)
+    return pattern, "triple" if triple else "single"
+
+
+async def run(url: str, users: int) -> dict[str, float]:
+    engine = create_engine(DatabaseConfig(url=url))
+    now = datetime.now(timezone.utc)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all, tables=[USERS])
+        await conn.run_sync(Base.metadata.create_all, tables=[USERS])
+        await conn.execute(insert(USERS), [
+            {"id": u, "telegram_id": f"bench{u}", "language": "en", "timezone": "UTC",
+             "working_style_code": SEGMENTS[u % 4], "created_at": now, "updated_at": now}
+            for u in range(1, users + 1)
+        ])
+    data = trajectories(users)
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    timings = {}
+
+    async with factory() as session:
+        start = time.perf_counter()
+        for user_id, trajectory in data.items():
+            segment = (await session.execute(
+                select(USERS.c.working_style_code).where(USERS.c.id == user_id)
+            )).scalar_one_or_none() or "NT"
+            scalar_rules(segment, trajectory)
+        timings["scalar"] = time.perf_counter() - start
+
+        classifier = BurnoutClassifier(session, cache=BurnoutClassificationCache(max_size=users))
+        start = time.perf_counter()
+        await classifier.classify_many(data)
+        timings["batch"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        await classifier.classify_many(data)
+        timings["cached"] = time.perf_counter() - start
+
+    await engine.dispose()
+    return timings
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--users", type=int, default=5000)
+    parser.add_argument("--url", default="sqlite+aiosqlite://")
+    args = parser.parse_args(argv)
+
+    timings = asyncio.run(run(args.url, args.users))
+    for mode, elapsed in timings.items():
+        print(f"{mode:<7} {args.users / elapsed:10,.0f} users/s  ({elapsed * 1000:8.1f} ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
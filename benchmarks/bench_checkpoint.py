@@ -0,0 +1,99 @@
+"""
+Daily graph checkpoint benchmark for Aurora Sun V1.
+
+Runs the Daily Workflow graph over a synthetic user population with and
+without DailyGraphCheckpointer (process-memory backend, so the numbers are
+encoding and LangGraph overhead, not network) and reports:
+- users/minute with checkpointing off and on
+- checkpoint write latency (p50 / p99)
+- encoded checkpoint size versus the same checkpoint as plain JSON
+
+Usage:
+    python -m benchmarks.bench_checkpoint
+    python -m benchmarks.bench_checkpoint --users 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+
+from src.workflows.checkpoint import DailyGraphCheckpointer, set_daily_checkpointer
+from src.workflows.daily_graph import build_daily_graph, invalidate_daily_graph, run_daily_graph_batch
+
+SEGMENTS = ("AD", "AU", "AH", "NT", "CU")
+DATE = "2026-10-18"
+
+
+class TimedCheckpointer(DailyGraphCheckpointer):
+    """Records write latency and encoded / JSON sizes."""
+
+    def __init__(self):
+        super().__init__()
+        self.latencies: list[float] = []
+        self.encoded: list[int] = []
+        self.plain: list[int] = []
+
+    async def aput(self, config, checkpoint, metadata, new_versions):
+        start = time.perf_counter()
+        result = await super().aput(config, checkpoint, metadata, new_versions)
+        self.latencies.append(time.perf_counter() - start)
+        fields = await self.memory.hgetall(self._key(config["configurable"]["thread_id"]))
+        self.encoded.append(len(fields[config["configurable"].get("checkpoint_ns", "")]))
+        self.plain.append(len(json.dumps([checkpoint, metadata], default=str)))
+        return result
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def run(users: int, concurrency: int) -> float:
+    segments = {user_id: SEGMENTS[user_id % len(SEGMENTS)] for user_id in range(users)}
+    summary = await run_daily_graph_batch(range(users), DATE, segments, max_concurrency=concurrency)
+    return summary.users_per_minute
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--users", type=int, default=2_000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    # Import LangGraph outside the timed sections
+    build_daily_graph()
+
+    set_daily_checkpointer(None)
+    invalidate_daily_graph()
+    plain_rate = asyncio.run(run(args.users, args.concurrency))
+    print(f"no checkpoints  {plain_rate:>10,.0f} users/min")
+
+    checkpointer = TimedCheckpointer()
+    set_daily_checkpointer(checkpointer)
+    invalidate_daily_graph()
+    try:
+        rate = asyncio.run(run(args.users, args.concurrency))
+    finally:
+        set_daily_checkpointer(None)
+        invalidate_daily_graph()
+    print(f"checkpointed    {rate:>10,.0f} users/min  ({rate / plain_rate:.2f}x)")
+
+    latencies_ms = [s * 1000 for s in checkpointer.latencies]
+    print(
+        f"write latency   p50={percentile(latencies_ms, 0.5):.3f}ms "
+        f"p99={percentile(latencies_ms, 0.99):.3f}ms  ({len(latencies_ms)} writes)"
+    )
+    encoded = statistics.mean(checkpointer.encoded)
+    plain = statistics.mean(checkpointer.plain)
+    print(f"checkpoint size {encoded:,.0f} B encoded vs {plain:,.0f} B JSON ({encoded / plain:.0%})")
+    print(f"retained runs   {len(checkpointer.memory)} (latest checkpoint per run only)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""
+Daily graph fleet benchmark for Aurora Sun V1.
+
+Runs the Daily Workflow graph over a synthetic user population and reports
+users/minute for:
+- rebuild: the graph is built and compiled for every user (previous behaviour)
+- cached: run_daily_graph_batch() with the per-process compiled graph
+
+The rebuild baseline runs on a smaller sample (--baseline-users) since it is
+much slower; users/minute is comparable across sample sizes.
+
+Usage:
+    python -m benchmarks.bench_daily_graph
+    python -m benchmarks.bench_daily_graph --users 10000 --concurrency 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+
+from src.workflows import daily_graph
+from src.workflows.daily_graph import build_daily_graph, run_daily_graph_batch
+
+SEGMENTS = ("AD", "AU", "AH", "NT", "CU")
+DATE = "2026-10-18"
+
+
+def synthetic_segments(users: int) -> dict[int, str]:
+    """Segment code per user, cycling through all segments."""
+    return {user_id: SEGMENTS[user_id % len(SEGMENTS)] for user_id in range(users)}
+
+
+async def run_rebuild(users: int, concurrency: int) -> float:
+    """Return users/minute when every run compiles its own graph."""
+    original = daily_graph.get_daily_graph
+    daily_graph.get_daily_graph = lambda registry=None: build_daily_graph(
+        daily_graph.get_daily_checkpointer()
+    )
+    try:
+        summary = await run_daily_graph_batch(
+            range(users), DATE, synthetic_segments(users), max_concurrency=concurrency
+        )
+    finally:
+        daily_graph.get_daily_graph = original
+    return summary.users_per_minute
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--baseline-users", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    # Import LangGraph outside the timed sections
+    build_daily_graph()
+
+    rebuild_rate = asyncio.run(run_rebuild(args.baseline_users, args.concurrency))
+    print(f"rebuild  {rebuild_rate:>10,.0f} users/min  ({args.baseline_users} users)")
+
+    start = time.perf_counter()
+    summary = asyncio.run(run_daily_graph_batch(
+        range(args.users), DATE, synthetic_segments(args.users), max_concurrency=args.concurrency
+    ))
+    print(
+        f"cached   {summary.users_per_minute:>10,.0f} users/min  ({args.users} users, "
+        f"{time.perf_counter() - start:.1f}s)  {rebuild_rate and summary.users_per_minute / rebuild_rate:.1f}x"
+    )
+    print(
+        f"outcomes completed={summary.completed} redirected={summary.redirected} "
+        f"timed_out={summary.timed_out} failed={summary.failed} final={summary.final_stages}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
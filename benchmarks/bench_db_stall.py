@@ -0,0 +1,175 @@
+"""
+Database event-loop stall benchmark for Aurora Sun V1.
+
+Runs the neurostate read pattern (latest energy record + 7-day baseline, as
+in EnergyPredictor) for many concurrent users while a heartbeat task ticks
+every millisecond, and reports how long the event loop was blocked:
+- sync: a synchronous Session queried inside async code (previous behaviour)
+- async: AsyncSession from the shared pooled engine (src.models.database)
+
+A stall is a heartbeat tick arriving later than scheduled. Uses a SQLite
+file via aiosqlite by default so it runs without a server; pass
+--async-url/--sync-url to measure against PostgreSQL.
+
+Usage:
+    python -m benchmarks.bench_db_stall
+    python -m benchmarks.bench_db_stall --rows 500000 --requests 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine, func, insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+
+from src.models.base import Base
+from src.models.database import DatabaseConfig, create_engine as create_async_engine
+from src.models.neurostate import EnergyLevelRecord
+
+ENERGY = EnergyLevelRecord.__table__
+USERS = 1000
+
+
+def queries(user_id: int, now: datetime) -> list:
+    """The per-request reads: latest record and 7-day baseline."""
+    return [
+        select(ENERGY.c.energy_level, ENERGY.c.energy_score)
+        .where(ENERGY.c.user_id == user_id)
+        .order_by(ENERGY.c.predicted_at.desc())
+        .limit(1),
+        select(func.avg(ENERGY.c.energy_score))
+        .where(ENERGY.c.user_id == user_id, ENERGY.c.predicted_at >= now - timedelta(days=7)),
+    ]
+
+
+def seed(sync_url: str, rows: int) -> None:
+    """Create the energy table and fill it with random records."""
+    engine = create_engine(sync_url)
+    Base.metadata.drop_all(engine, tables=[ENERGY])
+    Base.metadata.create_all(engine, tables=[ENERGY])
+    now = datetime.now(timezone.utc)
+    rng = random.Random(7)
+    batch = []
+    with engine.begin() as conn:
+        for i in range(rows):
+            batch.append({
+                "user_id": rng.randrange(USERS),
+                "energy_level": "yellow",
+                "energy_score": rng.uniform(0, 100),
+                "predicted_at": now - timedelta(minutes=rng.randrange(30 * 24 * 60)),
+                "created_at": now,
+            })
+            if len(batch) == 10_000:
+                conn.execute(insert(ENERGY), batch)
+                batch = []
+        if batch:
+            conn.execute(insert(ENERGY), batch)
+    engine.dispose()
+
+
+async def heartbeat(stalls: list[float], stop: asyncio.Event, interval: float = 0.001) -> None:
+    """Record how late each tick is."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        stalls.append(max(0.0, time.perf_counter() - start - interval))
+
+
+async def measure(handler, requests: int, concurrency: int) -> tuple[list[float], float]:
+    """Run requests through handler while the heartbeat runs."""
+    stalls: list[float] = []
+    stop = asyncio.Event()
+    beat = asyncio.create_task(heartbeat(stalls, stop))
+    semaphore = asyncio.Semaphore(concurrency)
+    now = datetime.now(timezone.utc)
+
+    async def one(user_id: int) -> None:
+        async with semaphore:
+            await handler(user_id, now)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i % USERS) for i in range(requests)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await beat
+    return stalls, elapsed
+
+
+async def run_sync(sync_url: str, requests: int, concurrency: int) -> tuple[list[float], float]:
+    engine = create_engine(sync_url)
+    factory = sessionmaker(engine)
+
+    async def handler(user_id: int, now: datetime) -> None:
+        with factory() as session:
+            for stmt in queries(user_id, now):
+                session.execute(stmt).all()
+
+    try:
+        return await measure(handler, requests, concurrency)
+    finally:
+        engine.dispose()
+
+
+async def run_async(async_url: str, requests: int, concurrency: int) -> tuple[list[float], float]:
+    engine = create_async_engine(DatabaseConfig(url=async_url, pool_size=concurrency))
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def handler(user_id: int, now: datetime) -> None:
+        async with factory() as session:
+            for stmt in queries(user_id, now):
+                (await session.execute(stmt)).all()
+
+    try:
+        return await measure(handler, requests, concurrency)
+    finally:
+        await engine.dispose()
+
+
+def report(name: str, stalls: list[float], elapsed: float, requests: int) -> None:
+    ordered = sorted(stalls) or [0.0]
+    p99 = ordered[min(len(ordered) - 1, int(0.99 * len(ordered)))]
+    print(
+        f"{name:<6} max stall {ordered[-1] * 1000:8.1f} ms  p99 {p99 * 1000:7.2f} ms  "
+        f"blocked {sum(stalls):6.2f}s of {elapsed:6.2f}s  {requests / elapsed:8,.0f} req/s"
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--sync-url", default=None)
+    parser.add_argument("--async-url", default=None)
+    args = parser.parse_args(argv)
+
+    tmpdir = None
+    if args.sync_url is None or args.async_url is None:
+        tmpdir = tempfile.TemporaryDirectory()
+        path = os.path.join(tmpdir.name, "bench.db")
+        args.sync_url = args.sync_url or f"sqlite:///{path}"
+        args.async_url = args.async_url or f"sqlite+aiosqlite:///{path}"
+
+    try:
+        seed(args.sync_url, args.rows)
+        stalls, elapsed = asyncio.run(run_sync(args.sync_url, args.requests, args.concurrency))
+        report("sync", stalls, elapsed, args.requests)
+        stalls, elapsed = asyncio.run(run_async(args.async_url, args.requests, args.concurrency))
+        report("async", stalls, elapsed, args.requests)
+    finally:
+        if tmpdir is not None:
+            tmpdir.cleanup()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+"""
+Import-time benchmark for Aurora Sun V1.
+
+Runs `python -X importtime -c "import <package>"` in a fresh interpreter for
+each top-level package and reports the cumulative import time, plus which
+heavy third-party libraries were pulled in. Package `__init__` modules use
+lazy exports, so importing a package should not import SQLAlchemy, Telegram
+or LangGraph until a name is actually used.
+
+Usage:
+    python -m benchmarks.bench_import_time
+    python -m benchmarks.bench_import_time --repeat 5 src.services src.bot
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+DEFAULT_TARGETS = [
+    "src.core",
+    "src.bot",
+    "src.lib",
+    "src.modules",
+    "src.services",
+    "src.services.neurostate",
+    "src.workflows",
+]
+
+# Top-level libraries that must not be imported just by importing a package
+HEAVY_LIBRARIES = ("sqlalchemy", "telegram", "langgraph", "redis", "cryptography")
+
+
+@dataclass
+class ImportTiming:
+    """Result of one `-X importtime` run."""
+
+    target: str
+    cumulative_us: int
+    imported: set[str]
+
+    @property
+    def heavy_imports(self) -> list[str]:
+        return sorted(lib for lib in HEAVY_LIBRARIES if lib in self.imported)
+
+
+def measure_import(target: str, statement: str | None = None) -> ImportTiming:
+    """Import `target` in a fresh interpreter and parse the importtime log.
+
+    Args:
+        target: Dotted package/module name
+        statement: Python statement to run instead of `import <target>`
+
+    Returns:
+        ImportTiming with the cumulative time of `target` and all imported names
+    """
+    code = statement or f"import {target}"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    imported: set[str] = set()
+    cumulative_us = 0
+    for line in proc.stderr.splitlines():
+        # "import time:  self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, _, fields = line.partition(":")
+        _self_us, cumulative, name = (part.strip() for part in fields.split("|"))
+        imported.add(name.split(".")[0])
+        if name == target:
+            cumulative_us = int(cumulative)
+
+    return ImportTiming(target=target, cumulative_us=cumulative_us, imported=imported)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("targets", nargs="*", default=DEFAULT_TARGETS)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    print(f"{'package':<28} {'median ms':>10}  heavy imports")
+    failed = False
+    for target in args.targets:
+        runs = [measure_import(target) for _ in range(args.repeat)]
+        median_ms = statistics.median(r.cumulative_us for r in runs) / 1000
+        heavy = runs[-1].heavy_imports
+        failed = failed or bool(heavy)
+        print(f"{target:<28} {median_ms:>10.1f}  {', '.join(heavy) or '-'}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
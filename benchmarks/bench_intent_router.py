@@ -0,0 +1,71 @@
+"""
+Intent routing throughput benchmark for Aurora Sun V1.
+
+Classifies the labelled intent corpus repeatedly and reports messages/sec for
+the compiled regex fast path and for a full `classify()` pass (fast path plus
+a cached fake LLM fallback), the fast-path hit rate, and how many LLM calls
+were needed.
+
+Usage:
+    python -m benchmarks.bench_intent_router
+    python -m benchmarks.bench_intent_router --rounds 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from typing import Optional
+
+from benchmarks.intent_corpus import INTENT_CORPUS
+from src.core.intent_router import IntentRouter
+
+
+async def fake_llm(text: str, intents: list[str]) -> Optional[tuple[str, float]]:
+    """Stand-in for the Haiku fallback (~no latency, always unsure)."""
+    return "planning.start", 0.4
+
+
+def bench_fast_path(router: IntentRouter, messages: list[str], rounds: int) -> float:
+    """Return fast-path messages/sec."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for message in messages:
+            router.match_fast_path(message)
+    return rounds * len(messages) / (time.perf_counter() - start)
+
+
+async def bench_classify(router: IntentRouter, messages: list[str], rounds: int) -> float:
+    """Return full classify() messages/sec."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for message in messages:
+            await router.classify(message)
+    return rounds * len(messages) / (time.perf_counter() - start)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    messages = [text for text, _ in INTENT_CORPUS]
+    router = IntentRouter(llm_classifier=fake_llm)
+
+    fast_rate = bench_fast_path(router, messages, args.rounds)
+    full_rate = asyncio.run(bench_classify(router, messages, args.rounds))
+    stats = router.stats
+    total = sum(stats.values())
+
+    print(f"messages:           {len(messages)} x {args.rounds} rounds")
+    print(f"fast path:          {fast_rate:>12,.0f} msg/s")
+    print(f"classify (cached):  {full_rate:>12,.0f} msg/s")
+    print(f"fast-path hit rate: {stats['regex'] / total:>12.1%}")
+    print(f"LLM calls:          {stats['llm']:>12}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
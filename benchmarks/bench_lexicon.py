@@ -0,0 +1,70 @@
+"""
+Task keyword classification benchmark for Aurora Sun V1.
+
+Classifies task titles for every energy heuristic (spoon costs, depleted-pool
+gating, IBNS interest, ICNU integrity), comparing:
+- substring: previous behaviour. Each heuristic runs its own
+  `any(kw in title ...)` checks over its keyword list
+- lexicon: one LexiconRegistry pass per title for all categories
+- lexicon (cached): titles seen before (the same task is scored by several
+  heuristics and on every gating check) come from the LRU
+
+Usage:
+    python -m benchmarks.bench_lexicon
+    python -m benchmarks.bench_lexicon --titles 5000 --distinct 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+
+from src.lib.lexicon import DEFAULT_LEXICONS, LexiconRegistry
+
+WORDS = (
+    "plan call with friend about the new design project meet team and present values "
+    "walk after work organize notes decide focus on complex stress report learn build"
+).split()
+
+CATEGORIES = [c for c in DEFAULT_LEXICONS["en"] if not c.startswith("inertia.")]
+
+
+def titles(count: int, distinct: int, seed: int = 3) -> list[str]:
+    rng = random.Random(seed)
+    pool = [" ".join(rng.choices(WORDS, k=rng.randint(2, 8))) for _ in range(distinct)]
+    return [rng.choice(pool) for _ in range(count)]
+
+
+def substring(title: str) -> dict[str, bool]:
+    """The per-heuristic keyword checks used before."""
+    lexicon = DEFAULT_LEXICONS["en"]
+    return {category: any(kw in title for kw in lexicon[category]) for category in CATEGORIES}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--titles", type=int, default=20_000)
+    parser.add_argument("--distinct", type=int, default=1_000, help="Distinct titles among them")
+    args = parser.parse_args(argv)
+
+    sample = titles(args.titles, args.distinct)
+    uncached = LexiconRegistry(cache_size=0)
+    cached = LexiconRegistry()
+    runs = (
+        ("substring", substring),
+        ("lexicon", uncached.counts),
+        ("lexicon (cached)", cached.counts),
+    )
+    for mode, classify in runs:
+        start = time.perf_counter()
+        for title in sample:
+            classify(title)
+        elapsed = time.perf_counter() - start
+        print(f"{mode:<17} {elapsed / len(sample) * 1e6:8.2f} us per title")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
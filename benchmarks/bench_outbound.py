@@ -0,0 +1,132 @@
+"""
+Outbound send throughput benchmark for Aurora Sun V1.
+
+Sends a burst of messages to a local fake Bot API that enforces Telegram's
+limits (global msg/s and per-chat msg/s, answering 429 RetryAfter when they
+are exceeded) and compares:
+- naive: every message sent immediately (bounded concurrency only)
+- scheduled: OutboundSender with global + per-chat token buckets
+
+Reports delivered msg/s, 429s received, and how long a crisis message
+enqueued behind the burst waited.
+
+Limits are scaled by --scale (default 10x Telegram's) to keep runs short.
+
+Usage:
+    python -m benchmarks.bench_outbound
+    python -m benchmarks.bench_outbound --messages 2000 --chats 500 --scale 1
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from collections import defaultdict, deque
+
+from telegram.error import RetryAfter
+
+from src.bot.outbound import OutboundSender, SendPriority
+
+
+class FakeBotAPI:
+    """In-process Bot API enforcing global and per-chat sliding-window limits."""
+
+    def __init__(self, global_rate: float, per_chat_rate: float, latency: float = 0.02):
+        self.global_rate = global_rate
+        self.per_chat_rate = per_chat_rate
+        self.latency = latency
+        self._global: deque[float] = deque()
+        self._chats: dict[int, deque[float]] = defaultdict(deque)
+        self.delivered: dict[str, float] = {}
+        self.rejected = 0
+
+    async def send(self, chat_id: int, text: str, options: dict) -> None:
+        await asyncio.sleep(self.latency)
+        now = time.monotonic()
+        for window, limit in ((self._global, self.global_rate),
+                              (self._chats[chat_id], self.per_chat_rate)):
+            while window and window[0] <= now - 1.0:
+                window.popleft()
+            if len(window) >= limit:
+                self.rejected += 1
+                raise RetryAfter(1)
+        self._global.append(now)
+        self._chats[chat_id].append(now)
+        self.delivered[text] = now
+
+
+async def run_naive(api: FakeBotAPI, messages: list[tuple[int, str]]) -> float:
+    """Send everything at once; retry after 429 like a naive client would."""
+    semaphore = asyncio.Semaphore(64)
+
+    async def send(chat_id: int, text: str) -> None:
+        for _ in range(10):
+            async with semaphore:
+                try:
+                    await api.send(chat_id, text, {})
+                    return
+                except RetryAfter as e:
+                    retry_after = e.retry_after
+            await asyncio.sleep(float(retry_after))
+
+    start = time.monotonic()
+    await asyncio.gather(*(send(c, t) for c, t in messages))
+    return start
+
+
+async def run_scheduled(api: FakeBotAPI, messages: list[tuple[int, str]], scale: float) -> float:
+    sender = OutboundSender(
+        api.send,
+        global_rate=OutboundSender.GLOBAL_RATE * scale,
+        per_chat_rate=OutboundSender.PER_CHAT_RATE * scale,
+        per_chat_burst=1,
+    )
+    await sender.start()
+    start = time.monotonic()
+    futures = [
+        sender.enqueue(
+            c, t, SendPriority.CRISIS if t == "crisis" else SendPriority.PROACTIVE
+        )
+        for c, t in messages
+    ]
+    await asyncio.gather(*futures)
+    await sender.stop()
+    return start
+
+
+def report(name: str, api: FakeBotAPI, start: float, count: int) -> None:
+    finished = max(api.delivered.values())
+    print(
+        f"{name:<10} {count / (finished - start):>9,.0f} msg/s  "
+        f"429s={api.rejected:<6} crisis waited {api.delivered['crisis'] - start:6.2f}s"
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--messages", type=int, default=1500)
+    parser.add_argument("--chats", type=int, default=500)
+    parser.add_argument("--scale", type=float, default=10.0)
+    args = parser.parse_args(argv)
+
+    messages = [(i % args.chats, f"m{i}") for i in range(args.messages - 1)]
+    messages.append((args.chats + 1, "crisis"))  # enqueued last
+
+    def new_api() -> FakeBotAPI:
+        return FakeBotAPI(
+            global_rate=OutboundSender.GLOBAL_RATE * args.scale,
+            per_chat_rate=OutboundSender.PER_CHAT_RATE * args.scale,
+        )
+
+    print(f"{args.messages} messages to {args.chats + 1} chats, limits x{args.scale}")
+    api = new_api()
+    report("naive", api, asyncio.run(run_naive(api, messages)), args.messages)
+    api = new_api()
+    report("scheduled", api, asyncio.run(run_scheduled(api, messages, args.scale)), args.messages)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+"""
+Sensory modality update benchmark for Aurora Sun V1.
+
+Applies sensory events (several modality deltas each) to user profiles and
+compares:
+- json: previous behaviour. modality_loads is JSON text; every delta is its
+  own update_modality() (read, decode, copy, encode, UPDATE, COMMIT) followed
+  by assess() (read and decode again)
+- packed: modality_loads is a packed float32 vector; one update_modalities()
+  per event (read, apply all deltas, UPDATE, COMMIT, state from the vector)
+
+The statement sequences mirror SensoryStateAssessment; Core statements are
+used so the run needs no ORM setup. Also reports the per-profile codec cost
+(json.loads/json.dumps vs struct unpack/pack). Uses a SQLite file via
+aiosqlite by default; pass --url to measure against PostgreSQL.
+
+Usage:
+    python -m benchmarks.bench_sensory_update
+    python -m benchmarks.bench_sensory_update --events 5000 --deltas 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import timeit
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, Float, Integer, MetaData, Table, Text, event, insert, select, update
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.models.base import Base
+from src.models.database import DatabaseConfig, create_engine
+from src.models.neurostate import (
+    MODALITY_INDEX,
+    SENSORY_MODALITIES,
+    SensoryProfile,
+    modalities_to_dict,
+    pack_modalities,
+    unpack_modalities,
+)
+
+PACKED = SensoryProfile.__table__
+LEGACY = Table(
+    "sensory_profiles_json",
+    MetaData(),
+    Column("id", Integer, primary_key=True),
+    Column("user_id", Integer, nullable=False, index=True),
+    Column("modality_loads", Text),
+    Column("overall_load", Float, nullable=False),
+    Column("last_assessed", Text),
+)
+USERS = 500
+
+
+def clamp(value: float) -> float:
+    return max(0.0, min(100.0, value))
+
+
+async def setup(engine) -> None:
+    now = datetime.now(timezone.utc)
+    zero = dict.fromkeys(SENSORY_MODALITIES, 0.0)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all, tables=[PACKED])
+        await conn.run_sync(Base.metadata.create_all, tables=[PACKED])
+        await conn.run_sync(LEGACY.metadata.drop_all)
+        await conn.run_sync(LEGACY.metadata.create_all)
+        await conn.execute(insert(LEGACY), [
+            {"user_id": u, "modality_loads": json.dumps(zero), "overall_load": 0.0,
+             "last_assessed": now.isoformat()}
+            for u in range(USERS)
+        ])
+        await conn.execute(insert(PACKED), [
+            {"user_id": u, "modality_loads": zero, "overall_load": 0.0, "last_assessed": now,
+             "segment_code": "AU", "created_at": now, "updated_at": now}
+            for u in range(USERS)
+        ])
+
+
+async def json_event(factory, user_id: int, deltas: dict[str, float]) -> dict[str, float]:
+    loads: dict[str, float] = {}
+    for modality, delta in deltas.items():
+        async with factory() as session, session.begin():
+            row = (await session.execute(
+                select(LEGACY.c.id, LEGACY.c.modality_loads).where(LEGACY.c.user_id == user_id).limit(1)
+            )).one()
+            loads = json.loads(row.modality_loads).copy()
+            loads[modality] = clamp(loads.get(modality, 0.0) + delta)
+            await session.execute(
+                update(LEGACY).where(LEGACY.c.id == row.id).values(
+                    modality_loads=json.dumps(loads), overall_load=max(loads.values()),
+                    last_assessed=datetime.now(timezone.utc).isoformat(),
+                )
+            )
+        async with factory() as session:
+            payload = (await session.execute(
+                select(LEGACY.c.modality_loads).where(LEGACY.c.user_id == user_id).limit(1)
+            )).scalar_one()
+            loads = json.loads(payload)
+    return loads
+
+
+async def packed_event(factory, user_id: int, deltas: dict[str, float]) -> dict[str, float]:
+    async with factory() as session, session.begin():
+        row = (await session.execute(
+            select(PACKED.c.id, PACKED.c.modality_loads).where(PACKED.c.user_id == user_id).limit(1)
+        )).one()
+        vector = list(row.modality_loads)
+        for modality, delta in deltas.items():
+            i = MODALITY_INDEX[modality]
+            vector[i] = clamp(vector[i] + delta)
+        now = datetime.now(timezone.utc)
+        await session.execute(
+            update(PACKED).where(PACKED.c.id == row.id).values(
+                modality_loads=tuple(vector), overall_load=max(vector),
+                last_assessed=now, updated_at=now,
+            )
+        )
+    return modalities_to_dict(vector)
+
+
+async def run(url: str, mode: str, events: int, deltas: int) -> tuple[float, int, int]:
+    """Apply events; return elapsed seconds, statements and commits."""
+    engine = create_engine(DatabaseConfig(url=url))
+    await setup(engine)
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    counts = {"statements": 0, "commits": 0}
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def on_execute(*args):
+        counts["statements"] += 1
+
+    @event.listens_for(engine.sync_engine, "commit")
+    def on_commit(*args):
+        counts["commits"] += 1
+
+    rng = random.Random(7)
+    handler = json_event if mode == "json" else packed_event
+    start = time.perf_counter()
+    for _ in range(events):
+        chosen = rng.sample(SENSORY_MODALITIES, deltas)
+        await handler(factory, rng.randrange(USERS), {m: rng.uniform(-10, 15) for m in chosen})
+    elapsed = time.perf_counter() - start
+    await engine.dispose()
+    return elapsed, counts["statements"], counts["commits"]
+
+
+def codec_costs(number: int = 100_000) -> tuple[float, float]:
+    """Microseconds per decode + encode of one profile."""
+    loads = {m: 42.5 for m in SENSORY_MODALITIES}
+    text, data = json.dumps(loads), pack_modalities(tuple(loads.values()))
+    json_us = timeit.timeit(lambda: json.dumps(json.loads(text)), number=number) / number * 1e6
+    packed_us = timeit.timeit(lambda: pack_modalities(unpack_modalities(data)), number=number) / number * 1e6
+    return json_us, packed_us
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--deltas", type=int, default=3, help="Modality deltas per event")
+    parser.add_argument("--url", default=None)
+    args = parser.parse_args(argv)
+
+    tmpdir = None
+    if args.url is None:
+        tmpdir = tempfile.TemporaryDirectory()
+        args.url = f"sqlite+aiosqlite:///{os.path.join(tmpdir.name, 'bench.db')}"
+
+    try:
+        for mode in ("json", "packed"):
+            elapsed, statements, commits = asyncio.run(run(args.url, mode, args.events, args.deltas))
+            print(
+                f"{mode:<7} {args.events / elapsed:8,.0f} events/s  "
+                f"{statements / args.events:5.1f} statements/event  "
+                f"{commits / args.events:4.1f} commits/event"
+            )
+        json_us, packed_us = codec_costs()
+        print(f"codec   json {json_us:6.2f} us  packed {packed_us:6.2f} us per decode+encode")
+    finally:
+        if tmpdir is not None:
+            tmpdir.cleanup()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""
+Webhook update parsing benchmark for Aurora Sun V1.
+
+Decodes the recorded update corpus (JSON bytes, as received by the webhook
+endpoint) with:
+- full: json.loads + telegram.Update.de_json for every update
+- fast: parse_update() (LiteUpdate for text/callbacks, Update otherwise)
+
+Reports updates/sec for the recorded traffic mix and for text/callback
+updates only.
+
+Usage:
+    python -m benchmarks.bench_update_parse
+    python -m benchmarks.bench_update_parse --updates 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from typing import Callable
+
+from telegram import Update
+
+from benchmarks.update_corpus import UPDATE_CORPUS
+from src.bot.fast_update import parse_update
+
+
+def build_bodies(count: int, fast_only: bool) -> list[bytes]:
+    """Serialize `count` corpus updates with increasing update_ids."""
+    corpus = [payload for payload, fast in UPDATE_CORPUS if fast or not fast_only]
+    return [
+        json.dumps({"update_id": 800000 + i, **corpus[i % len(corpus)]}).encode()
+        for i in range(count)
+    ]
+
+
+def parse_full(body: bytes) -> Update:
+    return Update.de_json(json.loads(body), None)
+
+
+def bench(parse: Callable[[bytes], object], bodies: list[bytes]) -> float:
+    """Return updates/sec."""
+    start = time.perf_counter()
+    for body in bodies:
+        parse(body)
+    return len(bodies) / (time.perf_counter() - start)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--updates", type=int, default=50_000)
+    args = parser.parse_args(argv)
+
+    for label, fast_only in (("recorded mix", False), ("text/callback", True)):
+        bodies = build_bodies(args.updates, fast_only)
+        full_rate = bench(parse_full, bodies)
+        fast_rate = bench(parse_update, bodies)
+        print(
+            f"{label:<14} full {full_rate:>10,.0f} updates/s  "
+            f"fast {fast_rate:>10,.0f} updates/s  ({fast_rate / full_rate:.1f}x)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""
+Webhook handler throughput benchmark for Aurora Sun V1.
+
+Feeds synthetic text updates through TelegramWebhookHandler.handle_update and
+reports updates/sec for:
+- per-update: a new handler (and OnboardingFlow) built for every update,
+  as webhook_handler did before handlers became application-scoped
+- long-lived: one handler built and started once, shared by all updates
+
+Telegram I/O is faked (reply_text is a no-op) and rate limiting always
+allows, so the numbers isolate handler overhead.
+
+Usage:
+    python -m benchmarks.bench_webhook
+    python -m benchmarks.bench_webhook --updates 20000 --users 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+os.environ.setdefault("AURORA_DEV_MODE", "1")
+
+from src.bot.webhook import TelegramWebhookHandler, WebhookServices  # noqa: E402
+from src.lib.encryption import get_hash_service  # noqa: E402
+
+
+class AllowAllRateLimiter:
+    """Rate limiter stub: every request is allowed."""
+
+    @staticmethod
+    async def check_rate_limit(user_id: int, action: str = "chat") -> bool:
+        return True
+
+
+async def _reply(*args, **kwargs) -> None:
+    return None
+
+
+def make_updates(count: int, users: int) -> list[SimpleNamespace]:
+    """Build `count` text updates spread over `users` users."""
+    updates = []
+    for i in range(count):
+        user = SimpleNamespace(id=100_000 + i % users, language_code="en", first_name="B")
+        message = SimpleNamespace(text="en", reply_text=_reply, chat_id=user.id)
+        updates.append(SimpleNamespace(
+            update_id=i,
+            message=message,
+            effective_message=message,
+            effective_user=user,
+            effective_chat=SimpleNamespace(id=user.id),
+            callback_query=None,
+        ))
+    return updates
+
+
+def make_services() -> WebhookServices:
+    return WebhookServices(
+        rate_limiter=AllowAllRateLimiter,
+        hash_service=get_hash_service(),
+    )
+
+
+async def bench_per_update(updates: list[SimpleNamespace]) -> float:
+    """Updates/sec with a new handler per update."""
+    services = make_services()
+    start = time.perf_counter()
+    for update in updates:
+        await TelegramWebhookHandler(services=services).handle_update(update)
+    return len(updates) / (time.perf_counter() - start)
+
+
+async def bench_long_lived(updates: list[SimpleNamespace]) -> float:
+    """Updates/sec with one application-scoped handler."""
+    handler = TelegramWebhookHandler(services=make_services())
+    await handler.startup()
+    start = time.perf_counter()
+    for update in updates:
+        await handler.handle_update(update)
+    return len(updates) / (time.perf_counter() - start)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--updates", type=int, default=5000)
+    parser.add_argument("--users", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    per_update = asyncio.run(bench_per_update(make_updates(args.updates, args.users)))
+    long_lived = asyncio.run(bench_long_lived(make_updates(args.updates, args.users)))
+
+    print(f"updates:      {args.updates} from {args.users} users")
+    print(f"per-update:   {per_update:>10,.0f} updates/s")
+    print(f"long-lived:   {long_lived:>10,.0f} updates/s ({long_lived / per_update:.2f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""
+Write-behind telemetry benchmark for Aurora Sun V1.
+
+Logs energy predictions from many concurrent users and compares:
+- per-event: one INSERT and one COMMIT per event (previous behaviour)
+- write-behind: WriteBehindBuffer, one multi-row INSERT and one COMMIT per flush
+
+Reports events/s, commits/s and events per commit (commits counted on the engine). Uses a
+SQLite file via aiosqlite by default; pass --url to measure against
+PostgreSQL.
+
+Usage:
+    python -m benchmarks.bench_write_behind
+    python -m benchmarks.bench_write_behind --events 50000 --max-batch 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.models.base import Base
+from src.models.database import DatabaseConfig, create_engine
+from src.models.neurostate import EnergyLevelRecord
+from src.services.write_behind import WriteBehindBuffer
+
+ENERGY = EnergyLevelRecord.__table__
+USERS = 1000
+
+
+def row(i: int) -> dict:
+    now = datetime.now(timezone.utc)
+    return {
+        "user_id": i % USERS,
+        "energy_level": "baseline",
+        "energy_score": float(i % 100),
+        "predicted_at": now,
+        "behavioral_proxies": {"message_length": i % 300, "time_of_day": now.hour},
+        "created_at": now,
+    }
+
+
+async def run(url: str, mode: str, events: int, concurrency: int, max_batch: int) -> tuple[float, int]:
+    """Log events; return elapsed seconds (until durable) and commits."""
+    engine = create_engine(DatabaseConfig(url=url, pool_size=concurrency))
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all, tables=[ENERGY])
+        await conn.run_sync(Base.metadata.create_all, tables=[ENERGY])
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    commits = 0
+
+    @event.listens_for(engine.sync_engine, "commit")
+    def on_commit(*args):
+        nonlocal commits
+        commits += 1
+
+    buffer = WriteBehindBuffer(factory, max_batch=max_batch)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i: int) -> None:
+        async with semaphore:
+            if mode == "per-event":
+                async with factory() as session, session.begin():
+                    await session.execute(insert(ENERGY), row(i))
+            else:
+                await buffer.insert(ENERGY, row(i))
+            # Rest of the message handling: let other tasks (the flusher) run
+            await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(events)))
+    await buffer.close()
+    elapsed = time.perf_counter() - start
+    await engine.dispose()
+    return elapsed, commits
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--events", type=int, default=10_000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--max-batch", type=int, default=500)
+    parser.add_argument("--url", default=None)
+    args = parser.parse_args(argv)
+
+    tmpdir = None
+    if args.url is None:
+        tmpdir = tempfile.TemporaryDirectory()
+        args.url = f"sqlite+aiosqlite:///{os.path.join(tmpdir.name, 'bench.db')}"
+
+    try:
+        for mode in ("per-event", "write-behind"):
+            elapsed, commits = asyncio.run(
+                run(args.url, mode, args.events, args.concurrency, args.max_batch)
+            )
+            print(
+                f"{mode:<13} {args.events / elapsed:10,.0f} events/s  "
+                f"{commits:7,} commits  {commits / elapsed:8,.1f} commits/s  "
+                f"{args.events / max(commits, 1):6,.0f} events/commit  ({elapsed:.2f}s)"
+            )
+    finally:
+        if tmpdir is not None:
+            tmpdir.cleanup()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
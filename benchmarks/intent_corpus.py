@@ -0,0 +1,57 @@
+"""
+Labelled intent corpus for Aurora Sun V1.
+
+(message, expected intent) pairs used by the intent router confusion-matrix
+test and the routing throughput benchmark. `None` means the fast path should
+miss and the message goes to the LLM fallback.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+INTENT_CORPUS: list[tuple[str, Optional[str]]] = [
+    # Slash commands
+    ("/plan", "planning.start"),
+    ("/review", "review.start"),
+    ("/capture", "capture.quick"),
+    ("/plan@AuroraSunBot", "planning.start"),
+    # Planning
+    ("Let's plan my day", "planning.start"),
+    ("help me plan the week", "planning.start"),
+    ("What should I work on today?", "planning.start"),
+    ("Ich will meinen Tag planen", "planning.start"),
+    ("Can we set my priorities?", "planning.prioritize"),
+    ("what's most important today", "planning.prioritize"),
+    ("this is too big, break it down", "planning.breakdown"),
+    ("I need smaller steps for the report", "planning.breakdown"),
+    ("add a task", "planning.add_task"),
+    ("add call the dentist to my list", "planning.add_task"),
+    ("show my tasks", "planning.show_tasks"),
+    ("What's on my plate?", "planning.show_tasks"),
+    ("list my todos", "planning.show_tasks"),
+    # Review
+    ("Let's review my day", "review.start"),
+    ("reflect on the week", "review.start"),
+    ("How did my day go?", "review.start"),
+    ("what did I get done", "review.accomplishments"),
+    ("my energy was low after lunch", "review.energy"),
+    ("tomorrow I want to start earlier", "review.forward"),
+    # Future letter
+    ("I want to write a letter to my future self", "future_letter.start"),
+    ("start my future letter", "future_letter.start"),
+    ("continue the letter", "future_letter.continue"),
+    # Capture
+    ("idea: newsletter about focus", "capture.idea"),
+    ("Task: renew passport", "capture.task"),
+    ("todo: buy milk", "capture.task"),
+    ("note: the wifi password is on the fridge", "capture.note"),
+    ("quick thought about the garden", "capture.quick"),
+    ("I just had an idea for the app", "capture.idea"),
+    ("remind me that Sam prefers email", "capture.note"),
+    # Fast-path misses (LLM fallback)
+    ("ugh everything is too much", None),
+    ("the cat knocked over my coffee again", None),
+    ("hmm", None),
+    ("can you tell me a joke", None),
+]
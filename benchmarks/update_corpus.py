@@ -0,0 +1,77 @@
+"""
+Recorded Telegram update corpus for Aurora Sun V1.
+
+Anonymised webhook payloads (IDs and names replaced) covering the update
+shapes the bot receives: plain text, commands, inline keyboard callbacks,
+and the rarer shapes that must take the full parsing path (media, voice,
+edits, replies, inline-message callbacks, chat member changes).
+
+Each entry is (payload without update_id, expected to take the fast path).
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+_USER = {"id": 100001, "is_bot": False, "first_name": "Alex", "language_code": "de"}
+_CHAT = {"id": 100001, "first_name": "Alex", "type": "private"}
+_DATE = 1760000000
+
+
+def _message(text: str, **extra: Any) -> dict[str, Any]:
+    message = {"message_id": 501, "from": _USER, "chat": _CHAT, "date": _DATE, "text": text}
+    message.update(extra)
+    return message
+
+
+UPDATE_CORPUS: list[tuple[dict[str, Any], bool]] = [
+    # Plain text
+    ({"message": _message("Let's plan my day")}, True),
+    ({"message": _message("Ich bin heute total erschöpft, alles ist zu viel")}, True),
+    ({"message": _message("add call the dentist to my list")}, True),
+    ({"message": _message("ok")}, True),
+    ({"message": _message("What should I work on today? I have the report, "
+                          "groceries and I promised to call my sister")}, True),
+    ({"message": _message("https://example.com/article",
+                          entities=[{"offset": 0, "length": 27, "type": "url"}],
+                          link_preview_options={"is_disabled": True})}, True),
+    # Commands
+    ({"message": _message("/start", entities=[{"offset": 0, "length": 6, "type": "bot_command"}])}, True),
+    ({"message": _message("/plan", entities=[{"offset": 0, "length": 5, "type": "bot_command"}])}, True),
+    # Inline keyboard callbacks
+    ({"callback_query": {
+        "id": "4382bfdwdsb323b2d9",
+        "from": _USER,
+        "message": _message("Choose your working style:", reply_markup={"inline_keyboard": [
+            [{"text": "ADHD", "callback_data": "segment_AD"}],
+            [{"text": "Autism", "callback_data": "segment_AU"}],
+        ]}),
+        "chat_instance": "-5395284934021",
+        "data": "segment_AD",
+    }}, True),
+    ({"callback_query": {
+        "id": "4382bfdwdsb323b2e1",
+        "from": _USER,
+        "message": _message("Do you consent to data processing?"),
+        "chat_instance": "-5395284934021",
+        "data": "consent_accept",
+    }}, True),
+    # Full path: media, voice, edits, replies, inline-message callbacks, membership
+    ({"message": {"message_id": 502, "from": _USER, "chat": _CHAT, "date": _DATE,
+                  "photo": [{"file_id": "AgAD1", "file_unique_id": "AQAD1", "width": 90,
+                             "height": 90, "file_size": 1200}],
+                  "caption": "my desk right now"}}, False),
+    ({"message": {"message_id": 503, "from": _USER, "chat": _CHAT, "date": _DATE,
+                  "voice": {"file_id": "AwAD1", "file_unique_id": "AgAD2", "duration": 12,
+                            "mime_type": "audio/ogg", "file_size": 24000}}}, False),
+    ({"edited_message": _message("Let's plan my week", edit_date=_DATE + 30)}, False),
+    ({"message": _message("yes, that one", reply_to_message=_message("Which task first?"))}, False),
+    ({"callback_query": {"id": "4382bfdwdsb323b2f7", "from": _USER,
+                         "inline_message_id": "AAAAA", "chat_instance": "-1",
+                         "data": "segment_AU"}}, False),
+    ({"my_chat_member": {"chat": _CHAT, "from": _USER, "date": _DATE,
+                         "old_chat_member": {"user": {"id": 42, "is_bot": True, "first_name": "Aurora"},
+                                             "status": "member"},
+                         "new_chat_member": {"user": {"id": 42, "is_bot": True, "first_name": "Aurora"},
+                                             "status": "kicked", "until_date": 0}}}, False),
+]
@@ -0,0 +1,95 @@
+"""
+Store sensory modality loads as a packed float32 vector.
+
+sensory_profiles.modality_loads held a JSON object ({modality: load}); it
+now holds the 20-byte vector written by ModalityVector. The column becomes
+binary (bytea on PostgreSQL) and existing JSON rows are rewritten in the
+packed format. Downgrade restores JSON text.
+
+Revision ID: 2a7c4e91d0b3
+Revises:
+Create Date: 2026-10-18
+
+References:
+    - ARCHITECTURE.md Section 14 (Data Models)
+"""
+
+import json
+
+import sqlalchemy as sa
+from alembic import op
+
+from src.models.neurostate import modalities_from_bytes, modalities_to_dict, pack_modalities
+
+# Revision identifiers, used by Alembic
+revision = "2a7c4e91d0b3"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+TABLE = "sensory_profiles"
+COLUMN = "modality_loads"
+
+profiles = sa.table(
+    TABLE,
+    sa.column("id", sa.Integer),
+    sa.column(COLUMN, sa.LargeBinary),
+)
+
+
+def _is_binary(bind: sa.engine.Connection) -> bool:
+    """Whether the column is already binary (e.g. created from the models)."""
+    for column in sa.inspect(bind).get_columns(TABLE):
+        if column["name"] == COLUMN:
+            return isinstance(column["type"], sa.LargeBinary)
+    return False
+
+
+def _rewrite_rows(bind: sa.engine.Connection, encode) -> None:
+    """Re-encode every stored vector with encode(vector) -> bytes."""
+    rows = bind.execute(
+        sa.select(profiles.c.id, profiles.c[COLUMN]).where(profiles.c[COLUMN].is_not(None))
+    ).all()
+    updates = []
+    for row_id, data in rows:
+        if isinstance(data, str):
+            data = data.encode()
+        vector = modalities_from_bytes(bytes(data))
+        if vector is not None:
+            updates.append({"row_id": row_id, "data": encode(vector)})
+    if updates:
+        bind.execute(
+            profiles.update()
+            .where(profiles.c.id == sa.bindparam("row_id"))
+            .values({COLUMN: sa.bindparam("data")}),
+            updates,
+        )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if not _is_binary(bind):
+        if bind.dialect.name == "postgresql":
+            op.alter_column(
+                TABLE, COLUMN,
+                type_=sa.LargeBinary(),
+                postgresql_using=f"convert_to({COLUMN}, 'UTF8')",
+            )
+        else:
+            with op.batch_alter_table(TABLE) as batch:
+                batch.alter_column(COLUMN, type_=sa.LargeBinary())
+    _rewrite_rows(bind, pack_modalities)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    _rewrite_rows(bind, lambda vector: json.dumps(modalities_to_dict(vector)).encode())
+    if bind.dialect.name == "postgresql":
+        op.alter_column(
+            TABLE, COLUMN,
+            type_=sa.Text(),
+            postgresql_using=f"convert_from({COLUMN}, 'UTF8')",
+        )
+    else:
+        with op.batch_alter_table(TABLE) as batch:
+            batch.alter_column(COLUMN, type_=sa.Text())
@@ -3,34 +3,106 @@ Bot package for Aurora Sun V1.
 
 This package contains the Telegram bot components:
 - webhook.py: Main webhook handler for Telegram updates
+- ingestion.py: HTTP webhook endpoint with bounded queue and worker pool
+- fast_update.py: Fast-path parsing of text and callback updates
+- dedup.py: update_id dedup for Telegram replays
+- outbound.py: Rate-shaped priority send queue
 - onboarding.py: User onboarding state machine (SW-13)
 
 Usage:
     from src.bot import webhook, onboarding
 """
 
-from src.bot.webhook import (
-    TelegramWebhookHandler,
-    webhook_handler,
-    create_app,
-    process_telegram_update,
-)
-from src.bot.onboarding import (
-    OnboardingStates,
-    OnboardingFlow,
-    SEGMENT_DISPLAY_NAMES,
-    CONSENT_TEXTS,
-)
-
-__all__ = [
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .webhook import (
+        TelegramWebhookHandler,
+        WebhookServices,
+        get_webhook_handler,
+        set_webhook_handler,
+        UserMailboxDispatcher,
+        get_dispatcher,
+        webhook_handler,
+        create_app,
+        process_telegram_update,
+    )
+    from .ingestion import (
+        WebhookIngestionServer,
+        IngestionConfig,
+        IngestionConfigError,
+        OverflowPolicy,
+        serve_webhook,
+    )
+    from .fast_update import LiteUpdate, parse_update
+    from .dedup import UpdateDeduplicator
+    from .outbound import (
+        OutboundSender,
+        SendPriority,
+        TokenBucket,
+        get_outbound_sender,
+        set_outbound_sender,
+    )
+    from .onboarding import (
+        OnboardingStates,
+        OnboardingFlow,
+        SEGMENT_DISPLAY_NAMES,
+        CONSENT_TEXTS,
+    )
+
+
+# Public name -> submodule that defines it. Submodules are imported on first
+# attribute access (PEP 562), so importing this package stays cheap.
+_LAZY_EXPORTS: dict[str, str] = {
     # Webhook
-    "TelegramWebhookHandler",
-    "webhook_handler",
-    "create_app",
-    "process_telegram_update",
+    "TelegramWebhookHandler": ".webhook",
+    "WebhookServices": ".webhook",
+    "get_webhook_handler": ".webhook",
+    "set_webhook_handler": ".webhook",
+    "UserMailboxDispatcher": ".webhook",
+    "get_dispatcher": ".webhook",
+    "webhook_handler": ".webhook",
+    "create_app": ".webhook",
+    "process_telegram_update": ".webhook",
+    # Ingestion
+    "WebhookIngestionServer": ".ingestion",
+    "IngestionConfig": ".ingestion",
+    "IngestionConfigError": ".ingestion",
+    "OverflowPolicy": ".ingestion",
+    "serve_webhook": ".ingestion",
+    # Fast-path parsing
+    "LiteUpdate": ".fast_update",
+    "parse_update": ".fast_update",
+    # Dedup
+    "UpdateDeduplicator": ".dedup",
+    # Outbound
+    "OutboundSender": ".outbound",
+    "SendPriority": ".outbound",
+    "TokenBucket": ".outbound",
+    "get_outbound_sender": ".outbound",
+    "set_outbound_sender": ".outbound",
     # Onboarding
-    "OnboardingStates",
-    "OnboardingFlow",
-    "SEGMENT_DISPLAY_NAMES",
-    "CONSENT_TEXTS",
-]
+    "OnboardingStates": ".onboarding",
+    "OnboardingFlow": ".onboarding",
+    "SEGMENT_DISPLAY_NAMES": ".onboarding",
+    "CONSENT_TEXTS": ".onboarding",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule that defines ``name`` on first access."""
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
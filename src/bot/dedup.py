@@ -0,0 +1,115 @@
+"""
+Update Deduplication for Aurora Sun V1.
+
+Telegram redelivers webhook updates it considers unanswered. Processing a
+replay costs LLM calls and can repeat side effects (saved tasks,
+transactions), so replays are dropped before rate limiting and the consent
+gate run.
+
+Two layers, keyed on update_id:
+1. Local ring buffer of the most recent update_ids (O(1), per process)
+2. Redis `SET key NX EX ttl` shared by all workers (skipped when Redis is down)
+
+Reference: ARCHITECTURE.md Section 4 (Natural Language Interface)
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import deque
+from typing import Any, Optional
+
+from prometheus_client import Counter
+
+logger = logging.getLogger(__name__)
+
+
+DUPLICATES = Counter(
+    "aurora_webhook_duplicate_updates_total",
+    "Replayed Telegram updates dropped before processing",
+    ["layer"],  # local | redis
+)
+
+
+class UpdateDeduplicator:
+    """
+    Bounded update_id dedup cache (local ring buffer + Redis).
+
+    An update counts as seen when it is first checked, not when it finishes
+    processing: a replay that arrives while the original is still running is
+    dropped too.
+    """
+
+    DEFAULT_CAPACITY = 10_000
+    DEFAULT_TTL = 24 * 3600  # Telegram keeps undelivered updates for 24 hours
+    KEY_PREFIX = "aurora:update:"
+
+    def __init__(
+        self,
+        redis: Any = None,
+        capacity: int = DEFAULT_CAPACITY,
+        ttl: int = DEFAULT_TTL,
+    ):
+        """
+        Initialize the deduplicator.
+
+        Args:
+            redis: RedisService with set_if_absent() (None: local layer only)
+            capacity: Number of recent update_ids kept in the local ring buffer
+            ttl: Lifetime of the shared Redis marker in seconds
+        """
+        self._redis = redis
+        self._capacity = capacity
+        self._ttl = ttl
+        self._ring: deque[int] = deque()
+        self._seen: set[int] = set()
+        self.duplicates_local = 0
+        self.duplicates_redis = 0
+
+    @property
+    def duplicates(self) -> int:
+        """Total number of dropped replays."""
+        return self.duplicates_local + self.duplicates_redis
+
+    def _remember(self, update_id: int) -> None:
+        """Record an update_id, evicting the oldest when the ring is full."""
+        if len(self._ring) >= self._capacity:
+            self._seen.discard(self._ring.popleft())
+        self._ring.append(update_id)
+        self._seen.add(update_id)
+
+    async def is_duplicate(self, update_id: Optional[int]) -> bool:
+        """
+        Check whether an update was already seen, and mark it as seen.
+
+        Args:
+            update_id: Telegram update_id
+
+        Returns:
+            True if the update is a replay and must be dropped
+        """
+        if update_id is None:
+            return False
+
+        if update_id in self._seen:
+            self.duplicates_local += 1
+            DUPLICATES.labels("local").inc()
+            logger.info(f"Dropped duplicate update {update_id} (local)")
+            return True
+        self._remember(update_id)
+
+        if self._redis is None:
+            return False
+        try:
+            first = await self._redis.set_if_absent(f"{self.KEY_PREFIX}{update_id}", 1, self._ttl)
+        except Exception as e:
+            # Fail open: a rare double-processing beats dropping real updates
+            logger.warning(f"Update dedup Redis check failed: {type(e).__name__}")
+            return False
+
+        if first is False:
+            self.duplicates_redis += 1
+            DUPLICATES.labels("redis").inc()
+            logger.info(f"Dropped duplicate update {update_id} (redis)")
+            return True
+        return False
@@ -0,0 +1,232 @@
+"""
+Fast-Path Update Parsing for Aurora Sun V1.
+
+Nearly all traffic is plain text messages and inline keyboard callbacks.
+For those, the handler only needs a handful of fields (user id, chat id,
+text, language_code, callback data), yet Update.de_json builds a full object
+graph (Update, Message, User, Chat, MessageEntity, ...) for every update.
+
+parse_update() reads those fields straight from the decoded JSON into a
+slotted LiteUpdate. Anything else (media, edited messages, inline-message
+callbacks, chat member updates, ...) falls back to telegram.Update, and a
+LiteUpdate can still be expanded with to_update() when a flow (onboarding)
+needs the full object.
+
+Reference: ARCHITECTURE.md Section 4 (Natural Language Interface)
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Optional, Union
+
+from telegram import Update
+
+
+# Message keys a plain text message may carry. Any other key (photo, voice,
+# reply_to_message, forward_origin, ...) sends the update down the full path.
+TEXT_MESSAGE_KEYS = frozenset({
+    "message_id",
+    "from",
+    "chat",
+    "date",
+    "text",
+    "entities",
+    "link_preview_options",
+})
+
+
+class LiteUpdate:
+    """
+    The fields of a text message or callback query update.
+
+    Attributes:
+        update_id: Telegram update_id
+        user_id: Sender's Telegram user ID
+        chat_id: Chat to reply to
+        message_id: Message ID (the keyboard message for callbacks)
+        text: Message text (None for callbacks)
+        language_code: Sender's Telegram locale (may be None)
+        callback_data: Inline button data (None for messages)
+        callback_query_id: Callback query ID (None for messages)
+        payload: The decoded update JSON (kept for to_update())
+        bot: telegram.Bot used for replies and to_update()
+    """
+
+    __slots__ = (
+        "update_id",
+        "user_id",
+        "chat_id",
+        "message_id",
+        "text",
+        "language_code",
+        "callback_data",
+        "callback_query_id",
+        "payload",
+        "bot",
+        "_update",
+    )
+
+    def __init__(
+        self,
+        update_id: int,
+        user_id: int,
+        chat_id: int,
+        message_id: int,
+        text: Optional[str],
+        language_code: Optional[str],
+        callback_data: Optional[str],
+        callback_query_id: Optional[str],
+        payload: dict[str, Any],
+        bot: Any = None,
+    ):
+        self.update_id = update_id
+        self.user_id = user_id
+        self.chat_id = chat_id
+        self.message_id = message_id
+        self.text = text
+        self.language_code = language_code
+        self.callback_data = callback_data
+        self.callback_query_id = callback_query_id
+        self.payload = payload
+        self.bot = bot
+        self._update: Optional[Update] = None
+
+    def __repr__(self) -> str:
+        kind = "callback" if self.callback_query_id is not None else "message"
+        return f"LiteUpdate(update_id={self.update_id}, {kind}, user_id={self.user_id})"
+
+    @property
+    def is_callback(self) -> bool:
+        """True for callback query updates."""
+        return self.callback_query_id is not None
+
+    def to_update(self) -> Update:
+        """Build (once) the full telegram.Update for this update."""
+        if self._update is None:
+            self._update = Update.de_json(self.payload, self.bot)
+        return self._update
+
+    async def reply_text(self, text: str, **kwargs: Any) -> Any:
+        """
+        Send a message to the update's chat.
+
+        Args:
+            text: Message text
+            **kwargs: Extra send_message arguments
+
+        Returns:
+            The sent telegram.Message
+        """
+        return await self.bot.send_message(chat_id=self.chat_id, text=text, **kwargs)
+
+    async def answer_callback_query(self, text: Optional[str] = None) -> Any:
+        """
+        Answer the callback query (stops the button's loading indicator).
+
+        Args:
+            text: Optional notification shown to the user
+        """
+        if self.callback_query_id is None:
+            return None
+        return await self.bot.answer_callback_query(self.callback_query_id, text=text)
+
+
+def _parse_message(update_id: int, message: dict[str, Any], payload: dict[str, Any], bot: Any) -> Optional[LiteUpdate]:
+    text = message.get("text")
+    sender = message.get("from")
+    if text is None or sender is None or not TEXT_MESSAGE_KEYS.issuperset(message):
+        return None
+    return LiteUpdate(
+        update_id=update_id,
+        user_id=sender["id"],
+        chat_id=message["chat"]["id"],
+        message_id=message["message_id"],
+        text=text,
+        language_code=sender.get("language_code"),
+        callback_data=None,
+        callback_query_id=None,
+        payload=payload,
+        bot=bot,
+    )
+
+
+def _parse_callback(update_id: int, query: dict[str, Any], payload: dict[str, Any], bot: Any) -> Optional[LiteUpdate]:
+    data = query.get("data")
+    message = query.get("message")
+    # Game callbacks carry no data; inline-message callbacks carry no chat
+    if data is None or message is None:
+        return None
+    sender = query["from"]
+    return LiteUpdate(
+        update_id=update_id,
+        user_id=sender["id"],
+        chat_id=message["chat"]["id"],
+        message_id=message["message_id"],
+        text=None,
+        language_code=sender.get("language_code"),
+        callback_data=data,
+        callback_query_id=query["id"],
+        payload=payload,
+        bot=bot,
+    )
+
+
+def parse_lite(payload: dict[str, Any], bot: Any = None) -> Optional[LiteUpdate]:
+    """
+    Extract a LiteUpdate from a decoded update, if it is on the fast path.
+
+    Args:
+        payload: Decoded update JSON
+        bot: telegram.Bot to attach
+
+    Returns:
+        LiteUpdate for plain text messages and chat callback queries,
+        None for everything else
+    """
+    # Exactly update_id plus one update kind
+    if len(payload) != 2:
+        return None
+    update_id = payload.get("update_id")
+    if update_id is None:
+        return None
+    try:
+        message = payload.get("message")
+        if message is not None:
+            return _parse_message(update_id, message, payload, bot)
+        query = payload.get("callback_query")
+        if query is not None:
+            return _parse_callback(update_id, query, payload, bot)
+    except (KeyError, TypeError):
+        # Malformed for the fast path; let Update.de_json deal with it
+        return None
+    return None
+
+
+def parse_update(
+    raw: Union[bytes, str, dict[str, Any]],
+    bot: Any = None,
+) -> Union[LiteUpdate, Update]:
+    """
+    Decode a webhook update, taking the fast path when possible.
+
+    Args:
+        raw: Request body or already decoded update JSON
+        bot: telegram.Bot to attach
+
+    Returns:
+        LiteUpdate for text messages and callback queries, telegram.Update otherwise
+    """
+    payload = json.loads(raw) if isinstance(raw, (bytes, str)) else raw
+    lite = parse_lite(payload, bot)
+    if lite is not None:
+        return lite
+    return Update.de_json(payload, bot)
+
+
+__all__ = [
+    "LiteUpdate",
+    "TEXT_MESSAGE_KEYS",
+    "parse_lite",
+    "parse_update",
+]
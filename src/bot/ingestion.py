@@ -0,0 +1,465 @@
+"""
+Webhook Ingestion Server for Aurora Sun V1.
+
+Native (asyncio streams) HTTP endpoint for Telegram webhook POSTs:
+
+    Telegram POST -> validate secret token -> bounded queue -> 200 OK
+                                                   |
+                                     worker pool -> dispatcher -> handler
+
+The response is sent as soon as the update is queued, so Telegram never
+waits on LLM or DB calls. When the queue is full the server either rejects
+the update with 503 (backpressure: Telegram redelivers it later) or drops
+the oldest queued update (load shedding), depending on the overflow policy.
+
+Queue depth, queue wait time and per-outcome counters are exported as
+Prometheus metrics and served on GET /metrics of a separate listener bound
+to an internal interface (never on the public webhook port).
+
+References:
+    - ARCHITECTURE.md Section 4 (Natural Language Interface)
+    - ARCHITECTURE.md Section 10 (Security & Privacy Architecture, F-003)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import hmac
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Awaitable, Callable, Optional
+
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Metrics
+# =============================================================================
+
+QUEUE_DEPTH = Gauge(
+    "aurora_webhook_queue_depth",
+    "Updates waiting in the webhook ingestion queue",
+)
+QUEUE_WAIT = Histogram(
+    "aurora_webhook_queue_wait_seconds",
+    "Time an update waited in the ingestion queue before a worker picked it up",
+    buckets=(0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+UPDATES = Counter(
+    "aurora_webhook_updates_total",
+    "Webhook updates by outcome",
+    ["outcome"],  # accepted | rejected | shed | processed | failed
+)
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+class IngestionConfigError(RuntimeError):
+    """The ingestion server is configured unsafely and refuses to start."""
+
+
+class OverflowPolicy(str, Enum):
+    """What to do with a new update when the queue is full."""
+
+    REJECT = "reject"  # 503: backpressure, Telegram redelivers later
+    SHED_OLDEST = "shed_oldest"  # Drop the oldest queued update, accept the new one
+
+
+@dataclass
+class IngestionConfig:
+    """
+    Webhook ingestion configuration.
+
+    Attributes:
+        host: Interface to bind
+        port: Port to bind
+        path: Webhook path Telegram POSTs to
+        secret_token: Expected X-Telegram-Bot-Api-Secret-Token (None disables the
+            check, which is only allowed with AURORA_DEV_MODE=1)
+        max_queue_size: Bound of the in-process update queue
+        workers: Number of worker tasks draining the queue
+        overflow_policy: Behaviour when the queue is full
+        max_body_bytes: Largest accepted request body
+        metrics_host: Interface of the /metrics listener (keep it internal)
+        metrics_port: Port of the /metrics listener (None: no metrics endpoint)
+    """
+
+    host: str = "0.0.0.0"
+    port: int = 8443
+    path: str = "/telegram/webhook"
+    secret_token: Optional[str] = None
+    max_queue_size: int = 1000
+    workers: int = 8
+    overflow_policy: OverflowPolicy = OverflowPolicy.REJECT
+    max_body_bytes: int = 1024 * 1024
+    metrics_host: str = "127.0.0.1"
+    metrics_port: Optional[int] = 9464
+
+    @classmethod
+    def from_env(cls) -> IngestionConfig:
+        """Build the configuration from AURORA_WEBHOOK_* environment variables."""
+        metrics_port = os.environ.get("AURORA_WEBHOOK_METRICS_PORT", str(cls.metrics_port))
+        return cls(
+            host=os.environ.get("AURORA_WEBHOOK_HOST", cls.host),
+            port=int(os.environ.get("AURORA_WEBHOOK_PORT", cls.port)),
+            path=os.environ.get("AURORA_WEBHOOK_PATH", cls.path),
+            secret_token=os.environ.get("AURORA_WEBHOOK_SECRET") or None,
+            max_queue_size=int(os.environ.get("AURORA_WEBHOOK_QUEUE_SIZE", cls.max_queue_size)),
+            workers=int(os.environ.get("AURORA_WEBHOOK_WORKERS", cls.workers)),
+            overflow_policy=OverflowPolicy(
+                os.environ.get("AURORA_WEBHOOK_OVERFLOW", OverflowPolicy.REJECT.value)
+            ),
+            metrics_host=os.environ.get("AURORA_WEBHOOK_METRICS_HOST", cls.metrics_host),
+            metrics_port=int(metrics_port) if metrics_port else None,
+        )
+
+
+@dataclass
+class IngestionStats:
+    """Counters for one server instance (Prometheus metrics are process-wide)."""
+
+    accepted: int = 0
+    rejected: int = 0
+    shed: int = 0
+    processed: int = 0
+    failed: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def avg_wait(self) -> float:
+        """Average queue wait in seconds over all picked-up updates."""
+        picked = self.processed + self.failed
+        return self.total_wait / picked if picked else 0.0
+
+
+# =============================================================================
+# Server
+# =============================================================================
+
+UpdateProcessor = Callable[[dict[str, Any]], Awaitable[None]]
+
+_REASONS = {200: "OK", 400: "Bad Request", 401: "Unauthorized", 404: "Not Found",
+            405: "Method Not Allowed", 413: "Payload Too Large", 503: "Service Unavailable"}
+
+
+class WebhookIngestionServer:
+    """
+    HTTP webhook endpoint with a bounded queue and a worker pool.
+
+    Usage:
+        server = WebhookIngestionServer(process=handle_payload, config=IngestionConfig.from_env())
+        await server.start()
+        ...
+        await server.stop()
+    """
+
+    def __init__(self, process: UpdateProcessor, config: Optional[IngestionConfig] = None):
+        """
+        Initialize the server.
+
+        Args:
+            process: Coroutine function handling one decoded update payload
+            config: Ingestion configuration (defaults to IngestionConfig())
+        """
+        self._process = process
+        self.config = config or IngestionConfig()
+        self.stats = IngestionStats()
+        self._queue: asyncio.Queue[tuple[dict[str, Any], float]] = asyncio.Queue(
+            maxsize=self.config.max_queue_size
+        )
+        self._workers: list[asyncio.Task] = []
+        self._server: Optional[asyncio.Server] = None
+        self._metrics_server: Optional[asyncio.Server] = None
+        # Compared as bytes: a non-ASCII header must not raise in compare_digest
+        self._secret = (
+            self.config.secret_token.encode() if self.config.secret_token is not None else None
+        )
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of updates waiting for a worker."""
+        return self._queue.qsize()
+
+    @property
+    def port(self) -> int:
+        """Bound port (useful when configured with port 0)."""
+        if self._server is None or not self._server.sockets:
+            return self.config.port
+        return self._server.sockets[0].getsockname()[1]
+
+    @property
+    def metrics_port(self) -> Optional[int]:
+        """Bound port of the /metrics listener (None without one)."""
+        if self._metrics_server is None or not self._metrics_server.sockets:
+            return self.config.metrics_port
+        return self._metrics_server.sockets[0].getsockname()[1]
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    async def start(self) -> None:
+        """
+        Start the worker pool and begin accepting connections.
+
+        Raises:
+            IngestionConfigError: No secret token is set outside dev mode
+        """
+        if not self.config.secret_token:
+            if os.environ.get("AURORA_DEV_MODE") != "1":
+                raise IngestionConfigError(
+                    "No webhook secret token. Set AURORA_WEBHOOK_SECRET "
+                    "(or AURORA_DEV_MODE=1 for local development)."
+                )
+            logger.warning("Webhook secret token check disabled (dev mode)")
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"webhook-worker-{i}")
+            for i in range(self.config.workers)
+        ]
+        self._server = await asyncio.start_server(
+            functools.partial(self._handle_connection, route=self._route),
+            self.config.host,
+            self.config.port,
+        )
+        if self.config.metrics_port is not None:
+            self._metrics_server = await asyncio.start_server(
+                functools.partial(self._handle_connection, route=self._route_metrics),
+                self.config.metrics_host,
+                self.config.metrics_port,
+            )
+            logger.info(f"Metrics on {self.config.metrics_host}:{self.metrics_port}/metrics")
+        logger.info(
+            f"Webhook ingestion listening on {self.config.host}:{self.port}{self.config.path} "
+            f"(queue={self.config.max_queue_size}, workers={self.config.workers})"
+        )
+
+    async def serve_forever(self) -> None:
+        """Serve until cancelled."""
+        if self._server is None:
+            await self.start()
+        await self._server.serve_forever()
+
+    async def stop(self, drain: bool = True) -> None:
+        """
+        Stop accepting updates and shut down the worker pool.
+
+        Args:
+            drain: Process already queued updates before stopping
+        """
+        for server in (self._server, self._metrics_server):
+            if server is not None:
+                server.close()
+                await server.wait_closed()
+        self._server = self._metrics_server = None
+        if drain:
+            await self._queue.join()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    # =========================================================================
+    # Queue
+    # =========================================================================
+
+    def offer(self, payload: dict[str, Any]) -> bool:
+        """
+        Put an update on the queue according to the overflow policy.
+
+        Args:
+            payload: Decoded Telegram update
+
+        Returns:
+            True if the update was queued, False if it was rejected
+        """
+        item = (payload, time.monotonic())
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            if self.config.overflow_policy is OverflowPolicy.REJECT:
+                self.stats.rejected += 1
+                UPDATES.labels("rejected").inc()
+                return False
+            # Shed the oldest update to keep the freshest ones
+            self._queue.get_nowait()
+            self._queue.task_done()
+            self._queue.put_nowait(item)
+            self.stats.shed += 1
+            UPDATES.labels("shed").inc()
+
+        self.stats.accepted += 1
+        UPDATES.labels("accepted").inc()
+        QUEUE_DEPTH.set(self._queue.qsize())
+        return True
+
+    async def _worker(self) -> None:
+        """Drain the queue, one update at a time."""
+        while True:
+            payload, enqueued_at = await self._queue.get()
+            waited = time.monotonic() - enqueued_at
+            QUEUE_WAIT.observe(waited)
+            QUEUE_DEPTH.set(self._queue.qsize())
+            self.stats.total_wait += waited
+            self.stats.max_wait = max(self.stats.max_wait, waited)
+            try:
+                await self._process(payload)
+                self.stats.processed += 1
+                UPDATES.labels("processed").inc()
+            except Exception as e:
+                self.stats.failed += 1
+                UPDATES.labels("failed").inc()
+                logger.error(
+                    f"Update {payload.get('update_id')} failed: {type(e).__name__}",
+                    exc_info=True,
+                )
+            finally:
+                self._queue.task_done()
+
+    # =========================================================================
+    # HTTP
+    # =========================================================================
+
+    async def _handle_connection(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        route: Callable[[str, str, dict[str, str], bytes], tuple[int, bytes, str]],
+    ) -> None:
+        """Serve HTTP/1.1 requests on one (keep-alive) connection."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, _, rest = request_line.decode("latin-1").partition(" ")
+                target = rest.split(" ", 1)[0]
+
+                headers: dict[str, str] = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get("content-length", "0") or 0)
+                if length > self.config.max_body_bytes:
+                    await self._respond(writer, 413, close=True)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                status, content, content_type = route(method, target, headers, body)
+                keep_alive = headers.get("connection", "").lower() != "close"
+                await self._respond(writer, status, content, content_type, close=not keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    def _route(
+        self, method: str, target: str, headers: dict[str, str], body: bytes
+    ) -> tuple[int, bytes, str]:
+        """Map a webhook request to (status, body, content type)."""
+        if target != self.config.path:
+            return 404, b"", "text/plain"
+        if method != "POST":
+            return 405, b"", "text/plain"
+
+        # F-003: verify the secret token set via setWebhook(secret_token=...)
+        if self._secret is not None:
+            # Headers were decoded as latin-1, so this restores the raw bytes
+            received = headers.get("x-telegram-bot-api-secret-token", "").encode("latin-1")
+            if not hmac.compare_digest(received, self._secret):
+                return 401, b"", "text/plain"
+
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return 400, b"", "text/plain"
+        if not isinstance(payload, dict):
+            return 400, b"", "text/plain"
+
+        if not self.offer(payload):
+            return 503, b"", "text/plain"
+        return 200, b"", "text/plain"
+
+    @staticmethod
+    def _route_metrics(
+        method: str, target: str, headers: dict[str, str], body: bytes
+    ) -> tuple[int, bytes, str]:
+        """Map a request on the internal metrics listener."""
+        if target != "/metrics":
+            return 404, b"", "text/plain"
+        if method != "GET":
+            return 405, b"", "text/plain"
+        return 200, generate_latest(), CONTENT_TYPE_LATEST
+
+    @staticmethod
+    async def _respond(
+        writer: asyncio.StreamWriter,
+        status: int,
+        body: bytes = b"",
+        content_type: str = "text/plain",
+        close: bool = False,
+    ) -> None:
+        """Write an HTTP/1.1 response."""
+        head = (
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'close' if close else 'keep-alive'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+
+# =============================================================================
+# Application wiring
+# =============================================================================
+
+async def serve_webhook(application: Any, config: Optional[IngestionConfig] = None) -> None:
+    """
+    Run the Telegram application behind the ingestion server until cancelled.
+
+    Workers hand decoded updates to the per-user mailbox dispatcher without
+    waiting for them to be handled (the dispatcher bounds the in-flight
+    updates and logs failures), so a slow user never holds up the queue.
+
+    Args:
+        application: telegram.ext.Application from create_app()
+        config: Ingestion configuration (defaults to IngestionConfig.from_env())
+    """
+    from src.bot.fast_update import parse_update
+    from src.bot.webhook import get_dispatcher
+
+    async def process(payload: dict[str, Any]) -> None:
+        # No await before submit(): updates reach the mailboxes in queue order.
+        # Text messages and callbacks skip the full Update object graph.
+        update = parse_update(payload, application.bot)
+        get_dispatcher().submit(update)
+
+    await application.initialize()
+    if application.post_init is not None:
+        await application.post_init(application)
+
+    server = WebhookIngestionServer(process=process, config=config or IngestionConfig.from_env())
+    try:
+        await server.serve_forever()
+    finally:
+        await server.stop()
+        await get_dispatcher().join()
+        if application.post_shutdown is not None:
+            await application.post_shutdown(application)
+        await application.shutdown()
@@ -165,8 +165,14 @@ class OnboardingFlow:
     - Segment selection uses display names, not internal codes
     """
 
-    def __init__(self):
-        """Initialize the onboarding flow."""
+    def __init__(self, hash_service: Any = None):
+        """
+        Initialize the onboarding flow.
+
+        Args:
+            hash_service: HashService for Telegram IDs (defaults to the global one)
+        """
+        self._hash_service = hash_service
         self._states: Dict[str, OnboardingStates] = {}  # user_hash -> state
         self._user_data: Dict[str, Dict[str, Any]] = {}  # user_hash -> data
 
@@ -244,6 +250,8 @@ class OnboardingFlow:
             raise ValueError("No effective user in update")
 
         telegram_id = str(user.id)
+        if self._hash_service is not None:
+            return self._hash_service.hash_pii(telegram_id)
         return hash_telegram_id(telegram_id)
 
     async def start(self, update: Update, language: str = "en") -> None:
@@ -0,0 +1,407 @@
+"""
+Outbound Send Scheduler for Aurora Sun V1.
+
+All bot-initiated and reply messages go through one queue that shapes
+traffic to Telegram's limits instead of hitting 429s:
+
+- Global token bucket (~30 msg/s for the whole bot)
+- Per-chat token buckets (~1 msg/s per chat, small bursts allowed)
+- Priority classes: crisis responses first, proactive impulses last
+- 429 RetryAfter: the chat is paused for retry_after and its messages are
+  retried together when the pause ends; transient network errors are
+  retried with backoff
+
+References:
+    - ARCHITECTURE.md Section 5 (Daily Workflow: morning/midday/evening messages)
+    - ARCHITECTURE.md Section 13 (Crisis Safety Net)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+from dataclasses import dataclass, field
+from datetime import timedelta
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from telegram.error import BadRequest, NetworkError, RetryAfter
+
+logger = logging.getLogger(__name__)
+
+
+class SendPriority(IntEnum):
+    """Send priority classes (lower = sent first)."""
+
+    CRISIS = 0  # Crisis Safety Net responses
+    RESPONSE = 1  # Replies to user messages
+    SCHEDULED = 2  # Daily workflow (morning, midday, evening)
+    PROACTIVE = 3  # Proactive impulses and nudges
+
+
+# Sends one message: (chat_id, text, kwargs) -> sent message
+SendFunction = Callable[[int, str, Dict[str, Any]], Awaitable[Any]]
+
+
+# =============================================================================
+# Token Bucket
+# =============================================================================
+
+class TokenBucket:
+    """Token bucket refilled continuously at `rate` tokens per second."""
+
+    def __init__(self, rate: float, capacity: float, now: float):
+        """
+        Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens (burst size)
+            now: Current time (event loop clock)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = now
+        self.blocked_until = 0.0
+
+    def delay(self, now: float) -> float:
+        """Seconds until one token is available (0 if available now)."""
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def consume(self) -> None:
+        """Take one token (call only after delay() returned 0)."""
+        self.tokens -= 1
+
+    def block(self, until: float) -> None:
+        """Pause the bucket until `until` (e.g. after a 429)."""
+        self.blocked_until = max(self.blocked_until, until)
+
+    def is_idle(self, now: float) -> bool:
+        """True if the bucket is full and unblocked (safe to discard)."""
+        return now >= self.blocked_until and self.delay(now) == 0 and self.tokens >= self.capacity
+
+
+# =============================================================================
+# Outbound Sender
+# =============================================================================
+
+@dataclass
+class OutboundMessage:
+    """A queued outbound message."""
+
+    chat_id: int
+    text: str
+    priority: SendPriority
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    attempts: int = 0
+    future: Optional[asyncio.Future] = None
+
+
+@dataclass
+class OutboundStats:
+    """Outbound send counters."""
+
+    sent: int = 0
+    failed: int = 0
+    retried: int = 0
+    rate_limited: int = 0  # 429 responses received
+
+
+class OutboundSender:
+    """
+    Priority send queue shaped by a global and per-chat token buckets.
+
+    Usage:
+        sender = OutboundSender.for_bot(application.bot)
+        await sender.start()
+        sender.enqueue(chat_id, "Good morning!", SendPriority.SCHEDULED)
+    """
+
+    GLOBAL_RATE = 30.0  # messages/second for the whole bot
+    GLOBAL_BURST = 1  # Smooth pacing: any 1s window stays within GLOBAL_RATE + 1
+    PER_CHAT_RATE = 1.0  # messages/second per chat
+    PER_CHAT_BURST = 3
+    MAX_ATTEMPTS = 4
+    MAX_IN_FLIGHT = 64
+    DRAIN_TIMEOUT = 30.0  # Seconds stop() waits for the queue to empty
+
+    def __init__(
+        self,
+        send: SendFunction,
+        global_rate: float = GLOBAL_RATE,
+        global_burst: int = GLOBAL_BURST,
+        per_chat_rate: float = PER_CHAT_RATE,
+        per_chat_burst: int = PER_CHAT_BURST,
+        max_attempts: int = MAX_ATTEMPTS,
+        max_in_flight: int = MAX_IN_FLIGHT,
+    ):
+        """
+        Initialize the sender.
+
+        Args:
+            send: Coroutine function performing one Bot API send
+            global_rate: Global messages/second
+            global_burst: Messages the bot may send back to back
+            per_chat_rate: Messages/second per chat
+            per_chat_burst: Messages a chat may receive back to back
+            max_attempts: Attempts per message before giving up
+            max_in_flight: Concurrent Bot API requests
+        """
+        self._send = send
+        self._global_rate = global_rate
+        self._global_burst = global_burst
+        self._per_chat_rate = per_chat_rate
+        self._per_chat_burst = per_chat_burst
+        self._max_attempts = max_attempts
+        self._in_flight = asyncio.Semaphore(max_in_flight)
+        self._sequence = itertools.count()
+        # (priority, seq, message): ready to send
+        self._ready: list[tuple[int, int, OutboundMessage]] = []
+        # (ready_at, priority, seq, message): waiting on a chat bucket or retry_after
+        self._delayed: list[tuple[float, int, int, OutboundMessage]] = []
+        self._global: Optional[TokenBucket] = None
+        self._chats: Dict[int, TokenBucket] = {}
+        self._wakeup = asyncio.Event()
+        self._tasks: set[asyncio.Task] = set()
+        self._scheduler: Optional[asyncio.Task] = None
+        self.stats = OutboundStats()
+
+    @classmethod
+    def for_bot(cls, bot: Any, **kwargs: Any) -> OutboundSender:
+        """Create a sender that sends through a telegram.Bot."""
+        async def send(chat_id: int, text: str, options: Dict[str, Any]) -> Any:
+            return await bot.send_message(chat_id=chat_id, text=text, **options)
+
+        return cls(send, **kwargs)
+
+    @property
+    def pending(self) -> int:
+        """Messages queued or waiting for a retry."""
+        return len(self._ready) + len(self._delayed)
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    async def start(self) -> None:
+        """Start the scheduler task."""
+        loop = asyncio.get_running_loop()
+        self._global = TokenBucket(self._global_rate, self._global_burst, loop.time())
+        self._scheduler = asyncio.create_task(self._run(), name="outbound-scheduler")
+
+    async def stop(self, drain: bool = True, drain_timeout: float = DRAIN_TIMEOUT) -> None:
+        """
+        Stop the scheduler.
+
+        Messages not sent by then (drain timed out, or the scheduler died)
+        and in-flight sends are given up: their futures resolve to False.
+
+        Args:
+            drain: Send everything still queued first
+            drain_timeout: Seconds to wait for the queue to drain
+        """
+        if drain and self._scheduler is not None:
+            try:
+                await asyncio.wait_for(self._drain(), drain_timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"Outbound drain timed out with {self.pending} messages queued")
+        if self._scheduler is not None:
+            self._scheduler.cancel()
+            (result,) = await asyncio.gather(self._scheduler, return_exceptions=True)
+            if isinstance(result, Exception):
+                logger.error(f"Outbound scheduler had died: {type(result).__name__}")
+            self._scheduler = None
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        for _, _, message in self._ready:
+            self._resolve(message, False)
+        for *_, message in self._delayed:
+            self._resolve(message, False)
+        self._ready.clear()
+        self._delayed.clear()
+
+    async def _drain(self) -> None:
+        """Wait until nothing is queued or in flight (or the scheduler died)."""
+        while self.pending or self._tasks:
+            if self._scheduler is None or self._scheduler.done():
+                # Nothing releases the queue any more
+                return
+            await asyncio.sleep(0.01)
+
+    # =========================================================================
+    # Queue
+    # =========================================================================
+
+    def enqueue(
+        self,
+        chat_id: int,
+        text: str,
+        priority: SendPriority = SendPriority.RESPONSE,
+        **kwargs: Any,
+    ) -> asyncio.Future:
+        """
+        Queue a message.
+
+        Args:
+            chat_id: Telegram chat ID
+            text: Message text
+            priority: Send priority class
+            **kwargs: Extra send_message arguments (reply_markup, parse_mode, ...)
+
+        Returns:
+            Future resolving to True when sent, False if it finally failed
+        """
+        message = OutboundMessage(
+            chat_id=chat_id,
+            text=text,
+            priority=priority,
+            kwargs=kwargs,
+            future=asyncio.get_running_loop().create_future(),
+        )
+        heapq.heappush(self._ready, (priority, next(self._sequence), message))
+        self._wakeup.set()
+        return message.future
+
+    def _delay(self, message: OutboundMessage, ready_at: float) -> None:
+        heapq.heappush(
+            self._delayed, (ready_at, message.priority, next(self._sequence), message)
+        )
+
+    def _chat_bucket(self, chat_id: int, now: float) -> TokenBucket:
+        bucket = self._chats.get(chat_id)
+        if bucket is None:
+            bucket = TokenBucket(self._per_chat_rate, self._per_chat_burst, now)
+            self._chats[chat_id] = bucket
+        return bucket
+
+    async def _run(self) -> None:
+        """Scheduler loop: release messages as both buckets allow."""
+        loop = asyncio.get_running_loop()
+        while True:
+            now = loop.time()
+
+            # Messages whose chat delay or retry_after has passed become ready
+            while self._delayed and self._delayed[0][0] <= now:
+                _, priority, seq, message = heapq.heappop(self._delayed)
+                heapq.heappush(self._ready, (priority, seq, message))
+
+            if not self._ready:
+                timeout = self._delayed[0][0] - now if self._delayed else None
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                self._discard_idle_chats(loop.time())
+                continue
+
+            global_wait = self._global.delay(now)
+            if global_wait > 0:
+                await asyncio.sleep(global_wait)
+                continue
+
+            _, _, message = heapq.heappop(self._ready)
+            chat = self._chat_bucket(message.chat_id, now)
+            chat_wait = chat.delay(now)
+            if chat_wait > 0:
+                # Park it: other chats keep flowing meanwhile
+                self._delay(message, now + chat_wait)
+                continue
+
+            self._global.consume()
+            chat.consume()
+            await self._in_flight.acquire()
+            task = asyncio.create_task(self._deliver(message))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    def _discard_idle_chats(self, now: float) -> None:
+        """Drop per-chat buckets that are full again (nothing to remember)."""
+        waiting = {m.chat_id for *_, m in self._delayed}
+        for chat_id in [c for c, b in self._chats.items() if c not in waiting and b.is_idle(now)]:
+            del self._chats[chat_id]
+
+    async def _deliver(self, message: OutboundMessage) -> None:
+        """Send one message and schedule a retry on 429 or transient errors."""
+        loop = asyncio.get_running_loop()
+        message.attempts += 1
+        try:
+            await self._send(message.chat_id, message.text, message.kwargs)
+        except RetryAfter as e:
+            self.stats.rate_limited += 1
+            retry_after = e.retry_after
+            if isinstance(retry_after, timedelta):
+                retry_after = retry_after.total_seconds()
+            resume_at = loop.time() + float(retry_after)
+            # Pause the chat: its queued messages retry together afterwards
+            self._chat_bucket(message.chat_id, loop.time()).block(resume_at)
+            self._retry(message, resume_at)
+        except NetworkError as e:
+            if isinstance(e, BadRequest):
+                self._fail(message, e)
+            else:
+                self._retry(message, loop.time() + min(2 ** message.attempts, 30))
+        except asyncio.CancelledError:
+            self._resolve(message, False)
+            raise
+        except Exception as e:
+            self._fail(message, e)
+        else:
+            self.stats.sent += 1
+            self._resolve(message, True)
+        finally:
+            self._in_flight.release()
+            self._wakeup.set()
+
+    def _retry(self, message: OutboundMessage, ready_at: float) -> None:
+        if message.attempts >= self._max_attempts:
+            self._fail(message, None)
+            return
+        self.stats.retried += 1
+        self._delay(message, ready_at)
+
+    def _fail(self, message: OutboundMessage, error: Optional[Exception]) -> None:
+        self.stats.failed += 1
+        reason = type(error).__name__ if error else "too many attempts"
+        logger.warning(f"Outbound message to chat {message.chat_id} failed: {reason}")
+        self._resolve(message, False)
+
+    @staticmethod
+    def _resolve(message: OutboundMessage, success: bool) -> None:
+        if message.future is not None and not message.future.done():
+            message.future.set_result(success)
+
+
+# Global sender instance
+_outbound_sender: Optional[OutboundSender] = None
+
+
+def get_outbound_sender() -> Optional[OutboundSender]:
+    """
+    Get the global outbound sender (None until set at startup).
+
+    Returns:
+        The global OutboundSender instance, if configured
+    """
+    return _outbound_sender
+
+
+def set_outbound_sender(sender: Optional[OutboundSender]) -> None:
+    """
+    Set the global outbound sender.
+
+    Args:
+        sender: The OutboundSender to use globally
+    """
+    global _outbound_sender
+    _outbound_sender = sender
@@ -23,29 +23,90 @@ References:
     - ARCHITECTURE.md Section 13 (SW-13, SW-15)
 """
 
+import asyncio
 import os
 import logging
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 
 # Security imports
-from src.lib.security import RateLimiter
+from src.lib.security import RateLimiter, RateLimitTier
 from src.models.consent import ConsentService, ConsentStatus
-from typing import Optional, Any
+from typing import Awaitable, Callable, Deque, Dict, Optional, Any, Union
 
 from telegram import Update
 from telegram.ext import (
     Application,
+    CallbackQueryHandler,
     ContextTypes,
     MessageHandler,
     CommandHandler,
     filters,
 )
 
+from src.bot.dedup import UpdateDeduplicator
+from src.bot.fast_update import LiteUpdate
 from src.bot.onboarding import OnboardingFlow, OnboardingStates
-from src.lib.encryption import hash_telegram_id
+from src.bot.outbound import (
+    OutboundSender,
+    SendPriority,
+    get_outbound_sender,
+    set_outbound_sender,
+)
+from src.core.callback_router import CallbackRouter, get_callback_router
+from src.core.module_context import ModuleContext
+from src.core.module_registry import ModuleRegistry, get_registry
+from src.core.segment_context import SegmentContext
+from src.lib.encryption import (
+    EncryptionServiceError,
+    get_encryption_service,
+    get_hash_service,
+    hash_telegram_id,
+)
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class WebhookServices:
+    """
+    Application-scoped services shared by every update.
+
+    Built once at startup and injected into TelegramWebhookHandler. Fields
+    left as None are resolved to the global instances in startup().
+
+    Attributes:
+        session_factory: Creates database sessions (e.g. a sessionmaker)
+        redis: RedisService for distributed state
+        encryption: EncryptionService for per-user field encryption
+        hash_service: HashService for Telegram ID hashing
+        intent_router: Intent Router for NLI routing
+        rate_limiter: Rate limiter with an async check_rate_limit(user_id, action)
+        registry: Module registry used for routing
+        deduplicator: Drops replayed updates by update_id
+        callback_router: Decodes inline button presses and dispatches them
+        write_behind: Batches telemetry writes of the services built while
+            handling updates (flushed on shutdown)
+        event_scheduler: Fires the Daily Workflow events and nightly jobs
+        checkpointer: Saves Daily Workflow graph runs so they can resume
+    """
+
+    session_factory: Optional[Callable[[], Any]] = None
+    redis: Any = None
+    encryption: Any = None
+    hash_service: Any = None
+    intent_router: Any = None
+    rate_limiter: Any = RateLimiter
+    registry: Optional[ModuleRegistry] = None
+    deduplicator: Optional[UpdateDeduplicator] = None
+    callback_router: Optional[CallbackRouter] = None
+    write_behind: Any = None
+    event_scheduler: Any = None
+    checkpointer: Any = None
+
+
 class TelegramWebhookHandler:
     """
     Handles Telegram webhook updates and routes them through the NLI.
@@ -61,31 +122,224 @@ class TelegramWebhookHandler:
         self,
         nli_service: Any = None,
         db_session: Any = None,
+        services: Optional["WebhookServices"] = None,
     ):
         """
         Initialize the webhook handler.
 
+        The handler is application-scoped: build it once at startup and
+        reuse it for every update, so onboarding state and the shared
+        services survive between updates.
+
         Args:
             nli_service: NLI service for intent routing (optional, lazy loaded)
             db_session: Database session for user lookups (optional, lazy loaded)
+            services: Shared application services (defaults resolved in startup())
         """
-        self._nli_service = nli_service
+        self._services = services if services is not None else WebhookServices()
+        self._nli_service = nli_service or self._services.intent_router
         self._db_session = db_session
-        self._onboarding_flow = OnboardingFlow()
+        self._rate_limiter = self._services.rate_limiter
+        self._onboarding_flow = OnboardingFlow(hash_service=self._services.hash_service)
+        self._scheduler_task: Optional[asyncio.Task] = None
+        self._started = False
+
+    # =============================================================================
+    # Lifecycle
+    # =============================================================================
+
+    async def startup(self) -> None:
+        """
+        Resolve shared services once, before the first update.
+
+        Services that were not injected fall back to the global instances.
+        """
+        if self._started:
+            return
+
+        services = self._services
+        if services.registry is None:
+            services.registry = get_registry()
+        if services.callback_router is None:
+            services.callback_router = get_callback_router()
+        if services.intent_router is None:
+            from src.core.intent_router import get_intent_router
+            services.intent_router = get_intent_router()
+        if self._nli_service is None:
+            self._nli_service = services.intent_router
+        if services.hash_service is None:
+            services.hash_service = get_hash_service()
+        if services.encryption is None:
+            try:
+                services.encryption = get_encryption_service()
+            except EncryptionServiceError as e:
+                logger.warning(f"Encryption service unavailable: {e}")
+        if services.redis is None:
+            from src.services.redis_service import get_redis_service
+            services.redis = get_redis_service()
+        if services.deduplicator is None:
+            services.deduplicator = UpdateDeduplicator(redis=services.redis)
+        self._start_write_behind(services)
+        redis_client = await services.redis.get_client()
+        self._start_event_scheduler(services, redis_client)
+        await self._start_neurostate_stores(redis_client)
+        await self._start_checkpointer(services, redis_client)
+        await self._start_morning_prerender(services, redis_client)
+
+        self._started = True
+        logger.info("Webhook handler started")
+
+    @staticmethod
+    def _start_write_behind(services: WebhookServices) -> None:
+        """Install the write-behind buffer that services default their writer to."""
+        from src.services.write_behind import WriteBehindBuffer, set_write_behind_buffer
+
+        if services.write_behind is None:
+            services.write_behind = WriteBehindBuffer(session_factory=services.session_factory)
+        set_write_behind_buffer(services.write_behind)
+
+    def _start_event_scheduler(self, services: WebhookServices, redis_client: Any) -> None:
+        """Install the (Redis-backed) event scheduler and start its poll loop."""
+        from src.workflows.scheduler import DailyEventScheduler, set_event_scheduler
+
+        if services.event_scheduler is None:
+            services.event_scheduler = DailyEventScheduler(redis_client=redis_client)
+        set_event_scheduler(services.event_scheduler)
+        self._scheduler_task = asyncio.create_task(
+            services.event_scheduler.run(self._handle_due_events)
+        )
+
+    async def _handle_due_events(self, events: list[Any]) -> None:
+        """Send the Daily Workflow message of each due event (scheduler handler)."""
+        from src.workflows.daily_workflow import get_daily_workflow
+
+        workflow = get_daily_workflow()
+        sender = get_outbound_sender()
+        for event in events:
+            try:
+                text = await workflow.run_scheduled_event(
+                    event.user_id, event.kind.value, event.segment_code, event.local_date
+                )
+            except Exception as e:
+                logger.error(
+                    f"Scheduled {event.kind.value} event failed for user {event.user_id}: "
+                    f"{type(e).__name__}",
+                    exc_info=True,
+                )
+                continue
+            if sender is None:
+                logger.warning(f"No outbound sender, dropping scheduled {event.kind.value} event")
+                continue
+            # Scheduled users are keyed by Telegram user ID, i.e. their private chat
+            sender.enqueue(event.user_id, text, SendPriority.SCHEDULED)
+
+    @staticmethod
+    async def _start_neurostate_stores(client: Any) -> None:
+        """Keep energy baselines and masking aggregates in Redis; reconcile baselines every night."""
+        from src.services.neurostate.energy_baseline import (
+            EnergyBaselineStore,
+            reconcile_energy_baselines,
+            set_energy_baseline_store,
+        )
+        from src.services.neurostate.masking_aggregate import MaskingLoadStore, set_masking_load_store
+        from src.workflows.scheduler import get_event_scheduler
+
+        if client is not None:
+            # Same client: the snapshot loader reads both with one MGET
+            set_energy_baseline_store(EnergyBaselineStore(redis_client=client))
+            set_masking_load_store(MaskingLoadStore(redis_client=client))
+        else:
+            logger.warning("Redis unavailable, energy baselines and masking aggregates kept in process memory")
+        await get_event_scheduler().schedule_nightly_job(
+            "reconcile_energy_baselines", reconcile_energy_baselines
+        )
+
+    @staticmethod
+    async def _start_checkpointer(services: WebhookServices, client: Any) -> None:
+        """Install the daily graph checkpointer and purge its memory fallback nightly."""
+        from src.workflows.checkpoint import DailyGraphCheckpointer, set_daily_checkpointer
+        from src.workflows.scheduler import get_event_scheduler
+
+        if services.checkpointer is None:
+            if client is not None:
+                # Own binary client: the shared one decodes responses to str
+                redis_url = os.environ.get("REDIS_URL", "redis://localhost:6379/0")
+                services.checkpointer = DailyGraphCheckpointer.from_url(redis_url)
+            else:
+                logger.warning("Redis unavailable, daily graph checkpoints kept in process memory")
+                services.checkpointer = DailyGraphCheckpointer()
+        set_daily_checkpointer(services.checkpointer)
+        await get_event_scheduler().schedule_nightly_job(
+            "purge_checkpoint_memory", services.checkpointer.purge_memory
+        )
+
+    @staticmethod
+    async def _start_morning_prerender(services: WebhookServices, client: Any) -> None:
+        """Share pre-rendered mornings through Redis and render them every night."""
+        from src.workflows.prerender import (
+            MorningRenderStore,
+            prerender_upcoming_mornings,
+            set_morning_store,
+        )
+        from src.workflows.scheduler import get_event_scheduler
+
+        if client is not None:
+            set_morning_store(MorningRenderStore(redis_client=client, encryption=services.encryption))
+        await get_event_scheduler().schedule_nightly_job(
+            "prerender_mornings", prerender_upcoming_mornings
+        )
 
-    async def handle_update(self, update: Update) -> None:
+    async def shutdown(self) -> None:
+        """Stop the scheduler, flush buffered writes and release shared connections (once, at application shutdown)."""
+        from src.models.database import dispose_engine
+        from src.services.write_behind import close_write_behind_buffer
+
+        if self._scheduler_task is not None:
+            self._scheduler_task.cancel()
+            try:
+                await self._scheduler_task
+            except asyncio.CancelledError:
+                pass
+            self._scheduler_task = None
+        await close_write_behind_buffer()
+        self._services.write_behind = None
+        if self._services.checkpointer is not None:
+            from src.workflows.checkpoint import set_daily_checkpointer
+
+            await self._services.checkpointer.aclose()
+            set_daily_checkpointer(None)
+            self._services.checkpointer = None
+        # After the last flush: close the shared database pool
+        await dispose_engine()
+        redis_service = self._services.redis
+        if redis_service is not None and redis_service.client is not None:
+            await redis_service.client.aclose()
+        self._started = False
+        logger.info("Webhook handler stopped")
+
+    async def handle_update(self, update: Union[Update, LiteUpdate]) -> None:
         """
         Main entry point for handling Telegram updates.
 
         This is the core handler that:
-        1. Extracts message and user info
-        2. Validates consent (SW-15)
-        3. Routes through NLI
-        4. Returns response
+        1. Drops replayed updates (update_id dedup)
+        2. Extracts message and user info
+        3. Validates consent (SW-15)
+        4. Routes button presses to their module, messages through NLI
+        5. Returns response
 
         Args:
-            update: Telegram Update object
+            update: Telegram Update, or a LiteUpdate from the fast-path parser
         """
+        # Drop Telegram replays before rate limiting and the consent gate
+        deduplicator = self._services.deduplicator
+        if deduplicator is not None and await deduplicator.is_duplicate(update.update_id):
+            return
+
+        if isinstance(update, LiteUpdate):
+            await self._handle_lite_update(update)
+            return
+
         if not update.message and not update.callback_query:
             logger.warning("Received update without message or callback_query")
             return
@@ -95,11 +349,11 @@ class TelegramWebhookHandler:
         # =============================================================================
         user = update.effective_user
         if user:
-            rate_limiter = RateLimiter()
-            # Check message rate limit (30/min, 100/hour)
-            if not rate_limiter.check_rate_limit(user.id, "message"):
+            # Check chat rate limit (30/min, 100/hour)
+            allowed = await self._rate_limiter.check_rate_limit(user.id, RateLimitTier.CHAT.value)
+            if not allowed:
                 logger.warning(f"Rate limit exceeded for user {user.id}")
-                await update.message.reply_text(
+                await update.effective_message.reply_text(
                     "You're sending messages too quickly. Please wait a moment."
                 )
                 return
@@ -110,8 +364,7 @@ class TelegramWebhookHandler:
             logger.warning("Update has no effective_user")
             return
 
-        telegram_id = str(user.id)
-        telegram_id_hash = hash_telegram_id(telegram_id)
+        telegram_id_hash = self._hash_telegram_id(user.id)
 
         # =============================================================================
         # F-001: Consent gate - Block all non-onboarding until consent is VALID
@@ -126,7 +379,7 @@ class TelegramWebhookHandler:
 
         # Check consent gate (SW-15 / GDPR Art. 9)
         consent_result = await self._check_consent(user_record.id)
-        if consent_result.status != ConsentStatus.VALID:
+        if consent_result != ConsentStatus.VALID:
             # Block processing until valid consent
             await self._request_consent(update, user_record)
             return
@@ -137,8 +390,79 @@ class TelegramWebhookHandler:
         # For extra security in production, verify X-Telegram-Bot-Api-Secret-Token header
         # =============================================================================
 
+        # Button presses go straight to their module (no intent detection)
+        if update.callback_query is not None:
+            await self._route_callback(
+                update.callback_query.data,
+                user.id,
+                update.effective_chat.id,
+                user.language_code,
+                update.callback_query.answer,
+                update.effective_message.reply_text,
+                user_record,
+            )
+            return
+
         # Route through NLI
-        await self._route_through_nli(update, user)
+        await self._route_through_nli(update, user, user_record)
+
+    async def _handle_lite_update(self, update: LiteUpdate) -> None:
+        """
+        Handle a fast-path text message or callback query.
+
+        Same gates as handle_update(); the full telegram.Update is only
+        built for onboarding and the consent request.
+
+        Args:
+            update: LiteUpdate from parse_update()
+        """
+        allowed = await self._rate_limiter.check_rate_limit(
+            update.user_id, RateLimitTier.CHAT.value
+        )
+        if not allowed:
+            logger.warning(f"Rate limit exceeded for user {update.user_id}")
+            await update.reply_text("You're sending messages too quickly. Please wait a moment.")
+            return
+
+        telegram_id_hash = self._hash_telegram_id(update.user_id)
+        user_record = await self._get_user_by_telegram_hash(telegram_id_hash)
+
+        if user_record is None:
+            full = update.to_update()
+            await self._handle_onboarding(full, full.effective_user, telegram_id_hash)
+            return
+
+        consent_result = await self._check_consent(user_record.id)
+        if consent_result != ConsentStatus.VALID:
+            await self._request_consent(update.to_update(), user_record)
+            return
+
+        if update.is_callback:
+            await self._route_callback(
+                update.callback_data,
+                update.user_id,
+                update.chat_id,
+                update.language_code,
+                update.answer_callback_query,
+                update.reply_text,
+                user_record,
+            )
+        elif update.text is not None:
+            await self._route_text(
+                update.text,
+                update.user_id,
+                update.chat_id,
+                update.language_code,
+                update.reply_text,
+                user_record,
+            )
+
+    def _hash_telegram_id(self, user_id: int) -> str:
+        """Hash a Telegram user ID with the injected (or global) hash service."""
+        telegram_id = str(user_id)
+        if self._services.hash_service is not None:
+            return self._services.hash_service.hash_pii(telegram_id)
+        return hash_telegram_id(telegram_id)
 
     # =============================================================================
     # Helper Methods for Consent and User Management
@@ -206,30 +530,203 @@ class TelegramWebhookHandler:
         # Start onboarding flow
         await self._onboarding_flow.start(update, user, telegram_id_hash)
 
-    async def _route_through_nli(self, update: Update, user: Any) -> None:
+    async def _route_through_nli(
+        self,
+        update: Update,
+        user: Any,
+        user_record: Any = None,
+    ) -> None:
         """
         Route message through the NLI (Intent Router).
 
         This is where the magic happens:
         1. Extract message text
-        2. Pass to Intent Router
-        3. Route to appropriate module
+        2. Pass to Intent Router (regex fast path, LLM fallback on a miss)
+        3. Route to appropriate module, or ask one clarifying question
         4. Send response
 
         Args:
             update: Telegram Update
             user: Telegram user object
+            user_record: User record from the database (optional)
         """
         # Extract message text
         message_text = update.message.text if update.message else ""
         if not message_text:
             return
 
-        # TODO: Implement actual NLI routing
-        # For now, just echo back (scaffold)
-        response_text = f"Echo: {message_text}"
+        await self._route_text(
+            message_text,
+            user.id,
+            update.effective_chat.id,
+            user.language_code,
+            update.message.reply_text,
+            user_record,
+        )
+
+    async def _route_text(
+        self,
+        message_text: str,
+        user_id: int,
+        chat_id: int,
+        language_code: Optional[str],
+        reply: Callable[[str], Awaitable[Any]],
+        user_record: Any = None,
+    ) -> None:
+        """
+        Classify a message, route it to its module and send the response.
+
+        Args:
+            message_text: Message text
+            user_id: Telegram user ID
+            chat_id: Chat to respond in
+            language_code: Telegram locale of the user
+            reply: Coroutine function replying in the update's chat
+            user_record: User record from the database (optional)
+        """
+        if self._nli_service is None:
+            from src.core.intent_router import get_intent_router
+            self._nli_service = get_intent_router()
+
+        await self._record_interaction(user_id, user_record)
+        await self._observe_channels(user_id, message_text, user_record)
+
+        registry = self._services.registry or get_registry()
+        match = await self._nli_service.classify(message_text)
+        module = registry.route(match.intent) if match.intent else None
+
+        if module is None or self._nli_service.needs_clarification(match):
+            # Low confidence: ask one clarifying question instead of guessing
+            await reply(
+                "I'm not sure what you'd like to do. "
+                "Do you want to plan, review, or capture something?"
+            )
+            return
+
+        ctx = self._module_context(
+            module.name,
+            user_id,
+            language_code,
+            user_record,
+            metadata={"intent": match.intent, "intent_source": match.source},
+        )
+        response = await module.on_enter(ctx)
+        await self._send_response(chat_id, response.text, reply)
+
+    @staticmethod
+    async def _record_interaction(user_id: int, user_record: Any) -> None:
+        """
+        Keep the user's daily events in step with their profile and re-score
+        interval check-ins from this message.
+
+        Args:
+            user_id: Telegram user ID (the scheduler's key: their private chat)
+            user_record: User record from the database (optional)
+        """
+        from src.workflows.scheduler import get_event_scheduler
+
+        scheduler = get_event_scheduler()
+        segment_code = getattr(user_record, "working_style_code", None)
+        if segment_code:
+            # Picks up segment and timezone changes
+            await scheduler.ensure_user(
+                user_id, segment_code, getattr(user_record, "timezone", None) or "UTC"
+            )
+        await scheduler.record_interaction(user_id, datetime.now(timezone.utc))
+
+    async def _observe_channels(self, user_id: int, message_text: str, user_record: Any) -> None:
+        """
+        Update an AuDHD user's channel dominance scores with this message.
+
+        Only AuDHD users have a variable dominant channel; other segments
+        are skipped so their messages cost no score write.
 
-        await update.message.reply_text(response_text)
+        Args:
+            user_id: Telegram user ID
+            message_text: Message text
+            user_record: User record from the database (optional)
+        """
+        if getattr(user_record, "working_style_code", None) != "AH":
+            return
+        from src.services.neurostate.channel import ChannelDominanceDetector
+
+        detector = ChannelDominanceDetector(self._db_session)
+        await detector.observe_message(user_record.id, message_text)
+
+    async def _route_callback(
+        self,
+        callback_data: Optional[str],
+        user_id: int,
+        chat_id: int,
+        language_code: Optional[str],
+        answer: Callable[..., Awaitable[Any]],
+        reply: Callable[[str], Awaitable[Any]],
+        user_record: Any = None,
+    ) -> None:
+        """
+        Dispatch an inline button press straight to its module.
+
+        Args:
+            callback_data: callback_data of the pressed button
+            user_id: Telegram user ID
+            chat_id: Chat to respond in
+            language_code: Telegram locale of the user
+            answer: Coroutine function answering the callback query
+            reply: Coroutine function replying in the update's chat
+            user_record: User record from the database (optional)
+        """
+        router = self._services.callback_router or get_callback_router()
+        action = await router.decode(callback_data)
+        # Always answer, so the button stops spinning
+        await answer()
+        if action is None:
+            # Not a module button (e.g. an onboarding keyboard) or expired
+            return
+
+        ctx = self._module_context(
+            action.module,
+            user_id,
+            language_code,
+            user_record,
+            metadata={"intent_source": "callback", "callback_action": action.action},
+        )
+        response = await router.dispatch(action, ctx, self._services.registry or get_registry())
+        if response is not None:
+            await self._send_response(chat_id, response.text, reply)
+
+    @staticmethod
+    def _module_context(
+        module_name: str,
+        user_id: int,
+        language_code: Optional[str],
+        user_record: Any,
+        metadata: Dict[str, Any],
+    ) -> ModuleContext:
+        """Build the ModuleContext for a routed message or button press."""
+        return ModuleContext(
+            user_id=user_record.id if user_record else user_id,
+            segment_context=SegmentContext.from_code(
+                getattr(user_record, "working_style_code", None) or "NT"
+            ),
+            state="idle",
+            session_id=str(uuid.uuid4()),
+            language=getattr(user_record, "language", None) or language_code or "en",
+            module_name=module_name,
+            metadata=metadata,
+        )
+
+    @staticmethod
+    async def _send_response(
+        chat_id: int,
+        text: str,
+        reply: Callable[[str], Awaitable[Any]],
+    ) -> None:
+        """Send a module response through the outbound sender, else reply directly."""
+        sender = get_outbound_sender()
+        if sender is not None:
+            sender.enqueue(chat_id, text, SendPriority.RESPONSE)
+        else:
+            await reply(text)
 
     async def _handle_onboarding(
         self,
@@ -265,6 +762,16 @@ class TelegramWebhookHandler:
         # Process current step
         await self._onboarding_flow.process_step(update)
 
+        # Just completed with consent: start the user's daily events
+        if (
+            state != OnboardingStates.COMPLETED
+            and await self._onboarding_flow.get_state(telegram_id_hash) == OnboardingStates.COMPLETED
+        ):
+            user_data = self._onboarding_flow.get_user_data(telegram_id_hash) or {}
+            if user_data.get("consented") and user_data.get("segment"):
+                from src.workflows.scheduler import get_event_scheduler
+                await get_event_scheduler().schedule_user(user.id, user_data["segment"])
+
     async def _get_user_by_telegram_hash(self, telegram_id_hash: str) -> Optional[Any]:
         """
         Get user from database by hashed Telegram ID.
@@ -306,25 +813,229 @@ class TelegramWebhookHandler:
 # =============================================================================
 
 
+# =============================================================================
+# Per-User Mailbox Dispatcher
+# =============================================================================
+
+
+@dataclass
+class _Mailbox:
+    """Pending updates of one user, drained by a single worker task."""
+
+    pending: Deque[tuple[Update, asyncio.Future]] = field(default_factory=deque)
+    worker: Optional[asyncio.Task] = None
+
+
+class UserMailboxDispatcher:
+    """
+    Dispatches updates to per-user mailboxes.
+
+    - Updates of one user are handled strictly in arrival order (one at a
+      time), so per-user state (planning sessions, onboarding, tension) is
+      never touched by two updates at once.
+    - Different users are handled concurrently, up to `max_concurrency`
+      updates in flight across all users.
+    - A mailbox exists only while it has pending updates: its worker exits
+      and the mailbox is reclaimed as soon as it drains.
+    """
+
+    DEFAULT_MAX_CONCURRENCY = 64
+
+    def __init__(
+        self,
+        handler: Callable[[Update], Awaitable[None]],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        """
+        Initialize the dispatcher.
+
+        Args:
+            handler: Coroutine function that handles one update
+            max_concurrency: Maximum number of updates handled at once (across users)
+        """
+        self._handler = handler
+        self._max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._mailboxes: Dict[Any, _Mailbox] = {}
+
+    @staticmethod
+    def mailbox_key(update: Update) -> Any:
+        """Key of the mailbox an update belongs to (user, else chat)."""
+        if isinstance(update, LiteUpdate):
+            return update.user_id
+        if update.effective_user is not None:
+            return update.effective_user.id
+        if update.effective_chat is not None:
+            return ("chat", update.effective_chat.id)
+        return None
+
+    def submit(self, update: Update) -> asyncio.Future:
+        """Queue an update in its user's mailbox.
+
+        Args:
+            update: Telegram Update
+
+        Returns:
+            Future resolving to True once the update was handled
+            successfully (False if the handler raised)
+        """
+        key = self.mailbox_key(update)
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+
+        mailbox = self._mailboxes.get(key)
+        if mailbox is None:
+            mailbox = _Mailbox()
+            self._mailboxes[key] = mailbox
+        mailbox.pending.append((update, future))
+
+        if mailbox.worker is None:
+            mailbox.worker = asyncio.create_task(self._drain(key, mailbox))
+        return future
+
+    async def _drain(self, key: Any, mailbox: _Mailbox) -> None:
+        """Handle a mailbox's updates in order, then reclaim it."""
+        try:
+            while mailbox.pending:
+                update, future = mailbox.pending.popleft()
+                async with self._semaphore:
+                    try:
+                        await self._handler(update)
+                        success = True
+                    except Exception as e:
+                        logger.error(
+                            f"Update {update.update_id} failed: {type(e).__name__}",
+                            exc_info=True,
+                        )
+                        success = False
+                if not future.done():
+                    future.set_result(success)
+        finally:
+            # No await between the last empty check and removal, so a
+            # concurrent submit() either landed in `pending` or sees no mailbox
+            if self._mailboxes.get(key) is mailbox:
+                del self._mailboxes[key]
+            for _update, future in mailbox.pending:
+                if not future.done():
+                    future.set_result(False)
+
+    async def join(self) -> None:
+        """Wait until all mailboxes have drained."""
+        while self._mailboxes:
+            workers = [m.worker for m in self._mailboxes.values() if m.worker is not None]
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    @property
+    def active_mailboxes(self) -> int:
+        """Number of users with pending or in-flight updates."""
+        return len(self._mailboxes)
+
+    @property
+    def pending_updates(self) -> int:
+        """Number of queued updates not yet started."""
+        return sum(len(m.pending) for m in self._mailboxes.values())
+
+
+# Global handler instance (application-scoped)
+_webhook_handler: Optional[TelegramWebhookHandler] = None
+
+
+def get_webhook_handler() -> TelegramWebhookHandler:
+    """
+    Get the application-scoped webhook handler.
+
+    Returns:
+        The global TelegramWebhookHandler instance
+    """
+    global _webhook_handler
+    if _webhook_handler is None:
+        _webhook_handler = TelegramWebhookHandler()
+    return _webhook_handler
+
+
+def set_webhook_handler(handler: TelegramWebhookHandler) -> None:
+    """
+    Set the application-scoped webhook handler.
+
+    Args:
+        handler: The TelegramWebhookHandler to use globally
+    """
+    global _webhook_handler
+    _webhook_handler = handler
+
+
+async def _handle_update(update: Update) -> None:
+    """Handle one update with the application-scoped webhook handler."""
+    await get_webhook_handler().handle_update(update)
+
+
+# Global dispatcher instance
+_dispatcher: Optional[UserMailboxDispatcher] = None
+
+
+def get_dispatcher() -> UserMailboxDispatcher:
+    """
+    Get the global update dispatcher.
+
+    The concurrency cap is read from AURORA_MAX_CONCURRENT_UPDATES.
+
+    Returns:
+        The global UserMailboxDispatcher instance
+    """
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = UserMailboxDispatcher(
+            handler=_handle_update,
+            max_concurrency=int(
+                os.environ.get(
+                    "AURORA_MAX_CONCURRENT_UPDATES",
+                    UserMailboxDispatcher.DEFAULT_MAX_CONCURRENCY,
+                )
+            ),
+        )
+    return _dispatcher
+
+
 async def webhook_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """
     Main webhook handler for Telegram bot.
 
     This function is called for every incoming Telegram update.
-    It delegates to the TelegramWebhookHandler class.
+    It queues the update in its user's mailbox and returns immediately;
+    the dispatcher delegates to the TelegramWebhookHandler class.
 
     Args:
         update: Telegram Update
         context: Telegram context
     """
-    handler = TelegramWebhookHandler()
-    await handler.handle_update(update)
+    get_dispatcher().submit(update)
+
 
+async def _on_startup(application: Application) -> None:
+    """Application post_init hook: start the shared webhook handler and sender."""
+    await get_webhook_handler().startup()
+    sender = OutboundSender.for_bot(application.bot)
+    await sender.start()
+    set_outbound_sender(sender)
 
-def create_app() -> Application:
+
+async def _on_shutdown(application: Application) -> None:
+    """Application post_shutdown hook: drain updates and sends, then release services."""
+    await get_dispatcher().join()
+    sender = get_outbound_sender()
+    if sender is not None:
+        await sender.stop()
+        set_outbound_sender(None)
+    await get_webhook_handler().shutdown()
+
+
+def create_app(services: Optional[WebhookServices] = None) -> Application:
     """
     Create and configure the Telegram Application.
 
+    Args:
+        services: Shared services for the webhook handler (defaults to the
+            global instances)
+
     Returns:
         Configured telegram.ext.Application
     """
@@ -336,7 +1047,23 @@ def create_app() -> Application:
         raise ValueError("TELEGRAM_BOT_TOKEN environment variable is required")
 
     # Create application
-    application = Application.builder().token(bot_token).build()
+    # Updates are accepted concurrently; per-user ordering is enforced by
+    # the mailbox dispatcher
+    application = (
+        Application.builder()
+        .token(bot_token)
+        .concurrent_updates(True)
+        .post_init(_on_startup)
+        .post_shutdown(_on_shutdown)
+        .build()
+    )
+
+    # One handler for the application's lifetime
+    set_webhook_handler(TelegramWebhookHandler(services=services))
+
+    # Modules are registered lazily; each is imported on its first routed intent
+    from src.modules import register_builtin_modules
+    register_builtin_modules()
 
     # Add handlers
     application.add_handler(
@@ -346,10 +1073,22 @@ def create_app() -> Application:
         )
     )
 
+    # Inline button presses (module buttons and the onboarding keyboards)
+    application.add_handler(CallbackQueryHandler(webhook_handler))
+
     # Add command handlers
     application.add_handler(CommandHandler("start", webhook_handler))
     application.add_handler(CommandHandler("help", webhook_handler))
 
+    # Slash command aliases are routed as intents by the Intent Router
+    from src.core.intent_router import COMMAND_ALIASES
+    application.add_handler(
+        CommandHandler(
+            [command.lstrip("/") for command in COMMAND_ALIASES if command != "/help"],
+            webhook_handler,
+        )
+    )
+
     return application
 
 
@@ -370,13 +1109,17 @@ async def process_telegram_update(update: Update) -> str:
     Returns:
         Response text to send back to user
     """
-    handler = TelegramWebhookHandler()
-    await handler.handle_update(update)
+    await get_webhook_handler().handle_update(update)
     return "OK"
 
 
 __all__ = [
     "TelegramWebhookHandler",
+    "WebhookServices",
+    "get_webhook_handler",
+    "set_webhook_handler",
+    "UserMailboxDispatcher",
+    "get_dispatcher",
     "webhook_handler",
     "create_app",
     "process_telegram_update",
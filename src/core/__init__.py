@@ -8,6 +8,8 @@ Reference: ARCHITECTURE.md Section 2 (Module System)
 Exports:
     - Module: Protocol that all modules implement
     - ModuleRegistry: Discovers and routes to modules
+    - IntentRouter: Two-stage intent detection (regex fast path + LLM fallback)
+    - CallbackRouter: Compact callback_data codec and button dispatch
     - ModuleContext: Context passed to module operations
     - ModuleResponse: Response returned by module operations
     - DailyWorkflowHooks: Module hooks for daily workflow
@@ -17,6 +19,14 @@ Exports:
 
 from .module_protocol import Module
 from .module_registry import ModuleRegistry, get_registry, set_registry
+from .intent_router import IntentRouter, IntentMatch, get_intent_router, set_intent_router
+from .callback_router import (
+    CallbackAction,
+    CallbackRouter,
+    CallbackTokenError,
+    get_callback_router,
+    set_callback_router,
+)
 from .module_context import ModuleContext
 from .module_response import ModuleResponse
 from .daily_workflow_hooks import DailyWorkflowHooks, DailyWorkflowHook
@@ -30,7 +40,13 @@ from .segment_context import (
     WorkingStyleCode,
 )
 from .buttons import Button, ButtonRow, ButtonGrid, ButtonType
-from .side_effects import SideEffect, SideEffectType, SideEffectBatch, SideEffectExecutor
+from .side_effects import (
+    SideEffect,
+    SideEffectType,
+    SideEffectBatch,
+    SideEffectExecutor,
+    ConcurrentSideEffectExecutor,
+)
 
 
 __all__ = [
@@ -40,6 +56,17 @@ __all__ = [
     "ModuleRegistry",
     "get_registry",
     "set_registry",
+    # Intent Router
+    "IntentRouter",
+    "IntentMatch",
+    "get_intent_router",
+    "set_intent_router",
+    # Callback Router
+    "CallbackAction",
+    "CallbackRouter",
+    "CallbackTokenError",
+    "get_callback_router",
+    "set_callback_router",
     # Context & Response
     "ModuleContext",
     "ModuleResponse",
@@ -64,6 +91,7 @@ __all__ = [
     "SideEffectType",
     "SideEffectBatch",
     "SideEffectExecutor",
+    "ConcurrentSideEffectExecutor",
 ]
 
 
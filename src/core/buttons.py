@@ -12,6 +12,9 @@ from dataclasses import dataclass
 from typing import Optional
 from enum import Enum
 
+# Telegram's callback_data limit in bytes
+CALLBACK_DATA_LIMIT = 64
+
 
 class ButtonType(Enum):
     """Types of buttons supported."""
@@ -64,12 +67,44 @@ class Button:
 
         Args:
             text: Button text
-            callback_data: Callback data
+            callback_data: Callback data (at most 64 bytes)
 
         Returns:
             Button instance
+
+        Raises:
+            ValueError: If callback_data exceeds Telegram's 64-byte limit
         """
-        return cls(text=text, callback_data=callback_data)
+        if len(callback_data.encode("utf-8")) > CALLBACK_DATA_LIMIT:
+            raise ValueError(
+                f"callback_data exceeds {CALLBACK_DATA_LIMIT} bytes; use Button.action()"
+            )
+        # url=None explicitly: the url() factory shadows the field default
+        return cls(text=text, callback_data=callback_data, url=None)
+
+    @classmethod
+    def action(cls, text: str, module: str, action: str, *args: int | str) -> Button:
+        """Create an inline button dispatched straight to a module action.
+
+        The payload is encoded by the global CallbackRouter; presses skip
+        intent detection.
+
+        Args:
+            text: Button text
+            module: Owning module name
+            action: Callback action registered for the module
+            *args: Small arguments (ints and strings)
+
+        Returns:
+            Button instance
+        """
+        from .callback_router import get_callback_router
+
+        return cls(
+            text=text,
+            callback_data=get_callback_router().encode(module, action, *args),
+            url=None,
+        )
 
     @classmethod
     def url(cls, text: str, url: str) -> Button:
@@ -95,7 +130,12 @@ class Button:
         Returns:
             Button instance
         """
-        return cls(text=text, callback_data=f"switch_inline:{query}", button_type=ButtonType.SWITCH_INLINE)
+        return cls(
+            text=text,
+            callback_data=f"switch_inline:{query}",
+            url=None,
+            button_type=ButtonType.SWITCH_INLINE,
+        )
 
     def to_telegram_format(self) -> dict:
         """Convert to Telegram button format.
@@ -0,0 +1,461 @@
+"""
+Callback Router for Aurora Sun V1.
+
+Inline button presses carry a compact binary payload in callback_data that
+names the owning module, the action, and a few small arguments. A press is
+decoded and dispatched straight to the module (two table lookups), without
+intent detection.
+
+callback_data layout (Telegram allows 1-64 bytes):
+
+    "~" + base64url(module_id | action_id | args...)   inline payload
+    "#" + token                                        payload stored server-side
+
+module_id and action_id are single bytes. Each argument is a varint header
+(zigzag int << 1, or str byte length << 1 | 1) followed by the UTF-8 bytes
+for strings. Payloads that do not fit in 64 bytes are kept in Redis (shared
+by all workers, surviving restarts) under a short random token; the
+in-process state store is only a fallback while Redis is unreachable. callback_data without a prefix (e.g. the
+onboarding keyboards' "lang_en") is left to the regular handlers.
+
+IDs are persisted in messages users can still press days later: module IDs
+must never be reused, and action lists are append-only.
+
+Reference: ARCHITECTURE.md Section 2 (Module System)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+import logging
+import secrets
+from dataclasses import dataclass
+from typing import Any, Optional, Sequence, Union
+
+from .buttons import CALLBACK_DATA_LIMIT
+from .module_context import ModuleContext
+from .module_response import ModuleResponse
+
+logger = logging.getLogger(__name__)
+
+
+INLINE_PREFIX = "~"
+TOKEN_PREFIX = "#"
+
+# Action every module supports: re-enter the module (Module.on_enter)
+ENTER_ACTION = "enter"
+
+CallbackArg = Union[int, str]
+
+
+@dataclass(frozen=True)
+class CallbackAction:
+    """A decoded button press.
+
+    Attributes:
+        module: Name of the owning module
+        action: Action name within the module
+        args: Small arguments (ints and short strings)
+    """
+
+    module: str
+    action: str
+    args: tuple[CallbackArg, ...] = ()
+
+
+# =============================================================================
+# Binary Codec
+# =============================================================================
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, pos: int) -> tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def pack_payload(module_id: int, action_id: int, args: Sequence[CallbackArg] = ()) -> bytes:
+    """
+    Pack a button payload into bytes.
+
+    Args:
+        module_id: Module ID (0-255)
+        action_id: Action ID within the module (0-255)
+        args: Small arguments (ints and strings)
+
+    Returns:
+        Binary payload
+    """
+    out = bytearray((module_id, action_id))
+    for arg in args:
+        if isinstance(arg, bool) or not isinstance(arg, (int, str)):
+            raise TypeError(f"Callback arguments must be int or str, got {type(arg).__name__}")
+        if isinstance(arg, int):
+            zigzag = arg * 2 if arg >= 0 else -arg * 2 - 1
+            _write_varint(out, zigzag << 1)
+        else:
+            encoded = arg.encode("utf-8")
+            _write_varint(out, (len(encoded) << 1) | 1)
+            out += encoded
+    return bytes(out)
+
+
+def unpack_payload(data: bytes) -> tuple[int, int, tuple[CallbackArg, ...]]:
+    """
+    Unpack a binary payload built by pack_payload().
+
+    Args:
+        data: Binary payload
+
+    Returns:
+        (module_id, action_id, args)
+
+    Raises:
+        ValueError: If the payload is truncated or malformed
+    """
+    try:
+        module_id, action_id = data[0], data[1]
+        args: list[CallbackArg] = []
+        pos = 2
+        while pos < len(data):
+            header, pos = _read_varint(data, pos)
+            if header & 1:
+                end = pos + (header >> 1)
+                if end > len(data):
+                    raise ValueError("Truncated string argument")
+                args.append(data[pos:end].decode("utf-8"))
+                pos = end
+            else:
+                zigzag = header >> 1
+                args.append(zigzag >> 1 if not zigzag & 1 else -((zigzag + 1) >> 1))
+        return module_id, action_id, tuple(args)
+    except (IndexError, UnicodeDecodeError) as e:
+        raise ValueError(f"Malformed callback payload: {e}") from e
+
+
+# =============================================================================
+# Token Store
+# =============================================================================
+
+class CallbackTokenError(RuntimeError):
+    """Raised when an oversized payload cannot be stored under a token."""
+
+
+class RedisCallbackStore:
+    """
+    Oversized callback payloads in Redis, with an in-process fallback.
+
+    encode() runs while building keyboards (sync), so set() never waits on
+    Redis inside the event loop: the payload goes to the bounded state store
+    at once and is written to Redis in the background, after which the local
+    copy is dropped. Payload writes that Redis rejects stay local and are
+    logged: those tokens work only in this process until they expire.
+    Outside an event loop (scripts) set() writes through the sync client.
+    """
+
+    def __init__(self, redis_service: Any = None, fallback: Any = None):
+        """
+        Args:
+            redis_service: RedisService (defaults to the global service)
+            fallback: TTL store used until (or instead of) Redis (defaults to
+                the global state store)
+        """
+        self._redis_service = redis_service
+        self._fallback = fallback
+        self._writes: set[asyncio.Task[None]] = set()
+
+    def _redis(self) -> Any:
+        if self._redis_service is None:
+            from src.services.redis_service import get_redis_service
+            self._redis_service = get_redis_service()
+        return self._redis_service
+
+    def _local(self) -> Any:
+        if self._fallback is None:
+            from src.services.state_store import get_state_store
+            self._fallback = get_state_store()
+        return self._fallback
+
+    def set(self, key: str, value: bytes, ttl: Optional[int] = None) -> bool:
+        """Store a payload; False if neither Redis nor the fallback took it."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return self._set_blocking(key, value, ttl)
+
+        if not self._local().set(key, value, ttl=ttl):
+            return False
+        task = loop.create_task(self._write(key, value, ttl))
+        self._writes.add(task)
+        task.add_done_callback(self._writes.discard)
+        return True
+
+    async def _write(self, key: str, value: bytes, ttl: Optional[int]) -> None:
+        """Copy a locally stored payload to Redis (background task of set())."""
+        encoded = base64.b64encode(value).decode("ascii")
+        try:
+            if await self._redis().set(key, encoded, ttl=ttl):
+                self._local().delete(key)
+                return
+            logger.warning("Callback token not stored in Redis (unavailable), keeping it locally")
+        except Exception as e:
+            logger.warning(f"Callback token write to Redis failed, keeping it locally: {type(e).__name__}")
+
+    def _set_blocking(self, key: str, value: bytes, ttl: Optional[int]) -> bool:
+        encoded = base64.b64encode(value).decode("ascii")
+        try:
+            if self._redis().set_sync(key, encoded, ttl=ttl):
+                return True
+            logger.warning("Callback token not stored in Redis (unavailable), keeping it locally")
+        except Exception as e:
+            logger.warning(f"Callback token write to Redis failed, keeping it locally: {type(e).__name__}")
+        return bool(self._local().set(key, value, ttl=ttl))
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Load a payload (local copy first, then Redis)."""
+        value = self._local().get(key)
+        if value is not None:
+            return value
+        try:
+            raw = await self._redis().get(key)
+            if raw is not None:
+                return base64.b64decode(json.loads(raw))
+        except Exception as e:
+            logger.warning(f"Callback token read from Redis failed: {type(e).__name__}")
+        return None
+
+    async def flush(self) -> None:
+        """Wait for pending background writes (shutdown, tests)."""
+        if self._writes:
+            await asyncio.gather(*self._writes, return_exceptions=True)
+
+
+# =============================================================================
+# Callback Router
+# =============================================================================
+
+class CallbackRouter:
+    """
+    Encodes inline button payloads and dispatches presses to their module.
+
+    Usage:
+        router = get_callback_router()
+        router.register("planning", 1, ["pick_priority"])
+
+        button = Button.action("Top priority", "planning", "pick_priority", task_id)
+
+        # On press (webhook)
+        action = await router.decode(callback_query.data)
+        response = await router.dispatch(action, ctx)
+    """
+
+    TOKEN_TTL = 7 * 24 * 3600  # Buttons stay pressable for a week
+    TOKEN_BYTES = 9  # 12 URL-safe characters
+    TOKEN_KEY_PREFIX = "aurora:callback:"
+
+    def __init__(self, store: Any = None, token_ttl: int = TOKEN_TTL):
+        """
+        Initialize an empty router.
+
+        Args:
+            store: TTL store with set(key, value, ttl) -> bool and async
+                get(key) for oversized payloads (defaults to a RedisCallbackStore)
+            token_ttl: Lifetime of stored payloads in seconds
+        """
+        self._store = store
+        self._token_ttl = token_ttl
+        # module name -> (module_id, {action name -> action_id})
+        self._modules: dict[str, tuple[int, dict[str, int]]] = {}
+        # module_id -> (module name, [action names by id])
+        self._by_id: dict[int, tuple[str, list[str]]] = {}
+
+    def register(self, module_name: str, module_id: int, actions: Sequence[str] = ()) -> None:
+        """
+        Register a module's callback actions.
+
+        Action IDs are list positions; ENTER_ACTION is always action 0.
+
+        Args:
+            module_name: Module name (as in the module registry)
+            module_id: Stable module ID (1-255, never reused)
+            actions: Action names (append-only)
+
+        Raises:
+            ValueError: If the module ID is taken or out of range
+        """
+        if not 1 <= module_id <= 255:
+            raise ValueError(f"Callback module ID must be 1-255, got {module_id}")
+        owner = self._by_id.get(module_id)
+        if owner is not None and owner[0] != module_name:
+            raise ValueError(
+                f"Callback module ID {module_id} already used by '{owner[0]}'"
+            )
+
+        names = [ENTER_ACTION] + [a for a in actions if a != ENTER_ACTION]
+        if len(names) > 256:
+            raise ValueError(f"Module '{module_name}' has more than 256 callback actions")
+        self._modules[module_name] = (module_id, {name: i for i, name in enumerate(names)})
+        self._by_id[module_id] = (module_name, names)
+
+    def is_registered(self, module_name: str) -> bool:
+        """Check if a module has callback actions registered."""
+        return module_name in self._modules
+
+    # =========================================================================
+    # Encoding
+    # =========================================================================
+
+    def encode(self, module_name: str, action: str, *args: CallbackArg) -> str:
+        """
+        Build callback_data for a button.
+
+        Args:
+            module_name: Owning module
+            action: Registered action name
+            *args: Small arguments (ints and strings)
+
+        Returns:
+            callback_data of at most CALLBACK_DATA_LIMIT bytes
+
+        Raises:
+            KeyError: If the module or action is not registered
+            CallbackTokenError: If an oversized payload cannot be stored
+        """
+        module_id, actions = self._modules[module_name]
+        payload = pack_payload(module_id, actions[action], args)
+
+        data = INLINE_PREFIX + base64.urlsafe_b64encode(payload).rstrip(b"=").decode("ascii")
+        if len(data) <= CALLBACK_DATA_LIMIT:
+            return data
+
+        token = secrets.token_urlsafe(self.TOKEN_BYTES)
+        if not self._get_store().set(self.TOKEN_KEY_PREFIX + token, payload, ttl=self._token_ttl):
+            # A token without its payload would be a dead button
+            raise CallbackTokenError(f"Could not store callback payload for {module_name}.{action}")
+        return TOKEN_PREFIX + token
+
+    async def decode(self, data: Optional[str]) -> Optional[CallbackAction]:
+        """
+        Decode callback_data built by encode().
+
+        Args:
+            data: callback_data from a callback query
+
+        Returns:
+            CallbackAction, or None for foreign, malformed, unknown or
+            expired payloads
+        """
+        if not data:
+            return None
+
+        prefix = data[0]
+        if prefix == INLINE_PREFIX:
+            encoded = data[1:]
+            try:
+                payload = base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4))
+            except ValueError:
+                return None
+        elif prefix == TOKEN_PREFIX:
+            payload = await self._get_store().get(self.TOKEN_KEY_PREFIX + data[1:])
+            if payload is None:
+                logger.info("Callback token expired or unknown")
+                return None
+        else:
+            return None
+
+        try:
+            module_id, action_id, args = unpack_payload(payload)
+        except ValueError:
+            logger.warning("Malformed callback payload")
+            return None
+
+        entry = self._by_id.get(module_id)
+        if entry is None or action_id >= len(entry[1]):
+            logger.warning(f"Unknown callback action {module_id}/{action_id}")
+            return None
+        module_name, actions = entry
+        return CallbackAction(module=module_name, action=actions[action_id], args=args)
+
+    def _get_store(self) -> Any:
+        if self._store is None:
+            self._store = RedisCallbackStore()
+        return self._store
+
+    # =========================================================================
+    # Dispatch
+    # =========================================================================
+
+    async def dispatch(
+        self,
+        action: CallbackAction,
+        ctx: ModuleContext,
+        registry: Any = None,
+    ) -> Optional[ModuleResponse]:
+        """
+        Hand a button press to its module.
+
+        ENTER_ACTION calls on_enter(); any other action calls
+        handle(action, ctx) with the arguments in ctx.metadata["callback_args"].
+
+        Args:
+            action: Decoded button press
+            ctx: Module context for the user
+            registry: Module registry (defaults to the global registry)
+
+        Returns:
+            The module's response, or None if the module is not registered
+        """
+        if registry is None:
+            from .module_registry import get_registry
+            registry = get_registry()
+
+        module = registry.get_module(action.module)
+        if module is None:
+            logger.warning(f"Callback for unregistered module '{action.module}'")
+            return None
+
+        ctx.metadata["callback_args"] = action.args
+        if action.action == ENTER_ACTION:
+            return await module.on_enter(ctx)
+        return await module.handle(action.action, ctx)
+
+
+# Global router instance
+_callback_router: Optional[CallbackRouter] = None
+
+
+def get_callback_router() -> CallbackRouter:
+    """
+    Get the global callback router.
+
+    Returns:
+        The global CallbackRouter instance
+    """
+    global _callback_router
+    if _callback_router is None:
+        _callback_router = CallbackRouter()
+    return _callback_router
+
+
+def set_callback_router(router: CallbackRouter) -> None:
+    """
+    Set the global callback router.
+
+    Args:
+        router: The CallbackRouter to use globally
+    """
+    global _callback_router
+    _callback_router = router
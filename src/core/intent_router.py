@@ -0,0 +1,517 @@
+"""
+Intent Router for Aurora Sun V1.
+
+Two-stage intent detection for the Natural Language Interface:
+
+1. Regex fast path (~70% of inputs): every intent pattern is compiled into
+   ONE alternation with a named group per pattern. A single `search()` over
+   the normalized message yields the intent and its confidence.
+2. LLM fallback (~30%): only on a fast-path miss, the message is classified
+   by a lightweight model (Haiku). Results are kept in a bounded LRU cache
+   keyed by the normalized text, so repeated phrasings never hit the LLM twice.
+
+The router outputs an intent plus confidence. High confidence auto-routes
+via ModuleRegistry.route(); low confidence asks one clarifying question.
+
+Reference: ARCHITECTURE.md Section 4 (Layer 1: Natural Language Interface)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .module_registry import ModuleRegistry
+
+
+logger = logging.getLogger(__name__)
+
+
+# Type for the LLM fallback: (normalized text, candidate intents) -> (intent, confidence)
+IntentClassifier = Callable[[str, list[str]], Awaitable[Optional[tuple[str, float]]]]
+
+
+# =============================================================================
+# Default Patterns
+# =============================================================================
+
+# Slash commands are syntactic sugar for intents (ARCHITECTURE.md Section 4)
+COMMAND_ALIASES: dict[str, str] = {
+    "/plan": "planning.start",
+    "/review": "review.start",
+    "/capture": "capture.quick",
+    "/habits": "habit.list",
+    "/beliefs": "belief.list",
+    "/money": "money.start",
+    "/budget": "money.budget",
+    "/growth": "aurora.growth",
+    "/help": "meta.help",
+}
+
+# (intent, regex fragment, confidence). Fragments are matched against the
+# normalized (casefolded, whitespace-collapsed) message and must not contain
+# named groups. Order within equal confidence is the tie-breaker.
+DEFAULT_INTENT_PATTERNS: list[tuple[str, str, float]] = [
+    # Slash command aliases (exact)
+    *[
+        (intent, rf"^{re.escape(command)}(?:@\w+)?\b", 1.0)
+        for command, intent in COMMAND_ALIASES.items()
+    ],
+    # Planning
+    ("planning.start", r"\b(?:let'?s |help me )?plan (?:my|the|our) (?:day|morning|week)\b", 0.95),
+    ("planning.start", r"\bwhat should i (?:work on|do) today\b", 0.9),
+    ("planning.start", r"\b(?:tag|meinen tag) planen\b", 0.9),
+    ("planning.prioritize", r"\b(?:set|pick|choose) (?:my )?priorities\b", 0.9),
+    ("planning.prioritize", r"\bwhat(?:'s| is) (?:most )?important today\b", 0.85),
+    ("planning.breakdown", r"\bbreak (?:it|this|that|\w+) down\b", 0.9),
+    ("planning.breakdown", r"\bsmaller steps\b", 0.85),
+    ("planning.add_task", r"\badd (?:a )?task\b", 0.95),
+    ("planning.add_task", r"\badd .{1,60} to (?:my|the) (?:list|plan|tasks)\b", 0.9),
+    ("planning.show_tasks", r"\b(?:show|list|see) (?:me )?(?:my )?(?:tasks|to-?dos?|todo list)\b", 0.95),
+    ("planning.show_tasks", r"\bwhat(?:'s| is) on my (?:list|plate)\b", 0.85),
+    # Review
+    ("review.start", r"\b(?:let'?s |let me )?(?:review|reflect on) (?:my|the) (?:day|week)\b", 0.95),
+    ("review.start", r"\bhow did my (?:day|week) go\b", 0.9),
+    ("review.start", r"\blet me reflect\b", 0.85),
+    ("review.accomplishments", r"\bwhat (?:did i|i) (?:get done|accomplish(?:ed)?|finish(?:ed)?)\b", 0.85),
+    ("review.energy", r"\bmy energy (?:today|was|is)\b", 0.8),
+    ("review.forward", r"\btomorrow i (?:want|will|plan) to\b", 0.8),
+    # Future letter
+    ("future_letter.start", r"\b(?:write|start) (?:a |my )?(?:letter to|future letter)\b", 0.95),
+    ("future_letter.start", r"\bletter to (?:my )?future self\b", 0.95),
+    ("future_letter.continue", r"\bcontinue (?:my |the )?letter\b", 0.9),
+    # Capture (fire-and-forget)
+    ("capture.idea", r"^idea\s*:", 0.95),
+    ("capture.task", r"^(?:task|todo|to-do)\s*:", 0.95),
+    ("capture.note", r"^(?:note|remember)\s*:", 0.95),
+    ("capture.quick", r"^(?:quick thought|capture|jot)\b", 0.9),
+    ("capture.idea", r"\bi (?:just )?had an idea\b", 0.85),
+    ("capture.note", r"\bremind me (?:that|about)\b", 0.75),
+    # Meta
+    ("meta.help", r"^(?:help|hilfe)\b|\bwhat can you do\b", 0.9),
+]
+
+
+# =============================================================================
+# Data Classes
+# =============================================================================
+
+@dataclass
+class IntentMatch:
+    """Result of intent detection.
+
+    Attributes:
+        intent: Detected intent (None if nothing matched)
+        confidence: Confidence in the intent (0-1)
+        source: Which stage produced it: "regex", "cache", "llm", or "none"
+    """
+
+    intent: Optional[str]
+    confidence: float
+    source: str
+
+    @property
+    def is_match(self) -> bool:
+        """Check if any intent was detected."""
+        return self.intent is not None
+
+
+NO_MATCH = IntentMatch(intent=None, confidence=0.0, source="none")
+
+
+def normalize_text(text: str) -> str:
+    """Normalize a message for matching and cache keys.
+
+    NFKC-normalizes, casefolds and collapses whitespace so that trivially
+    different phrasings share one cache entry.
+
+    Args:
+        text: Raw message text
+
+    Returns:
+        Normalized text
+    """
+    return " ".join(unicodedata.normalize("NFKC", text).casefold().split())
+
+
+# =============================================================================
+# Classification Cache
+# =============================================================================
+
+class IntentCache:
+    """Bounded LRU cache of LLM classifications keyed by normalized text.
+
+    Misses (no intent) are cached too, so gibberish does not re-trigger
+    the LLM on every repeat.
+    """
+
+    DEFAULT_MAX_SIZE = 5000
+    DEFAULT_TTL = 24 * 3600  # seconds
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, ttl: int = DEFAULT_TTL):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries (least recently used are evicted)
+            ttl: Time-to-live per entry in seconds
+        """
+        self._entries: OrderedDict[str, tuple[Optional[str], float, float]] = OrderedDict()
+        self._max_size = max_size
+        self._ttl = ttl
+
+    def get(self, key: str) -> Optional[tuple[Optional[str], float]]:
+        """Get a cached (intent, confidence), or None if absent/expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        intent, confidence, stored_at = entry
+        if time.monotonic() - stored_at > self._ttl:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return intent, confidence
+
+    def set(self, key: str, intent: Optional[str], confidence: float) -> None:
+        """Store a classification, evicting the least recently used entry if full."""
+        self._entries[key] = (intent, confidence, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Clear all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# =============================================================================
+# Intent Router
+# =============================================================================
+
+class IntentRouter:
+    """Two-stage intent router: compiled regex fast path + cached LLM fallback.
+
+    Usage:
+        router = build_intent_router(get_registry(), llm_classifier=HaikuIntentClassifier())
+        match = await router.classify("let's plan my day")
+        if match.confidence >= router.confidence_threshold:
+            module = registry.route(match.intent)
+    """
+
+    # Below this confidence, ask one clarifying question instead of routing
+    CONFIDENCE_THRESHOLD = 0.7
+
+    def __init__(
+        self,
+        patterns: Optional[list[tuple[str, str, float]]] = None,
+        llm_classifier: Optional[IntentClassifier] = None,
+        cache: Optional[IntentCache] = None,
+        confidence_threshold: float = CONFIDENCE_THRESHOLD,
+        registry: Optional["ModuleRegistry"] = None,
+    ):
+        """
+        Initialize the router.
+
+        Args:
+            patterns: (intent, regex fragment, confidence) triples
+                (defaults to DEFAULT_INTENT_PATTERNS)
+            llm_classifier: Async fallback classifier, called only on a fast-path miss
+            cache: Classification cache for the fallback (bounded LRU by default)
+            confidence_threshold: Minimum confidence for auto-routing
+            registry: Module registry; only patterns of its registered intents
+                are compiled, again whenever registry.version changes
+        """
+        self._llm_classifier = llm_classifier
+        self._cache = cache if cache is not None else IntentCache()
+        self.confidence_threshold = confidence_threshold
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._stats = {"regex": 0, "cache": 0, "llm": 0, "none": 0}
+        self._registry = registry
+        self._registry_version: Optional[int] = None
+        self.compile(patterns if patterns is not None else DEFAULT_INTENT_PATTERNS)
+
+    def compile(self, patterns: list[tuple[str, str, float]]) -> None:
+        """Compile all patterns into one combined automaton.
+
+        Alternatives are ordered by confidence (highest first) so that, at
+        the same match position, the most specific pattern wins. With a
+        registry, patterns for intents no registered module handles are left
+        out (and recompiled from `patterns` when the registry changes).
+
+        Args:
+            patterns: (intent, regex fragment, confidence) triples
+        """
+        self._patterns = list(patterns)
+        if self._registry is not None:
+            self._registry_version = self._registry.version
+            registered = set(self._registry.list_intents())
+            patterns = [p for p in patterns if p[0] in registered]
+        ordered = sorted(patterns, key=lambda p: -p[2])
+        self._groups: dict[str, tuple[str, float]] = {}
+        alternatives: list[str] = []
+        for index, (intent, fragment, confidence) in enumerate(ordered):
+            group = f"p{index}"
+            self._groups[group] = (intent, confidence)
+            alternatives.append(f"(?P<{group}>{fragment})")
+
+        self._automaton: Optional[re.Pattern[str]] = (
+            re.compile("|".join(alternatives)) if alternatives else None
+        )
+        self._intents = sorted({intent for intent, _, _ in ordered})
+        # Patterns changed: cached LLM answers may now be fast-path hits
+        self._cache.clear()
+
+    def _refresh(self) -> None:
+        """Recompile if modules were registered or removed since the last compile."""
+        if self._registry is not None and self._registry.version != self._registry_version:
+            self.compile(self._patterns)
+
+    @property
+    def intents(self) -> list[str]:
+        """All intents the fast path can produce."""
+        self._refresh()
+        return list(self._intents)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Count of classifications per source (regex, cache, llm, none)."""
+        return dict(self._stats)
+
+    def match_fast_path(self, text: str) -> IntentMatch:
+        """Run the regex fast path only.
+
+        Args:
+            text: Raw or normalized message text
+
+        Returns:
+            IntentMatch from the regex stage, or NO_MATCH
+        """
+        self._refresh()
+        return self._match_normalized(normalize_text(text))
+
+    def _match_normalized(self, normalized: str) -> IntentMatch:
+        """Run the regex fast path on already normalized text."""
+        if self._automaton is None:
+            return NO_MATCH
+
+        found = self._automaton.search(normalized)
+        if found is None:
+            return NO_MATCH
+
+        intent, confidence = self._groups[found.lastgroup]
+        return IntentMatch(intent=intent, confidence=confidence, source="regex")
+
+    async def classify(self, text: str) -> IntentMatch:
+        """Detect the intent of a message.
+
+        Args:
+            text: Raw message text
+
+        Returns:
+            IntentMatch with intent, confidence and the stage that produced it
+        """
+        normalized = normalize_text(text)
+        if not normalized:
+            self._stats["none"] += 1
+            return NO_MATCH
+
+        self._refresh()
+        match = self._match_normalized(normalized)
+        if match.is_match:
+            self._stats["regex"] += 1
+            return match
+
+        cached = self._cache.get(normalized)
+        if cached is not None:
+            self._stats["cache"] += 1
+            intent, confidence = cached
+            return IntentMatch(intent=intent, confidence=confidence, source="cache")
+
+        if self._llm_classifier is None:
+            self._stats["none"] += 1
+            return NO_MATCH
+
+        return await self._classify_with_llm(normalized)
+
+    async def _classify_with_llm(self, normalized: str) -> IntentMatch:
+        """Call the LLM fallback, sharing one call between concurrent identical messages."""
+        pending = self._inflight.get(normalized)
+        if pending is not None:
+            self._stats["cache"] += 1
+            return await asyncio.shield(pending)
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[normalized] = future
+        try:
+            self._stats["llm"] += 1
+            try:
+                result = await self._llm_classifier(normalized, self._intents)
+            except Exception as e:
+                # Do not cache failures: the next message retries the LLM
+                logger.warning(f"Intent LLM fallback failed: {type(e).__name__}")
+                match = NO_MATCH
+            else:
+                if result is not None and result[0] in self._intents:
+                    intent, confidence = result[0], max(0.0, min(1.0, result[1]))
+                else:
+                    intent, confidence = None, 0.0
+                self._cache.set(normalized, intent, confidence)
+                match = IntentMatch(intent=intent, confidence=confidence, source="llm")
+            future.set_result(match)
+            return match
+        finally:
+            # A cancelled leader must not leave its waiters hanging
+            if not future.done():
+                future.set_result(NO_MATCH)
+            self._inflight.pop(normalized, None)
+
+    def needs_clarification(self, match: IntentMatch) -> bool:
+        """Check if a match is too uncertain to auto-route.
+
+        Args:
+            match: Result of classify()
+
+        Returns:
+            True if the user should get one clarifying question
+        """
+        return match.confidence < self.confidence_threshold
+
+
+# =============================================================================
+# LLM Fallback
+# =============================================================================
+
+class HaikuIntentClassifier:
+    """Intent classification fallback using Claude Haiku.
+
+    The anthropic client is created on first use, so importing the router
+    does not import the SDK.
+    """
+
+    DEFAULT_MODEL = "claude-3-5-haiku-latest"
+
+    PROMPT = """Classify the user's message into exactly one of these intents:
+{intents}
+
+If none fits, answer "none".
+Respond with the intent and a confidence between 0 and 1, e.g. "planning.start 0.8".
+
+Message: "{message}\""""
+
+    def __init__(self, model: Optional[str] = None, max_tokens: int = 20):
+        """
+        Initialize the classifier.
+
+        Args:
+            model: Anthropic model name (defaults to AURORA_INTENT_MODEL or Haiku)
+            max_tokens: Response token limit
+        """
+        self._model = model or os.environ.get("AURORA_INTENT_MODEL", self.DEFAULT_MODEL)
+        self._max_tokens = max_tokens
+        self._client = None
+
+    async def __call__(self, text: str, intents: list[str]) -> Optional[tuple[str, float]]:
+        """Classify `text` into one of `intents`."""
+        if self._client is None:
+            from anthropic import AsyncAnthropic
+            self._client = AsyncAnthropic()
+
+        response = await self._client.messages.create(
+            model=self._model,
+            max_tokens=self._max_tokens,
+            messages=[{
+                "role": "user",
+                "content": self.PROMPT.format(intents="\n".join(intents), message=text),
+            }],
+        )
+        return self.parse(response.content[0].text)
+
+    @staticmethod
+    def parse(answer: str) -> Optional[tuple[str, float]]:
+        """Parse "<intent> <confidence>" from the model answer."""
+        parts = answer.strip().split()
+        if not parts or parts[0].lower() == "none":
+            return None
+        try:
+            confidence = float(parts[1]) if len(parts) > 1 else 0.5
+        except ValueError:
+            confidence = 0.5
+        return parts[0], confidence
+
+
+# =============================================================================
+# Factory
+# =============================================================================
+
+def build_intent_router(
+    registry: "ModuleRegistry",
+    patterns: Optional[list[tuple[str, str, float]]] = None,
+    llm_classifier: Optional[IntentClassifier] = None,
+    cache: Optional[IntentCache] = None,
+) -> IntentRouter:
+    """Build a router restricted to the intents registered in `registry`.
+
+    Patterns for intents that no module handles are dropped, so the router
+    never produces an intent that ModuleRegistry.route() cannot resolve.
+    The router follows the registry: when modules are registered or
+    removed later (registry.version changes), the fast path is recompiled.
+
+    Args:
+        registry: Module registry (lazy modules are not imported)
+        patterns: Pattern triples (defaults to DEFAULT_INTENT_PATTERNS)
+        llm_classifier: Async fallback classifier
+        cache: Classification cache for the fallback
+
+    Returns:
+        Configured IntentRouter
+    """
+    return IntentRouter(
+        patterns=patterns,
+        llm_classifier=llm_classifier,
+        cache=cache,
+        registry=registry,
+    )
+
+
+# Global router instance
+_intent_router: Optional[IntentRouter] = None
+
+
+def get_intent_router() -> IntentRouter:
+    """Get the global intent router, built from the global registry.
+
+    The Haiku fallback is wired in when ANTHROPIC_API_KEY is set; without
+    it, fast-path misses go to clarification.
+
+    Returns:
+        The global IntentRouter instance
+    """
+    global _intent_router
+    if _intent_router is None:
+        from .module_registry import get_registry
+        llm_classifier = HaikuIntentClassifier() if os.environ.get("ANTHROPIC_API_KEY") else None
+        _intent_router = build_intent_router(get_registry(), llm_classifier=llm_classifier)
+    return _intent_router
+
+
+def set_intent_router(router: IntentRouter) -> None:
+    """Set the global intent router instance.
+
+    Args:
+        router: The IntentRouter to use globally
+    """
+    global _intent_router
+    _intent_router = router
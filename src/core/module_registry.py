@@ -4,13 +4,21 @@ Module Registry for Aurora Sun V1.
 Discovers and routes to modules. Adding a module = register + done.
 The registry maintains the mapping from intents to modules.
 
+Modules can also be registered lazily by import path: only the intent list
+is recorded at startup, and the module is imported and instantiated the
+first time one of its intents is routed. This keeps worker startup free of
+SQLAlchemy models and other heavy imports pulled in by module code.
+
 Reference: ARCHITECTURE.md Section 2 (Module System)
 """
 
 from __future__ import annotations
 
+import importlib
 import logging
-from typing import Optional, Dict, List, TYPE_CHECKING
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Optional, Dict, List, TYPE_CHECKING
 
 from .module_protocol import Module
 from .daily_workflow_hooks import DailyWorkflowHooks, DailyWorkflowHook
@@ -19,12 +27,63 @@ from .daily_workflow_hooks import DailyWorkflowHooks, DailyWorkflowHook
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class LazyModuleSpec:
+    """A module registered by import path, instantiated on first use.
+
+    Attributes:
+        name: Module name (must match the ``name`` of the built module)
+        import_path: "package.module:ClassName" of the module class
+        intents: Intents the module handles (routed before import)
+        init_kwargs: Keyword arguments passed to the class on instantiation
+    """
+
+    name: str
+    import_path: str
+    intents: list[str]
+    init_kwargs: dict[str, Any] = field(default_factory=dict)
+
+    def load(self) -> Module:
+        """Import the module class and build an instance.
+
+        Returns:
+            The instantiated Module
+
+        Raises:
+            ValueError: If the import path is malformed or the built module's
+                name does not match the registered name
+        """
+        module_path, _, attr = self.import_path.partition(":")
+        if not module_path or not attr:
+            raise ValueError(
+                f"Invalid import path '{self.import_path}' for module '{self.name}'. "
+                f"Expected 'package.module:ClassName'."
+            )
+
+        module_cls = getattr(importlib.import_module(module_path), attr)
+        module = module_cls(**self.init_kwargs)
+
+        if module.name != self.name:
+            raise ValueError(
+                f"Lazy module '{self.name}' resolved to a module named '{module.name}'."
+            )
+        undeclared = set(module.intents) - set(self.intents)
+        if undeclared:
+            logger.warning(
+                f"Module '{self.name}' handles intents not declared at registration "
+                f"(not routable until declared): {sorted(undeclared)}"
+            )
+
+        return module
+
+
 class ModuleRegistry:
     """Discovers and routes to modules.
 
     This is the central registry for all modules. It maintains:
-    - _modules: Map of module name -> Module instance
-    - _intent_map: Map of intent string -> Module instance
+    - _modules: Map of module name -> Module instance (built modules)
+    - _lazy_specs: Map of module name -> LazyModuleSpec (not yet built)
+    - _intent_map: Map of intent string -> module name
 
     Adding a new module means implementing Module(Protocol) and registering.
     The router then automatically handles those intents.
@@ -34,6 +93,13 @@ class ModuleRegistry:
         registry.register(PlanningModule())
         registry.register(HabitsModule())
 
+        # Or defer the import until the first routed intent
+        registry.register_lazy(
+            "capture",
+            "src.modules.capture:CaptureModule",
+            intents=["capture.quick", "capture.task"],
+        )
+
         # Route an intent
         module = registry.route("planning.start")
         if module:
@@ -43,8 +109,11 @@ class ModuleRegistry:
     def __init__(self) -> None:
         """Initialize an empty registry."""
         self._modules: Dict[str, Module] = {}
-        self._intent_map: Dict[str, Module] = {}
+        self._lazy_specs: Dict[str, LazyModuleSpec] = {}
+        self._intent_map: Dict[str, str] = {}
         self._initialized: bool = False
+        self._load_lock = threading.Lock()
+        self._version: int = 0
 
     def register(self, module: Module) -> None:
         """Register a module with the registry.
@@ -58,32 +127,107 @@ class ModuleRegistry:
         Raises:
             ValueError: If module name or intents conflict with existing modules
         """
+        self._check_conflicts(module.name, module.intents)
+
+        # Register the module
+        self._modules[module.name] = module
+
+        # Register all intents
+        for intent in module.intents:
+            self._intent_map[intent] = module.name
+        self._version += 1
+
+        logger.info(
+            f"Registered module '{module.name}' with intents: {module.intents}"
+        )
+
+    def register_lazy(
+        self,
+        name: str,
+        import_path: str,
+        intents: list[str],
+        **init_kwargs: Any,
+    ) -> None:
+        """Register a module by import path without importing it.
+
+        The intents are routable immediately. The module is imported and
+        instantiated the first time one of them is routed (or the module
+        is requested by name).
+
+        Args:
+            name: The module name
+            import_path: "package.module:ClassName" of the module class
+            intents: Intents the module handles
+            **init_kwargs: Keyword arguments passed to the class on instantiation
+
+        Raises:
+            ValueError: If module name or intents conflict with existing modules
+        """
+        self._check_conflicts(name, intents)
+
+        self._lazy_specs[name] = LazyModuleSpec(
+            name=name,
+            import_path=import_path,
+            intents=list(intents),
+            init_kwargs=init_kwargs,
+        )
+        for intent in intents:
+            self._intent_map[intent] = name
+        self._version += 1
+
+        logger.info(
+            f"Registered lazy module '{name}' ({import_path}) with intents: {intents}"
+        )
+
+    def _check_conflicts(self, name: str, intents: list[str]) -> None:
+        """Raise if a module name or any of its intents is already taken."""
         # Check for name conflicts
-        if module.name in self._modules:
+        if name in self._modules or name in self._lazy_specs:
             raise ValueError(
-                f"Module '{module.name}' is already registered. "
+                f"Module '{name}' is already registered. "
                 f"Use a different name or deregister the existing module first."
             )
 
         # Check for intent conflicts
-        for intent in module.intents:
+        for intent in intents:
             if intent in self._intent_map:
                 existing = self._intent_map[intent]
                 raise ValueError(
-                    f"Intent '{intent}' is already registered to module '{existing.name}'. "
-                    f"Cannot register to '{module.name}'."
+                    f"Intent '{intent}' is already registered to module '{existing}'. "
+                    f"Cannot register to '{name}'."
                 )
 
-        # Register the module
-        self._modules[module.name] = module
+    def _resolve(self, name: str) -> Optional[Module]:
+        """Return a built module by name, building it if it is still lazy."""
+        module = self._modules.get(name)
+        if module is not None:
+            return module
 
-        # Register all intents
-        for intent in module.intents:
-            self._intent_map[intent] = module
+        if name not in self._lazy_specs:
+            return None
 
-        logger.info(
-            f"Registered module '{module.name}' with intents: {module.intents}"
-        )
+        with self._load_lock:
+            # Another thread may have built it while we waited
+            module = self._modules.get(name)
+            if module is not None:
+                return module
+
+            spec = self._lazy_specs[name]
+            module = spec.load()
+            self._modules[name] = module
+            del self._lazy_specs[name]
+
+        logger.info(f"Loaded lazy module '{name}' from {spec.import_path}")
+        return module
+
+    def load_all(self) -> None:
+        """Build every lazily registered module.
+
+        Used where all modules are needed at once (e.g., collecting daily
+        workflow hooks) or to warm a worker before taking traffic.
+        """
+        for name in list(self._lazy_specs):
+            self._resolve(name)
 
     def deregister(self, module_name: str) -> bool:
         """Deregister a module from the registry.
@@ -97,16 +241,18 @@ class ModuleRegistry:
             True if the module was found and removed, False otherwise
         """
         module = self._modules.pop(module_name, None)
-        if module is None:
+        spec = self._lazy_specs.pop(module_name, None)
+        if module is None and spec is None:
             return False
 
         # Remove all intent mappings for this module
         intents_to_remove = [
-            intent for intent, mod in self._intent_map.items()
-            if mod.name == module_name
+            intent for intent, name in self._intent_map.items()
+            if name == module_name
         ]
         for intent in intents_to_remove:
             del self._intent_map[intent]
+        self._version += 1
 
         logger.info(f"Deregistered module '{module_name}'")
         return True
@@ -114,32 +260,51 @@ class ModuleRegistry:
     def route(self, intent: str) -> Optional[Module]:
         """Route an intent to the appropriate module.
 
+        Lazily registered modules are imported and built on their first
+        routed intent.
+
         Args:
             intent: The intent to route (e.g., "planning.start", "habit.list")
 
         Returns:
             The Module that handles this intent, or None if not found
         """
-        return self._intent_map.get(intent)
+        name = self._intent_map.get(intent)
+        if name is None:
+            return None
+        return self._resolve(name)
 
     def get_module(self, name: str) -> Optional[Module]:
         """Get a module by name.
 
+        Lazily registered modules are built on first access.
+
         Args:
             name: The module name
 
         Returns:
             The Module instance, or None if not found
         """
-        return self._modules.get(name)
+        return self._resolve(name)
 
     def list_modules(self) -> List[str]:
-        """List all registered module names.
+        """List all registered module names (built and lazy).
 
         Returns:
             List of module names
         """
-        return list(self._modules.keys())
+        return list(self._modules.keys()) + list(self._lazy_specs.keys())
+
+    def is_loaded(self, module_name: str) -> bool:
+        """Check if a module has been built (not merely registered lazily).
+
+        Args:
+            module_name: The module name to check
+
+        Returns:
+            True if the module instance exists
+        """
+        return module_name in self._modules
 
     def list_intents(self) -> Dict[str, str]:
         """List all registered intents and their modules.
@@ -147,14 +312,14 @@ class ModuleRegistry:
         Returns:
             Dict mapping intent -> module name
         """
-        return {
-            intent: module.name
-            for intent, module in self._intent_map.items()
-        }
+        return dict(self._intent_map)
 
     def get_daily_hooks(self) -> Dict[str, List[DailyWorkflowHook]]:
         """Collect all daily workflow hooks from all modules.
 
+        Every lazily registered module is built first, since hooks are
+        provided by module instances.
+
         Returns:
             Dict mapping hook stage (morning, planning_enrichment, etc.)
             to list of hook callables from all modules
@@ -166,6 +331,7 @@ class ModuleRegistry:
             "evening_review": [],
         }
 
+        self.load_all()
         for module in self._modules.values():
             module_hooks = module.get_daily_workflow_hooks()
 
@@ -197,7 +363,7 @@ class ModuleRegistry:
         Returns:
             True if the module is registered
         """
-        return module_name in self._modules
+        return module_name in self._modules or module_name in self._lazy_specs
 
     def clear(self) -> None:
         """Clear all registered modules and intents.
@@ -205,13 +371,24 @@ class ModuleRegistry:
         Useful for testing or hot-reloading.
         """
         self._modules.clear()
+        self._lazy_specs.clear()
         self._intent_map.clear()
+        self._version += 1
         logger.info("Cleared all modules from registry")
 
+    @property
+    def version(self) -> int:
+        """Registry version, bumped whenever modules are added or removed.
+
+        Caches derived from the registered modules and their daily workflow
+        hooks (e.g. the compiled daily graph) are invalidated when it changes.
+        """
+        return self._version
+
     @property
     def module_count(self) -> int:
-        """Get the number of registered modules."""
-        return len(self._modules)
+        """Get the number of registered modules (built and lazy)."""
+        return len(self._modules) + len(self._lazy_specs)
 
     @property
     def intent_count(self) -> int:
@@ -61,6 +61,9 @@ class NeurostateConfig:
     sensory_accumulation: bool  # True for AU/AH -- sensory load does NOT habituate
     interoception_reliability: str  # moderate (AD) | low (AU) | very_low (AH) | high (NT)
     waiting_mode_vulnerability: str  # high (AD) | high (AU) | extreme (AH)
+    sensory_recovery_half_life_hours: float  # 2 (AD) | 8 (AU) | 10 (AH) | 1 (NT)
+    sensory_recovery_delay_hours: float  # Quiet time before recovery starts: 1 (AU/AH) | 0
+    spoon_recovery_per_hour: float  # Spoons regained per pool per hour: 0.5 (AH) | 1
 
 
 @dataclass
@@ -186,6 +189,9 @@ NeurostateConfig_configs: dict[WorkingStyleCode, NeurostateConfig] = {
         sensory_accumulation=False,
         interoception_reliability="moderate",
         waiting_mode_vulnerability="high",
+        sensory_recovery_half_life_hours=2.0,
+        sensory_recovery_delay_hours=0.0,
+        spoon_recovery_per_hour=1.0,
     ),
     "AU": NeurostateConfig(
         burnout_model="overload_shutdown",
@@ -195,6 +201,9 @@ NeurostateConfig_configs: dict[WorkingStyleCode, NeurostateConfig] = {
         sensory_accumulation=True,
         interoception_reliability="low",
         waiting_mode_vulnerability="high",
+        sensory_recovery_half_life_hours=8.0,
+        sensory_recovery_delay_hours=1.0,
+        spoon_recovery_per_hour=1.0,
     ),
     "AH": NeurostateConfig(
         burnout_model="three_type",
@@ -204,6 +213,9 @@ NeurostateConfig_configs: dict[WorkingStyleCode, NeurostateConfig] = {
         sensory_accumulation=True,
         interoception_reliability="very_low",
         waiting_mode_vulnerability="extreme",
+        sensory_recovery_half_life_hours=10.0,
+        sensory_recovery_delay_hours=1.0,
+        spoon_recovery_per_hour=0.5,
     ),
     "NT": NeurostateConfig(
         burnout_model="standard",
@@ -213,6 +225,9 @@ NeurostateConfig_configs: dict[WorkingStyleCode, NeurostateConfig] = {
         sensory_accumulation=False,
         interoception_reliability="high",
         waiting_mode_vulnerability="low",
+        sensory_recovery_half_life_hours=1.0,
+        sensory_recovery_delay_hours=0.0,
+        spoon_recovery_per_hour=1.0,
     ),
     "CU": NeurostateConfig(
         burnout_model="standard",
@@ -222,6 +237,9 @@ NeurostateConfig_configs: dict[WorkingStyleCode, NeurostateConfig] = {
         sensory_accumulation=False,
         interoception_reliability="high",
         waiting_mode_vulnerability="low",
+        sensory_recovery_half_life_hours=2.0,
+        sensory_recovery_delay_hours=0.0,
+        spoon_recovery_per_hour=1.0,
     ),
 }
 
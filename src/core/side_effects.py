@@ -10,13 +10,18 @@ Reference: ARCHITECTURE.md Section 2 (Module System)
 
 from __future__ import annotations
 
+import asyncio
+import logging
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, Optional
 from enum import Enum
 from datetime import datetime
 import uuid
 
 
+logger = logging.getLogger(__name__)
+
+
 class SideEffectType(Enum):
     """Types of side effects that can be executed."""
 
@@ -242,3 +247,192 @@ class SideEffectExecutor:
             success = await self.execute(effect, batch.user_id)
             results.append(success)
         return results
+
+
+# =============================================================================
+# Concurrent Executor
+# =============================================================================
+
+# DB writes that are coalesced into one transaction with bulk INSERT/UPDATE
+COALESCED_DB_EFFECTS: frozenset[SideEffectType] = frozenset({
+    SideEffectType.SAVE_TASK,
+    SideEffectType.UPDATE_TASK,
+    SideEffectType.SAVE_TRANSACTION,
+    SideEffectType.SAVE_CAPTURED_ITEM,
+})
+
+# Executes one effect: (effect, user_id) -> success
+SideEffectHandler = Callable[[SideEffect, Optional[int]], Awaitable[bool]]
+
+# Writes all coalesced DB effects in ONE transaction; raises to roll back.
+# A writer may define supports(effect_type) -> bool to coalesce only the
+# types it can write; the others go to their per-type handlers.
+BulkWriter = Callable[[Optional[int], list[SideEffect]], Awaitable[None]]
+
+
+class ConcurrentSideEffectExecutor(SideEffectExecutor):
+    """Side effect executor with coalesced DB writes and optional concurrency.
+
+    Execution model for a batch:
+    - Priority levels run in order (lower first).
+    - By default effects of one priority level keep the sequential order of
+      SideEffectExecutor: they run one after another in list order, and
+      only consecutive DB effects (COALESCED_DB_EFFECTS) that the bulk
+      writer supports are merged into a single transaction.
+    - With concurrent_groups=True, a caller declares that effects of one
+      priority level are independent (an effect may then depend only on
+      lower priorities). The level is grouped by type, and the groups run
+      concurrently. Effects inside a group run in order, since effects of
+      one type usually touch the same records. All supported DB effects of
+      the level form one group, written in a single transaction.
+
+    Results stay per effect, in priority order.
+    """
+
+    def __init__(
+        self,
+        handlers: Optional[Dict[SideEffectType, SideEffectHandler]] = None,
+        bulk_writer: Optional[BulkWriter] = None,
+        max_concurrency: int = 8,
+        concurrent_groups: bool = False,
+    ):
+        """
+        Initialize the executor.
+
+        Args:
+            handlers: Per-type effect handlers
+            bulk_writer: Transactional bulk writer for COALESCED_DB_EFFECTS
+                (without one, or for types it does not support, DB effects
+                use their per-type handlers)
+            max_concurrency: Maximum number of groups running at once
+            concurrent_groups: Run the effect types of one priority level
+                concurrently (only if same-priority effects are independent)
+        """
+        self._handlers: Dict[SideEffectType, SideEffectHandler] = dict(handlers or {})
+        self._bulk_writer = bulk_writer
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._concurrent_groups = concurrent_groups
+
+    def register_handler(self, effect_type: SideEffectType, handler: SideEffectHandler) -> None:
+        """Register the handler for an effect type.
+
+        Args:
+            effect_type: Effect type to handle
+            handler: Async handler returning a success flag
+        """
+        self._handlers[effect_type] = handler
+
+    async def execute(self, effect: SideEffect, user_id: Optional[int]) -> bool:
+        """Execute a single side effect with its registered handler.
+
+        Args:
+            effect: The side effect to execute
+            user_id: The user ID
+
+        Returns:
+            True if execution was successful
+        """
+        handler = self._handlers.get(effect.effect_type)
+        if handler is None:
+            logger.warning(f"No handler for side effect type {effect.effect_type.value}")
+            return False
+        try:
+            return bool(await handler(effect, user_id))
+        except Exception as e:
+            logger.error(f"Side effect {effect.effect_type.value} failed: {type(e).__name__}")
+            return False
+
+    async def execute_batch(self, batch: SideEffectBatch) -> list[bool]:
+        """Execute a batch of side effects.
+
+        Args:
+            batch: The batch to execute
+
+        Returns:
+            List of success flags for each effect (in priority order)
+        """
+        batch.sort_by_priority()
+        results: list[bool] = [False] * len(batch.effects)
+
+        for level in self._priority_levels(batch.effects):
+            if not self._concurrent_groups:
+                for key, members in self._runs(level):
+                    await self._run_group(key, members, batch.user_id, results)
+                continue
+            groups = self._group_level(level)
+            await asyncio.gather(*(
+                self._run_group(key, members, batch.user_id, results)
+                for key, members in groups.items()
+            ))
+
+        return results
+
+    @staticmethod
+    def _priority_levels(effects: list[SideEffect]) -> list[list[tuple[int, SideEffect]]]:
+        """Split sorted effects into consecutive priority levels, keeping indices."""
+        levels: list[list[tuple[int, SideEffect]]] = []
+        for index, effect in enumerate(effects):
+            if levels and levels[-1][0][1].priority == effect.priority:
+                levels[-1].append((index, effect))
+            else:
+                levels.append([(index, effect)])
+        return levels
+
+    def _group_level(
+        self, level: list[tuple[int, SideEffect]]
+    ) -> Dict[Any, list[tuple[int, SideEffect]]]:
+        """Group one priority level by effect type (DB writes share one group)."""
+        groups: Dict[Any, list[tuple[int, SideEffect]]] = {}
+        for index, effect in level:
+            if self._coalesces(effect.effect_type):
+                key: Any = "db"
+            else:
+                key = effect.effect_type
+            groups.setdefault(key, []).append((index, effect))
+        return groups
+
+    def _runs(
+        self, level: list[tuple[int, SideEffect]]
+    ) -> list[tuple[Any, list[tuple[int, SideEffect]]]]:
+        """Split one priority level into sequential runs (consecutive DB writes share one)."""
+        runs: list[tuple[Any, list[tuple[int, SideEffect]]]] = []
+        for index, effect in level:
+            if self._coalesces(effect.effect_type):
+                if runs and runs[-1][0] == "db":
+                    runs[-1][1].append((index, effect))
+                else:
+                    runs.append(("db", [(index, effect)]))
+            else:
+                runs.append((effect.effect_type, [(index, effect)]))
+        return runs
+
+    def _coalesces(self, effect_type: SideEffectType) -> bool:
+        """Whether an effect type goes to the bulk writer."""
+        if self._bulk_writer is None or effect_type not in COALESCED_DB_EFFECTS:
+            return False
+        supports = getattr(self._bulk_writer, "supports", None)
+        return supports is None or supports(effect_type)
+
+    async def _run_group(
+        self,
+        key: Any,
+        members: list[tuple[int, SideEffect]],
+        user_id: Optional[int],
+        results: list[bool],
+    ) -> None:
+        """Run one group and write its per-effect results."""
+        async with self._semaphore:
+            if key == "db":
+                try:
+                    await self._bulk_writer(user_id, [effect for _, effect in members])
+                    success = True
+                except Exception as e:
+                    # The whole transaction rolled back: every member failed
+                    logger.error(f"Bulk side effect write failed: {type(e).__name__}")
+                    success = False
+                for index, _ in members:
+                    results[index] = success
+                return
+
+            for index, effect in members:
+                results[index] = await self.execute(effect, user_id)
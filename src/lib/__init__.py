@@ -5,40 +5,80 @@ Contains shared utilities:
 - encryption.py: Field-level encryption (AES-256-GCM)
 - security.py: Input sanitization and rate limiting
 - gdpr.py: GDPR compliance utilities
+- keyword_matcher.py: Compiled multi-keyword (Aho-Corasick) matching
+- lexicon.py: Per-language keyword lexicons for the heuristics (hot reload)
+- json_ttl_store.py: Per-user Redis JSON store with TTL and bounded local fallback
 """
 
-from src.lib.encryption import (
-    EncryptionService,
-    DataClassification,
-    EncryptedField,
-    get_encryption_service,
-    get_hash_service,
-    encrypt_for_user,
-    decrypt_for_user,
-    hash_telegram_id,
-    hash_for_search,
-)
-from src.lib.security import (
-    InputSanitizer,
-    RateLimiter,
-    MessageSizeValidator,
-    SecurityHeaders,
-)
-
-__all__ = [
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .encryption import (
+        EncryptionService,
+        DataClassification,
+        EncryptedField,
+        get_encryption_service,
+        get_hash_service,
+        encrypt_for_user,
+        decrypt_for_user,
+        hash_telegram_id,
+        hash_for_search,
+    )
+    from .security import (
+        InputSanitizer,
+        RateLimiter,
+        MessageSizeValidator,
+        SecurityHeaders,
+    )
+    from .keyword_matcher import KeywordMatcher
+    from .lexicon import LexiconRegistry, get_lexicon_registry, set_lexicon_registry
+    from .json_ttl_store import JsonTTLStore, get_many
+
+
+# Public name -> submodule that defines it. Submodules are imported on first
+# attribute access (PEP 562), so importing this package stays cheap.
+_LAZY_EXPORTS: dict[str, str] = {
     # Encryption
-    "EncryptionService",
-    "DataClassification",
-    "EncryptedField",
-    "get_encryption_service",
-    "get_hash_service",
-    "encrypt_for_user",
-    "decrypt_for_user",
-    "hash_telegram_id",
-    "hash_for_search",
+    "EncryptionService": ".encryption",
+    "DataClassification": ".encryption",
+    "EncryptedField": ".encryption",
+    "get_encryption_service": ".encryption",
+    "get_hash_service": ".encryption",
+    "encrypt_for_user": ".encryption",
+    "decrypt_for_user": ".encryption",
+    "hash_telegram_id": ".encryption",
+    "hash_for_search": ".encryption",
     # Security
-    "InputSanitizer",
-    "RateLimiter",
-    "MessageSizeValidator",
-    "SecurityHeaders",
-]
+    "InputSanitizer": ".security",
+    "RateLimiter": ".security",
+    "MessageSizeValidator": ".security",
+    "SecurityHeaders": ".security",
+    # Keyword matching
+    "KeywordMatcher": ".keyword_matcher",
+    # Lexicons
+    "LexiconRegistry": ".lexicon",
+    "get_lexicon_registry": ".lexicon",
+    "set_lexicon_registry": ".lexicon",
+    # Redis JSON stores
+    "JsonTTLStore": ".json_ttl_store",
+    "get_many": ".json_ttl_store",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule that defines ``name`` on first access."""
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
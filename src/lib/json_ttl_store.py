@@ -0,0 +1,175 @@
+"""
+Redis JSON Store with TTL for Aurora Sun V1.
+
+Several services keep one small JSON document per user in Redis with a TTL
+(channel scores, energy baselines, masking aggregates, pre-rendered
+mornings). JsonTTLStore is their shared base:
+
+- Values are stored under KEY_PREFIX + user_id with the store's TTL.
+- When Redis is missing or failing, values are kept in process memory with
+  the same expiry. That fallback is a bounded LRU (MAX_LOCAL entries), so a
+  long Redis outage cannot grow it without limit; an entry is dropped again
+  once Redis accepts the next write for its user.
+- Subclasses set KEY_PREFIX, TTL and NAME (used in log messages) and may
+  override _encode/_decode, e.g. to encrypt.
+- get_many() reads values of several stores at once; stores sharing a Redis
+  client are read with one MGET (one round trip).
+
+Usage:
+    class ScoreStore(JsonTTLStore[Scores]):
+        KEY_PREFIX = "aurora:scores:"
+        TTL = 24 * 3600
+        NAME = "Scores"
+
+        def _decode(self, user_id, data):
+            return Scores.from_json(data)
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Generic, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class JsonTTLStore(Generic[T]):
+    """JSON values by user ID (Redis with a bounded in-process fallback)."""
+
+    KEY_PREFIX = "aurora:"
+    TTL = 24 * 3600
+    NAME = "JSON store"
+    MAX_LOCAL = 10_000  # Fallback entries kept while Redis is unavailable
+
+    def __init__(
+        self,
+        redis_client: Any = None,
+        ttl: Optional[int] = None,
+        max_local: int = MAX_LOCAL,
+    ):
+        """
+        Args:
+            redis_client: redis.asyncio client (None: process memory only)
+            ttl: Lifetime of an untouched value in seconds (default: TTL)
+            max_local: Maximum number of values kept in process memory
+        """
+        self._redis = redis_client
+        self._ttl = self.TTL if ttl is None else ttl
+        self._max_local = max_local
+        # user_id -> (JSON, expires_at), least recently used first
+        self._local: OrderedDict[int, tuple[str, float]] = OrderedDict()
+
+    # =========================================================================
+    # Encoding (override in subclasses)
+    # =========================================================================
+
+    def _encode(self, value: T) -> Optional[str]:
+        """Serialize a value (None: do not store it)."""
+        return value.to_json()  # type: ignore[attr-defined]
+
+    def _decode(self, user_id: int, data: str) -> T:
+        """Deserialize a stored value (raises TypeError/ValueError/KeyError)."""
+        raise NotImplementedError
+
+    # =========================================================================
+    # Access
+    # =========================================================================
+
+    async def get(self, user_id: int) -> Optional[T]:
+        """Load a user's value, if any."""
+        data = None
+        if self._redis is not None:
+            try:
+                data = await self._redis.get(f"{self.KEY_PREFIX}{user_id}")
+            except Exception as e:
+                logger.warning(f"{self.NAME} read from Redis failed, trying locally: {type(e).__name__}")
+        return self._resolve(user_id, data)
+
+    def _resolve(self, user_id: int, data: Optional[str]) -> Optional[T]:
+        """Decode a value read from Redis (None: try process memory)."""
+        if data is None:
+            data = self._get_local(user_id)
+        if data is None:
+            return None
+        try:
+            return self._decode(user_id, data)
+        except (TypeError, ValueError, KeyError):
+            logger.warning(f"Discarding malformed {self.NAME.lower()} for user {user_id}")
+            return None
+
+    async def put(self, value: T) -> None:
+        """Store a value under its user_id, replacing the previous one."""
+        user_id: int = value.user_id  # type: ignore[attr-defined]
+        data = self._encode(value)
+        if data is None:
+            return
+        if self._redis is not None:
+            try:
+                await self._redis.set(f"{self.KEY_PREFIX}{user_id}", data, ex=self._ttl)
+                self._local.pop(user_id, None)
+                return
+            except Exception as e:
+                logger.warning(f"{self.NAME} write to Redis failed, keeping it locally: {type(e).__name__}")
+        self._put_local(user_id, data)
+
+    async def delete(self, user_id: int) -> None:
+        """Drop a user's value."""
+        self._local.pop(user_id, None)
+        if self._redis is not None:
+            try:
+                await self._redis.delete(f"{self.KEY_PREFIX}{user_id}")
+            except Exception as e:
+                logger.warning(f"{self.NAME} delete in Redis failed: {type(e).__name__}")
+
+    # =========================================================================
+    # Process-memory Fallback
+    # =========================================================================
+
+    def _get_local(self, user_id: int) -> Optional[str]:
+        entry = self._local.get(user_id)
+        if entry is None:
+            return None
+        if entry[1] <= time.time():
+            del self._local[user_id]
+            return None
+        self._local.move_to_end(user_id)
+        return entry[0]
+
+    def _put_local(self, user_id: int, data: str) -> None:
+        self._local[user_id] = (data, time.time() + self._ttl)
+        self._local.move_to_end(user_id)
+        while len(self._local) > self._max_local:
+            self._local.popitem(last=False)
+
+
+async def get_many(*requests: tuple[JsonTTLStore[Any], int]) -> list[Any]:
+    """
+    Load several values, one MGET per distinct Redis client.
+
+    Args:
+        requests: (store, user_id) pairs
+
+    Returns:
+        The value of each request (None if missing), in request order
+    """
+    data: list[Optional[str]] = [None] * len(requests)
+    by_client: dict[int, list[int]] = {}
+    for i, (store, _) in enumerate(requests):
+        if store._redis is not None:
+            by_client.setdefault(id(store._redis), []).append(i)
+    for indexes in by_client.values():
+        client = requests[indexes[0]][0]._redis
+        keys = [f"{requests[i][0].KEY_PREFIX}{requests[i][1]}" for i in indexes]
+        try:
+            values = await client.mget(keys)
+        except Exception as e:
+            names = ", ".join(requests[i][0].NAME for i in indexes)
+            logger.warning(f"{names} read from Redis failed, trying locally: {type(e).__name__}")
+            continue
+        for i, value in zip(indexes, values):
+            data[i] = value
+    return [store._resolve(user_id, data[i]) for i, (store, user_id) in enumerate(requests)]
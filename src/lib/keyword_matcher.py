@@ -0,0 +1,125 @@
+"""
+Compiled Multi-keyword Matcher for Aurora Sun V1.
+
+Heuristics across the services score text by checking keyword lists with
+`any(kw in text for kw in keywords)` or `sum(1 for kw in keywords if kw in
+text)`: one substring search per keyword per text. KeywordMatcher compiles
+keyword lists grouped by category into one Aho-Corasick automaton (with the
+failure links folded into a full transition table), so a single pass over
+the text finds every keyword it contains, overlapping ones included.
+
+Matching keeps the substring semantics of those checks: case-insensitive,
+no word boundaries, and each keyword counts once per text.
+
+Usage:
+    matcher = KeywordMatcher({"focus": ["plan", "task"], "social": ["talk"]})
+    matcher.counts("Plan the task, then talk")  # {"focus": 2, "social": 1}
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Iterable, Mapping
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton over keyword lists by category."""
+
+    def __init__(self, categories: Mapping[str, Iterable[str]]):
+        """
+        Compile the automaton.
+
+        Args:
+            categories: Category -> keywords (a keyword may appear in several
+                categories; matching is case-insensitive)
+        """
+        self.categories: tuple[str, ...] = tuple(categories)
+        keyword_ids: dict[str, int] = {}
+        keyword_categories: list[list[int]] = []
+        for index, category in enumerate(self.categories):
+            for keyword in categories[category]:
+                keyword = keyword.lower()
+                if not keyword:
+                    continue
+                kid = keyword_ids.setdefault(keyword, len(keyword_ids))
+                if kid == len(keyword_categories):
+                    keyword_categories.append([])
+                if index not in keyword_categories[kid]:
+                    keyword_categories[kid].append(index)
+        self.keywords: tuple[str, ...] = tuple(keyword_ids)
+        self._keyword_categories = [tuple(c) for c in keyword_categories]
+
+        # Trie
+        goto: list[dict[str, int]] = [{}]
+        output: list[tuple[int, ...]] = [()]
+        for kid, keyword in enumerate(self.keywords):
+            state = 0
+            for ch in keyword:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    output.append(())
+                state = nxt
+            output[state] += (kid,)
+
+        # Failure links, breadth first; each state's full transition table
+        # extends that of its failure state (always shallower, so complete)
+        fail = [0] * len(goto)
+        delta: list[dict[str, int]] = [dict(goto[0])] + [{} for _ in goto[1:]]
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            delta[state] = {**delta[fail[state]], **goto[state]}
+            for ch, nxt in goto[state].items():
+                fail[nxt] = delta[fail[state]].get(ch, 0) if state else 0
+                output[nxt] += output[fail[nxt]]
+                queue.append(nxt)
+        self._delta = delta
+        self._output = output
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def find(self, text: str) -> set[int]:
+        """
+        IDs (indexes into self.keywords) of the keywords contained in text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Set of keyword IDs
+        """
+        delta, output = self._delta, self._output
+        found: set[int] = set()
+        state = 0
+        for ch in text.lower():
+            state = delta[state].get(ch, 0)
+            if output[state]:
+                found.update(output[state])
+        return found
+
+    def matches(self, text: str) -> set[str]:
+        """Keywords contained in text."""
+        return {self.keywords[kid] for kid in self.find(text)}
+
+    def counts(self, text: str) -> dict[str, int]:
+        """
+        Number of distinct keywords of each category contained in text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Category -> hit count (every category present, 0 if no hits)
+        """
+        hits = [0] * len(self.categories)
+        for kid in self.find(text):
+            for index in self._keyword_categories[kid]:
+                hits[index] += 1
+        return dict(zip(self.categories, hits))
+
+
+__all__ = ["KeywordMatcher"]
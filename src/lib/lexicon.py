@@ -0,0 +1,309 @@
+"""
+Keyword Lexicon Registry for Aurora Sun V1.
+
+The neurostate and energy heuristics (inertia scoring, spoon costs and
+gating, IBNS interest, ICNU integrity) scan text with their own keyword
+lists. LexiconRegistry holds all of these lists as categories named
+"<lexicon>.<category>" and compiles them into one KeywordMatcher
+(Aho-Corasick) per language, so one pass over a text returns hit counts
+for every category:
+
+    hits = get_lexicon_registry().counts(task.title, language="de")
+    if hits["spoons.social"]: ...
+
+- Per-language sets: a language's categories are the default (English)
+  keywords plus that language's own, so English words in a German message
+  still count. Unknown languages use the default set.
+- Hot reload: reload() swaps in new lexicons; with a lexicon file
+  ({language: {category: [keywords]}}, overriding built-in categories),
+  reload_if_changed() re-reads it when its mtime changes. Matchers are
+  compiled lazily after a reload.
+- Results are cached per (language, text) in a small LRU, since the same
+  task title is scored by several heuristics.
+
+Counts are the number of distinct keywords of a category in the text, the
+same as `sum(1 for kw in keywords if kw in text.lower())`.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Iterable, Mapping, Optional
+
+from src.i18n import DEFAULT_LANGUAGE
+from src.lib.keyword_matcher import KeywordMatcher
+
+logger = logging.getLogger(__name__)
+
+Lexicons = Mapping[str, Mapping[str, Iterable[str]]]
+
+
+# =============================================================================
+# Built-in Lexicons
+# =============================================================================
+
+DEFAULT_LEXICONS: dict[str, dict[str, list[str]]] = {
+    "en": {
+        # InertiaDetector
+        "inertia.autistic": [
+            "stuck", "can't start", "want to but", "frozen", "overwhelmed",
+            "don't know how", "too much", "decision paralysis", "paralyzed",
+            "cannot switch", "tunnel", "loop", "ruminate", "rumination",
+        ],
+        "inertia.activation": [
+            "should", "need to", "want to", "later", "tomorrow", "eventually",
+            "procrastinate", "lazy", "motivation", "can't be bothered",
+            "hard to start", "put off", "keep forgetting", "distracted",
+        ],
+        "inertia.double_block": [
+            "want to but shouldn't", "should but can't", "stuck and tired",
+            "overwhelmed and bored", "too much and not enough",
+        ],
+        "inertia.want": ["want"],
+        "inertia.can": ["can"],
+        "inertia.should": ["should"],
+        "inertia.later": ["later", "tomorrow"],
+        # EnergySystem.spend_spoons: pool costs
+        "spoons.social": ["talk", "meet", "call", "social", "friend"],
+        "spoons.sensory": ["noise", "bright", "crowd", "sensory"],
+        "spoons.ef": ["plan", "organize", "decide", "focus", "complex"],
+        "spoons.emotional": ["emotional", "difficult", "hard", "stress"],
+        "spoons.physical": ["exercise", "walk", "run", "physical"],
+        "spoons.masking": ["present", "interview", "social", "public"],
+        # EnergySystem.can_attempt_task: tasks blocked by a depleted pool
+        "spoon_gate.social": ["social", "talk", "meet"],
+        "spoon_gate.sensory": ["noise", "sensory"],
+        "spoon_gate.ef": ["plan", "focus", "complex"],
+        "spoon_gate.emotional": ["emotional", "stress"],
+        # IBNS/ICNU
+        "energy.interest": ["learn", "create", "explore", "design", "build", "new", "fun", "exciting"],
+        "energy.integrity": ["values", "purpose", "meaning", "identity", "core", "belief", "mission", "vision"],
+        "energy.essential_integrity": ["values", "purpose", "meaning", "identity", "core"],
+    },
+    "de": {
+        "inertia.autistic": [
+            "feststecken", "stecke fest", "komme nicht los", "erstarrt", "überfordert",
+            "weiß nicht wie", "zu viel", "entscheidungslähmung", "gelähmt", "grübeln",
+        ],
+        "inertia.activation": [
+            "sollte", "müsste", "später", "morgen", "irgendwann", "aufschieben",
+            "faul", "motivation", "keine lust", "abgelenkt", "vergesse",
+        ],
+        "inertia.want": ["will", "möchte"],
+        "inertia.can": ["kann"],
+        "inertia.should": ["sollte", "müsste"],
+        "inertia.later": ["später", "morgen"],
+        "spoons.social": ["treffen", "anrufen", "telefonat", "freund", "besprechung"],
+        "spoons.sensory": ["lärm", "laut", "grell", "menschenmenge", "sensorisch"],
+        "spoons.ef": ["planen", "organisieren", "entscheiden", "fokus", "komplex"],
+        "spoons.emotional": ["emotional", "schwierig", "schwer", "stress"],
+        "spoons.physical": ["sport", "spazier", "laufen", "körperlich"],
+        "spoons.masking": ["präsentation", "vorstellungsgespräch", "öffentlich"],
+        "spoon_gate.social": ["treffen", "besprechung"],
+        "spoon_gate.sensory": ["lärm", "sensorisch"],
+        "spoon_gate.ef": ["planen", "fokus", "komplex"],
+        "spoon_gate.emotional": ["emotional", "stress"],
+        "energy.interest": ["lernen", "erstellen", "entdecken", "gestalten", "bauen", "neue", "spaß"],
+        "energy.integrity": ["grundwerte", "sinn", "bedeutung", "identität", "überzeugung", "mission", "vision"],
+        "energy.essential_integrity": ["grundwerte", "sinn", "bedeutung", "identität"],
+    },
+}
+
+
+# =============================================================================
+# Registry
+# =============================================================================
+
+class LexiconRegistry:
+    """Keyword lexicons by language, compiled to one matcher per language."""
+
+    CACHE_SIZE = 4096
+
+    def __init__(
+        self,
+        lexicons: Optional[Lexicons] = None,
+        path: Optional[str] = None,
+        default_language: str = DEFAULT_LANGUAGE,
+        cache_size: int = CACHE_SIZE,
+    ):
+        """
+        Args:
+            lexicons: Language -> category -> keywords (defaults to the built-in set)
+            path: Optional JSON lexicon file overriding categories per language
+            default_language: Language whose keywords every language includes
+            cache_size: Cached (language, text) results
+        """
+        self._base = _copy(lexicons if lexicons is not None else DEFAULT_LEXICONS)
+        self._path = path
+        self._mtime: Optional[float] = None
+        self._default = default_language
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+        self._lexicons: dict[str, dict[str, list[str]]] = self._base
+        self._matchers: dict[str, KeywordMatcher] = {}
+        self._cache: OrderedDict[tuple[str, str], dict[str, int]] = OrderedDict()
+        if path is not None:
+            self.reload_if_changed()
+
+    @property
+    def languages(self) -> list[str]:
+        """Languages with their own lexicons."""
+        return list(self._lexicons)
+
+    def categories(self, language: Optional[str] = None) -> tuple[str, ...]:
+        """Categories matched for a language."""
+        return self.matcher(language).categories
+
+    def matcher(self, language: Optional[str] = None) -> KeywordMatcher:
+        """
+        Compiled matcher for a language (compiled on first use).
+
+        Args:
+            language: Language code (None or unknown: the default language)
+
+        Returns:
+            KeywordMatcher over the language's categories
+        """
+        language = language if language in self._lexicons else self._default
+        matchers = self._matchers
+        matcher = matchers.get(language)
+        if matcher is None:
+            matcher = KeywordMatcher(self._merged(language))
+            matchers[language] = matcher
+        return matcher
+
+    def counts(self, text: str, language: Optional[str] = None) -> dict[str, int]:
+        """
+        Hit counts of every category in one pass over text.
+
+        Args:
+            text: Text to scan
+            language: Language code (None or unknown: the default language)
+
+        Returns:
+            Category -> number of distinct keywords found (0 if none);
+            shared with the cache, so not to be modified
+        """
+        language = language if language in self._lexicons else self._default
+        key = (language, text)
+        cache = self._cache
+        hits = cache.get(key)
+        if hits is not None:
+            return hits
+        hits = self.matcher(language).counts(text)
+        cache[key] = hits
+        if len(cache) > self._cache_size:
+            try:
+                cache.popitem(last=False)
+            except KeyError:
+                pass
+        return hits
+
+    def reload(self, lexicons: Optional[Lexicons] = None) -> None:
+        """
+        Swap in new lexicons (hot reload).
+
+        Args:
+            lexicons: Language -> category -> keywords, overriding the
+                registry's base lexicons per category (None: base only)
+        """
+        merged = _copy(self._base)
+        for language, categories in (lexicons or {}).items():
+            merged.setdefault(language, {}).update(
+                {category: list(keywords) for category, keywords in categories.items()}
+            )
+        with self._lock:
+            # Readers keep using the old matchers until these swaps
+            self._lexicons = merged
+            self._matchers = {}
+            self._cache = OrderedDict()
+        logger.info(f"Lexicons reloaded: {sorted(merged)}")
+
+    def reload_if_changed(self) -> bool:
+        """
+        Re-read the lexicon file if it changed since the last load.
+
+        A missing or malformed file keeps the current lexicons.
+
+        Returns:
+            True if new lexicons were loaded
+        """
+        if self._path is None:
+            return False
+        try:
+            mtime = os.stat(self._path).st_mtime
+        except OSError as e:
+            logger.warning(f"Lexicon file unavailable, keeping current lexicons: {type(e).__name__}")
+            return False
+        if mtime == self._mtime:
+            return False
+        try:
+            with open(self._path, encoding="utf-8") as f:
+                data = json.load(f)
+            if not isinstance(data, dict) or not all(isinstance(v, dict) for v in data.values()):
+                raise ValueError("expected {language: {category: [keywords]}}")
+        except (OSError, ValueError) as e:
+            logger.warning(f"Lexicon file not loaded, keeping current lexicons: {type(e).__name__}")
+            return False
+        self.reload(data)
+        self._mtime = mtime
+        return True
+
+    def _merged(self, language: str) -> dict[str, list[str]]:
+        """Default-language categories plus the language's own keywords."""
+        lexicons = self._lexicons
+        merged = {category: list(keywords) for category, keywords in lexicons.get(self._default, {}).items()}
+        if language != self._default:
+            for category, keywords in lexicons.get(language, {}).items():
+                merged.setdefault(category, []).extend(keywords)
+        return merged
+
+
+def _copy(lexicons: Lexicons) -> dict[str, dict[str, list[str]]]:
+    return {
+        language: {category: list(keywords) for category, keywords in categories.items()}
+        for language, categories in lexicons.items()
+    }
+
+
+# Global registry instance
+_registry: Optional[LexiconRegistry] = None
+
+
+def get_lexicon_registry() -> LexiconRegistry:
+    """
+    Get the global lexicon registry.
+
+    Uses the file in AURORA_LEXICON_PATH, if set, on top of the built-in
+    lexicons.
+
+    Returns:
+        The global LexiconRegistry instance
+    """
+    global _registry
+    if _registry is None:
+        _registry = LexiconRegistry(path=os.environ.get("AURORA_LEXICON_PATH"))
+    return _registry
+
+
+def set_lexicon_registry(registry: LexiconRegistry) -> None:
+    """
+    Set the global lexicon registry.
+
+    Args:
+        registry: The LexiconRegistry to use globally
+    """
+    global _registry
+    _registry = registry
+
+
+__all__ = [
+    "DEFAULT_LEXICONS",
+    "LexiconRegistry",
+    "get_lexicon_registry",
+    "set_lexicon_registry",
+]
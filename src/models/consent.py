@@ -38,6 +38,7 @@ import hmac
 import uuid
 
 from sqlalchemy import (
+    select,
     Column,
     Integer,
     String,
@@ -47,9 +48,12 @@ from sqlalchemy import (
     Boolean,
     Text,
 )
-from sqlalchemy.orm import DeclarativeBase, Session as DbSession
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.sql import func
 
+from src.models.database import unit_of_work
+
 
 # ============================================
 # SQLAlchemy Base
@@ -212,19 +216,19 @@ class ConsentService:
         is_valid = await service.verify_consent(user_id=1)
 
     Attributes:
-        _session: SQLAlchemy database session.
+        _session: SQLAlchemy async database session.
         _hmac_secret: Secret key for IP hashing (HMAC).
     """
 
     # Default consent version - should be updated with each consent text change
     DEFAULT_CONSENT_VERSION = "1.0"
 
-    def __init__(self, session: DbSession, hmac_secret: Optional[str] = None):
+    def __init__(self, session: AsyncSession, hmac_secret: Optional[str] = None):
         """
         Initialize the consent service.
 
         Args:
-            session: SQLAlchemy database session for persistence.
+            session: SQLAlchemy async database session for persistence.
             hmac_secret: Secret key for HMAC hashing of IP addresses.
                          REQUIRED - must be provided via environment variable.
         """
@@ -310,34 +314,31 @@ class ConsentService:
         if not language:
             raise ValueError("consent_language cannot be empty")
 
-        # Check if user already has active consent
-        existing = await self._get_active_consent(user_id)
-        if existing:
-            # Update existing record instead of creating new one
-            existing.consent_given_at = datetime.now(timezone.utc)
-            existing.consent_version = version
-            existing.consent_language = language
-            existing.ip_hash = self._hash_ip(ip)
-            existing.consent_text_hash = self._hash_consent_text(consent_text)
-            existing.consent_withdrawn_at = None
-            self._session.commit()
-            return existing
-
-        # Create new consent record
-        record = ConsentRecord(
-            user_id=user_id,
-            consent_version=version,
-            consent_language=language,
-            consent_given_at=datetime.now(timezone.utc),
-            consent_withdrawn_at=None,
-            ip_hash=self._hash_ip(ip),
-            consent_text_hash=self._hash_consent_text(consent_text),
-        )
-
-        self._session.add(record)
-        self._session.commit()
-        self._session.refresh(record)
+        async with unit_of_work(self._session):
+            # Check if user already has active consent
+            record = await self._get_active_consent(user_id)
+            if record:
+                # Update existing record instead of creating new one
+                record.consent_given_at = datetime.now(timezone.utc)
+                record.consent_version = version
+                record.consent_language = language
+                record.ip_hash = self._hash_ip(ip)
+                record.consent_text_hash = self._hash_consent_text(consent_text)
+                record.consent_withdrawn_at = None
+            else:
+                # Create new consent record
+                record = ConsentRecord(
+                    user_id=user_id,
+                    consent_version=version,
+                    consent_language=language,
+                    consent_given_at=datetime.now(timezone.utc),
+                    consent_withdrawn_at=None,
+                    ip_hash=self._hash_ip(ip),
+                    consent_text_hash=self._hash_consent_text(consent_text),
+                )
+                self._session.add(record)
 
+        await self._session.refresh(record)
         return record
 
     async def verify_consent(self, user_id: int) -> bool:
@@ -390,9 +391,7 @@ class ConsentService:
             )
 
         # Get the most recent consent record
-        record = self._session.query(ConsentRecord).filter(
-            ConsentRecord.user_id == user_id
-        ).order_by(ConsentRecord.consent_given_at.desc()).first()
+        record = await self.get_consent_record(user_id)
 
         if record is None:
             return ConsentValidationResult(
@@ -455,15 +454,15 @@ class ConsentService:
         if user_id <= 0:
             raise ValueError("user_id must be a positive integer")
 
-        record = await self._get_active_consent(user_id)
-        if record is None:
-            raise RuntimeError(
-                f"No active consent record found for user {user_id}. "
-                "Cannot withdraw consent."
-            )
+        async with unit_of_work(self._session):
+            record = await self._get_active_consent(user_id)
+            if record is None:
+                raise RuntimeError(
+                    f"No active consent record found for user {user_id}. "
+                    "Cannot withdraw consent."
+                )
 
-        record.consent_withdrawn_at = datetime.now(timezone.utc)
-        self._session.commit()
+            record.consent_withdrawn_at = datetime.now(timezone.utc)
 
     async def get_consent_version(self, user_id: int) -> Optional[str]:
         """
@@ -495,9 +494,13 @@ class ConsentService:
         Returns:
             The most recent ConsentRecord, or None if not found.
         """
-        return self._session.query(ConsentRecord).filter(
-            ConsentRecord.user_id == user_id
-        ).order_by(ConsentRecord.consent_given_at.desc()).first()
+        result = await self._session.execute(
+            select(ConsentRecord)
+            .where(ConsentRecord.user_id == user_id)
+            .order_by(ConsentRecord.consent_given_at.desc())
+            .limit(1)
+        )
+        return result.scalars().first()
 
     async def _get_active_consent(self, user_id: int) -> Optional[ConsentRecord]:
         """
@@ -509,10 +512,16 @@ class ConsentService:
         Returns:
             The active ConsentRecord, or None if no active consent exists.
         """
-        return self._session.query(ConsentRecord).filter(
-            ConsentRecord.user_id == user_id,
-            ConsentRecord.consent_withdrawn_at.is_(None),
-        ).order_by(ConsentRecord.consent_given_at.desc()).first()
+        result = await self._session.execute(
+            select(ConsentRecord)
+            .where(
+                ConsentRecord.user_id == user_id,
+                ConsentRecord.consent_withdrawn_at.is_(None),
+            )
+            .order_by(ConsentRecord.consent_given_at.desc())
+            .limit(1)
+        )
+        return result.scalars().first()
 
     async def get_consent_history(self, user_id: int) -> list[ConsentRecord]:
         """
@@ -527,12 +536,12 @@ class ConsentService:
         Returns:
             List of ConsentRecord objects, oldest first.
         """
-        return (
-            self._session.query(ConsentRecord)
-            .filter(ConsentRecord.user_id == user_id)
+        result = await self._session.execute(
+            select(ConsentRecord)
+            .where(ConsentRecord.user_id == user_id)
             .order_by(ConsentRecord.consent_given_at.desc())
-            .all()
         )
+        return list(result.scalars().all())
 
     async def reconsent(
         self,
@@ -572,7 +581,7 @@ class ConsentService:
 
 
 async def check_consent_gate(
-    session: DbSession,
+    session: AsyncSession,
     user_id: int,
 ) -> ConsentValidationResult:
     """
@@ -582,7 +591,7 @@ async def check_consent_gate(
     It should be called before any data processing that requires consent.
 
     Args:
-        session: SQLAlchemy database session.
+        session: SQLAlchemy async database session.
         user_id: The ID of the user to check.
 
     Returns:
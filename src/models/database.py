@@ -0,0 +1,261 @@
+"""
+Database Engine for Aurora Sun V1.
+
+One async engine per process (SQLAlchemy AsyncEngine over asyncpg), shared
+by all services, so connections are pooled instead of opened per request,
+and no service blocks the event loop on a database round-trip.
+
+- Pool: sized per process (pool_size + max_overflow is the most connections
+  one worker can hold), pre-ping against dropped connections, recycled
+  before server-side idle timeouts, short checkout timeout so overload
+  fails fast instead of queueing every message.
+- Statement caches: asyncpg prepared statements per connection and the
+  SQLAlchemy compiled-query cache per engine. Set
+  AURORA_DB_STATEMENT_CACHE_SIZE=0 behind PgBouncer in transaction mode.
+- unit_of_work(): one commit (or rollback) per update; nested units join
+  the outermost one.
+
+Configuration (environment):
+    AURORA_DATABASE_URL: SQLAlchemy async URL (postgresql+asyncpg://...)
+    AURORA_DB_POOL_SIZE, AURORA_DB_MAX_OVERFLOW, AURORA_DB_POOL_TIMEOUT,
+    AURORA_DB_POOL_RECYCLE, AURORA_DB_STATEMENT_CACHE_SIZE
+
+Usage:
+    async with session_scope() as session:
+        service = InertiaDetector(session)
+        event = await service.log_event(...)
+
+Reference: ARCHITECTURE.md Section 3 (Neurotype Segmentation)
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Optional
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_DATABASE_URL = "postgresql+asyncpg://aurora@localhost:5432/aurora"
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+@dataclass
+class DatabaseConfig:
+    """Engine and pool settings.
+
+    Attributes:
+        url: SQLAlchemy async database URL
+        pool_size: Connections kept open per process
+        max_overflow: Extra connections under burst load
+        pool_timeout: Seconds to wait for a free connection
+        pool_recycle: Seconds after which a connection is replaced
+        statement_cache_size: Prepared statements cached per asyncpg connection
+        query_cache_size: Compiled SQL cached per engine
+        echo: Log all SQL
+    """
+
+    url: str = DEFAULT_DATABASE_URL
+    pool_size: int = 10
+    max_overflow: int = 10
+    pool_timeout: float = 5.0
+    pool_recycle: int = 1800
+    statement_cache_size: int = 512
+    query_cache_size: int = 1200
+    echo: bool = False
+
+    @classmethod
+    def from_env(cls) -> "DatabaseConfig":
+        """Load the configuration from the environment."""
+        return cls(
+            url=os.environ.get("AURORA_DATABASE_URL", cls.url),
+            pool_size=int(os.environ.get("AURORA_DB_POOL_SIZE", cls.pool_size)),
+            max_overflow=int(os.environ.get("AURORA_DB_MAX_OVERFLOW", cls.max_overflow)),
+            pool_timeout=float(os.environ.get("AURORA_DB_POOL_TIMEOUT", cls.pool_timeout)),
+            pool_recycle=int(os.environ.get("AURORA_DB_POOL_RECYCLE", cls.pool_recycle)),
+            statement_cache_size=int(
+                os.environ.get("AURORA_DB_STATEMENT_CACHE_SIZE", cls.statement_cache_size)
+            ),
+        )
+
+    def engine_kwargs(self) -> dict[str, Any]:
+        """Keyword arguments for create_async_engine()."""
+        kwargs: dict[str, Any] = {
+            "echo": self.echo,
+            "query_cache_size": self.query_cache_size,
+            "pool_pre_ping": True,
+        }
+        if make_url(self.url).get_backend_name() == "sqlite":
+            # SQLite (tests, local runs) has no server-side pool to size
+            return kwargs
+        kwargs.update(
+            pool_size=self.pool_size,
+            max_overflow=self.max_overflow,
+            pool_timeout=self.pool_timeout,
+            pool_recycle=self.pool_recycle,
+            connect_args={"statement_cache_size": self.statement_cache_size},
+        )
+        return kwargs
+
+    def engine_url(self) -> Any:
+        """URL with the dialect-level prepared statement cache size."""
+        url = make_url(self.url)
+        if url.get_dialect().driver == "asyncpg":
+            url = url.update_query_dict(
+                {"prepared_statement_cache_size": str(self.statement_cache_size)}
+            )
+        return url
+
+
+def create_engine(config: Optional[DatabaseConfig] = None) -> AsyncEngine:
+    """
+    Create an async engine.
+
+    Args:
+        config: Engine settings (defaults to DatabaseConfig.from_env())
+
+    Returns:
+        AsyncEngine
+    """
+    config = config or DatabaseConfig.from_env()
+    engine = create_async_engine(config.engine_url(), **config.engine_kwargs())
+    logger.info(
+        f"Database engine created ({engine.url.render_as_string(hide_password=True)}, "
+        f"pool_size={config.pool_size}, max_overflow={config.max_overflow})"
+    )
+    return engine
+
+
+# =============================================================================
+# Shared Engine
+# =============================================================================
+
+_engine: Optional[AsyncEngine] = None
+_session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+
+
+def get_engine() -> AsyncEngine:
+    """
+    Get the process-wide engine (created from the environment on first use).
+
+    Returns:
+        The shared AsyncEngine
+    """
+    global _engine
+    if _engine is None:
+        _engine = create_engine()
+    return _engine
+
+
+def set_engine(engine: AsyncEngine) -> None:
+    """
+    Set the process-wide engine (tests, custom configuration).
+
+    Args:
+        engine: The AsyncEngine to share
+    """
+    global _engine, _session_factory
+    _engine = engine
+    _session_factory = None
+
+
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """
+    Get the session factory bound to the shared engine.
+
+    Sessions keep loaded attributes after commit (expire_on_commit=False), so
+    returned models can be read without another round-trip.
+
+    Returns:
+        async_sessionmaker for AsyncSession
+    """
+    global _session_factory
+    if _session_factory is None:
+        _session_factory = async_sessionmaker(get_engine(), expire_on_commit=False)
+    return _session_factory
+
+
+async def dispose_engine() -> None:
+    """Close all pooled connections (shutdown)."""
+    global _engine, _session_factory
+    if _engine is not None:
+        await _engine.dispose()
+    _engine = None
+    _session_factory = None
+
+
+# =============================================================================
+# Sessions and Units of Work
+# =============================================================================
+
+@asynccontextmanager
+async def session_scope(
+    session_factory: Optional[async_sessionmaker[AsyncSession]] = None,
+) -> AsyncIterator[AsyncSession]:
+    """
+    Open a session from the shared pool and close it afterwards.
+
+    Args:
+        session_factory: Factory to use (defaults to get_session_factory())
+
+    Yields:
+        AsyncSession
+    """
+    factory = session_factory or get_session_factory()
+    async with factory() as session:
+        yield session
+
+
+@asynccontextmanager
+async def unit_of_work(session: AsyncSession) -> AsyncIterator[AsyncSession]:
+    """
+    Run one update as a single transaction: commit on success, roll back on error.
+
+    Units nest: an inner unit joins the outermost one, which alone commits,
+    so a service method can call another without committing twice.
+
+    Args:
+        session: The session to work in
+
+    Yields:
+        The same session
+    """
+    depth = session.info.get("unit_of_work_depth", 0)
+    session.info["unit_of_work_depth"] = depth + 1
+    try:
+        yield session
+        if depth == 0:
+            await session.commit()
+    except BaseException:
+        if depth == 0:
+            await session.rollback()
+        raise
+    finally:
+        session.info["unit_of_work_depth"] = depth
+
+
+__all__ = [
+    "DatabaseConfig",
+    "DEFAULT_DATABASE_URL",
+    "create_engine",
+    "get_engine",
+    "set_engine",
+    "get_session_factory",
+    "dispose_engine",
+    "session_scope",
+    "unit_of_work",
+]
@@ -9,12 +9,17 @@ References:
 - ARCHITECTURE.md Section 14 (Data Models)
 """
 
+import json
+import struct
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Any, Optional, Sequence
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text, Index, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Float, DateTime, Text, Index, ForeignKey, JSON, LargeBinary
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.types import TypeDecorator
 
 from src.models.base import Base
 from src.lib.encryption import DataClassification, EncryptedField, get_encryption_service
@@ -56,6 +61,114 @@ class EnergyLevel(str, Enum):
     HYPERFOCUS = "hyperfocus"   # Peak engagement
 
 
+# =============================================================================
+# Modality Vector
+# =============================================================================
+
+# Fixed order of the sensory modality vector
+SENSORY_MODALITIES: tuple[str, ...] = ("visual", "auditory", "tactile", "olfactory", "proprioceptive")
+MODALITY_INDEX: dict[str, int] = {name: i for i, name in enumerate(SENSORY_MODALITIES)}
+ZERO_MODALITIES: tuple[float, ...] = (0.0,) * len(SENSORY_MODALITIES)
+
+_MODALITY_STRUCT = struct.Struct(f"<{len(SENSORY_MODALITIES)}f")
+
+
+def pack_modalities(loads: Sequence[float]) -> bytes:
+    """Pack a modality vector as little-endian float32 (20 bytes)."""
+    return _MODALITY_STRUCT.pack(*loads)
+
+
+def unpack_modalities(data: bytes) -> tuple[float, ...]:
+    """
+    Unpack a modality vector packed by pack_modalities().
+
+    float32 keeps about 7 significant digits; values are rounded to 4
+    decimals so 12.3 reads back as 12.3.
+    """
+    return tuple(round(v, 4) for v in _MODALITY_STRUCT.unpack(data))
+
+
+def modalities_from_dict(loads: dict[str, float]) -> tuple[float, ...]:
+    """Modality vector from a {modality: load} dict (unknown names ignored)."""
+    return tuple(float(loads.get(name, 0.0)) for name in SENSORY_MODALITIES)
+
+
+def modalities_to_dict(vector: Sequence[float]) -> dict[str, float]:
+    """{modality: load} dict from a modality vector."""
+    return dict(zip(SENSORY_MODALITIES, vector))
+
+
+def modalities_from_bytes(data: bytes) -> Optional[tuple[float, ...]]:
+    """
+    Decode a stored modality vector (None if malformed).
+
+    Rows written before the packed format hold a JSON object. A packed
+    vector never starts with "{" and ends with "}" (its last byte would be
+    the high byte of a float32 above 1e37), so those rows are recognised
+    even when the JSON is exactly 20 bytes long.
+    """
+    if data[:1] == b"{" and data[-1:] == b"}":
+        try:
+            return modalities_from_dict(json.loads(data))
+        except (TypeError, ValueError, AttributeError):
+            pass
+    return unpack_modalities(data) if len(data) == _MODALITY_STRUCT.size else None
+
+
+class ModalityVector(TypeDecorator):
+    """
+    Sensory modality loads as a packed float32 array (SENSORY_MODALITIES order).
+
+    Binds a vector (sequence of floats) or a {modality: load} dict; loads a
+    tuple. Rows written before the packed format (JSON text) still load.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect: Any) -> Optional[bytes]:
+        if value is None:
+            return None
+        if isinstance(value, dict):
+            value = modalities_from_dict(value)
+        return pack_modalities(value)
+
+    def process_result_value(self, value: Any, dialect: Any) -> Optional[tuple[float, ...]]:
+        if value is None:
+            return None
+        if isinstance(value, str):
+            value = value.encode()
+        return modalities_from_bytes(bytes(value))
+
+
+class modality_vector_hex(FunctionElement):
+    """Hex text of a packed modality vector (for text-typed UNION columns)."""
+
+    type = Text()
+    inherit_cache = True
+
+
+@compiles(modality_vector_hex)
+def _compile_modality_vector_hex(element: Any, compiler: Any, **kw: Any) -> str:
+    return f"hex({compiler.process(element.clauses, **kw)})"
+
+
+@compiles(modality_vector_hex, "postgresql")
+def _compile_modality_vector_hex_pg(element: Any, compiler: Any, **kw: Any) -> str:
+    return f"encode({compiler.process(element.clauses, **kw)}, 'hex')"
+
+
+def modalities_from_hex(text: Optional[str]) -> Optional[tuple[float, ...]]:
+    """Decode modality_vector_hex() output (None if missing or malformed)."""
+    if not text:
+        return None
+    try:
+        data = bytes.fromhex(text)
+    except ValueError:
+        return None
+    return modalities_from_bytes(data)
+
+
 # =============================================================================
 # Sensory Profile Model
 # =============================================================================
@@ -80,11 +193,11 @@ class SensoryProfile(Base):
     # Primary key
     id = Column(Integer, primary_key=True, autoincrement=True)
 
-    # Sensory load per modality (0-100 scale)
-    # Stored as encrypted JSON for ART.9 classification
-    _modality_loads_plaintext = Column(
+    # Sensory load per modality (0-100 scale), SENSORY_MODALITIES order
+    # Packed float32 vector (20 bytes); ART.9 field encryption still pending
+    modality_vector = Column(
         "modality_loads",
-        Text,
+        ModalityVector,
         nullable=True,
     )
 
@@ -123,31 +236,24 @@ class SensoryProfile(Base):
     @property
     def modality_loads(self) -> dict:
         """
-        Get decrypted modality loads.
+        Get modality loads as a {modality: load} dict.
 
         Data Classification: ART_9_SPECIAL (encrypted)
         """
-        if self._modality_loads_plaintext is None:
-            return {}
-        try:
-            # TODO: Integrate EncryptionService.decrypt_field() when available
-            # For now, return parsed JSON (will be fixed in next iteration)
-            import json
-            return json.loads(self._modality_loads_plaintext)
-        except Exception:
+        # TODO: Integrate EncryptionService.decrypt_field() when available
+        if self.modality_vector is None:
             return {}
+        return modalities_to_dict(self.modality_vector)
 
     @modality_loads.setter
     def modality_loads(self, value: dict) -> None:
         """
-        Set encrypted modality loads.
+        Set modality loads from a {modality: load} dict.
 
         Data Classification: ART_9_SPECIAL (encrypted)
         """
-        import json
         # TODO: Integrate EncryptionService.encrypt_field() when available
-        # For now, store JSON (will be fixed in next iteration)
-        self._modality_loads_plaintext = json.dumps(value)
+        self.modality_vector = modalities_from_dict(value)
 
     def __repr__(self) -> str:
         return f"<SensoryProfile(user_id={self.user_id}, overall_load={self.overall_load:.1f})>"
@@ -0,0 +1,155 @@
+"""
+Modules package for Aurora Sun V1.
+
+This package contains the user-facing modules (Module protocol implementations):
+- planning.py: Daily planning flow (Vision-to-Task)
+- review.py: Daily review flow (Vision-to-Task)
+- capture.py: Quick capture (Second Brain)
+- future_letter.py: Future letter deep dive (Vision-to-Task)
+
+Modules are registered lazily: only their names and intents are recorded at
+startup, and each module is imported and built on the first routed intent.
+
+Usage:
+    from src.core import get_registry
+    from src.modules import register_builtin_modules
+
+    register_builtin_modules(get_registry())
+
+Reference: ARCHITECTURE.md Section 2 (Module System)
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any, Optional
+
+from src.core.callback_router import CallbackRouter, get_callback_router
+from src.core.module_registry import ModuleRegistry, get_registry
+
+if TYPE_CHECKING:
+    from .planning import PlanningModule
+    from .review import ReviewModule
+    from .capture import CaptureModule
+    from .future_letter import FutureLetterModule
+
+
+# Built-in modules: (name, import path, intents).
+# Intents are declared here so routing works before the module is imported;
+# they must match the `intents` attribute of each module class.
+BUILTIN_MODULES: list[tuple[str, str, list[str]]] = [
+    (
+        "planning",
+        "src.modules.planning:PlanningModule",
+        [
+            "planning.start",
+            "planning.prioritize",
+            "planning.breakdown",
+            "planning.add_task",
+            "planning.show_tasks",
+        ],
+    ),
+    (
+        "review",
+        "src.modules.review:ReviewModule",
+        [
+            "review.start",
+            "review.accomplishments",
+            "review.challenges",
+            "review.energy",
+            "review.reflection",
+            "review.forward",
+        ],
+    ),
+    (
+        "capture",
+        "src.modules.capture:CaptureModule",
+        [
+            "capture.quick",
+            "capture.voice",
+            "capture.task",
+            "capture.idea",
+            "capture.note",
+        ],
+    ),
+    (
+        "future_letter",
+        "src.modules.future_letter:FutureLetterModule",
+        [
+            "future_letter.start",
+            "future_letter.write",
+            "future_letter.continue",
+        ],
+    ),
+]
+
+
+# Callback module IDs (persisted in inline buttons: never reuse an ID) and
+# callback actions (append-only). Every module also supports "enter".
+BUILTIN_CALLBACKS: list[tuple[str, int, list[str]]] = [
+    ("planning", 1, []),
+    ("review", 2, []),
+    ("capture", 3, []),
+    ("future_letter", 4, []),
+]
+
+
+def register_builtin_modules(
+    registry: Optional[ModuleRegistry] = None,
+    callback_router: Optional[CallbackRouter] = None,
+) -> ModuleRegistry:
+    """Register all built-in modules lazily.
+
+    Args:
+        registry: Registry to register into (defaults to the global registry)
+        callback_router: Router for the modules' button actions (defaults to
+            the global callback router)
+
+    Returns:
+        The registry the modules were registered into
+    """
+    if registry is None:
+        registry = get_registry()
+    if callback_router is None:
+        callback_router = get_callback_router()
+
+    for name, import_path, intents in BUILTIN_MODULES:
+        if not registry.is_registered(name):
+            registry.register_lazy(name, import_path, intents)
+
+    for name, module_id, actions in BUILTIN_CALLBACKS:
+        if not callback_router.is_registered(name):
+            callback_router.register(name, module_id, actions)
+
+    return registry
+
+
+# Public name -> submodule that defines it. Submodules are imported on first
+# attribute access (PEP 562), so importing this package stays cheap.
+_LAZY_EXPORTS: dict[str, str] = {
+    "PlanningModule": ".planning",
+    "ReviewModule": ".review",
+    "CaptureModule": ".capture",
+    "FutureLetterModule": ".future_letter",
+}
+
+__all__ = [
+    "BUILTIN_MODULES",
+    "BUILTIN_CALLBACKS",
+    "register_builtin_modules",
+    *_LAZY_EXPORTS,
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule that defines ``name`` on first access."""
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -17,176 +17,189 @@ Services:
 Reference: ARCHITECTURE.md Section 4 (Intelligence Layer)
 """
 
-from .tension_engine import (
-    TensionEngine,
-    TensionState,
-    Quadrant,
-    OverrideLevel,
-    FulfillmentType,
-    get_tension_engine,
-    get_user_tension,
-)
-
-from .coaching_engine import (
-    CoachingEngine,
-    CoachingResponse,
-    ChannelDominance,
-    get_coaching_engine,
-)
-
-from .pattern_detection import (
-    PatternDetectionService,
-    CycleType,
-    CycleSeverity,
-    DetectedCycle,
-    SignalName,
-    Intervention,
-    get_pattern_detection_service,
-)
-
-# Neurostate Services
-from .neurostate.sensory import (
-    SensoryStateAssessment,
-    SensoryState,
-    ModalityInput,
-)
-
-from .neurostate.inertia import (
-    InertiaDetector,
-    InertiaEventData,
-    InertiaDetectionResult,
-)
-
-from .neurostate.burnout import (
-    BurnoutClassifier,
-    BurnoutState,
-    BurnoutClassification,
-)
-
-from .neurostate.masking import (
-    MaskingLoadTracker,
-    MaskingLoad,
-    MaskingEvent,
-)
-
-from .neurostate.channel import (
-    ChannelDominanceDetector,
-    ChannelStateData,
-    ChannelDetectionResult,
-)
-
-from .neurostate.energy import (
-    EnergyPredictor,
-    BehavioralSignals,
-    EnergyPrediction,
-)
-
-from .effectiveness import (
-    EffectivenessService,
-    InterventionType,
-    InterventionOutcome,
-    SegmentCode,
-    InterventionInstance,
-    EffectivenessMetrics,
-    VariantExperiment,
-    EffectivenessMetricsResponse,
-    VariantComparisonResult,
-    InterventionOutcomeData,
-    EffectivenessReport,
-    get_effectiveness_service,
-)
-
-# Revenue Tracker (Money Pillar)
-from .revenue_tracker import (
-    RevenueTracker,
-    RevenueEntry,
-    RevenueBalance,
-    RevenueCategory,
-    EntryType,
-    get_revenue_tracker,
-    parse_and_save_revenue,
-)
-
-# Crisis Safety Net (SW-11)
-from .crisis_service import (
-    CrisisService,
-    CrisisLevel,
-    CrisisSignal,
-    CrisisResponse,
-    CountryCode,
-    get_crisis_service,
-    check_and_handle_crisis,
-)
-
-
-__all__ = [
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .tension_engine import (
+        TensionEngine,
+        TensionState,
+        Quadrant,
+        OverrideLevel,
+        FulfillmentType,
+        get_tension_engine,
+        get_user_tension,
+    )
+    from .coaching_engine import (
+        CoachingEngine,
+        CoachingResponse,
+        ChannelDominance,
+        get_coaching_engine,
+    )
+    from .pattern_detection import (
+        PatternDetectionService,
+        CycleType,
+        CycleSeverity,
+        DetectedCycle,
+        SignalName,
+        Intervention,
+        get_pattern_detection_service,
+    )
+    from .neurostate.sensory import (
+        SensoryStateAssessment,
+        SensoryState,
+        ModalityInput,
+    )
+    from .neurostate.inertia import (
+        InertiaDetector,
+        InertiaEventData,
+        InertiaDetectionResult,
+    )
+    from .neurostate.burnout import (
+        BurnoutClassifier,
+        BurnoutState,
+        BurnoutClassification,
+    )
+    from .neurostate.masking import (
+        MaskingLoadTracker,
+        MaskingLoad,
+        MaskingEvent,
+    )
+    from .neurostate.channel import (
+        ChannelDominanceDetector,
+        ChannelStateData,
+        ChannelDetectionResult,
+    )
+    from .neurostate.energy import (
+        EnergyPredictor,
+        BehavioralSignals,
+        EnergyPrediction,
+    )
+    from .effectiveness import (
+        EffectivenessService,
+        InterventionType,
+        InterventionOutcome,
+        SegmentCode,
+        InterventionInstance,
+        EffectivenessMetrics,
+        VariantExperiment,
+        EffectivenessMetricsResponse,
+        VariantComparisonResult,
+        InterventionOutcomeData,
+        EffectivenessReport,
+        get_effectiveness_service,
+    )
+    from .revenue_tracker import (
+        RevenueTracker,
+        RevenueEntry,
+        RevenueBalance,
+        RevenueCategory,
+        EntryType,
+        get_revenue_tracker,
+        parse_and_save_revenue,
+    )
+    from .side_effect_writer import SQLAlchemyBulkWriter
+    from .crisis_service import (
+        CrisisService,
+        CrisisLevel,
+        CrisisSignal,
+        CrisisResponse,
+        CountryCode,
+        get_crisis_service,
+        check_and_handle_crisis,
+    )
+
+
+# Public name -> submodule that defines it. Submodules are imported on first
+# attribute access (PEP 562), so importing this package stays cheap.
+_LAZY_EXPORTS: dict[str, str] = {
     # Tension Engine
-    "TensionEngine",
-    "TensionState",
-    "Quadrant",
-    "OverrideLevel",
-    "FulfillmentType",
-    "get_tension_engine",
-    "get_user_tension",
+    "TensionEngine": ".tension_engine",
+    "TensionState": ".tension_engine",
+    "Quadrant": ".tension_engine",
+    "OverrideLevel": ".tension_engine",
+    "FulfillmentType": ".tension_engine",
+    "get_tension_engine": ".tension_engine",
+    "get_user_tension": ".tension_engine",
     # Coaching Engine
-    "CoachingEngine",
-    "CoachingResponse",
-    "ChannelDominance",
-    "get_coaching_engine",
+    "CoachingEngine": ".coaching_engine",
+    "CoachingResponse": ".coaching_engine",
+    "ChannelDominance": ".coaching_engine",
+    "get_coaching_engine": ".coaching_engine",
     # Pattern Detection
-    "PatternDetectionService",
-    "CycleType",
-    "CycleSeverity",
-    "DetectedCycle",
-    "SignalName",
-    "Intervention",
-    "get_pattern_detection_service",
+    "PatternDetectionService": ".pattern_detection",
+    "CycleType": ".pattern_detection",
+    "CycleSeverity": ".pattern_detection",
+    "DetectedCycle": ".pattern_detection",
+    "SignalName": ".pattern_detection",
+    "Intervention": ".pattern_detection",
+    "get_pattern_detection_service": ".pattern_detection",
     # Neurostate Services
-    "SensoryStateAssessment",
-    "SensoryState",
-    "ModalityInput",
-    "InertiaDetector",
-    "InertiaEventData",
-    "InertiaDetectionResult",
-    "BurnoutClassifier",
-    "BurnoutState",
-    "BurnoutClassification",
-    "MaskingLoadTracker",
-    "MaskingLoad",
-    "MaskingEvent",
-    "ChannelDominanceDetector",
-    "ChannelStateData",
-    "ChannelDetectionResult",
-    "EnergyPredictor",
-    "BehavioralSignals",
-    "EnergyPrediction",
+    "SensoryStateAssessment": ".neurostate.sensory",
+    "SensoryState": ".neurostate.sensory",
+    "ModalityInput": ".neurostate.sensory",
+    "InertiaDetector": ".neurostate.inertia",
+    "InertiaEventData": ".neurostate.inertia",
+    "InertiaDetectionResult": ".neurostate.inertia",
+    "BurnoutClassifier": ".neurostate.burnout",
+    "BurnoutState": ".neurostate.burnout",
+    "BurnoutClassification": ".neurostate.burnout",
+    "MaskingLoadTracker": ".neurostate.masking",
+    "MaskingLoad": ".neurostate.masking",
+    "MaskingEvent": ".neurostate.masking",
+    "ChannelDominanceDetector": ".neurostate.channel",
+    "ChannelStateData": ".neurostate.channel",
+    "ChannelDetectionResult": ".neurostate.channel",
+    "EnergyPredictor": ".neurostate.energy",
+    "BehavioralSignals": ".neurostate.energy",
+    "EnergyPrediction": ".neurostate.energy",
     # Effectiveness Service
-    "EffectivenessService",
-    "InterventionType",
-    "InterventionOutcome",
-    "SegmentCode",
-    "InterventionInstance",
-    "EffectivenessMetrics",
-    "VariantExperiment",
-    "EffectivenessMetricsResponse",
-    "VariantComparisonResult",
-    "InterventionOutcomeData",
-    "EffectivenessReport",
-    "get_effectiveness_service",
+    "EffectivenessService": ".effectiveness",
+    "InterventionType": ".effectiveness",
+    "InterventionOutcome": ".effectiveness",
+    "SegmentCode": ".effectiveness",
+    "InterventionInstance": ".effectiveness",
+    "EffectivenessMetrics": ".effectiveness",
+    "VariantExperiment": ".effectiveness",
+    "EffectivenessMetricsResponse": ".effectiveness",
+    "VariantComparisonResult": ".effectiveness",
+    "InterventionOutcomeData": ".effectiveness",
+    "EffectivenessReport": ".effectiveness",
+    "get_effectiveness_service": ".effectiveness",
     # Revenue Tracker
-    "RevenueTracker",
-    "RevenueEntry",
-    "RevenueBalance",
-    "RevenueCategory",
-    "EntryType",
-    "get_revenue_tracker",
-    "parse_and_save_revenue",
+    "RevenueTracker": ".revenue_tracker",
+    "RevenueEntry": ".revenue_tracker",
+    "RevenueBalance": ".revenue_tracker",
+    "RevenueCategory": ".revenue_tracker",
+    "EntryType": ".revenue_tracker",
+    "get_revenue_tracker": ".revenue_tracker",
+    "parse_and_save_revenue": ".revenue_tracker",
+    # Side Effect Writer
+    "SQLAlchemyBulkWriter": ".side_effect_writer",
     # Crisis Service
-    "CrisisService",
-    "CrisisLevel",
-    "CrisisSignal",
-    "CrisisResponse",
-    "CountryCode",
-    "get_crisis_service",
-    "check_and_handle_crisis",
-]
+    "CrisisService": ".crisis_service",
+    "CrisisLevel": ".crisis_service",
+    "CrisisSignal": ".crisis_service",
+    "CrisisResponse": ".crisis_service",
+    "CountryCode": ".crisis_service",
+    "get_crisis_service": ".crisis_service",
+    "check_and_handle_crisis": ".crisis_service",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule that defines ``name`` on first access."""
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -25,6 +25,7 @@ from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.base import Base
+from src.services.write_behind import WriteBehindBuffer, current_write_behind_buffer
 
 
 # ============================================================================
@@ -311,9 +312,10 @@ class EffectivenessService:
         InterventionOutcome.ENGAGEMENT_DECREASED,
     }
 
-    def __init__(self, session: AsyncSession):
-        """Initialize with database session."""
+    def __init__(self, session: AsyncSession, writer: Optional[WriteBehindBuffer] = None):
+        """Initialize with database session and write-behind buffer for deliveries (defaults to the installed one)."""
         self.session = session
+        self._writer = writer if writer is not None else current_write_behind_buffer()
 
     async def log_intervention(
         self,
@@ -349,6 +351,19 @@ class EffectivenessService:
             delivered_at=datetime.now(timezone.utc),
         )
 
+        if self._writer is not None:
+            await self._writer.insert(InterventionInstance.__table__, {
+                "instance_id": instance.instance_id,
+                "user_id": user_id,
+                "segment": segment,
+                "intervention_type": intervention_type,
+                "intervention_id": intervention_id,
+                "module": module,
+                "variant": variant,
+                "delivered_at": instance.delivered_at,
+            })
+            return instance.instance_id
+
         self.session.add(instance)
         await self.session.commit()
 
@@ -368,6 +383,12 @@ class EffectivenessService:
             outcome: The measured outcome
             behavioral_signals: Optional behavioral signals collected during window
         """
+        if self._writer is not None and self._writer.pending_inserts(
+            InterventionInstance.__table__, instance_id=intervention_instance_id
+        ):
+            # Delivery not written yet
+            await self._writer.flush()
+
         # Fetch the intervention instance
         stmt = select(InterventionInstance).where(
             InterventionInstance.instance_id == intervention_instance_id
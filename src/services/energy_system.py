@@ -7,6 +7,9 @@ Unified energy management across segments:
 - Autism: Sensory + Cognitive load
 - Neurotypical: Simple RED/YELLOW/GREEN
 
+Task titles are classified with the shared keyword lexicons (one pass per
+title for all spoon, gating, interest and integrity categories).
+
 Data Classification: SENSITIVE (energy states contain personal data)
 
 Reference: ARCHITECTURE.md Section 3 (Neurotype Segmentation)
@@ -15,16 +18,26 @@ Reference: ARCHITECTURE.md Section 10 (Security & Privacy Architecture)
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import logging
+from dataclasses import astuple, dataclass
+from datetime import datetime, timezone
 from enum import Enum
-from typing import Literal, Optional
+from typing import Callable, Literal, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from src.core.segment_context import (
     SegmentContext,
     SegmentService,
     WorkingStyleCode,
 )
+from src.lib.lexicon import LexiconRegistry, get_lexicon_registry
+from src.models.database import session_scope
 from src.models.task import Task
+from src.services.neurostate.recovery import recover_spoons, segment_neurostate
+
+logger = logging.getLogger(__name__)
 
 
 # Energy state levels for simple RED/YELLOW/GREEN model
@@ -236,12 +249,30 @@ class EnergySystem:
         can_proceed = await energy_system.can_attempt_task(user_id=123, task=my_task)
     """
 
-    def __init__(self):
-        """Initialize the Energy System."""
+    def __init__(
+        self,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+        lexicons: Optional[LexiconRegistry] = None,
+        session_factory: Optional[async_sessionmaker[AsyncSession]] = None,
+    ):
+        """
+        Initialize the Energy System.
+
+        Args:
+            clock: Current time for read-time spoon recovery
+            lexicons: Task keyword lexicons (defaults to the global registry)
+            session_factory: Async session factory for user lookups
+                (defaults to the shared engine's)
+        """
         # In-memory storage for energy states (in production, backed by Redis)
         self._energy_states: dict[int, EnergyState] = {}
         self._spoon_drawers: dict[int, SpoonDrawer] = {}
+        # When each stored drawer's recovery started (see recovery.recover_spoons)
+        self._spoon_recovery_anchors: dict[int, datetime] = {}
         self._sensory_cognitive: dict[int, SensoryCognitiveLoad] = {}
+        self._clock = clock
+        self._lexicons = lexicons if lexicons is not None else get_lexicon_registry()
+        self._session_factory = session_factory
 
         # Segment service for context lookup
         self._segment_service = SegmentService()
@@ -263,6 +294,38 @@ class EnergySystem:
         # For now, default to NT
         return "NT"
 
+    async def _get_user_language(self, user_id: int, language: Optional[str] = None) -> Optional[str]:
+        """
+        Get the user's language for keyword lexicons.
+
+        A language passed by the caller (e.g. from ModuleContext) is used as
+        is; otherwise User.language is read.
+
+        Args:
+            user_id: The user's unique identifier
+            language: The user's language, if the caller already knows it
+
+        Returns:
+            ISO language code, or None for the default
+        """
+        if language is not None:
+            return language
+        from src.models.user import User
+        users = User.__table__
+        try:
+            async with session_scope(self._session_factory) as session:
+                result = await session.execute(
+                    select(users.c.language).where(users.c.id == user_id)
+                )
+                return result.scalar_one_or_none()
+        except Exception as e:
+            logger.warning(f"User language lookup failed, using the default lexicon: {type(e).__name__}")
+            return None
+
+    def _task_hits(self, task: Task, language: Optional[str]) -> dict[str, int]:
+        """Lexicon hit counts of every category in the task title (cached)."""
+        return self._lexicons.counts((task.title or "").lower(), language)
+
     async def get_energy_state(self, user_id: int) -> EnergyState:
         """
         Get simple energy state (RED/YELLOW/GREEN) for ADHD/Neurotypical users.
@@ -333,6 +396,7 @@ class EnergySystem:
         self,
         user_id: int,
         task: Task,
+        language: Optional[str] = None,
     ) -> IBNSResult:
         """
         Calculate Interest-Based Need State (IBNS) score for ADHD users.
@@ -349,19 +413,20 @@ class EnergySystem:
         Args:
             user_id: The user's unique identifier
             task: The task to evaluate
+            language: The user's language (read from the user if None)
 
         Returns:
             IBNSResult with component scores and recommendation
         """
         # Get task attributes for scoring
-        task_title = task.title or ""
         task_priority = task.priority or 3
 
         # Calculate components (simplified - in production, use LLM for nuanced scoring)
 
         # Interest: Based on task title keywords and user history
         # Higher priority tasks may indicate higher interest
-        interest = self._calculate_interest_score(task_title, task_priority)
+        hits = self._task_hits(task, await self._get_user_language(user_id, language))
+        interest = self._calculate_interest_score(hits, task_priority)
 
         # Challenge: Inverse of priority (lower priority = more challenging)
         # 1 = highest priority (easy/small), 5 = lowest (hard/big)
@@ -401,9 +466,9 @@ class EnergySystem:
             recommendation=recommendation,
         )
 
-    def _calculate_interest_score(self, title: str, priority: int) -> float:
+    def _calculate_interest_score(self, hits: dict[str, int], priority: int) -> float:
         """
-        Calculate interest score based on task title and priority.
+        Calculate interest score based on task title hits and priority.
 
         Higher priority (1-2) often indicates higher interest.
         """
@@ -411,9 +476,7 @@ class EnergySystem:
         base = 1.0 - ((priority - 1) / 4)  # 1 -> 1.0, 5 -> 0.0
 
         # Boost for interest keywords
-        interest_keywords = ["learn", "create", "explore", "design", "build", "new", "fun", "exciting"]
-        title_lower = title.lower()
-        keyword_boost = sum(0.1 for kw in interest_keywords if kw in title_lower)
+        keyword_boost = 0.1 * hits["energy.interest"]
 
         return min(1.0, base + keyword_boost)
 
@@ -482,6 +545,7 @@ class EnergySystem:
         self,
         user_id: int,
         task: Task,
+        language: Optional[str] = None,
     ) -> ICNUResult:
         """
         Calculate ICNU (Interest, Challenge, Novelty, Urgency) for AuDHD users.
@@ -495,15 +559,16 @@ class EnergySystem:
         Args:
             user_id: The user's unique identifier
             task: The task to evaluate
+            language: The user's language (read from the user if None)
 
         Returns:
             ICNUResult with component scores and integrity trigger flag
         """
         # Calculate components (same as IBNS but kept separate)
-        task_title = task.title or ""
         task_priority = task.priority or 3
+        hits = self._task_hits(task, await self._get_user_language(user_id, language))
 
-        interest = self._calculate_interest_score(task_title, task_priority)
+        interest = self._calculate_interest_score(hits, task_priority)
         challenge = self._calculate_challenge_score(task_priority)
         novelty = self._calculate_novelty_score(task)
         urgency = self._calculate_urgency_score(task)
@@ -518,9 +583,7 @@ class EnergySystem:
 
         # Check for integrity trigger
         # Tasks with identity/values keywords get integrity boost
-        integrity_keywords = ["values", "purpose", "meaning", "identity", "core", "belief", "mission", "vision"]
-        title_lower = task_title.lower()
-        integrity_trigger = any(kw in title_lower for kw in integrity_keywords)
+        integrity_trigger = hits["energy.integrity"] > 0
 
         # If integrity trigger, boost total score
         if integrity_trigger:
@@ -552,6 +615,8 @@ class EnergySystem:
 
         Tracks 6 resource pools: Social, Sensory, EF, Emotional, Physical, Masking.
         Each starts at 10 spoons. Depleted pools block related activities.
+        Pools refill over time per the segment's recovery rate, computed at
+        read time (nothing is written until the next update).
 
         For AuDHD, masking is exponential - each spoon costs more than the last.
 
@@ -561,6 +626,12 @@ class EnergySystem:
         Returns:
             SpoonDrawer with all 6 pool values
         """
+        drawer, _ = await self._recovered_spoon_drawer(user_id)
+        return drawer
+
+    async def _recovered_spoon_drawer(self, user_id: int) -> tuple[SpoonDrawer, datetime]:
+        """Stored drawer with recovery applied, and the anchor to store with it."""
+        now = self._clock()
         if user_id not in self._spoon_drawers:
             # Initialize with full spoons
             # In production, load from database or prompt user
@@ -572,7 +643,13 @@ class EnergySystem:
                 physical=10,
                 masking=10,
             )
-        return self._spoon_drawers[user_id]
+            self._spoon_recovery_anchors[user_id] = now
+        stored = self._spoon_drawers[user_id]
+        config = segment_neurostate(await self._get_user_segment(user_id))
+        pools, anchor = recover_spoons(
+            astuple(stored), self._spoon_recovery_anchors.get(user_id), now, config
+        )
+        return SpoonDrawer(*pools), anchor
 
     async def update_spoon_drawer(
         self,
@@ -599,7 +676,9 @@ class EnergySystem:
         Returns:
             Updated SpoonDrawer
         """
-        current = await self.calculate_spoon_drawer(user_id)
+        # Materialize recovery up to now before applying the change
+        current, anchor = await self._recovered_spoon_drawer(user_id)
+        self._spoon_recovery_anchors[user_id] = anchor
 
         self._spoon_drawers[user_id] = SpoonDrawer(
             social=max(0, min(10, social if social is not None else current.social)),
@@ -617,6 +696,7 @@ class EnergySystem:
         self,
         user_id: int,
         task: Task,
+        language: Optional[str] = None,
     ) -> SpoonDrawer:
         """
         Spend spoons for a task.
@@ -632,6 +712,7 @@ class EnergySystem:
         Args:
             user_id: The user's unique identifier
             task: The task to spend spoons on
+            language: The user's language (read from the user if None)
 
         Returns:
             Updated SpoonDrawer after spending
@@ -640,15 +721,15 @@ class EnergySystem:
 
         # Determine task type and cost
         # In production, use LLM or task metadata
-        task_title = (task.title or "").lower()
+        hits = self._task_hits(task, await self._get_user_language(user_id, language))
 
         # Calculate costs
-        social_cost = 2 if any(w in task_title for w in ["talk", "meet", "call", "social", "friend"]) else 0
-        sensory_cost = 3 if any(w in task_title for w in ["noise", "bright", "crowd", "sensory"]) else 0
-        ef_cost = 3 if any(w in task_title for w in ["plan", "organize", "decide", "focus", "complex"]) else 0
-        emotional_cost = 2 if any(w in task_title for w in ["emotional", "difficult", "hard", "stress"]) else 0
-        physical_cost = 2 if any(w in task_title for w in ["exercise", "walk", "run", "physical"]) else 0
-        masking_cost = 2 if any(w in task_title for w in ["present", "interview", "social", "public"]) else 0
+        social_cost = 2 if hits["spoons.social"] else 0
+        sensory_cost = 3 if hits["spoons.sensory"] else 0
+        ef_cost = 3 if hits["spoons.ef"] else 0
+        emotional_cost = 2 if hits["spoons.emotional"] else 0
+        physical_cost = 2 if hits["spoons.physical"] else 0
+        masking_cost = 2 if hits["spoons.masking"] else 0
 
         # Apply exponential masking cost for AuDHD
         if masking_cost > 0:
@@ -738,7 +819,12 @@ class EnergySystem:
         # In production: persist to database/Redis here
         return self._sensory_cognitive[user_id]
 
-    async def can_attempt_task(self, user_id: int, task: Task) -> bool:
+    async def can_attempt_task(
+        self,
+        user_id: int,
+        task: Task,
+        language: Optional[str] = None,
+    ) -> bool:
         """
         Determine if user has enough energy to attempt a task.
 
@@ -756,6 +842,7 @@ class EnergySystem:
         Args:
             user_id: The user's unique identifier
             task: The task to evaluate
+            language: The user's language (read from the user if None)
 
         Returns:
             True if user can attempt the task, False if blocked
@@ -766,6 +853,7 @@ class EnergySystem:
 
         # Check simple energy state first
         energy_state = await self.get_energy_state(user_id)
+        hits = self._task_hits(task, await self._get_user_language(user_id, language))
 
         # Get basic energy check
         if energy_state.level == EnergyStateEnum.RED:
@@ -775,9 +863,7 @@ class EnergySystem:
 
             # For AuDHD, also check integrity trigger
             if segment == "AH":
-                task_title = (task.title or "").lower()
-                integrity_keywords = ["values", "purpose", "meaning", "identity", "core"]
-                has_integrity = any(kw in task_title for kw in integrity_keywords)
+                has_integrity = hits["energy.essential_integrity"] > 0
                 is_essential = is_essential or has_integrity
 
             if not is_essential:
@@ -790,15 +876,13 @@ class EnergySystem:
             spoons = await self.calculate_spoon_drawer(user_id)
             if spoons.is_depleted:
                 # Check if task requires depleted pool
-                task_title = (task.title or "").lower()
-
-                if any(w in task_title for w in ["social", "talk", "meet"]) and spoons.social <= 2:
+                if hits["spoon_gate.social"] and spoons.social <= 2:
                     return False
-                if any(w in task_title for w in ["noise", "sensory"]) and spoons.sensory <= 2:
+                if hits["spoon_gate.sensory"] and spoons.sensory <= 2:
                     return False
-                if any(w in task_title for w in ["plan", "focus", "complex"]) and spoons.ef <= 2:
+                if hits["spoon_gate.ef"] and spoons.ef <= 2:
                     return False
-                if any(w in task_title for w in ["emotional", "stress"]) and spoons.emotional <= 2:
+                if hits["spoon_gate.emotional"] and spoons.emotional <= 2:
                     return False
 
         # Autism: Check Sensory/Cognitive load
@@ -917,16 +1001,17 @@ async def get_user_energy_state(user_id: int) -> EnergyState:
     return await system.get_energy_state(user_id)
 
 
-async def can_user_attempt_task(user_id: int, task: Task) -> bool:
+async def can_user_attempt_task(user_id: int, task: Task, language: Optional[str] = None) -> bool:
     """
     Convenience function to check if user can attempt a task.
 
     Args:
         user_id: The user's unique identifier
         task: The task to evaluate
+        language: The user's language (read from the user if None)
 
     Returns:
         True if user can attempt the task
     """
     system = get_energy_system()
-    return await system.can_attempt_task(user_id, task)
+    return await system.can_attempt_task(user_id, task, language)
@@ -9,71 +9,139 @@ This package contains the 6 neurostate intelligence services:
 - ChannelDominanceDetector: Channel dominance detection (AH)
 - EnergyPredictor: Behavioral proxy-based energy prediction
 
+NeurostateSnapshotLoader reads the latest state of all six in one query for
+the pre-flight, cached per user and invalidated by the services' writes.
+
 References:
 - ARCHITECTURE.md Section 3 (Neurotype Segmentation)
 """
 
-from src.services.neurostate.sensory import (
-    SensoryStateAssessment,
-    SensoryState,
-    ModalityInput,
-)
-
-from src.services.neurostate.inertia import (
-    InertiaDetector,
-    InertiaEventData,
-    InertiaDetectionResult,
-)
-
-from src.services.neurostate.burnout import (
-    BurnoutClassifier,
-    BurnoutState,
-    BurnoutClassification,
-)
+from __future__ import annotations
 
-from src.services.neurostate.masking import (
-    MaskingLoadTracker,
-    MaskingLoad,
-    MaskingEvent,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
 
-from src.services.neurostate.channel import (
-    ChannelDominanceDetector,
-    ChannelStateData,
-    ChannelDetectionResult,
-)
+if TYPE_CHECKING:
+    from .sensory import (
+        SensoryStateAssessment,
+        SensoryState,
+        ModalityInput,
+    )
+    from .inertia import (
+        InertiaDetector,
+        InertiaEventData,
+        InertiaDetectionResult,
+    )
+    from .burnout import (
+        BurnoutClassifier,
+        BurnoutState,
+        BurnoutClassification,
+        BurnoutClassificationCache,
+        TrajectoryFeatures,
+        invalidate_burnout_classification,
+    )
+    from .masking import (
+        MaskingLoadTracker,
+        MaskingLoad,
+        MaskingEvent,
+    )
+    from .masking_aggregate import (
+        DecayedMaskingLoad,
+        MaskingLoadStore,
+        verify_masking_loads,
+    )
+    from .channel import (
+        ChannelDominanceDetector,
+        ChannelStateData,
+        ChannelDetectionResult,
+    )
+    from .channel_scores import (
+        DecayedChannelScores,
+        ChannelScoreStore,
+        replay_channel_scores,
+        verify_channel_scores,
+    )
+    from .energy import (
+        EnergyPredictor,
+        BehavioralSignals,
+        EnergyPrediction,
+    )
+    from .energy_baseline import (
+        RollingEnergyBaseline,
+        EnergyBaselineStore,
+        reconcile_energy_baselines,
+    )
+    from .snapshot import (
+        NeurostateSnapshot,
+        NeurostateSnapshotCache,
+        NeurostateSnapshotLoader,
+        get_snapshot_cache,
+        set_snapshot_cache,
+        invalidate_snapshot,
+    )
 
-from src.services.neurostate.energy import (
-    EnergyPredictor,
-    BehavioralSignals,
-    EnergyPrediction,
-)
 
-
-# Re-export all classes
-__all__ = [
+# Public name -> submodule that defines it. Submodules are imported on first
+# attribute access (PEP 562), so importing this package stays cheap.
+_LAZY_EXPORTS: dict[str, str] = {
     # Sensory
-    "SensoryStateAssessment",
-    "SensoryState",
-    "ModalityInput",
+    "SensoryStateAssessment": ".sensory",
+    "SensoryState": ".sensory",
+    "ModalityInput": ".sensory",
     # Inertia
-    "InertiaDetector",
-    "InertiaEventData",
-    "InertiaDetectionResult",
+    "InertiaDetector": ".inertia",
+    "InertiaEventData": ".inertia",
+    "InertiaDetectionResult": ".inertia",
     # Burnout
-    "BurnoutClassifier",
-    "BurnoutState",
-    "BurnoutClassification",
+    "BurnoutClassifier": ".burnout",
+    "BurnoutState": ".burnout",
+    "BurnoutClassification": ".burnout",
+    "BurnoutClassificationCache": ".burnout",
+    "TrajectoryFeatures": ".burnout",
+    "invalidate_burnout_classification": ".burnout",
     # Masking
-    "MaskingLoadTracker",
-    "MaskingLoad",
-    "MaskingEvent",
+    "MaskingLoadTracker": ".masking",
+    "MaskingLoad": ".masking",
+    "MaskingEvent": ".masking",
+    "DecayedMaskingLoad": ".masking_aggregate",
+    "MaskingLoadStore": ".masking_aggregate",
+    "verify_masking_loads": ".masking_aggregate",
     # Channel
-    "ChannelDominanceDetector",
-    "ChannelStateData",
-    "ChannelDetectionResult",
+    "ChannelDominanceDetector": ".channel",
+    "ChannelStateData": ".channel",
+    "ChannelDetectionResult": ".channel",
+    "DecayedChannelScores": ".channel_scores",
+    "ChannelScoreStore": ".channel_scores",
+    "replay_channel_scores": ".channel_scores",
+    "verify_channel_scores": ".channel_scores",
     # Energy
-    "EnergyPredictor",
-    "BehavioralSignals",
-    "EnergyPrediction",
-]
+    "EnergyPredictor": ".energy",
+    "BehavioralSignals": ".energy",
+    "EnergyPrediction": ".energy",
+    "RollingEnergyBaseline": ".energy_baseline",
+    "EnergyBaselineStore": ".energy_baseline",
+    "reconcile_energy_baselines": ".energy_baseline",
+    # Snapshot
+    "NeurostateSnapshot": ".snapshot",
+    "NeurostateSnapshotCache": ".snapshot",
+    "NeurostateSnapshotLoader": ".snapshot",
+    "get_snapshot_cache": ".snapshot",
+    "set_snapshot_cache": ".snapshot",
+    "invalidate_snapshot": ".snapshot",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule that defines ``name`` on first access."""
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
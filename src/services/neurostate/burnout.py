@@ -6,18 +6,29 @@ Three distinct burnout types as defined in ARCHITECTURE.md Section 3:
 - Autism Overload->Shutdown: Sensory/Cognitive overload
 - AuDHD Triple: All three combined
 
+Trajectory features (variance, slope, trend halves, drops, boom-bust
+swings) are computed with NumPy for any number of trajectories at once, so
+classify_many() covers nightly jobs with one segment query and one feature
+pass. Classifications are cached per user until a new energy point arrives
+(see invalidate_burnout_classification).
+
 References:
 - ARCHITECTURE.md Section 3 (Neurotype Segmentation)
 - ARCHITECTURE.md Section 3.4 (Burnout Types)
 """
 
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
-from typing import Optional
+from typing import Mapping, Optional, Sequence
 
-from sqlalchemy.orm import Session
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.models.database import unit_of_work
 from src.models.neurostate import BurnoutAssessment, BurnoutType
+from src.services.neurostate.snapshot import invalidate_snapshot
 
 
 # =============================================================================
@@ -47,6 +58,150 @@ class BurnoutClassification:
     severity: float                        # 0-100
     trajectory_pattern: str               # "declining", "stable", "volatile", "recovering"
     recommended_protocol: str
+    indicators: dict = field(default_factory=dict)  # Trajectory features behind it
+
+
+# =============================================================================
+# Trajectory Features
+# =============================================================================
+
+@dataclass
+class TrajectoryFeatures:
+    """Features of one energy trajectory (oldest first)."""
+
+    length: int
+    last: float
+    variance: float                        # Sample variance (0 below 2 points)
+    slope: float                           # Least-squares trend, points/day
+    early_avg: float                       # First half of the last 7 days
+    late_avg: float                        # Second half of the last 7 days
+    min_last3: float
+    max_last5: float
+    min_last5: float
+    max_last7: float
+    drops: int                             # Day-over-day falls above the threshold
+    boom_bust_swings: int                  # Rise above the threshold, then a fall
+
+    def as_indicators(self) -> dict:
+        """Features stored with an assessment."""
+        return {
+            "variance": round(self.variance, 2),
+            "slope": round(self.slope, 2),
+            "drops": self.drops,
+            "boom_bust_swings": self.boom_bust_swings,
+        }
+
+
+def trajectory_features(
+    trajectories: Sequence[Sequence[float]],
+    swing_threshold: float = 10.0,
+) -> list[TrajectoryFeatures]:
+    """
+    Compute features for many trajectories in one vectorized pass.
+
+    Trajectories are right-aligned in a NaN-padded matrix (latest day in the
+    last column), so windows like "last 7 days" are column slices.
+
+    Args:
+        trajectories: Daily energy levels (0-100), oldest first
+        swing_threshold: Day-over-day change counted as a drop or a swing
+
+    Returns:
+        TrajectoryFeatures per trajectory, in order
+    """
+    rows = len(trajectories)
+    if rows == 0:
+        return []
+    lengths = np.fromiter((len(t) for t in trajectories), dtype=np.int64, count=rows)
+    width = max(int(lengths.max()), 1)
+    matrix = np.full((rows, width), np.nan)
+    for i, trajectory in enumerate(trajectories):
+        if len(trajectory):
+            matrix[i, width - len(trajectory):] = trajectory
+    valid = ~np.isnan(matrix)
+    values = np.where(valid, matrix, 0.0)
+    counts = np.maximum(lengths, 1)
+
+    # Variance and least-squares slope over the whole trajectory
+    mean = values.sum(axis=1) / counts
+    dev = np.where(valid, matrix - mean[:, None], 0.0)
+    variance = np.where(lengths > 1, (dev ** 2).sum(axis=1) / np.maximum(lengths - 1, 1), 0.0)
+    days = np.arange(width, dtype=float)[None, :]
+    day_mean = np.where(valid, days, 0.0).sum(axis=1) / counts
+    day_dev = np.where(valid, days - day_mean[:, None], 0.0)
+    day_ss = (day_dev ** 2).sum(axis=1)
+    slope = np.where(day_ss > 0, (day_dev * dev).sum(axis=1) / np.where(day_ss > 0, day_ss, 1.0), 0.0)
+
+    # Trend: halves of the last (up to) 7 days
+    recent = np.minimum(lengths, 7)
+    half = recent // 2
+    position = np.arange(width)[None, :] - (width - recent)[:, None]
+    early = (position >= 0) & (position < half[:, None])
+    late = position >= half[:, None]
+    early_avg = np.where(half > 0, (values * early).sum(axis=1) / np.maximum(half, 1), 0.0)
+    late_avg = (values * late).sum(axis=1) / np.maximum(recent - half, 1)
+
+    # Window extremes (shorter trajectories use all their days)
+    high = np.where(valid, matrix, -np.inf)
+    low = np.where(valid, matrix, np.inf)
+
+    # Drops and boom-bust swings (NaN differences compare False)
+    diffs = np.diff(matrix, axis=1)
+    drops = (diffs < -swing_threshold).sum(axis=1)
+    swings = ((diffs[:, :-1] > swing_threshold) & (diffs[:, 1:] < -swing_threshold)).sum(axis=1)
+
+    columns = zip(
+        lengths.tolist(), values[:, -1].tolist(), variance.tolist(), slope.tolist(),
+        early_avg.tolist(), late_avg.tolist(),
+        low[:, -3:].min(axis=1).tolist(), high[:, -5:].max(axis=1).tolist(),
+        low[:, -5:].min(axis=1).tolist(), high[:, -7:].max(axis=1).tolist(),
+        drops.tolist(), swings.tolist(),
+    )
+    return [TrajectoryFeatures(*column) for column in columns]
+
+
+# =============================================================================
+# Classification Cache
+# =============================================================================
+
+class BurnoutClassificationCache:
+    """Per-user classification cache, invalidated when a new energy point arrives."""
+
+    MAX_SIZE = 10_000
+
+    def __init__(self, max_size: int = MAX_SIZE):
+        """
+        Args:
+            max_size: Maximum cached users (least recently stored evicted)
+        """
+        self._max_size = max_size
+        # user_id -> (trajectory it was classified from, classification)
+        self._entries: OrderedDict[int, tuple[tuple[float, ...], BurnoutClassification]] = OrderedDict()
+
+    def get(self, user_id: int, trajectory: Sequence[float]) -> Optional[BurnoutClassification]:
+        """Cached classification of a user, if it was made from this trajectory."""
+        entry = self._entries.get(user_id)
+        if entry is None or entry[0] != tuple(trajectory):
+            return None
+        return entry[1]
+
+    def put(self, user_id: int, trajectory: Sequence[float], classification: BurnoutClassification) -> None:
+        """Store a classification."""
+        self._entries[user_id] = (tuple(trajectory), classification)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int) -> None:
+        """Drop a user's classification after a new energy point."""
+        self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        """Drop all classifications."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
 
 
 # =============================================================================
@@ -82,14 +237,19 @@ class BurnoutClassifier:
     VOLATILITY_THRESHOLD = 30.0           # High variance = volatile
     DECLINE_RATE_THRESHOLD = 10.0         # >10 points/day = declining
 
-    def __init__(self, db: Session):
+    # Users per segment query in classify_many()
+    SEGMENT_QUERY_CHUNK = 500
+
+    def __init__(self, db: AsyncSession, cache: Optional[BurnoutClassificationCache] = None):
         """
         Initialize the burnout classifier.
 
         Args:
-            db: SQLAlchemy database session
+            db: SQLAlchemy async database session
+            cache: Classification cache (defaults to the global cache)
         """
         self.db = db
+        self._cache = cache if cache is not None else get_burnout_cache()
 
     async def classify(
         self,
@@ -107,28 +267,72 @@ class BurnoutClassifier:
             BurnoutClassification with type, confidence, and recommendations
         """
         if len(energy_trajectory) < 3:
-            return BurnoutClassification(
-                burnout_type=BurnoutType.AD_BOOM_BUST,
-                confidence=0.0,
-                severity=0.0,
-                trajectory_pattern="insufficient_data",
-                recommended_protocol="Monitor energy levels",
-            )
+            return self._insufficient_data()
+
+        cached = self._cache.get(user_id, energy_trajectory)
+        if cached is not None:
+            return cached
 
         # Get user segment
-        segment_code = self._get_user_segment(user_id)
+        segment_code = await self._get_user_segment(user_id)
+
+        features = trajectory_features([energy_trajectory], self.DECLINE_RATE_THRESHOLD)[0]
+        classification = self._classify_features(segment_code, features)
+        self._cache.put(user_id, energy_trajectory, classification)
+        return classification
+
+    async def classify_many(
+        self,
+        trajectories: Mapping[int, Sequence[float]],
+    ) -> dict[int, BurnoutClassification]:
+        """
+        Classify many users at once (nightly jobs).
+
+        Cached classifications are reused; the rest need one segment query
+        per SEGMENT_QUERY_CHUNK users and one vectorized feature pass.
+
+        Args:
+            trajectories: User ID -> daily energy levels (0-100), oldest first
+
+        Returns:
+            User ID -> BurnoutClassification
+        """
+        results: dict[int, BurnoutClassification] = {}
+        pending: list[int] = []
+        for user_id, trajectory in trajectories.items():
+            if len(trajectory) < 3:
+                results[user_id] = self._insufficient_data()
+                continue
+            cached = self._cache.get(user_id, trajectory)
+            if cached is not None:
+                results[user_id] = cached
+            else:
+                pending.append(user_id)
 
+        if pending:
+            segments = await self._get_user_segments(pending)
+            features = trajectory_features(
+                [trajectories[user_id] for user_id in pending], self.DECLINE_RATE_THRESHOLD
+            )
+            for user_id, user_features in zip(pending, features):
+                classification = self._classify_features(segments[user_id], user_features)
+                self._cache.put(user_id, trajectories[user_id], classification)
+                results[user_id] = classification
+        return results
+
+    def _classify_features(self, segment_code: str, features: TrajectoryFeatures) -> BurnoutClassification:
+        """Classify one trajectory from its features."""
         # Analyze trajectory
-        trajectory_pattern = self._analyze_trajectory(energy_trajectory)
-        severity = self._calculate_severity(energy_trajectory, trajectory_pattern)
+        trajectory_pattern = self._pattern(features)
+        severity = self._calculate_severity(features, trajectory_pattern)
 
         # Classify based on segment and pattern
         if segment_code == "AU":
-            burnout_type, confidence = self._classify_autism(energy_trajectory, trajectory_pattern)
+            burnout_type, confidence = self._classify_autism(features, trajectory_pattern)
         elif segment_code == "AD":
-            burnout_type, confidence = self._classify_adhd(energy_trajectory, trajectory_pattern)
+            burnout_type, confidence = self._classify_adhd(features, trajectory_pattern)
         else:  # AH or default
-            burnout_type, confidence = self._classify_audhd(energy_trajectory, trajectory_pattern)
+            burnout_type, confidence = self._classify_audhd(features, trajectory_pattern)
 
         # Get recommended protocol
         protocol = self._get_burnout_protocol(burnout_type, severity, trajectory_pattern)
@@ -139,6 +343,17 @@ class BurnoutClassifier:
             severity=severity,
             trajectory_pattern=trajectory_pattern,
             recommended_protocol=protocol,
+            indicators=features.as_indicators(),
+        )
+
+    @staticmethod
+    def _insufficient_data() -> BurnoutClassification:
+        return BurnoutClassification(
+            burnout_type=BurnoutType.AD_BOOM_BUST,
+            confidence=0.0,
+            severity=0.0,
+            trajectory_pattern="insufficient_data",
+            recommended_protocol="Monitor energy levels",
         )
 
     async def assess_current_state(
@@ -154,15 +369,16 @@ class BurnoutClassifier:
         Returns:
             BurnoutState or None if no active assessment
         """
-        assessment = (
-            self.db.query(BurnoutAssessment)
-            .filter(
+        result = await self.db.execute(
+            select(BurnoutAssessment)
+            .where(
                 BurnoutAssessment.user_id == user_id,
                 BurnoutAssessment.resolved_at.is_(None),
             )
             .order_by(BurnoutAssessment.assessed_at.desc())
-            .first()
+            .limit(1)
         )
+        assessment = result.scalars().first()
 
         if not assessment:
             return None
@@ -204,30 +420,30 @@ class BurnoutClassifier:
         Returns:
             Created BurnoutAssessment
         """
-        # Close any existing active assessment
-        active = (
-            self.db.query(BurnoutAssessment)
-            .filter(
-                BurnoutAssessment.user_id == user_id,
-                BurnoutAssessment.resolved_at.is_(None),
+        async with unit_of_work(self.db):
+            # Close any existing active assessment
+            active = await self.db.execute(
+                select(BurnoutAssessment)
+                .where(
+                    BurnoutAssessment.user_id == user_id,
+                    BurnoutAssessment.resolved_at.is_(None),
+                )
             )
-            .all()
-        )
-        for a in active:
-            a.resolved_at = datetime.now(timezone.utc)
-
-        # Create new assessment
-        assessment = BurnoutAssessment(
-            user_id=user_id,
-            burnout_type=burnout_type.value,
-            severity_score=severity,
-            energy_trajectory=energy_trajectory,
-            indicators=indicators or {},
-            notes=notes,
-        )
-        self.db.add(assessment)
-        self.db.commit()
-        self.db.refresh(assessment)
+            for a in active.scalars():
+                a.resolved_at = datetime.now(timezone.utc)
+
+            # Create new assessment
+            assessment = BurnoutAssessment(
+                user_id=user_id,
+                burnout_type=burnout_type.value,
+                severity_score=severity,
+                energy_trajectory=energy_trajectory,
+                indicators=indicators or {},
+                notes=notes,
+            )
+            self.db.add(assessment)
+        await self.db.refresh(assessment)
+        invalidate_snapshot(user_id)
         return assessment
 
     async def resolve_assessment(
@@ -245,59 +461,50 @@ class BurnoutClassifier:
         Returns:
             Updated BurnoutAssessment
         """
-        assessment = (
-            self.db.query(BurnoutAssessment)
-            .filter(BurnoutAssessment.id == assessment_id)
-            .first()
-        )
-        if not assessment:
-            raise ValueError(f"BurnoutAssessment {assessment_id} not found")
-
-        assessment.resolved_at = datetime.now(timezone.utc)
-        if notes:
-            assessment.notes = (assessment.notes or "") + f"\nResolution: {notes}"
-
-        self.db.commit()
-        self.db.refresh(assessment)
+        async with unit_of_work(self.db):
+            assessment = await self.db.get(BurnoutAssessment, assessment_id)
+            if not assessment:
+                raise ValueError(f"BurnoutAssessment {assessment_id} not found")
+
+            assessment.resolved_at = datetime.now(timezone.utc)
+            if notes:
+                assessment.notes = (assessment.notes or "") + f"\nResolution: {notes}"
+        await self.db.refresh(assessment)
+        invalidate_snapshot(assessment.user_id)
         return assessment
 
     def _analyze_trajectory(self, trajectory: list[float]) -> str:
         """Analyze the energy trajectory pattern."""
-        if len(trajectory) < 3:
-            return "insufficient_data"
+        return self._pattern(trajectory_features([trajectory], self.DECLINE_RATE_THRESHOLD)[0])
 
-        # Calculate volatility (variance)
-        import statistics
-        if len(trajectory) > 1:
-            variance = statistics.variance(trajectory)
-            if variance > self.VOLATILITY_THRESHOLD ** 2:
-                return "volatile"
+    def _pattern(self, features: TrajectoryFeatures) -> str:
+        """Trajectory pattern from its features."""
+        if features.length < 3:
+            return "insufficient_data"
 
-        # Calculate trend
-        recent = trajectory[-7:] if len(trajectory) >= 7 else trajectory
-        if len(recent) >= 3:
-            early_avg = sum(recent[:len(recent)//2]) / (len(recent)//2)
-            late_avg = sum(recent[len(recent)//2:]) / (len(recent) - len(recent)//2)
+        # Volatility (variance)
+        if features.variance > self.VOLATILITY_THRESHOLD ** 2:
+            return "volatile"
 
-            if late_avg < early_avg - self.DECLINE_RATE_THRESHOLD * 3:
-                return "declining"
-            elif late_avg > early_avg + self.DECLINE_RATE_THRESHOLD * 3:
-                return "recovering"
+        # Trend over the last 7 days
+        if features.late_avg < features.early_avg - self.DECLINE_RATE_THRESHOLD * 3:
+            return "declining"
+        elif features.late_avg > features.early_avg + self.DECLINE_RATE_THRESHOLD * 3:
+            return "recovering"
 
         return "stable"
 
     def _calculate_severity(
         self,
-        trajectory: list[float],
+        features: TrajectoryFeatures,
         pattern: str,
     ) -> float:
         """Calculate severity score from trajectory and pattern."""
-        if not trajectory:
+        if not features.length:
             return 0.0
 
         # Base severity on current level
-        current = trajectory[-1]
-        base_severity = 100 - current
+        base_severity = 100 - features.last
 
         # Adjust based on pattern
         if pattern == "declining":
@@ -311,46 +518,42 @@ class BurnoutClassifier:
 
     def _classify_autism(
         self,
-        trajectory: list[float],
+        features: TrajectoryFeatures,
         pattern: str,
     ) -> tuple[BurnoutType, float]:
         """Classify burnout for Autism segment."""
         # AU: Gradual overload pattern
         # Look for: sustained high-low pattern, slow decline, then crash
-        if len(trajectory) >= 7:
-            recent = trajectory[-7:]
-            if all(e < 40 for e in recent):
+        if features.length >= 7:
+            if features.max_last7 < 40:
                 return BurnoutType.AU_OVERLOAD, 0.85
-            elif pattern == "declining" and any(e < 30 for e in trajectory[-3:]):
+            elif pattern == "declining" and features.min_last3 < 30:
                 return BurnoutType.AU_OVERLOAD, 0.75
 
         return BurnoutType.AU_OVERLOAD, 0.6
 
     def _classify_adhd(
         self,
-        trajectory: list[float],
+        features: TrajectoryFeatures,
         pattern: str,
     ) -> tuple[BurnoutType, float]:
         """Classify burnout for ADHD segment."""
         # AD: Boom-bust pattern
         # Look for: high variance, peaks followed by crashes
-        if len(trajectory) >= 5:
-            import statistics
-            variance = statistics.variance(trajectory) if len(trajectory) > 1 else 0
-
+        if features.length >= 5:
             # High volatility with recent crash
-            if variance > self.VOLATILITY_THRESHOLD ** 2 and trajectory[-1] < 30:
+            if features.variance > self.VOLATILITY_THRESHOLD ** 2 and features.last < 30:
                 return BurnoutType.AD_BOOM_BUST, 0.85
 
             # Very high then very low
-            if max(trajectory[-5:]) > 80 and min(trajectory[-5:]) < 30:
+            if features.max_last5 > 80 and features.min_last5 < 30:
                 return BurnoutType.AD_BOOM_BUST, 0.8
 
         return BurnoutType.AD_BOOM_BUST, 0.6
 
     def _classify_audhd(
         self,
-        trajectory: list[float],
+        features: TrajectoryFeatures,
         pattern: str,
     ) -> tuple[BurnoutType, float]:
         """Classify burnout for AuDHD segment."""
@@ -358,17 +561,15 @@ class BurnoutClassifier:
         # This is the default for AH as they can experience all three
 
         # First check if it's clearly one type
-        autism_type, autism_conf = self._classify_autism(trajectory, pattern)
-        adhd_type, adhd_conf = self._classify_adhd(trajectory, pattern)
+        autism_type, autism_conf = self._classify_autism(features, pattern)
+        adhd_type, adhd_conf = self._classify_adhd(features, pattern)
 
         # If both have high confidence, it's likely triple type
         if autism_conf > 0.7 and adhd_conf > 0.7:
             return BurnoutType.AH_TRIPLE, 0.9
 
         # If volatility is high + low current = triple
-        import statistics
-        variance = statistics.variance(trajectory) if len(trajectory) > 1 else 0
-        if variance > self.VOLATILITY_THRESHOLD ** 2 and trajectory[-1] < 40:
+        if features.variance > self.VOLATILITY_THRESHOLD ** 2 and features.last < 40:
             return BurnoutType.AH_TRIPLE, 0.8
 
         # Default to highest confidence single type
@@ -405,11 +606,70 @@ class BurnoutClassifier:
 
         return "Prevention: Maintain current patterns, watch for escalation"
 
-    def _get_user_segment(self, user_id: int) -> str:
+    async def _get_user_segment(self, user_id: int) -> str:
         """Get user's segment code."""
+        return (await self._get_user_segments([user_id]))[user_id]
+
+    async def _get_user_segments(self, user_ids: Sequence[int]) -> dict[int, str]:
+        """Get segment codes for many users (unknown users default to NT)."""
         from src.models.user import User
-        user = self.db.query(User).filter(User.id == user_id).first()
-        return user.working_style_code if user else "NT"
+        users = User.__table__
+        segments: dict[int, str] = {}
+        for i in range(0, len(user_ids), self.SEGMENT_QUERY_CHUNK):
+            chunk = list(user_ids[i:i + self.SEGMENT_QUERY_CHUNK])
+            result = await self.db.execute(
+                select(users.c.id, users.c.working_style_code).where(users.c.id.in_(chunk))
+            )
+            segments.update((user_id, code) for user_id, code in result)
+        return {user_id: segments.get(user_id) or "NT" for user_id in user_ids}
+
 
+# Global cache instance
+_burnout_cache: Optional[BurnoutClassificationCache] = None
+
+
+def get_burnout_cache() -> BurnoutClassificationCache:
+    """
+    Get the global burnout classification cache.
+
+    Returns:
+        The global BurnoutClassificationCache instance
+    """
+    global _burnout_cache
+    if _burnout_cache is None:
+        _burnout_cache = BurnoutClassificationCache()
+    return _burnout_cache
 
-__all__ = ["BurnoutClassifier", "BurnoutState", "BurnoutClassification"]
+
+def set_burnout_cache(cache: BurnoutClassificationCache) -> None:
+    """
+    Set the global burnout classification cache.
+
+    Args:
+        cache: The BurnoutClassificationCache to use globally
+    """
+    global _burnout_cache
+    _burnout_cache = cache
+
+
+def invalidate_burnout_classification(user_id: int) -> None:
+    """
+    Drop a user's cached classification (called when a new energy point arrives).
+
+    Args:
+        user_id: The user ID
+    """
+    get_burnout_cache().invalidate(user_id)
+
+
+__all__ = [
+    "BurnoutClassifier",
+    "BurnoutState",
+    "BurnoutClassification",
+    "BurnoutClassificationCache",
+    "TrajectoryFeatures",
+    "trajectory_features",
+    "get_burnout_cache",
+    "set_burnout_cache",
+    "invalidate_burnout_classification",
+]
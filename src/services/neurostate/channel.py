@@ -4,6 +4,10 @@ Channel Dominance Detector Service for Aurora Sun V1.
 For AuDHD: detects ADHD-day vs Autism-day channel dominance.
 As per ARCHITECTURE.md Section 3.6.
 
+Incoming messages update per-user decayed channel scores once each
+(observe_message); detect() reads them instead of rescanning recent
+messages (see channel_scores).
+
 References:
 - ARCHITECTURE.md Section 3 (Neurotype Segmentation)
 - ARCHITECTURE.md Section 3.6 (Channel Dominance - AuDHD)
@@ -11,11 +15,21 @@ References:
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
-from typing import Optional
+from typing import Callable, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.models.database import unit_of_work
 from src.models.neurostate import ChannelState, ChannelType
+from src.services.neurostate.channel_scores import (
+    CHANNEL_SIGNALS,
+    ChannelScoreStore,
+    channel_hits,
+    get_channel_score_store,
+    scores_from_hits,
+)
+from src.services.neurostate.snapshot import invalidate_snapshot
 
 
 # =============================================================================
@@ -72,6 +86,7 @@ class ChannelDominanceDetector:
 
     Usage:
         detector = ChannelDominanceDetector(db)
+        await detector.observe_message(user_id=123, text="...")
         result = await detector.detect(user_id=123)
     """
 
@@ -93,43 +108,47 @@ class ChannelDominanceDetector:
     CONFIDENCE_HIGH = 0.7
     CONFIDENCE_MEDIUM = 0.5
 
-    # Channel signal keywords
-    CHANNEL_SIGNALS = {
-        ChannelType.FOCUS: [
-            "detail", "specific", "exact", "plan", "structure",
-            "organize", "order", "system", "routine", "complete",
-            "finish", "task", "deadline", "step", "sequence",
-        ],
-        ChannelType.CREATIVE: [
-            "idea", "think", "maybe", "could", "imagine",
-            "different", "new", "creative", "brainstorm", "possibility",
-            "explore", "what if", "option", "alternative", "wonder",
-        ],
-        ChannelType.SOCIAL: [
-            "talk", "discuss", "share", "tell", "ask",
-            "friend", "family", "people", "connect", "together",
-            "relationship", "conversation", "response", "help", "support",
-        ],
-        ChannelType.PHYSICAL: [
-            "move", "do", "action", "start", "now",
-            "physical", "body", "energy", "active", "exercise",
-            "walk", "hands", "need to", "just", "go",
-        ],
-        ChannelType.LEARNING: [
-            "learn", "understand", "research", "know", "information",
-            "question", "why", "how", "explain", "read",
-            "study", "discover", "find out", "curious", "interest",
-        ],
-    }
-
-    def __init__(self, db: Session):
+    # Channel signal keywords (compiled into one matcher in channel_scores)
+    CHANNEL_SIGNALS = CHANNEL_SIGNALS
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        score_store: Optional[ChannelScoreStore] = None,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ):
         """
         Initialize the channel dominance detector.
 
         Args:
-            db: SQLAlchemy database session
+            db: SQLAlchemy async database session
+            score_store: Decayed channel scores (defaults to the global store)
+            clock: Current time for decaying the scores
         """
         self.db = db
+        self._score_store = score_store if score_store is not None else get_channel_score_store()
+        self._clock = clock
+
+    async def observe_message(
+        self,
+        user_id: int,
+        text: str,
+        at: Optional[datetime] = None,
+    ) -> Optional[dict[ChannelType, float]]:
+        """
+        Update the user's channel scores with an incoming user message.
+
+        Args:
+            user_id: The user's ID
+            text: Message text
+            at: When the message arrived (defaults to now)
+
+        Returns:
+            Channel scores after the message (None without a current signal)
+        """
+        now = at if at is not None else self._clock()
+        aggregate = await self._score_store.observe(user_id, channel_hits(text), now)
+        return aggregate.scores(now)
 
     async def detect(
         self,
@@ -150,13 +169,17 @@ class ChannelDominanceDetector:
         if recent_messages:
             channel_scores = self._analyze_messages(recent_messages)
         else:
-            # Use stored state
-            state = await self.get_current_state(user_id)
-            if state:
-                channel_scores = state.channel_scores
-            else:
-                # Default equal scores
-                channel_scores = {ch: 50.0 for ch in self.CHANNELS}
+            # Decayed scores kept per message: O(channels)
+            aggregate = await self._score_store.get(user_id)
+            channel_scores = aggregate.scores(self._clock()) if aggregate is not None else None
+            if channel_scores is None:
+                # Use stored state
+                state = await self.get_current_state(user_id)
+                if state:
+                    channel_scores = state.channel_scores
+                else:
+                    # Default equal scores
+                    channel_scores = {ch: 50.0 for ch in self.CHANNELS}
 
         # Determine dominant channel
         dominant = max(channel_scores.items(), key=lambda x: x[1])
@@ -208,35 +231,46 @@ class ChannelDominanceDetector:
         Returns:
             Created/updated ChannelState
         """
-        # Get current active state
-        current = await self.get_current_state(user_id)
-
         # Determine dominant channel
         dominant = max(channel_scores.items(), key=lambda x: x[1])
         dominant_channel = dominant[0]
 
-        if current:
-            # Update existing state
-            current.channel_scores = channel_scores
-            current.dominant_channel = dominant_channel.value
-            current.confidence = confidence
-            current.supporting_signals = supporting_signals or []
-            self.db.commit()
-            self.db.refresh(current)
-            return current
-        else:
-            # Create new state
-            state = ChannelState(
-                user_id=user_id,
-                dominant_channel=dominant_channel.value,
-                channel_scores={k.value: v for k, v in channel_scores.items()},
-                confidence=confidence,
-                supporting_signals=supporting_signals or [],
+        async with unit_of_work(self.db):
+            # Get current active state
+            state = await self._get_open_state(user_id)
+
+            if state:
+                # Update existing state
+                state.channel_scores = {k.value: v for k, v in channel_scores.items()}
+                state.dominant_channel = dominant_channel.value
+                state.confidence = confidence
+                state.supporting_signals = supporting_signals or []
+            else:
+                # Create new state
+                state = ChannelState(
+                    user_id=user_id,
+                    dominant_channel=dominant_channel.value,
+                    channel_scores={k.value: v for k, v in channel_scores.items()},
+                    confidence=confidence,
+                    supporting_signals=supporting_signals or [],
+                )
+                self.db.add(state)
+        await self.db.refresh(state)
+        invalidate_snapshot(user_id)
+        return state
+
+    async def _get_open_state(self, user_id: int) -> Optional[ChannelState]:
+        """Latest channel state row whose period is still open."""
+        result = await self.db.execute(
+            select(ChannelState)
+            .where(
+                ChannelState.user_id == user_id,
+                ChannelState.period_end.is_(None),
             )
-            self.db.add(state)
-            self.db.commit()
-            self.db.refresh(state)
-            return state
+            .order_by(ChannelState.period_start.desc())
+            .limit(1)
+        )
+        return result.scalars().first()
 
     async def get_current_state(
         self,
@@ -251,15 +285,7 @@ class ChannelDominanceDetector:
         Returns:
             ChannelStateData or None
         """
-        state = (
-            self.db.query(ChannelState)
-            .filter(
-                ChannelState.user_id == user_id,
-                ChannelState.period_end.is_(None),
-            )
-            .order_by(ChannelState.period_start.desc())
-            .first()
-        )
+        state = await self._get_open_state(user_id)
 
         if not state:
             return None
@@ -296,31 +322,19 @@ class ChannelDominanceDetector:
         Returns:
             Channel scores (0-100 per channel)
         """
-        user_messages = [m["text"].lower() for m in messages if m.get("is_user", False)]
+        user_messages = [m["text"] for m in messages if m.get("is_user", False)]
 
         if not user_messages:
             return {ch: 50.0 for ch in self.CHANNELS}
 
-        # Score each channel based on keyword matches
-        scores = {ch: 0.0 for ch in self.CHANNELS}
-
+        # Score each channel based on keyword matches (one pass per message)
+        hits = {ch: 0.0 for ch in self.CHANNELS}
         for msg in user_messages:
-            for channel, keywords in self.CHANNEL_SIGNALS.items():
-                matches = sum(1 for kw in keywords if kw in msg)
-                scores[channel] += matches
-
-        # Normalize scores to 0-100
-        max_score = max(scores.values()) if max(scores.values()) > 0 else 1
-        normalized = {
-            ch: (score / max_score) * 100 for ch, score in scores.items()
-        }
-
-        # Blend with baseline (50) for stability
-        blended = {
-            ch: normalized[ch] * 0.7 + 50 * 0.3 for ch in self.CHANNELS
-        }
+            for channel, matches in channel_hits(msg).items():
+                hits[channel] += matches
 
-        return blended
+        # Normalize to 0-100 and blend with baseline (50) for stability
+        return scores_from_hits(hits)
 
     def _get_recommended_approach(
         self,
@@ -0,0 +1,352 @@
+"""
+Incremental Channel Scores for Aurora Sun V1.
+
+ChannelDominanceDetector used to lowercase every recent message and search
+every keyword of every channel in each one on every detect().
+DecayedChannelScores keeps per-user keyword hits per channel instead,
+updated once per incoming message:
+
+- Each message is scanned once with a compiled KeywordMatcher (one pass
+  finds the keywords of all channels).
+- Hits decay exponentially (half-life 6h), so a channel shift within the
+  day outweighs the morning; all channels share one timestamp, so an update
+  is O(channels).
+- Scores are the decayed hits normalized to the strongest channel and
+  blended with the 50 baseline, as for a message window. Normalizing
+  cancels the common decay factor, so detect() is an O(channels) read;
+  once decayed hits fall below MIN_SIGNAL the user has no current signal
+  and the detector falls back to the stored state.
+
+Aggregates live in ChannelScoreStore (Redis JSON with TTL, process-memory
+fallback). replay_channel_scores() rebuilds an aggregate from message
+history and verify_channel_scores() compares it with the stored one.
+
+References:
+- ARCHITECTURE.md Section 3.6 (Channel Dominance - AuDHD)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterable, Mapping, Optional
+
+from src.lib.json_ttl_store import JsonTTLStore
+from src.lib.keyword_matcher import KeywordMatcher
+from src.models.neurostate import ChannelType
+
+logger = logging.getLogger(__name__)
+
+
+CHANNEL_HALF_LIFE = timedelta(hours=6)
+MIN_SIGNAL = 0.5                                # Decayed hits needed for a current signal
+
+CHANNELS = [
+    ChannelType.FOCUS,
+    ChannelType.CREATIVE,
+    ChannelType.SOCIAL,
+    ChannelType.PHYSICAL,
+    ChannelType.LEARNING,
+]
+
+# Channel signal keywords
+CHANNEL_SIGNALS: dict[ChannelType, list[str]] = {
+    ChannelType.FOCUS: [
+        "detail", "specific", "exact", "plan", "structure",
+        "organize", "order", "system", "routine", "complete",
+        "finish", "task", "deadline", "step", "sequence",
+    ],
+    ChannelType.CREATIVE: [
+        "idea", "think", "maybe", "could", "imagine",
+        "different", "new", "creative", "brainstorm", "possibility",
+        "explore", "what if", "option", "alternative", "wonder",
+    ],
+    ChannelType.SOCIAL: [
+        "talk", "discuss", "share", "tell", "ask",
+        "friend", "family", "people", "connect", "together",
+        "relationship", "conversation", "response", "help", "support",
+    ],
+    ChannelType.PHYSICAL: [
+        "move", "do", "action", "start", "now",
+        "physical", "body", "energy", "active", "exercise",
+        "walk", "hands", "need to", "just", "go",
+    ],
+    ChannelType.LEARNING: [
+        "learn", "understand", "research", "know", "information",
+        "question", "why", "how", "explain", "read",
+        "study", "discover", "find out", "curious", "interest",
+    ],
+}
+
+CHANNEL_MATCHER = KeywordMatcher({ch.value: keywords for ch, keywords in CHANNEL_SIGNALS.items()})
+
+
+def _timestamp(at: datetime) -> float:
+    """Unix time; naive datetimes are taken as UTC."""
+    if at.tzinfo is None:
+        at = at.replace(tzinfo=timezone.utc)
+    return at.timestamp()
+
+
+def _decay(seconds: float) -> float:
+    return math.pow(0.5, max(0.0, seconds) / CHANNEL_HALF_LIFE.total_seconds())
+
+
+def channel_hits(text: str) -> dict[ChannelType, int]:
+    """
+    Channel keywords contained in one message.
+
+    Args:
+        text: Message text
+
+    Returns:
+        Channel -> number of distinct keywords found
+    """
+    return {ChannelType(ch): hits for ch, hits in CHANNEL_MATCHER.counts(text).items()}
+
+
+def scores_from_hits(hits: Mapping[ChannelType, float]) -> dict[ChannelType, float]:
+    """
+    Channel scores (0-100) from keyword hits.
+
+    Hits are normalized to the strongest channel and blended with the 50
+    baseline for stability.
+
+    Args:
+        hits: Channel -> (decayed) keyword hits
+
+    Returns:
+        Channel -> score
+    """
+    max_hits = max(hits.values(), default=0.0)
+    if max_hits <= 0:
+        max_hits = 1.0
+    return {ch: (hits.get(ch, 0.0) / max_hits) * 100 * 0.7 + 50 * 0.3 for ch in CHANNELS}
+
+
+# =============================================================================
+# Aggregate
+# =============================================================================
+
+@dataclass
+class DecayedChannelScores:
+    """Per-user decayed keyword hits per channel, updated per message.
+
+    Attributes:
+        user_id: The user ID
+        hits: Channel value -> hits as of updated_at
+        updated_at: Unix time all hits are decayed to
+    """
+
+    user_id: int
+    hits: dict[str, float] = field(default_factory=dict)
+    updated_at: float = 0.0
+
+    def observe(self, counts: Mapping[ChannelType, float], at: datetime) -> None:
+        """
+        Add one message's keyword hits.
+
+        Args:
+            counts: Channel -> hits in the message
+            at: When the message arrived
+        """
+        ts = _timestamp(at)
+        if ts >= self.updated_at:
+            factor = _decay(ts - self.updated_at)
+            self.hits = {ch: value * factor for ch, value in self.hits.items()}
+            self.updated_at = ts
+            weight = 1.0
+        else:
+            # Out of order (replay, clock skew): decay the message forward instead
+            weight = _decay(self.updated_at - ts)
+        for channel, count in counts.items():
+            if count:
+                key = ChannelType(channel).value
+                self.hits[key] = self.hits.get(key, 0.0) + count * weight
+
+    def totals(self, now: datetime) -> dict[ChannelType, float]:
+        """Decayed hits per channel as of now."""
+        factor = _decay(_timestamp(now) - self.updated_at)
+        return {ch: self.hits.get(ch.value, 0.0) * factor for ch in CHANNELS}
+
+    def scores(self, now: datetime) -> Optional[dict[ChannelType, float]]:
+        """
+        Channel scores as of now.
+
+        Args:
+            now: Reference time
+
+        Returns:
+            Channel -> score (0-100), or None without a current signal
+        """
+        totals = self.totals(now)
+        if max(totals.values()) < MIN_SIGNAL:
+            return None
+        return scores_from_hits(totals)
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {"user_id": self.user_id, "hits": self.hits, "updated_at": self.updated_at},
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_json(cls, data: str) -> "DecayedChannelScores":
+        fields = json.loads(data)
+        return cls(
+            user_id=fields["user_id"],
+            hits={ch: float(value) for ch, value in fields["hits"].items()},
+            updated_at=float(fields["updated_at"]),
+        )
+
+
+# =============================================================================
+# Store
+# =============================================================================
+
+class ChannelScoreStore(JsonTTLStore[DecayedChannelScores]):
+    """Channel score aggregates by user ID (Redis with in-process fallback)."""
+
+    KEY_PREFIX = "aurora:channel:scores:"
+    TTL = 3 * 24 * 3600  # Hits have decayed far below MIN_SIGNAL by then
+    NAME = "Channel scores"
+
+    def _decode(self, user_id: int, data: str) -> DecayedChannelScores:
+        return DecayedChannelScores.from_json(data)
+
+    async def observe(
+        self,
+        user_id: int,
+        counts: Mapping[ChannelType, float],
+        at: datetime,
+    ) -> DecayedChannelScores:
+        """
+        Add one message's keyword hits to a user's aggregate (created if missing).
+
+        Args:
+            user_id: The user ID
+            counts: Channel -> hits in the message
+            at: When the message arrived
+
+        Returns:
+            The updated aggregate
+        """
+        aggregate = await self.get(user_id)
+        if aggregate is None:
+            aggregate = DecayedChannelScores(user_id=user_id)
+        aggregate.observe(counts, at)
+        await self.put(aggregate)
+        return aggregate
+
+
+# =============================================================================
+# Replay and Verification
+# =============================================================================
+
+def replay_channel_scores(
+    user_id: int,
+    history: Iterable[Mapping[str, Any]],
+) -> DecayedChannelScores:
+    """
+    Rebuild a user's aggregate from message history.
+
+    Args:
+        user_id: The user ID
+        history: Message dicts with 'text', 'is_user' and 'timestamp'
+            (only user messages count)
+
+    Returns:
+        DecayedChannelScores
+    """
+    aggregate = DecayedChannelScores(user_id=user_id)
+    for message in history:
+        if message.get("is_user", False):
+            aggregate.observe(channel_hits(message["text"]), message["timestamp"])
+    return aggregate
+
+
+async def verify_channel_scores(
+    user_id: int,
+    history: Iterable[Mapping[str, Any]],
+    store: Optional[ChannelScoreStore] = None,
+    now: Optional[datetime] = None,
+    tolerance: float = 1.0,
+) -> dict[ChannelType, tuple[float, float]]:
+    """
+    Compare a user's stored scores with a replay of the history.
+
+    Args:
+        user_id: The user ID
+        history: Message dicts with 'text', 'is_user' and 'timestamp'
+        store: Aggregate store (defaults to the global store)
+        now: Reference time (defaults to now)
+        tolerance: Largest accepted score difference per channel
+
+    Returns:
+        Channel -> (stored score, replayed score) for every mismatch
+        (empty when they agree or nothing is stored)
+    """
+    store = store if store is not None else get_channel_score_store()
+    now = now or datetime.now(timezone.utc)
+    stored = await store.get(user_id)
+    if stored is None:
+        return {}
+    baseline = dict.fromkeys(CHANNELS, 50.0)
+    stored_scores = stored.scores(now) or baseline
+    replayed_scores = replay_channel_scores(user_id, history).scores(now) or baseline
+
+    mismatches = {
+        ch: (stored_scores[ch], replayed_scores[ch])
+        for ch in CHANNELS
+        if abs(stored_scores[ch] - replayed_scores[ch]) > tolerance
+    }
+    if mismatches:
+        logger.warning(
+            f"Channel scores for user {user_id} drifted from the history: "
+            f"{sorted(ch.value for ch in mismatches)}"
+        )
+    return mismatches
+
+
+# Global store instance
+_channel_store: Optional[ChannelScoreStore] = None
+
+
+def get_channel_score_store() -> ChannelScoreStore:
+    """
+    Get the global channel score store (process memory until set).
+
+    Returns:
+        The global ChannelScoreStore instance
+    """
+    global _channel_store
+    if _channel_store is None:
+        _channel_store = ChannelScoreStore()
+    return _channel_store
+
+
+def set_channel_score_store(store: ChannelScoreStore) -> None:
+    """
+    Set the global channel score store.
+
+    Args:
+        store: The ChannelScoreStore to use globally
+    """
+    global _channel_store
+    _channel_store = store
+
+
+__all__ = [
+    "CHANNEL_SIGNALS",
+    "DecayedChannelScores",
+    "ChannelScoreStore",
+    "channel_hits",
+    "scores_from_hits",
+    "replay_channel_scores",
+    "verify_channel_scores",
+    "get_channel_score_store",
+    "set_channel_score_store",
+]
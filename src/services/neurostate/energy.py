@@ -14,13 +14,21 @@ References:
 """
 
 from dataclasses import dataclass, field
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone
 from typing import Optional
 
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.models.database import unit_of_work
 from src.models.neurostate import EnergyLevelRecord, EnergyLevel
+from src.services.neurostate.burnout import invalidate_burnout_classification
+from src.services.neurostate.energy_baseline import (
+    EnergyBaselineStore,
+    get_energy_baseline_store,
+    rebuild_baseline,
+)
+from src.services.neurostate.snapshot import invalidate_snapshot
+from src.services.write_behind import WriteBehindBuffer, current_write_behind_buffer
 
 
 # =============================================================================
@@ -101,14 +109,24 @@ class EnergyPredictor:
     LENGTH_BASELINE = 100    # Normal
     LENGTH_LONG = 300        # Long/engaged
 
-    def __init__(self, db: Session):
+    def __init__(
+        self,
+        db: AsyncSession,
+        baseline_store: Optional[EnergyBaselineStore] = None,
+        writer: Optional[WriteBehindBuffer] = None,
+    ):
         """
         Initialize the energy predictor.
 
         Args:
-            db: SQLAlchemy database session
+            db: SQLAlchemy async database session
+            baseline_store: Incremental energy baselines (defaults to the global store)
+            writer: Write-behind buffer for prediction records (defaults to the
+                installed buffer; without one, commit per prediction)
         """
         self.db = db
+        self._baseline_store = baseline_store if baseline_store is not None else get_energy_baseline_store()
+        self._writer = writer if writer is not None else current_write_behind_buffer()
 
     async def predict(
         self,
@@ -414,18 +432,16 @@ class EnergyPredictor:
         )
 
     async def _get_user_baseline(self, user_id: int) -> float:
-        """Get user's typical energy baseline."""
-        # Query recent energy records
-        recent = (
-            self.db.query(func.avg(EnergyLevelRecord.energy_score))
-            .filter(
-                EnergyLevelRecord.user_id == user_id,
-                EnergyLevelRecord.predicted_at >= datetime.now(timezone.utc) - timedelta(days=7),
-            )
-            .scalar()
-        )
+        """Get user's typical energy baseline (7-day mean, kept incrementally)."""
+        now = datetime.now(timezone.utc)
+        baseline = await self._baseline_store.get(user_id)
+        if baseline is None:
+            # Cold store: rebuild once from the records, then keep it updated
+            baseline = await rebuild_baseline(self.db, user_id, now)
+            await self._baseline_store.put(baseline)
 
-        return float(recent) if recent else self.ENERGY_BASELINE
+        recent = baseline.mean(now)
+        return recent if recent else self.ENERGY_BASELINE
 
     async def _log_prediction(
         self,
@@ -434,18 +450,39 @@ class EnergyPredictor:
         energy_score: float,
         behavioral_signals: BehavioralSignals,
     ) -> EnergyLevelRecord:
-        """Log the prediction to database."""
+        """Log the prediction to database (batched when a writer is set)."""
+        predicted_at = datetime.now(timezone.utc)
         record = EnergyLevelRecord(
             user_id=user_id,
             energy_level=energy_level.value,
             energy_score=energy_score,
+            predicted_at=predicted_at,
             behavioral_proxies={
                 "message_length": behavioral_signals.message_length,
                 "time_of_day": behavioral_signals.time_of_day_hour,
             },
         )
-        self.db.add(record)
-        self.db.commit()
+        if self._writer is not None:
+            # The snapshot keeps the previous energy until the row is written
+            await self._writer.insert(
+                EnergyLevelRecord.__table__,
+                {
+                    "user_id": user_id,
+                    "energy_level": record.energy_level,
+                    "energy_score": energy_score,
+                    "predicted_at": predicted_at,
+                    "behavioral_proxies": record.behavioral_proxies,
+                    "created_at": predicted_at,
+                },
+                on_flush=lambda: invalidate_snapshot(user_id),
+            )
+        else:
+            async with unit_of_work(self.db):
+                self.db.add(record)
+            invalidate_snapshot(user_id)
+        # A new energy point: the trajectory behind the burnout type changed
+        invalidate_burnout_classification(user_id)
+        await self._baseline_store.observe(user_id, energy_score, predicted_at)
         return record
 
 
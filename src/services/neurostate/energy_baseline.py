@@ -0,0 +1,334 @@
+"""
+Incremental Energy Baseline for Aurora Sun V1.
+
+EnergyPredictor blends every prediction with the user's typical energy. That
+baseline used to be an AVG(energy_score) over 7 days of EnergyLevelRecord
+rows, run on every predict. RollingEnergyBaseline keeps the same 7-day mean
+incrementally instead:
+
+- Hourly buckets (sum, count) plus running totals: logging a prediction adds
+  to the current bucket and drops buckets that left the window, so an update
+  is O(1) amortized and the mean needs no query. The window is exact to the
+  hour.
+- A time-decayed EWMA (half-life 3 days) next to the window for trend use;
+  unlike the window it reacts to the most recent days first.
+
+Baselines live in EnergyBaselineStore (Redis JSON with TTL, process-memory
+fallback). A missing baseline is rebuilt once from the last 7 days of
+records; reconcile_energy_baselines() rebuilds all of them nightly, so
+drift from lost updates (Redis eviction, concurrent writers, rows written
+elsewhere) lasts at most a day.
+
+References:
+- ARCHITECTURE.md Section 3.7 (Energy Prediction)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.lib.json_ttl_store import JsonTTLStore
+from src.models.database import session_scope
+from src.models.neurostate import EnergyLevelRecord
+
+logger = logging.getLogger(__name__)
+
+
+BASELINE_WINDOW = timedelta(days=7)
+BUCKET_SECONDS = 3600
+EWMA_HALF_LIFE = timedelta(days=3)
+
+
+def _timestamp(at: datetime) -> float:
+    """Unix time; naive datetimes (SQLite) are taken as UTC."""
+    if at.tzinfo is None:
+        at = at.replace(tzinfo=timezone.utc)
+    return at.timestamp()
+
+
+# =============================================================================
+# Baseline
+# =============================================================================
+
+@dataclass
+class RollingEnergyBaseline:
+    """Per-user energy baseline, updated per logged prediction.
+
+    Attributes:
+        user_id: The user ID
+        buckets: Hour index -> [sum of scores, count], oldest first
+        total: Sum of all scores in the buckets
+        count: Number of scores in the buckets
+        ewma: Exponentially weighted energy score (None before the first score)
+        ewma_at: Unix time of the last EWMA update
+    """
+
+    user_id: int
+    buckets: OrderedDict[int, list[float]] = field(default_factory=OrderedDict)
+    total: float = 0.0
+    count: int = 0
+    ewma: Optional[float] = None
+    ewma_at: float = 0.0
+
+    def _prune(self, now: float) -> None:
+        """Drop buckets that left the window."""
+        oldest = int((now - BASELINE_WINDOW.total_seconds()) // BUCKET_SECONDS)
+        while self.buckets:
+            hour, (bucket_sum, bucket_count) = next(iter(self.buckets.items()))
+            if hour > oldest:
+                break
+            self.buckets.popitem(last=False)
+            self.total -= bucket_sum
+            self.count -= int(bucket_count)
+        if not self.buckets:
+            # Drop accumulated float error along with the last bucket
+            self.total, self.count = 0.0, 0
+
+    def observe(self, score: float, at: datetime) -> None:
+        """
+        Add a logged energy score.
+
+        Args:
+            score: Energy score (0-100)
+            at: When it was predicted
+        """
+        now = _timestamp(at)
+        hour = int(now // BUCKET_SECONDS)
+        bucket = self.buckets.get(hour)
+        if bucket is None:
+            if self.buckets and hour < next(reversed(self.buckets)):
+                # Out of order (replay, clock skew): keep buckets sorted
+                self.buckets[hour] = [0.0, 0]
+                self.buckets = OrderedDict(sorted(self.buckets.items()))
+            else:
+                self.buckets[hour] = [0.0, 0]
+            bucket = self.buckets[hour]
+        bucket[0] += score
+        bucket[1] += 1
+        self.total += score
+        self.count += 1
+        self._prune(max(now, self.ewma_at))
+
+        if self.ewma is None:
+            self.ewma, self.ewma_at = score, now
+        else:
+            elapsed = max(0.0, now - self.ewma_at)
+            alpha = 1.0 - math.pow(0.5, elapsed / EWMA_HALF_LIFE.total_seconds())
+            self.ewma += alpha * (score - self.ewma)
+            self.ewma_at = max(self.ewma_at, now)
+
+    def mean(self, now: datetime) -> Optional[float]:
+        """
+        Mean energy score over the last 7 days.
+
+        Args:
+            now: Reference time
+
+        Returns:
+            The mean, or None without scores in the window
+        """
+        self._prune(_timestamp(now))
+        return self.total / self.count if self.count else None
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "user_id": self.user_id,
+            "buckets": [[hour, s, c] for hour, (s, c) in self.buckets.items()],
+            "ewma": self.ewma,
+            "ewma_at": self.ewma_at,
+        }, separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, data: str) -> "RollingEnergyBaseline":
+        fields = json.loads(data)
+        baseline = cls(user_id=fields["user_id"], ewma=fields["ewma"], ewma_at=fields["ewma_at"])
+        for hour, bucket_sum, bucket_count in fields["buckets"]:
+            baseline.buckets[int(hour)] = [float(bucket_sum), int(bucket_count)]
+            baseline.total += bucket_sum
+            baseline.count += int(bucket_count)
+        return baseline
+
+    @classmethod
+    def from_records(
+        cls,
+        user_id: int,
+        records: Iterable[tuple[float, datetime]],
+    ) -> "RollingEnergyBaseline":
+        """
+        Rebuild a baseline from logged records.
+
+        Args:
+            user_id: The user ID
+            records: (energy_score, predicted_at), oldest first
+
+        Returns:
+            RollingEnergyBaseline
+        """
+        baseline = cls(user_id=user_id)
+        for score, at in records:
+            baseline.observe(float(score), at)
+        return baseline
+
+
+# =============================================================================
+# Store
+# =============================================================================
+
+class EnergyBaselineStore(JsonTTLStore[RollingEnergyBaseline]):
+    """Energy baselines by user ID (Redis with in-process fallback)."""
+
+    KEY_PREFIX = "aurora:energy:baseline:"
+    TTL = 8 * 24 * 3600  # Window plus a day; inactive users expire
+    NAME = "Energy baseline"
+
+    def _decode(self, user_id: int, data: str) -> RollingEnergyBaseline:
+        return RollingEnergyBaseline.from_json(data)
+
+    async def observe(self, user_id: int, score: float, at: datetime) -> None:
+        """
+        Add a logged score to a user's stored baseline.
+
+        Without a stored baseline nothing is done: the next read rebuilds it
+        from the records, this one included.
+
+        Args:
+            user_id: The user ID
+            score: Energy score (0-100)
+            at: When it was predicted
+        """
+        baseline = await self.get(user_id)
+        if baseline is None:
+            return
+        baseline.observe(score, at)
+        await self.put(baseline)
+
+
+# =============================================================================
+# Rebuild and Nightly Reconciliation
+# =============================================================================
+
+def _window_query(since: datetime, user_ids: Optional[list[int]] = None) -> Any:
+    energy = EnergyLevelRecord.__table__
+    stmt = (
+        select(energy.c.user_id, energy.c.energy_score, energy.c.predicted_at)
+        .where(energy.c.predicted_at >= since)
+        .order_by(energy.c.user_id, energy.c.predicted_at)
+    )
+    if user_ids is not None:
+        stmt = stmt.where(energy.c.user_id.in_(user_ids))
+    return stmt
+
+
+async def rebuild_baseline(
+    session: AsyncSession,
+    user_id: int,
+    now: Optional[datetime] = None,
+) -> RollingEnergyBaseline:
+    """
+    Rebuild one user's baseline from the last 7 days of records.
+
+    Args:
+        session: Async database session
+        user_id: The user ID
+        now: Reference time (defaults to now)
+
+    Returns:
+        RollingEnergyBaseline
+    """
+    now = now or datetime.now(timezone.utc)
+    result = await session.execute(_window_query(now - BASELINE_WINDOW, [user_id]))
+    return RollingEnergyBaseline.from_records(
+        user_id, ((score, at) for _, score, at in result)
+    )
+
+
+async def reconcile_energy_baselines(
+    store: Optional[EnergyBaselineStore] = None,
+    session_factory: Optional[async_sessionmaker[AsyncSession]] = None,
+    now: Optional[datetime] = None,
+    batch_size: int = 5000,
+) -> int:
+    """
+    Rebuild every active user's baseline from the records (nightly job).
+
+    Streams the last 7 days of records in user order, so memory holds one
+    user's records at a time.
+
+    Args:
+        store: Baseline store (defaults to the global store)
+        session_factory: Async session factory (defaults to the shared engine's)
+        now: Reference time (defaults to now)
+        batch_size: Rows fetched per round-trip
+
+    Returns:
+        Number of baselines written
+    """
+    store = store if store is not None else get_energy_baseline_store()
+    now = now or datetime.now(timezone.utc)
+    written = 0
+    current: Optional[RollingEnergyBaseline] = None
+
+    async with session_scope(session_factory) as session:
+        result = await session.stream(
+            _window_query(now - BASELINE_WINDOW).execution_options(yield_per=batch_size)
+        )
+        async for user_id, score, at in result:
+            if current is None or current.user_id != user_id:
+                if current is not None:
+                    await store.put(current)
+                    written += 1
+                current = RollingEnergyBaseline(user_id=user_id)
+            current.observe(float(score), at)
+    if current is not None:
+        await store.put(current)
+        written += 1
+
+    logger.info(f"Reconciled {written} energy baselines")
+    return written
+
+
+# Global store instance
+_baseline_store: Optional[EnergyBaselineStore] = None
+
+
+def get_energy_baseline_store() -> EnergyBaselineStore:
+    """
+    Get the global energy baseline store (process memory until set).
+
+    Returns:
+        The global EnergyBaselineStore instance
+    """
+    global _baseline_store
+    if _baseline_store is None:
+        _baseline_store = EnergyBaselineStore()
+    return _baseline_store
+
+
+def set_energy_baseline_store(store: EnergyBaselineStore) -> None:
+    """
+    Set the global energy baseline store.
+
+    Args:
+        store: The EnergyBaselineStore to use globally
+    """
+    global _baseline_store
+    _baseline_store = store
+
+
+__all__ = [
+    "RollingEnergyBaseline",
+    "EnergyBaselineStore",
+    "rebuild_baseline",
+    "reconcile_energy_baselines",
+    "get_energy_baseline_store",
+    "set_energy_baseline_store",
+]
@@ -6,6 +6,9 @@ Three types of inertia as defined in ARCHITECTURE.md Section 3:
 - Activation Deficit: Cannot motivate (ADHD)
 - Double Block: Both combined (AuDHD)
 
+Keyword signals come from the shared lexicon registry: one pass per
+message yields the hits of every inertia category, in the user's language.
+
 References:
 - ARCHITECTURE.md Section 3 (Neurotype Segmentation)
 - ARCHITECTURE.md Section 3.3 (Inertia - AD/AU/AH)
@@ -15,9 +18,13 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from typing import Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.lib.lexicon import DEFAULT_LEXICONS, LexiconRegistry, get_lexicon_registry
+from src.models.database import unit_of_work
 from src.models.neurostate import InertiaEvent, InertiaType
+from src.services.neurostate.snapshot import invalidate_snapshot
 
 
 # =============================================================================
@@ -83,32 +90,22 @@ class InertiaDetector:
     PATTERN_WEIGHT = 0.5
     CONTEXT_WEIGHT = 0.2
 
-    # Keywords for each inertia type
-    AUTISTIC_INERTIA_KEYWORDS = [
-        "stuck", "can't start", "want to but", "frozen", "overwhelmed",
-        "don't know how", "too much", "decision paralysis", "paralyzed",
-        "cannot switch", "tunnel", "loop", "ruminate", "rumination",
-    ]
-
-    ACTIVATION_DEFICIT_KEYWORDS = [
-        "should", "need to", "want to", "later", "tomorrow", "eventually",
-        "procrastinate", "lazy", "motivation", "can't be bothered",
-        "hard to start", "put off", "keep forgetting", "distracted",
-    ]
-
-    DOUBLE_BLOCK_KEYWORDS = [
-        "want to but shouldn't", "should but can't", "stuck and tired",
-        "overwhelmed and bored", "too much and not enough",
-    ]
-
-    def __init__(self, db: Session):
+    # Keywords for each inertia type (English; all languages live in the
+    # lexicon registry under "inertia.*")
+    AUTISTIC_INERTIA_KEYWORDS = DEFAULT_LEXICONS["en"]["inertia.autistic"]
+    ACTIVATION_DEFICIT_KEYWORDS = DEFAULT_LEXICONS["en"]["inertia.activation"]
+    DOUBLE_BLOCK_KEYWORDS = DEFAULT_LEXICONS["en"]["inertia.double_block"]
+
+    def __init__(self, db: AsyncSession, lexicons: Optional[LexiconRegistry] = None):
         """
         Initialize the inertia detector.
 
         Args:
-            db: SQLAlchemy database session
+            db: SQLAlchemy async database session
+            lexicons: Keyword lexicons (defaults to the global registry)
         """
         self.db = db
+        self._lexicons = lexicons if lexicons is not None else get_lexicon_registry()
 
     async def detect(
         self,
@@ -128,8 +125,8 @@ class InertiaDetector:
         if len(recent_messages) < self.MIN_MESSAGE_COUNT:
             return InertiaDetectionResult(is_inertia=False)
 
-        # Get user segment for context
-        segment_code = self._get_user_segment(user_id)
+        # Get user segment and language for context
+        segment_code, language = await self._get_user_profile(user_id)
 
         # Analyze messages
         user_messages = [m["text"].lower() for m in recent_messages if m.get("is_user", False)]
@@ -137,10 +134,13 @@ class InertiaDetector:
         if not user_messages:
             return InertiaDetectionResult(is_inertia=False)
 
+        # One lexicon pass per message gives the hits of every category
+        message_hits = [self._lexicons.counts(msg, language) for msg in user_messages]
+
         # Score each inertia type
-        autistic_score = self._score_autistic_inertia(user_messages)
-        activation_score = self._score_activation_deficit(user_messages)
-        double_block_score = self._score_double_block(user_messages)
+        autistic_score = self._score_autistic_inertia(message_hits)
+        activation_score = self._score_activation_deficit(message_hits)
+        double_block_score = self._score_double_block(message_hits)
 
         # Determine primary type based on segment
         if segment_code == "AU":
@@ -206,18 +206,19 @@ class InertiaDetector:
         Returns:
             Created InertiaEvent
         """
-        event = InertiaEvent(
-            user_id=user_id,
-            inertia_type=inertia_type.value,
-            severity=severity,
-            trigger=trigger,
-            notes=notes,
-            attempted_interventions=[],
-            outcome="ongoing",
-        )
-        self.db.add(event)
-        self.db.commit()
-        self.db.refresh(event)
+        async with unit_of_work(self.db):
+            event = InertiaEvent(
+                user_id=user_id,
+                inertia_type=inertia_type.value,
+                severity=severity,
+                trigger=trigger,
+                notes=notes,
+                attempted_interventions=[],
+                outcome="ongoing",
+            )
+            self.db.add(event)
+        await self.db.refresh(event)
+        invalidate_snapshot(user_id)
         return event
 
     async def resolve_event(
@@ -239,17 +240,17 @@ class InertiaDetector:
         Returns:
             Updated InertiaEvent
         """
-        event = self.db.query(InertiaEvent).filter(InertiaEvent.id == event_id).first()
-        if not event:
-            raise ValueError(f"InertiaEvent {event_id} not found")
-
-        event.outcome = outcome
-        event.attempted_interventions = interventions_used
-        event.duration_minutes = duration_minutes
-        event.resolved_at = datetime.now(timezone.utc)
-
-        self.db.commit()
-        self.db.refresh(event)
+        async with unit_of_work(self.db):
+            event = await self.db.get(InertiaEvent, event_id)
+            if not event:
+                raise ValueError(f"InertiaEvent {event_id} not found")
+
+            event.outcome = outcome
+            event.attempted_interventions = interventions_used
+            event.duration_minutes = duration_minutes
+            event.resolved_at = datetime.now(timezone.utc)
+        await self.db.refresh(event)
+        invalidate_snapshot(event.user_id)
         return event
 
     async def get_active_inertia(
@@ -265,60 +266,49 @@ class InertiaDetector:
         Returns:
             Active InertiaEvent or None
         """
-        return (
-            self.db.query(InertiaEvent)
-            .filter(
+        result = await self.db.execute(
+            select(InertiaEvent)
+            .where(
                 InertiaEvent.user_id == user_id,
                 InertiaEvent.outcome == "ongoing",
             )
             .order_by(InertiaEvent.detected_at.desc())
-            .first()
+            .limit(1)
         )
+        return result.scalars().first()
 
-    def _score_autistic_inertia(self, messages: list[str]) -> float:
-        """Score messages for autistic inertia patterns."""
-        score = 0.0
-        for msg in messages:
-            for keyword in self.AUTISTIC_INERTIA_KEYWORDS:
-                if keyword in msg:
-                    score += self.INERTIA_KEYWORD_WEIGHT
+    def _score_autistic_inertia(self, message_hits: list[dict[str, int]]) -> float:
+        """Score messages (their lexicon hits) for autistic inertia patterns."""
+        score = sum(hits["inertia.autistic"] for hits in message_hits) * self.INERTIA_KEYWORD_WEIGHT
 
         # Pattern analysis
         # Repeated expressions of wanting to do something but can't
-        want_cant_count = sum(1 for msg in messages if "want" in msg and "can" in msg)
+        want_cant_count = sum(1 for hits in message_hits if hits["inertia.want"] and hits["inertia.can"])
         if want_cant_count >= 2:
             score += self.PATTERN_WEIGHT
 
-        return min(1.0, score / len(messages) if messages else 0)
+        return min(1.0, score / len(message_hits) if message_hits else 0)
 
-    def _score_activation_deficit(self, messages: list[str]) -> float:
-        """Score messages for ADHD activation deficit patterns."""
-        score = 0.0
-        for msg in messages:
-            for keyword in self.ACTIVATION_DEFICIT_KEYWORDS:
-                if keyword in msg:
-                    score += self.INERTIA_KEYWORD_WEIGHT
+    def _score_activation_deficit(self, message_hits: list[dict[str, int]]) -> float:
+        """Score messages (their lexicon hits) for ADHD activation deficit patterns."""
+        score = sum(hits["inertia.activation"] for hits in message_hits) * self.INERTIA_KEYWORD_WEIGHT
 
         # Pattern analysis
         # "should" but no action
-        should_count = sum(1 for msg in messages if "should" in msg)
-        later_count = sum(1 for msg in messages if "later" in msg or "tomorrow" in msg)
+        should_count = sum(1 for hits in message_hits if hits["inertia.should"])
+        later_count = sum(1 for hits in message_hits if hits["inertia.later"])
         if should_count >= 2 and later_count >= 1:
             score += self.PATTERN_WEIGHT
 
-        return min(1.0, score / len(messages) if messages else 0)
+        return min(1.0, score / len(message_hits) if message_hits else 0)
 
-    def _score_double_block(self, messages: list[str]) -> float:
-        """Score messages for double block patterns (AuDHD)."""
-        score = 0.0
-        for msg in messages:
-            for keyword in self.DOUBLE_BLOCK_KEYWORDS:
-                if keyword in msg:
-                    score += 0.5
+    def _score_double_block(self, message_hits: list[dict[str, int]]) -> float:
+        """Score messages (their lexicon hits) for double block patterns (AuDHD)."""
+        score = sum(hits["inertia.double_block"] for hits in message_hits) * 0.5
 
         # Both types present
-        autistic_indicators = sum(1 for msg in messages if any(k in msg for k in self.AUTISTIC_INERTIA_KEYWORDS))
-        activation_indicators = sum(1 for msg in messages if any(k in msg for k in self.ACTIVATION_DEFICIT_KEYWORDS))
+        autistic_indicators = sum(1 for hits in message_hits if hits["inertia.autistic"])
+        activation_indicators = sum(1 for hits in message_hits if hits["inertia.activation"])
 
         if autistic_indicators > 0 and activation_indicators > 0:
             score += self.PATTERN_WEIGHT
@@ -363,11 +353,17 @@ class InertiaDetector:
 
         return None
 
-    def _get_user_segment(self, user_id: int) -> str:
-        """Get user's segment code."""
+    async def _get_user_profile(self, user_id: int) -> tuple[str, Optional[str]]:
+        """Get user's segment code and language."""
         from src.models.user import User
-        user = self.db.query(User).filter(User.id == user_id).first()
-        return user.working_style_code if user else "NT"
+        users = User.__table__
+        result = await self.db.execute(
+            select(users.c.working_style_code, users.c.language).where(users.c.id == user_id)
+        )
+        row = result.first()
+        if row is None:
+            return "NT", None
+        return row.working_style_code or "NT", row.language
 
 
 __all__ = ["InertiaDetector", "InertiaEventData", "InertiaDetectionResult"]
@@ -9,14 +9,23 @@ References:
 - ARCHITECTURE.md Section 3.5 (Masking - AuDHD)
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from typing import Optional
 
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.models.database import unit_of_work
 from src.models.neurostate import MaskingLog
+from src.services.neurostate.masking_aggregate import (
+    REBUILD_HORIZON,
+    MaskingLoadStore,
+    get_masking_load_store,
+    rebuild_masking_load,
+)
+from src.services.neurostate.snapshot import invalidate_snapshot
+from src.services.write_behind import WriteBehindBuffer, current_write_behind_buffer
 
 
 # =============================================================================
@@ -62,6 +71,8 @@ class MaskingLoadTracker:
     - Each context accumulates independently
     - Masking in multiple contexts compounds exponentially
     - Recovery requires ceasing masking, not just time
+    - Context loads are time-decayed running totals kept per logged event
+      (see masking_aggregate), so reading the load needs no log query
 
     Masking Types:
     - Social camouflaging
@@ -99,14 +110,24 @@ class MaskingLoadTracker:
     # Time window for "recent" events (hours)
     RECENT_WINDOW_HOURS = 24
 
-    def __init__(self, db: Session):
+    def __init__(
+        self,
+        db: AsyncSession,
+        writer: Optional[WriteBehindBuffer] = None,
+        load_store: Optional[MaskingLoadStore] = None,
+    ):
         """
         Initialize the masking load tracker.
 
         Args:
-            db: SQLAlchemy database session
+            db: SQLAlchemy async database session
+            writer: Write-behind buffer for masking events (defaults to the
+                installed buffer; without one, commit per event)
+            load_store: Decayed per-context loads (defaults to the global store)
         """
         self.db = db
+        self._writer = writer if writer is not None else current_write_behind_buffer()
+        self._load_store = load_store if load_store is not None else get_masking_load_store()
 
     async def track(
         self,
@@ -149,7 +170,7 @@ class MaskingLoadTracker:
             event_load = base_load
 
         # Get current context loads
-        current_contexts = self._get_context_loads(user_id)
+        current_contexts = await self._get_context_loads(user_id)
 
         # Add exponential cost for context switching
         if context in current_contexts:
@@ -167,7 +188,7 @@ class MaskingLoadTracker:
         new_context_load = min(100.0, new_context_load)
 
         # Log the event
-        self._log_event(
+        await self._log_event(
             user_id=user_id,
             context=context,
             masking_type=masking_behavior,
@@ -193,13 +214,13 @@ class MaskingLoadTracker:
             Current MaskingLoad
         """
         # Get context loads
-        context_loads = self._get_context_loads(user_id)
+        context_loads = await self._get_context_loads(user_id)
 
         # Calculate total (exponential sum)
         total_load = self._calculate_total_load(context_loads)
 
         # Get recent events
-        recent_events = self._get_recent_events(user_id)
+        recent_events = await self._get_recent_events(user_id)
 
         return MaskingLoad(
             user_id=user_id,
@@ -229,18 +250,19 @@ class MaskingLoadTracker:
         Returns:
             Updated MaskingLoad
         """
-        current = self._get_context_loads(user_id)
+        current = await self._get_context_loads(user_id)
 
         if context in current:
             current[context] = max(0.0, current[context] - reduction)
 
             # Update database - find most recent event and mark reduction
             # For simplicity, we log a negative event
-            self._log_event(
+            await self._log_event(
                 user_id=user_id,
                 context=context,
                 masking_type="load_reduction",
                 load_score=-reduction,
+                duration_minutes=None,
                 notes="User-reported load reduction",
             )
 
@@ -286,26 +308,26 @@ class MaskingLoadTracker:
 
         return recommendations
 
-    def _get_context_loads(self, user_id: int) -> dict[str, float]:
-        """Get current load per context from database."""
-        # Sum load scores by context for unresolved masking
-        # For simplicity, use recent events to calculate
-        recent_time = datetime.now(timezone.utc) - timedelta(hours=self.RECENT_WINDOW_HOURS)
-
-        results = (
-            self.db.query(
-                MaskingLog.context,
-                func.sum(MaskingLog.load_score).label("total")
-            )
-            .filter(
-                MaskingLog.user_id == user_id,
-                MaskingLog.logged_at >= recent_time,
-            )
-            .group_by(MaskingLog.context)
-            .all()
-        )
-
-        return {ctx: max(0.0, float(total or 0)) for ctx, total in results}
+    async def _get_context_loads(self, user_id: int) -> dict[str, float]:
+        """Get current (decayed) load per context, kept incrementally per event."""
+        now = datetime.now(timezone.utc)
+        aggregate = await self._load_store.get(user_id)
+        if aggregate is None:
+            # Cold store: rebuild once from the log, then keep it updated
+            aggregate = await rebuild_masking_load(self.db, user_id, now)
+            for row in self._pending_events(user_id, now - REBUILD_HORIZON):
+                aggregate.observe(row["context"], row["load_score"], row["logged_at"])
+            await self._load_store.put(aggregate)
+        return aggregate.loads(now)
+
+    def _pending_events(self, user_id: int, since: datetime) -> list[dict]:
+        """Events still in the write-behind buffer (read-your-writes)."""
+        if self._writer is None:
+            return []
+        return [
+            row for row in self._writer.pending_inserts(MaskingLog.__table__, user_id=user_id)
+            if row["logged_at"] >= since
+        ]
 
     def _calculate_total_load(self, context_loads: dict[str, float]) -> float:
         """
@@ -325,7 +347,7 @@ class MaskingLoadTracker:
 
         return min(100.0, base_sum * exponential_factor)
 
-    def _log_event(
+    async def _log_event(
         self,
         user_id: int,
         context: str,
@@ -334,21 +356,42 @@ class MaskingLoadTracker:
         duration_minutes: Optional[int],
         notes: Optional[str],
     ) -> MaskingLog:
-        """Log a masking event to the database."""
-        event = MaskingLog(
-            user_id=user_id,
-            context=context,
-            masking_type=masking_type,
-            load_score=load_score,
-            duration_minutes=duration_minutes,
-            notes=notes,
-        )
-        self.db.add(event)
-        self.db.commit()
-        self.db.refresh(event)
+        """Log a masking event to the database (batched when a writer is set)."""
+        now = datetime.now(timezone.utc)
+        if self._writer is not None:
+            row = {
+                "user_id": user_id,
+                "context": context,
+                "masking_type": masking_type,
+                "load_score": load_score,
+                "duration_minutes": duration_minutes,
+                "notes": notes,
+                "logged_at": now,
+                "created_at": now,
+            }
+            await self._writer.insert(
+                MaskingLog.__table__, row, on_flush=lambda: invalidate_snapshot(user_id)
+            )
+            await self._load_store.observe(user_id, context, load_score, now)
+            return MaskingLog(**row)
+
+        async with unit_of_work(self.db):
+            event = MaskingLog(
+                user_id=user_id,
+                context=context,
+                masking_type=masking_type,
+                load_score=load_score,
+                duration_minutes=duration_minutes,
+                notes=notes,
+                logged_at=now,
+            )
+            self.db.add(event)
+        await self.db.refresh(event)
+        invalidate_snapshot(user_id)
+        await self._load_store.observe(user_id, context, load_score, now)
         return event
 
-    def _get_recent_events(
+    async def _get_recent_events(
         self,
         user_id: int,
         limit: int = 5,
@@ -356,16 +399,25 @@ class MaskingLoadTracker:
         """Get recent masking events."""
         recent_time = datetime.now(timezone.utc) - timedelta(hours=self.RECENT_WINDOW_HOURS)
 
-        return (
-            self.db.query(MaskingLog)
-            .filter(
+        result = await self.db.execute(
+            select(MaskingLog)
+            .where(
                 MaskingLog.user_id == user_id,
                 MaskingLog.logged_at >= recent_time,
             )
             .order_by(MaskingLog.logged_at.desc())
             .limit(limit)
-            .all()
         )
+        events = list(result.scalars().all())
+        pending = [MaskingLog(**row) for row in self._pending_events(user_id, recent_time)]
+        if pending:
+            events = sorted(
+                pending + events,
+                # SQLite returns naive UTC timestamps
+                key=lambda e: e.logged_at if e.logged_at.tzinfo else e.logged_at.replace(tzinfo=timezone.utc),
+                reverse=True,
+            )[:limit]
+        return events
 
 
 __all__ = ["MaskingLoadTracker", "MaskingLoad", "MaskingEvent"]
@@ -0,0 +1,295 @@
+"""
+Time-decayed Masking Aggregates for Aurora Sun V1.
+
+MaskingLoadTracker used to sum MaskingLog.load_score per context with a
+GROUP BY over the last 24 hours on every track() and get_current_load().
+DecayedMaskingLoad keeps a running total per context instead, updated on
+each logged event:
+
+- Each context holds (load, updated_at). A new event decays the stored load
+  to its own time and adds its score, so an update is O(1).
+- Loads decay exponentially (half-life 16h, about the same total weight as
+  the former 24h window); reading decays every context to "now", so the
+  current load is O(contexts) and needs no query.
+- Expiry is lazy: a context not updated for 24 hours is dropped when read
+  (or restarted by its next event), like a context without events in the
+  old window.
+
+Aggregates live in MaskingLoadStore (Redis JSON with TTL, process-memory
+fallback). A missing aggregate is rebuilt from the log by replaying the
+last 7 days of events (older events contribute < 0.1); verify_masking_loads()
+compares a stored aggregate with that rebuild.
+
+References:
+- ARCHITECTURE.md Section 3.5 (Masking - AuDHD)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.lib.json_ttl_store import JsonTTLStore
+from src.models.neurostate import MaskingLog
+
+logger = logging.getLogger(__name__)
+
+
+DECAY_HALF_LIFE = timedelta(hours=16)
+CONTEXT_EXPIRY = timedelta(hours=24)
+REBUILD_HORIZON = timedelta(days=7)
+
+
+def _timestamp(at: datetime) -> float:
+    """Unix time; naive datetimes (SQLite) are taken as UTC."""
+    if at.tzinfo is None:
+        at = at.replace(tzinfo=timezone.utc)
+    return at.timestamp()
+
+
+def _decay(seconds: float) -> float:
+    return math.pow(0.5, max(0.0, seconds) / DECAY_HALF_LIFE.total_seconds())
+
+
+# =============================================================================
+# Aggregate
+# =============================================================================
+
+@dataclass
+class DecayedMaskingLoad:
+    """Per-user masking load per context, updated per logged event.
+
+    Attributes:
+        user_id: The user ID
+        contexts: Context -> [load at updated_at, updated_at (Unix time)]
+    """
+
+    user_id: int
+    contexts: dict[str, list[float]] = field(default_factory=dict)
+
+    def observe(self, context: str, load_score: float, at: datetime) -> None:
+        """
+        Add a logged masking event (negative scores are reductions).
+
+        Args:
+            context: Masking context
+            load_score: Event load
+            at: When it was logged
+        """
+        now = _timestamp(at)
+        entry = self.contexts.get(context)
+        if entry is None or now - entry[1] >= CONTEXT_EXPIRY.total_seconds():
+            self.contexts[context] = [load_score, now]
+        elif now >= entry[1]:
+            entry[0] = entry[0] * _decay(now - entry[1]) + load_score
+            entry[1] = now
+        else:
+            # Out of order (replay, clock skew): decay the event forward instead
+            entry[0] += load_score * _decay(entry[1] - now)
+
+    def loads(self, now: datetime) -> dict[str, float]:
+        """
+        Current load per context, dropping expired contexts.
+
+        Args:
+            now: Reference time
+
+        Returns:
+            Context -> load (never negative)
+        """
+        ts = _timestamp(now)
+        expired = [
+            ctx for ctx, (_, updated_at) in self.contexts.items()
+            if ts - updated_at >= CONTEXT_EXPIRY.total_seconds()
+        ]
+        for ctx in expired:
+            del self.contexts[ctx]
+        return {
+            ctx: max(0.0, load * _decay(ts - updated_at))
+            for ctx, (load, updated_at) in self.contexts.items()
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {"user_id": self.user_id, "contexts": self.contexts}, separators=(",", ":")
+        )
+
+    @classmethod
+    def from_json(cls, data: str) -> "DecayedMaskingLoad":
+        fields = json.loads(data)
+        return cls(
+            user_id=fields["user_id"],
+            contexts={
+                ctx: [float(load), float(updated_at)]
+                for ctx, (load, updated_at) in fields["contexts"].items()
+            },
+        )
+
+    @classmethod
+    def from_events(
+        cls,
+        user_id: int,
+        events: Iterable[tuple[str, float, datetime]],
+    ) -> "DecayedMaskingLoad":
+        """
+        Rebuild an aggregate from logged events.
+
+        Args:
+            user_id: The user ID
+            events: (context, load_score, logged_at), oldest first
+
+        Returns:
+            DecayedMaskingLoad
+        """
+        aggregate = cls(user_id=user_id)
+        for context, load_score, at in events:
+            aggregate.observe(context, float(load_score), at)
+        return aggregate
+
+
+# =============================================================================
+# Store
+# =============================================================================
+
+class MaskingLoadStore(JsonTTLStore[DecayedMaskingLoad]):
+    """Masking aggregates by user ID (Redis with in-process fallback)."""
+
+    KEY_PREFIX = "aurora:masking:load:"
+    TTL = int(CONTEXT_EXPIRY.total_seconds()) + 3600  # Every context expired by then
+    NAME = "Masking aggregate"
+
+    def _decode(self, user_id: int, data: str) -> DecayedMaskingLoad:
+        return DecayedMaskingLoad.from_json(data)
+
+    async def observe(self, user_id: int, context: str, load_score: float, at: datetime) -> None:
+        """
+        Add a logged event to a user's stored aggregate.
+
+        Without a stored aggregate nothing is done: the next read rebuilds it
+        from the log, this event included.
+
+        Args:
+            user_id: The user ID
+            context: Masking context
+            load_score: Event load
+            at: When it was logged
+        """
+        aggregate = await self.get(user_id)
+        if aggregate is None:
+            return
+        aggregate.observe(context, load_score, at)
+        await self.put(aggregate)
+
+
+# =============================================================================
+# Rebuild and Verification
+# =============================================================================
+
+async def rebuild_masking_load(
+    session: AsyncSession,
+    user_id: int,
+    now: Optional[datetime] = None,
+) -> DecayedMaskingLoad:
+    """
+    Rebuild one user's aggregate by replaying the log.
+
+    Args:
+        session: Async database session
+        user_id: The user ID
+        now: Reference time (defaults to now)
+
+    Returns:
+        DecayedMaskingLoad
+    """
+    now = now or datetime.now(timezone.utc)
+    masking = MaskingLog.__table__
+    result = await session.execute(
+        select(masking.c.context, masking.c.load_score, masking.c.logged_at)
+        .where(masking.c.user_id == user_id, masking.c.logged_at >= now - REBUILD_HORIZON)
+        .order_by(masking.c.logged_at)
+    )
+    return DecayedMaskingLoad.from_events(user_id, result)
+
+
+async def verify_masking_loads(
+    session: AsyncSession,
+    user_id: int,
+    store: Optional[MaskingLoadStore] = None,
+    now: Optional[datetime] = None,
+    tolerance: float = 0.5,
+) -> dict[str, tuple[float, float]]:
+    """
+    Compare a user's stored aggregate with a rebuild from the log.
+
+    Args:
+        session: Async database session
+        user_id: The user ID
+        store: Aggregate store (defaults to the global store)
+        now: Reference time (defaults to now)
+        tolerance: Largest accepted difference per context
+
+    Returns:
+        Context -> (stored load, rebuilt load) for every mismatch
+        (empty when they agree or nothing is stored)
+    """
+    store = store if store is not None else get_masking_load_store()
+    now = now or datetime.now(timezone.utc)
+    stored = await store.get(user_id)
+    if stored is None:
+        return {}
+    stored_loads = stored.loads(now)
+    rebuilt_loads = (await rebuild_masking_load(session, user_id, now)).loads(now)
+
+    mismatches = {
+        ctx: (stored_loads.get(ctx, 0.0), rebuilt_loads.get(ctx, 0.0))
+        for ctx in stored_loads.keys() | rebuilt_loads.keys()
+        if abs(stored_loads.get(ctx, 0.0) - rebuilt_loads.get(ctx, 0.0)) > tolerance
+    }
+    if mismatches:
+        logger.warning(f"Masking aggregate for user {user_id} drifted from the log: {sorted(mismatches)}")
+    return mismatches
+
+
+# Global store instance
+_masking_store: Optional[MaskingLoadStore] = None
+
+
+def get_masking_load_store() -> MaskingLoadStore:
+    """
+    Get the global masking aggregate store (process memory until set).
+
+    Returns:
+        The global MaskingLoadStore instance
+    """
+    global _masking_store
+    if _masking_store is None:
+        _masking_store = MaskingLoadStore()
+    return _masking_store
+
+
+def set_masking_load_store(store: MaskingLoadStore) -> None:
+    """
+    Set the global masking aggregate store.
+
+    Args:
+        store: The MaskingLoadStore to use globally
+    """
+    global _masking_store
+    _masking_store = store
+
+
+__all__ = [
+    "DecayedMaskingLoad",
+    "MaskingLoadStore",
+    "rebuild_masking_load",
+    "verify_masking_loads",
+    "get_masking_load_store",
+    "set_masking_load_store",
+]
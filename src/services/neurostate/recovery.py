@@ -0,0 +1,141 @@
+"""
+Read-time Recovery for Aurora Sun V1.
+
+Sensory load and spoons recover over time, but a periodic job touching every
+user row to apply that recovery would cost a write per user per tick.
+Recovery is instead applied lazily: stored values stay as they were at the
+last write (with its timestamp), readers apply the segment's recovery curve
+up to "now", and the next write materializes the recovered value before
+applying its own change. Keeping neurostate current costs no background
+writes.
+
+Curves come from the segment's NeurostateConfig:
+- Sensory load: exponential decay with sensory_recovery_half_life_hours,
+  starting only after sensory_recovery_delay_hours without an update (AU/AH
+  loads do not fade while input continues).
+- Spoons: each pool regains spoon_recovery_per_hour, up to the maximum.
+
+References:
+- ARCHITECTURE.md Section 3 (Neurotype Segmentation)
+- ARCHITECTURE.md Section 3.2 (Sensory State - AU/AH)
+"""
+
+from __future__ import annotations
+
+import math
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Sequence
+
+from src.core.segment_context import NeurostateConfig, SegmentContext
+
+MAX_SPOONS = 10
+
+
+def elapsed_hours(since: Optional[datetime], now: datetime) -> float:
+    """Hours from since to now (0 if unknown or in the future); naive times are UTC."""
+    if since is None:
+        return 0.0
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    if now.tzinfo is None:
+        now = now.replace(tzinfo=timezone.utc)
+    return max(0.0, (now - since).total_seconds() / 3600)
+
+
+def segment_neurostate(code: Optional[str], default: str = "AU") -> NeurostateConfig:
+    """NeurostateConfig for a segment code (unknown or missing codes use default)."""
+    try:
+        return SegmentContext.from_code(code or default).neuro  # type: ignore[arg-type]
+    except KeyError:
+        return SegmentContext.from_code(default).neuro  # type: ignore[arg-type]
+
+
+# =============================================================================
+# Sensory Load
+# =============================================================================
+
+def sensory_recovery_factor(hours: float, config: NeurostateConfig) -> float:
+    """
+    Share of sensory load remaining after hours without an update.
+
+    Args:
+        hours: Hours since the last update
+        config: The segment's neurostate configuration
+
+    Returns:
+        Factor in (0, 1]
+    """
+    recovering = hours - config.sensory_recovery_delay_hours
+    if recovering <= 0 or config.sensory_recovery_half_life_hours <= 0:
+        return 1.0
+    return math.pow(0.5, recovering / config.sensory_recovery_half_life_hours)
+
+
+def recover_sensory(
+    vector: Sequence[float],
+    last_assessed: Optional[datetime],
+    now: datetime,
+    config: NeurostateConfig,
+) -> tuple[float, ...]:
+    """
+    Modality vector as of now, rounded to 2 decimals.
+
+    Args:
+        vector: Stored loads (0-100) as of last_assessed
+        last_assessed: When the loads were stored
+        now: Reference time
+        config: The segment's neurostate configuration
+
+    Returns:
+        Recovered modality vector
+    """
+    factor = sensory_recovery_factor(elapsed_hours(last_assessed, now), config)
+    if factor == 1.0:
+        return tuple(vector)
+    return tuple(round(load * factor, 2) for load in vector)
+
+
+# =============================================================================
+# Spoons
+# =============================================================================
+
+def recover_spoons(
+    pools: Sequence[int],
+    updated_at: Optional[datetime],
+    now: datetime,
+    config: NeurostateConfig,
+) -> tuple[tuple[int, ...], datetime]:
+    """
+    Spoon pools as of now, with the anchor for carrying partial recovery.
+
+    Whole spoons are regained; the returned anchor is moved forward only by
+    the time those whole spoons took, so frequent writes do not discard
+    partial progress.
+
+    Args:
+        pools: Stored spoon counts as of updated_at
+        updated_at: When the pools were stored
+        now: Reference time
+        config: The segment's neurostate configuration
+
+    Returns:
+        (recovered pools, recovery anchor to store with them)
+    """
+    rate = config.spoon_recovery_per_hour
+    if updated_at is None or rate <= 0:
+        return tuple(pools), now
+    regained = int(elapsed_hours(updated_at, now) * rate)
+    if all(pool >= MAX_SPOONS for pool in pools):
+        return tuple(pools), now
+    recovered = tuple(min(MAX_SPOONS, pool + regained) for pool in pools)
+    return recovered, updated_at + timedelta(hours=regained / rate)
+
+
+__all__ = [
+    "MAX_SPOONS",
+    "elapsed_hours",
+    "segment_neurostate",
+    "sensory_recovery_factor",
+    "recover_sensory",
+    "recover_spoons",
+]
@@ -11,11 +11,22 @@ References:
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Callable, Optional, Sequence
 
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.models.neurostate import SensoryProfile
+from src.models.database import unit_of_work
+from src.models.neurostate import (
+    MODALITY_INDEX,
+    SENSORY_MODALITIES,
+    ZERO_MODALITIES,
+    SensoryProfile,
+    modalities_to_dict,
+)
+from src.services.neurostate.recovery import recover_sensory, segment_neurostate
+from src.services.neurostate.snapshot import invalidate_snapshot
+from src.services.write_behind import WriteBehindBuffer, current_write_behind_buffer
 
 
 # =============================================================================
@@ -55,7 +66,9 @@ class SensoryStateAssessment:
     Key Principles:
     - Sensory load is CUMULATIVE for AU/AH (no habituation)
     - Each modality tracked separately: visual, auditory, tactile, olfactory, proprioceptive
-    - Recovery requires REDUCTION of load, not time alone
+    - Recovery requires REDUCTION of load, not time alone: stored loads only
+      fade after a quiet period, per the segment's recovery curve, applied
+      at read time and materialized by the next update (see recovery)
     - AU: High sensory sensitivity, slower recovery
     - AH: Variable sensitivity based on channel dominance
 
@@ -64,20 +77,30 @@ class SensoryStateAssessment:
         state = await service.assess(user_id=123, current_load={...})
     """
 
-    MODALITIES = ["visual", "auditory", "tactile", "olfactory", "proprioceptive"]
+    MODALITIES = list(SENSORY_MODALITIES)
 
     # Thresholds
     OVERLOAD_THRESHOLD = 80.0
     CRITICAL_THRESHOLD = 95.0
 
-    def __init__(self, db: Session):
+    def __init__(
+        self,
+        db: AsyncSession,
+        writer: Optional[WriteBehindBuffer] = None,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ):
         """
         Initialize the sensory state assessment service.
 
         Args:
-            db: SQLAlchemy database session
+            db: SQLAlchemy async database session
+            writer: Write-behind buffer for load updates (defaults to the
+                installed buffer; without one, commit per update)
+            clock: Current time for read-time recovery
         """
         self.db = db
+        self._writer = writer if writer is not None else current_write_behind_buffer()
+        self._clock = clock
 
     async def assess(
         self,
@@ -95,31 +118,12 @@ class SensoryStateAssessment:
             SensoryState with per-modality loads and overall assessment
         """
         # Get or create sensory profile
-        profile = self._get_or_create_profile(user_id)
+        profile = await self._get_or_create_profile(user_id)
+        vector, last_assessed = self._current_vector(profile, self._clock())
 
         # Use provided load or stored load
-        if current_load:
-            modality_loads = current_load
-        else:
-            modality_loads = profile.modality_loads
-
-        # Calculate overall load (max of all modalities, not average)
-        # This is because any single modality can trigger overwhelm
-        overall_load = max(modality_loads.values()) if modality_loads else 0.0
-
-        # Determine thresholds
-        is_overloaded = any(v > self.OVERLOAD_THRESHOLD for v in modality_loads.values())
-        is_critical = any(v > self.CRITICAL_THRESHOLD for v in modality_loads.values())
-
-        return SensoryState(
-            user_id=user_id,
-            modality_loads=modality_loads,
-            overall_load=overall_load,
-            last_assessed=profile.last_assessed,
-            segment_code=profile.segment_code or "AU",
-            is_overloaded=is_overloaded,
-            is_critical=is_critical,
-        )
+        modality_loads = current_load if current_load else modalities_to_dict(vector)
+        return self._state(user_id, modality_loads, last_assessed, profile.segment_code)
 
     async def update_modality(
         self,
@@ -132,7 +136,9 @@ class SensoryStateAssessment:
         Update a single modality's sensory load.
 
         CRITICAL: Loads are CUMULATIVE. Positive delta increases load,
-        negative delta decreases load. No automatic recovery.
+        negative delta decreases load. Recovery is applied at read time:
+        the stored load is first recovered to now with the segment's curve
+        (and materialized), then the delta is added to that value.
 
         Args:
             user_id: The user's ID
@@ -146,30 +152,72 @@ class SensoryStateAssessment:
         Raises:
             ValueError: If modality is not valid
         """
-        if modality not in self.MODALITIES:
+        return await self.update_modalities(user_id, {modality: load_delta}, context)
+
+    async def update_modalities(
+        self,
+        user_id: int,
+        deltas: dict[str, float],
+        context: str,
+    ) -> SensoryState:
+        """
+        Apply several modality deltas in one transaction.
+
+        The state is built from the updated vector, without reading the
+        profile again.
+
+        Args:
+            user_id: The user's ID
+            deltas: Change in load per modality (-100 to +100 each)
+            context: Description of what caused the change
+
+        Returns:
+            Updated SensoryState
+
+        Raises:
+            ValueError: If a modality is not valid
+        """
+        invalid = [m for m in deltas if m not in MODALITY_INDEX]
+        if invalid:
             raise ValueError(
-                f"Invalid modality: {modality}. Must be one of: {self.MODALITIES}"
+                f"Invalid modality: {invalid[0]}. Must be one of: {self.MODALITIES}"
             )
 
-        # Get or create profile
-        profile = self._get_or_create_profile(user_id)
+        if self._writer is not None:
+            profile = await self._get_or_create_profile(user_id)
+            now = self._clock()
+            vector, _ = self._current_vector(profile, now)
+            vector = self._apply_deltas(vector, deltas)
+            # Coalesced with pending updates of this profile: one UPDATE per flush
+            await self._writer.update(
+                SensoryProfile.__table__,
+                profile.id,
+                {
+                    "modality_loads": vector,
+                    "overall_load": max(vector),
+                    "last_assessed": now,
+                    "updated_at": now,
+                },
+                on_flush=lambda: invalidate_snapshot(user_id),
+            )
+            return self._state(user_id, modalities_to_dict(vector), now, profile.segment_code)
 
-        # Get current loads
-        modality_loads = profile.modality_loads.copy()
-        current_load = modality_loads.get(modality, 0.0)
+        async with unit_of_work(self.db):
+            # Get or create profile
+            profile = await self._get_or_create_profile(user_id)
 
-        # Apply delta (cumulative, no bounds initially)
-        new_load = max(0.0, min(100.0, current_load + load_delta))
-        modality_loads[modality] = new_load
+            # Materialize recovery up to now, then apply deltas (cumulative)
+            now = self._clock()
+            vector, _ = self._current_vector(profile, now)
+            vector = self._apply_deltas(vector, deltas)
 
-        # Save profile
-        profile.modality_loads = modality_loads
-        profile.overall_load = max(modality_loads.values())
-        profile.last_assessed = datetime.now(timezone.utc)
-        self.db.commit()
+            # Save profile
+            profile.modality_vector = vector
+            profile.overall_load = max(vector)
+            profile.last_assessed = now
+        invalidate_snapshot(user_id)
 
-        # Return updated state
-        return await self.assess(user_id)
+        return self._state(user_id, modalities_to_dict(vector), now, profile.segment_code)
 
     async def reset_modality(
         self,
@@ -226,24 +274,77 @@ class SensoryStateAssessment:
 
         return recommendations
 
-    def _get_or_create_profile(self, user_id: int) -> SensoryProfile:
+    @staticmethod
+    def _apply_deltas(vector: Sequence[float], deltas: dict[str, float]) -> tuple[float, ...]:
+        """Add deltas to a modality vector, clamped to 0-100."""
+        updated = list(vector)
+        for modality, delta in deltas.items():
+            i = MODALITY_INDEX[modality]
+            updated[i] = max(0.0, min(100.0, updated[i] + delta))
+        return tuple(updated)
+
+    def _state(
+        self,
+        user_id: int,
+        modality_loads: dict[str, float],
+        last_assessed: Optional[datetime],
+        segment_code: Optional[str],
+    ) -> SensoryState:
+        """Build a SensoryState from per-modality loads."""
+        # Overall load is the max of all modalities, not the average:
+        # any single modality can trigger overwhelm
+        peak = max(modality_loads.values()) if modality_loads else 0.0
+        return SensoryState(
+            user_id=user_id,
+            modality_loads=modality_loads,
+            overall_load=peak,
+            last_assessed=last_assessed,
+            segment_code=segment_code or "AU",
+            is_overloaded=peak > self.OVERLOAD_THRESHOLD,
+            is_critical=peak > self.CRITICAL_THRESHOLD,
+        )
+
+    def _current_vector(
+        self,
+        profile: SensoryProfile,
+        now: datetime,
+    ) -> tuple[Sequence[float], Optional[datetime]]:
+        """
+        Loads as of now: the stored vector (or an update still in the
+        write-behind buffer) with the segment's recovery applied.
+
+        Returns:
+            (modality vector, when it was stored)
+        """
+        vector, last_assessed = profile.modality_vector or ZERO_MODALITIES, profile.last_assessed
+        if self._writer is not None:
+            pending = self._writer.pending_update(SensoryProfile.__table__, profile.id)
+            if pending is not None:
+                vector, last_assessed = pending["modality_loads"], pending["last_assessed"]
+        config = segment_neurostate(profile.segment_code)
+        return recover_sensory(vector, last_assessed, now, config), last_assessed
+
+    async def _get_or_create_profile(self, user_id: int) -> SensoryProfile:
         """Get existing profile or create new one."""
-        profile = (
-            self.db.query(SensoryProfile)
-            .filter(SensoryProfile.user_id == user_id)
-            .first()
+        result = await self.db.execute(
+            select(SensoryProfile)
+            .where(SensoryProfile.user_id == user_id)
+            .limit(1)
         )
+        profile = result.scalars().first()
 
         if not profile:
-            profile = SensoryProfile(
-                user_id=user_id,
-                modality_loads={mod: 0.0 for mod in self.MODALITIES},
-                overall_load=0.0,
-                segment_code="AU",  # Default, can be updated
-            )
-            self.db.add(profile)
-            self.db.commit()
-            self.db.refresh(profile)
+            async with unit_of_work(self.db):
+                profile = SensoryProfile(
+                    user_id=user_id,
+                    modality_vector=ZERO_MODALITIES,
+                    overall_load=0.0,
+                    segment_code="AU",  # Default, can be updated
+                )
+                self.db.add(profile)
+                await self.db.flush()
+            await self.db.refresh(profile)
+            invalidate_snapshot(user_id)
 
         return profile
 
@@ -0,0 +1,530 @@
+"""
+Neurostate Snapshot for Aurora Sun V1.
+
+The tiered pre-flight (SW-18) needs the latest state from all six neurostate
+services. Asking each service costs one or more queries per service on every
+message. NeurostateSnapshotLoader instead reads the latest rows of all
+neurostate tables for a user in ONE round-trip: a UNION ALL of small,
+index-backed per-table selects, each producing the same five columns
+(kind, label, value, payload, ts).
+
+Snapshots are cached per user and invalidated by every write the neurostate
+services make (sensory update, masking log, burnout assessment, channel
+state, inertia event, energy prediction), so a cached snapshot never hides
+a write made through the services. The TTL only bounds staleness from
+writes made elsewhere and the sliding masking/energy windows.
+
+Sensory loads are recovered to "now" with the segment's curve (see
+recovery). Masking loads always come from the decayed per-context aggregate
+(see masking_aggregate). When the aggregate store is cold for a user, the
+query also returns their masking events of the rebuild horizon; the loader
+rebuilds the aggregate from them and stores it, as MaskingLoadTracker does,
+so the snapshot never mixes raw sums with decayed totals. The energy
+baseline likewise comes from the incremental EnergyBaselineStore (see
+energy_baseline); a cold baseline is rebuilt from the week of energy scores
+the query then returns.
+
+References:
+- ARCHITECTURE.md Section 3 (Neurotype Segmentation)
+- ARCHITECTURE.md SW-18 (Neurostate Assessment Tiered Pre-Flight)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional
+
+from sqlalchemy import Float, Select, String, Text, cast, literal, null, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.lib.json_ttl_store import get_many
+from src.models.database import session_scope
+from src.models.neurostate import (
+    BurnoutAssessment,
+    ChannelState,
+    EnergyLevelRecord,
+    InertiaEvent,
+    MaskingLog,
+    SensoryProfile,
+    modalities_from_hex,
+    modalities_to_dict,
+    modality_vector_hex,
+)
+from src.services.neurostate.energy_baseline import (
+    BASELINE_WINDOW,
+    EnergyBaselineStore,
+    RollingEnergyBaseline,
+    get_energy_baseline_store,
+)
+from src.services.neurostate.masking_aggregate import (
+    REBUILD_HORIZON,
+    DecayedMaskingLoad,
+    MaskingLoadStore,
+    get_masking_load_store,
+)
+from src.services.neurostate.recovery import recover_sensory, segment_neurostate
+
+logger = logging.getLogger(__name__)
+
+
+# Mirrors MaskingLoadTracker.CONTEXT_MULTIPLIER
+MASKING_CONTEXT_MULTIPLIER = 1.5
+
+
+# =============================================================================
+# Snapshot
+# =============================================================================
+
+@dataclass
+class NeurostateSnapshot:
+    """Latest neurostate of a user across all six services.
+
+    Attributes:
+        user_id: The user ID
+        loaded_at: Unix timestamp of the load
+        sensory_loads: Per-modality sensory loads (0-100)
+        sensory_load: Overall sensory load (0-100), None without a profile
+        masking_loads: Decayed masking load per context
+        burnout_type: Type of the active burnout assessment, if any
+        burnout_severity: Its severity (0-100)
+        dominant_channel: Dominant channel of the open channel state (AH)
+        channel_scores: Its per-channel scores
+        inertia_type: Type of the ongoing inertia event, if any
+        inertia_severity: Its severity (0-100)
+        energy_level: Latest predicted energy level
+        energy_score: Latest energy score (0-100)
+        energy_baseline: Mean energy score over the last 7 days
+    """
+
+    user_id: int
+    loaded_at: float = field(default_factory=time.time)
+    sensory_loads: dict[str, float] = field(default_factory=dict)
+    sensory_load: Optional[float] = None
+    masking_loads: dict[str, float] = field(default_factory=dict)
+    burnout_type: Optional[str] = None
+    burnout_severity: Optional[float] = None
+    dominant_channel: Optional[str] = None
+    channel_scores: dict[str, float] = field(default_factory=dict)
+    inertia_type: Optional[str] = None
+    inertia_severity: Optional[float] = None
+    energy_level: Optional[str] = None
+    energy_score: Optional[float] = None
+    energy_baseline: Optional[float] = None
+
+    @property
+    def masking_load(self) -> float:
+        """Total masking load with the exponential multi-context cost (0-100)."""
+        if not self.masking_loads:
+            return 0.0
+        factor = 1 + (MASKING_CONTEXT_MULTIPLIER ** (len(self.masking_loads) - 1) - 1) * 0.5
+        return min(100.0, sum(self.masking_loads.values()) * factor)
+
+    @property
+    def burnout_risk(self) -> Optional[float]:
+        """Active burnout severity as 0-1, None without an active assessment."""
+        if self.burnout_severity is None:
+            return None
+        return max(0.0, min(1.0, self.burnout_severity / 100.0))
+
+    def to_preflight(self) -> dict[str, Any]:
+        """Values for the pre-flight snapshot dict."""
+        return {
+            "energy_level": self.energy_level,
+            "sensory_load": self.sensory_load,
+            "masking_cost": self.masking_load if self.masking_loads else None,
+            "burnout_risk": self.burnout_risk,
+        }
+
+
+# =============================================================================
+# Query
+# =============================================================================
+
+def _branch(
+    kind: str,
+    label: Any,
+    value: Any,
+    payload: Any,
+    ts: Any,
+) -> Select[Any]:
+    """One UNION ALL member with the shared column set."""
+    return select(
+        literal(kind, String).label("kind"),
+        cast(label, String).label("label"),
+        cast(value, Float).label("value"),
+        cast(payload, Text).label("payload"),
+        ts.label("ts"),
+    )
+
+
+def _latest(stmt: Select[Any]) -> Select[Any]:
+    """Wrap an ORDER BY ... LIMIT 1 member so it is valid inside a UNION."""
+    sub = stmt.limit(1).subquery()
+    return select(*sub.c)
+
+
+def build_snapshot_query(
+    user_id: int,
+    now: datetime,
+    masking_events: bool = False,
+    energy_scores: bool = False,
+) -> Any:
+    """
+    Build the single-round-trip snapshot query for a user.
+
+    Args:
+        user_id: The user ID
+        now: Reference time for the masking and energy windows
+        masking_events: Also return the masking events of the rebuild
+            horizon (to rebuild a cold masking aggregate)
+        energy_scores: Also return the energy scores of the baseline
+            window (to rebuild a cold energy baseline)
+
+    Returns:
+        UNION ALL statement yielding (kind, label, value, payload, ts) rows
+    """
+    sensory = SensoryProfile.__table__
+    masking = MaskingLog.__table__
+    burnout = BurnoutAssessment.__table__
+    channel = ChannelState.__table__
+    inertia = InertiaEvent.__table__
+    energy = EnergyLevelRecord.__table__
+
+    branches = [
+        _latest(
+            _branch(
+                "sensory", sensory.c.segment_code, sensory.c.overall_load,
+                modality_vector_hex(sensory.c.modality_loads), sensory.c.last_assessed,
+            )
+            .where(sensory.c.user_id == user_id)
+            .order_by(sensory.c.last_assessed.desc())
+        ),
+        _latest(
+            _branch(
+                "burnout", burnout.c.burnout_type, burnout.c.severity_score,
+                null(), burnout.c.assessed_at,
+            )
+            .where(burnout.c.user_id == user_id, burnout.c.resolved_at.is_(None))
+            .order_by(burnout.c.assessed_at.desc())
+        ),
+        _latest(
+            _branch(
+                "channel", channel.c.dominant_channel, channel.c.confidence,
+                channel.c.channel_scores, channel.c.period_start,
+            )
+            .where(channel.c.user_id == user_id, channel.c.period_end.is_(None))
+            .order_by(channel.c.period_start.desc())
+        ),
+        _latest(
+            _branch(
+                "inertia", inertia.c.inertia_type, inertia.c.severity,
+                inertia.c.trigger, inertia.c.detected_at,
+            )
+            .where(inertia.c.user_id == user_id, inertia.c.outcome == "ongoing")
+            .order_by(inertia.c.detected_at.desc())
+        ),
+        _latest(
+            _branch(
+                "energy", energy.c.energy_level, energy.c.energy_score,
+                null(), energy.c.predicted_at,
+            )
+            .where(energy.c.user_id == user_id)
+            .order_by(energy.c.predicted_at.desc())
+        ),
+    ]
+    if masking_events:
+        branches.append(
+            _branch(
+                "masking_event", masking.c.context, masking.c.load_score,
+                null(), masking.c.logged_at,
+            )
+            .where(masking.c.user_id == user_id, masking.c.logged_at >= now - REBUILD_HORIZON)
+        )
+    if energy_scores:
+        branches.append(
+            _branch(
+                "energy_score", null(), energy.c.energy_score,
+                null(), energy.c.predicted_at,
+            )
+            .where(energy.c.user_id == user_id, energy.c.predicted_at >= now - BASELINE_WINDOW)
+        )
+    return union_all(*branches)
+
+
+def _json_dict(payload: Optional[str]) -> dict[str, float]:
+    """Parse a JSON object column, {} if missing or malformed."""
+    if not payload:
+        return {}
+    try:
+        data = json.loads(payload)
+    except ValueError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def snapshot_from_rows(
+    user_id: int,
+    rows: Any,
+    now: Optional[datetime] = None,
+) -> NeurostateSnapshot:
+    """
+    Assemble a snapshot from the rows of build_snapshot_query().
+
+    Args:
+        user_id: The user ID
+        rows: (kind, label, value, payload, ts) rows
+        now: Reference time for read-time sensory recovery (None: stored loads)
+
+    Returns:
+        NeurostateSnapshot
+    """
+    snapshot = NeurostateSnapshot(user_id=user_id)
+    for kind, label, value, payload, ts in rows:
+        if kind == "sensory":
+            snapshot.sensory_load = value
+            vector = modalities_from_hex(payload)
+            if vector is not None and now is not None:
+                vector = recover_sensory(vector, ts, now, segment_neurostate(label))
+                snapshot.sensory_load = max(vector)
+            snapshot.sensory_loads = modalities_to_dict(vector) if vector is not None else {}
+        elif kind == "burnout":
+            snapshot.burnout_type = label
+            snapshot.burnout_severity = value
+        elif kind == "channel":
+            snapshot.dominant_channel = label
+            snapshot.channel_scores = _json_dict(payload)
+        elif kind == "inertia":
+            snapshot.inertia_type = label
+            snapshot.inertia_severity = value
+        elif kind == "energy":
+            snapshot.energy_level = label
+            snapshot.energy_score = value
+    return snapshot
+
+
+# =============================================================================
+# Cache
+# =============================================================================
+
+class NeurostateSnapshotCache:
+    """Per-user snapshot cache, invalidated by neurostate service writes."""
+
+    TTL = 300  # Seconds; bounds staleness from writes outside the services
+    MAX_SIZE = 10_000
+
+    def __init__(self, ttl: float = TTL, max_size: int = MAX_SIZE):
+        """
+        Args:
+            ttl: Seconds a snapshot stays usable
+            max_size: Maximum cached users (least recently stored evicted)
+        """
+        self._ttl = ttl
+        self._max_size = max_size
+        # user_id -> (snapshot, stored_at)
+        self._entries: OrderedDict[int, tuple[NeurostateSnapshot, float]] = OrderedDict()
+        # Invalidations are numbered; a load racing a write is not stored.
+        # user_id -> number of their last invalidation, least recent first,
+        # bounded by max_size; forgotten users count as invalidated at the
+        # newest forgotten number (may drop a fresh load, never keeps a stale one)
+        self._invalidations = 0
+        self._invalidated: OrderedDict[int, int] = OrderedDict()
+        self._forgotten = 0
+
+    def generation(self, user_id: int) -> int:
+        """Invalidation number to take before loading a user's snapshot."""
+        return self._invalidations
+
+    def _invalidated_at(self, user_id: int) -> int:
+        """Number of the user's last invalidation (upper bound if forgotten)."""
+        return self._invalidated.get(user_id, self._forgotten)
+
+    def get(self, user_id: int) -> Optional[NeurostateSnapshot]:
+        """Cached snapshot of a user, or None if missing or expired."""
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[1] > self._ttl:
+            del self._entries[user_id]
+            return None
+        return entry[0]
+
+    def put(self, snapshot: NeurostateSnapshot, generation: Optional[int] = None) -> None:
+        """
+        Store a snapshot.
+
+        Args:
+            snapshot: The loaded snapshot
+            generation: generation() taken before the load; if the user was
+                invalidated since, the snapshot is already stale and dropped
+        """
+        if generation is not None and self._invalidated_at(snapshot.user_id) > generation:
+            return
+        self._entries[snapshot.user_id] = (snapshot, time.monotonic())
+        self._entries.move_to_end(snapshot.user_id)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int) -> None:
+        """Drop a user's snapshot after a neurostate write."""
+        self._entries.pop(user_id, None)
+        self._invalidations += 1
+        self._invalidated[user_id] = self._invalidations
+        self._invalidated.move_to_end(user_id)
+        while len(self._invalidated) > self._max_size:
+            _, self._forgotten = self._invalidated.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all snapshots."""
+        for user_id in list(self._entries):
+            self.invalidate(user_id)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# =============================================================================
+# Loader
+# =============================================================================
+
+class NeurostateSnapshotLoader:
+    """
+    Loads NeurostateSnapshots in one query, through the per-user cache.
+
+    Usage:
+        loader = NeurostateSnapshotLoader()
+        snapshot = await loader.load(user_id)
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[async_sessionmaker[AsyncSession]] = None,
+        cache: Optional[NeurostateSnapshotCache] = None,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+        masking_store: Optional[MaskingLoadStore] = None,
+        baseline_store: Optional[EnergyBaselineStore] = None,
+    ):
+        """
+        Initialize the loader.
+
+        Args:
+            session_factory: Async session factory (defaults to the shared engine's)
+            cache: Snapshot cache (defaults to the global cache)
+            clock: Current time for the masking and energy windows
+            masking_store: Decayed masking aggregates (defaults to the global store)
+            baseline_store: Incremental energy baselines (defaults to the global store)
+        """
+        self._session_factory = session_factory
+        self._cache = cache if cache is not None else get_snapshot_cache()
+        self._clock = clock
+        self._masking_store = masking_store if masking_store is not None else get_masking_load_store()
+        self._baseline_store = baseline_store if baseline_store is not None else get_energy_baseline_store()
+
+    async def load(self, user_id: int, use_cache: bool = True) -> NeurostateSnapshot:
+        """
+        Get a user's snapshot (cached, or one database round-trip).
+
+        Args:
+            user_id: The user ID
+            use_cache: False to always read the database
+
+        Returns:
+            NeurostateSnapshot
+        """
+        if use_cache:
+            cached = self._cache.get(user_id)
+            if cached is not None:
+                return cached
+
+        generation = self._cache.generation(user_id)
+        now = self._clock()
+        # One Redis round trip for both stores (when they share a client)
+        masking, baseline = await get_many(
+            (self._masking_store, user_id), (self._baseline_store, user_id)
+        )
+        async with session_scope(self._session_factory) as session:
+            result = await session.execute(
+                build_snapshot_query(
+                    user_id, now,
+                    masking_events=masking is None,
+                    energy_scores=baseline is None,
+                )
+            )
+            rows = result.all()
+        snapshot = snapshot_from_rows(user_id, rows, now)
+        if masking is None:
+            # Cold store: rebuild from the returned events, then keep it updated
+            events = sorted(
+                ((label, value, ts) for kind, label, value, _, ts in rows if kind == "masking_event"),
+                key=lambda event: event[2],
+            )
+            masking = DecayedMaskingLoad.from_events(user_id, events)
+            await self._masking_store.put(masking)
+        snapshot.masking_loads = masking.loads(now)
+        if baseline is None:
+            baseline = RollingEnergyBaseline.from_records(
+                user_id,
+                sorted(
+                    ((value, ts) for kind, _, value, _, ts in rows if kind == "energy_score"),
+                    key=lambda record: record[1],
+                ),
+            )
+            await self._baseline_store.put(baseline)
+        snapshot.energy_baseline = baseline.mean(now)
+        self._cache.put(snapshot, generation)
+        logger.debug(f"Loaded neurostate snapshot for user {user_id} ({len(rows)} rows)")
+        return snapshot
+
+
+# Global cache instance
+_snapshot_cache: Optional[NeurostateSnapshotCache] = None
+
+
+def get_snapshot_cache() -> NeurostateSnapshotCache:
+    """
+    Get the global neurostate snapshot cache.
+
+    Returns:
+        The global NeurostateSnapshotCache instance
+    """
+    global _snapshot_cache
+    if _snapshot_cache is None:
+        _snapshot_cache = NeurostateSnapshotCache()
+    return _snapshot_cache
+
+
+def set_snapshot_cache(cache: NeurostateSnapshotCache) -> None:
+    """
+    Set the global neurostate snapshot cache.
+
+    Args:
+        cache: The NeurostateSnapshotCache to use globally
+    """
+    global _snapshot_cache
+    _snapshot_cache = cache
+
+
+def invalidate_snapshot(user_id: int) -> None:
+    """
+    Invalidate a user's cached snapshot (called by the services after writes).
+
+    Args:
+        user_id: The user ID
+    """
+    get_snapshot_cache().invalidate(user_id)
+
+
+__all__ = [
+    "NeurostateSnapshot",
+    "NeurostateSnapshotCache",
+    "NeurostateSnapshotLoader",
+    "build_snapshot_query",
+    "snapshot_from_rows",
+    "get_snapshot_cache",
+    "set_snapshot_cache",
+    "invalidate_snapshot",
+]
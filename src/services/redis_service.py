@@ -1,6 +1,7 @@
 """Redis service for distributed state management."""
 
 import os
+import time
 from typing import Any, Optional
 import json
 
@@ -10,35 +11,58 @@ import redis.asyncio as redis
 class RedisService:
     """Redis service for distributed caching and state management."""
 
+    # While Redis is down, connection attempts back off from 1s up to a minute
+    RECONNECT_BACKOFF = 1.0
+    MAX_RECONNECT_BACKOFF = 60.0
+
     def __init__(self):
         """Initialize Redis connection."""
         redis_url = os.environ.get("REDIS_URL", "redis://localhost:6379/0")
         self._client: Optional[redis.Redis] = None
         self._sync_client: Optional[redis.Redis] = None
+        # Monotonic time before which no reconnect is attempted, and the next delay
+        self._retry_at = 0.0
+        self._backoff = self.RECONNECT_BACKOFF
+
+    def _may_connect(self) -> bool:
+        """False while backing off after a failed connection attempt."""
+        return time.monotonic() >= self._retry_at
+
+    def _connect_failed(self) -> None:
+        self._retry_at = time.monotonic() + self._backoff
+        self._backoff = min(self._backoff * 2, self.MAX_RECONNECT_BACKOFF)
+
+    def _connected(self) -> None:
+        self._retry_at = 0.0
+        self._backoff = self.RECONNECT_BACKOFF
 
     async def _ensure_async_client(self) -> Optional[redis.Redis]:
         """Get or create async Redis client."""
-        if self._client is None:
+        if self._client is None and self._may_connect():
             redis_url = os.environ.get("REDIS_URL", "redis://localhost:6379/0")
             try:
                 self._client = redis.from_url(redis_url, decode_responses=True)
                 # Test connection
                 await self._client.ping()
-            except redis.ConnectionError:
+                self._connected()
+            except (redis.ConnectionError, redis.TimeoutError, OSError):
                 # Fall back to None - will use in-memory fallback
                 self._client = None
+                self._connect_failed()
         return self._client
 
     def _get_sync_client(self) -> Optional[redis.Redis]:
         """Get synchronous Redis client for sync operations."""
-        if self._sync_client is None:
+        if self._sync_client is None and self._may_connect():
             redis_url = os.environ.get("REDIS_URL", "redis://localhost:6379/0")
             try:
                 import redis as sync_redis
                 self._sync_client = sync_redis.from_url(redis_url, decode_responses=True)
                 self._sync_client.ping()
+                self._connected()
             except Exception:
                 self._sync_client = None
+                self._connect_failed()
         return self._sync_client
 
     @property
@@ -46,6 +70,10 @@ class RedisService:
         """Get the raw async Redis client for advanced operations."""
         return self._client
 
+    async def get_client(self) -> Optional[redis.Redis]:
+        """Get the raw async Redis client, connecting on first use (None if unavailable)."""
+        return await self._ensure_async_client()
+
     async def get(self, key: str) -> Optional[str]:
         """Get value by key."""
         client = await self._ensure_async_client()
@@ -62,6 +90,17 @@ class RedisService:
             return await client.setex(key, ttl, json.dumps(value))
         return await client.set(key, json.dumps(value))
 
+    async def set_if_absent(self, key: str, value: Any, ttl: int) -> Optional[bool]:
+        """Set key only if it does not exist (SET NX EX).
+
+        Returns True if the key was set, False if it already existed,
+        None if Redis is unavailable.
+        """
+        client = await self._ensure_async_client()
+        if client is None:
+            return None
+        return bool(await client.set(key, json.dumps(value), nx=True, ex=ttl))
+
     async def delete(self, key: str) -> bool:
         """Delete key."""
         client = await self._ensure_async_client()
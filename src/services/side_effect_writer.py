@@ -0,0 +1,123 @@
+"""
+Bulk Side Effect Writer for Aurora Sun V1.
+
+Writes the coalesced DB side effects of one batch in a single transaction,
+for the effect types it has a table for (SAVE_TASK and UPDATE_TASK by
+default; supports() tells the executor which). Effects of the
+same table and column set become ONE executemany INSERT or UPDATE, so a
+planning commit with five tasks is one round-trip and one commit instead of
+five.
+
+Used as the `bulk_writer` of ConcurrentSideEffectExecutor.
+
+Reference: ARCHITECTURE.md Section 2 (Module System)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy import Table, bindparam, insert, update
+from sqlalchemy.orm import Session
+
+from src.core.side_effects import SideEffect, SideEffectType
+
+logger = logging.getLogger(__name__)
+
+
+# Effect types that update existing rows (payload must contain the row "id")
+UPDATE_EFFECTS: frozenset[SideEffectType] = frozenset({SideEffectType.UPDATE_TASK})
+
+
+def _default_tables() -> Dict[SideEffectType, Table]:
+    """Tables for the effect types that have a model in this release."""
+    from src.models.task import Task
+
+    return {
+        SideEffectType.SAVE_TASK: Task.__table__,
+        SideEffectType.UPDATE_TASK: Task.__table__,
+    }
+
+
+class SQLAlchemyBulkWriter:
+    """Transactional bulk writer for coalesced DB side effects.
+
+    Rows are always scoped to the batch user: inserts get `user_id` set,
+    updates only match rows owned by the user.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        tables: Optional[Dict[SideEffectType, Table]] = None,
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            session_factory: Creates a SQLAlchemy session (e.g. a sessionmaker)
+            tables: Effect type -> target table (defaults to the Task table
+                for SAVE_TASK/UPDATE_TASK)
+        """
+        self._session_factory = session_factory
+        self._tables = tables if tables is not None else _default_tables()
+
+    def supports(self, effect_type: SideEffectType) -> bool:
+        """Whether effects of this type can be bulk written (a table is configured)."""
+        return effect_type in self._tables
+
+    async def __call__(self, user_id: Optional[int], effects: list[SideEffect]) -> None:
+        """Write all effects in one transaction (raises to signal rollback).
+
+        Args:
+            user_id: Owner of the rows
+            effects: Coalesced DB effects, in priority order
+        """
+        # Sync Session: keep the blocking round-trip off the event loop
+        await asyncio.to_thread(self._write, user_id, effects)
+
+    def _write(self, user_id: Optional[int], effects: list[SideEffect]) -> None:
+        """Group effects into executemany statements and run them in one transaction."""
+        inserts: Dict[tuple[Table, tuple[str, ...]], list[dict[str, Any]]] = {}
+        updates: Dict[tuple[Table, tuple[str, ...]], list[dict[str, Any]]] = {}
+
+        for effect in effects:
+            table = self._tables.get(effect.effect_type)
+            if table is None:
+                raise ValueError(f"No table configured for {effect.effect_type.value}")
+
+            row = {k: v for k, v in effect.payload.items() if k in table.c and k != "user_id"}
+            if effect.effect_type in UPDATE_EFFECTS:
+                if "id" not in row:
+                    raise ValueError(f"{effect.effect_type.value} payload requires 'id'")
+                updates.setdefault((table, tuple(sorted(row))), []).append(row)
+            else:
+                row.pop("id", None)
+                row["user_id"] = user_id
+                inserts.setdefault((table, tuple(sorted(row))), []).append(row)
+
+        with self._session_factory() as session, session.begin():
+            for (table, _columns), rows in inserts.items():
+                session.execute(insert(table), rows)
+
+            for (table, columns), rows in updates.items():
+                values = [c for c in columns if c != "id"]
+                if not values:
+                    continue
+                stmt = (
+                    update(table)
+                    .where(table.c.id == bindparam("row_id"))
+                    .where(table.c.user_id == bindparam("row_user_id"))
+                    .values({c: bindparam(c) for c in values})
+                )
+                session.execute(stmt, [
+                    {**{c: row[c] for c in values}, "row_id": row["id"], "row_user_id": user_id}
+                    for row in rows
+                ])
+
+        logger.debug(
+            f"Bulk wrote {len(effects)} side effects for user {user_id} "
+            f"({len(inserts)} insert / {len(updates)} update statements)"
+        )
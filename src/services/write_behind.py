@@ -0,0 +1,502 @@
+"""
+Write-behind Buffer for Aurora Sun V1.
+
+High-frequency telemetry (energy predictions, masking events, sensory load
+updates, intervention deliveries) used to cost one INSERT/UPDATE and one
+COMMIT per event. WriteBehindBuffer collects these rows in memory and
+writes them in one transaction per flush:
+
+- Inserts of the same table and column set become ONE multi-row INSERT
+  (executemany; insertmanyvalues on asyncpg).
+- Updates are coalesced per row key (last write wins), so a burst of sensory
+  updates for one user is a single UPDATE.
+- A flush runs when max_batch rows are pending, every flush_interval seconds,
+  and on close() (shutdown), which retries until the database accepts the
+  rows or max_retries is used up.
+- Rows of a flush that failed on the connection or database (transient)
+  are put back in front of newer ones. A flush rejected for its data
+  (IntegrityError/DataError) is retried in halves down to single rows; the
+  rows the database still rejects go to the dead-letter log instead of
+  blocking the buffer, the others are written.
+
+Bounded loss: on a hard crash at most the rows of the last flush_interval
+(and never more than max_pending) are lost. max_pending bounds memory during
+a database outage; overflow="block" makes producers wait for a flush (no
+loss), overflow="drop" drops the oldest pending rows (bounded loss, producers
+never wait). Read paths that need their own writes use pending_inserts() /
+pending_update(); other readers see a row at most flush_interval late.
+
+Reference: ARCHITECTURE.md Section 3 (Neurotype Segmentation)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict, deque
+from typing import Any, Callable, Optional
+
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy import Table, bindparam, insert, update
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.models.database import session_scope, unit_of_work
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Metrics
+# =============================================================================
+
+WRITE_BEHIND_ROWS = Counter(
+    "aurora_write_behind_rows_total",
+    "Write-behind rows by table and outcome",
+    ["table", "outcome"],  # written | requeued | dropped | dead_lettered
+)
+WRITE_BEHIND_FLUSH_SECONDS = Histogram(
+    "aurora_write_behind_flush_seconds",
+    "Write-behind flush latency (one transaction)",
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+WRITE_BEHIND_PENDING = Gauge(
+    "aurora_write_behind_pending",
+    "Rows waiting in the write-behind buffer",
+)
+
+OVERFLOW_POLICIES = ("block", "drop")
+
+# Errors caused by the rows themselves: retrying the same row cannot succeed
+ROW_ERRORS = (IntegrityError, DataError)
+
+Inserts = list[tuple[Table, dict[str, Any]]]
+Updates = OrderedDict[tuple[Table, str, Any], dict[str, Any]]
+
+
+class WriteBehindBuffer:
+    """
+    Batches telemetry inserts and updates into periodic transactions.
+
+    Usage:
+        buffer = WriteBehindBuffer()
+        await buffer.insert(EnergyLevelRecord.__table__, row)
+        ...
+        await buffer.close()  # on shutdown
+    """
+
+    MAX_BATCH = 500
+    FLUSH_INTERVAL = 1.0
+    MAX_PENDING = 50_000
+    MAX_RETRIES = 5
+    DEAD_LETTER_SIZE = 1000
+
+    def __init__(
+        self,
+        session_factory: Optional[async_sessionmaker[AsyncSession]] = None,
+        max_batch: int = MAX_BATCH,
+        flush_interval: float = FLUSH_INTERVAL,
+        max_pending: int = MAX_PENDING,
+        overflow: str = "block",
+        max_retries: int = MAX_RETRIES,
+    ):
+        """
+        Initialize the buffer.
+
+        Args:
+            session_factory: Async session factory (defaults to the shared engine's)
+            max_batch: Pending rows that trigger a flush
+            flush_interval: Seconds between time-based flushes (the loss window)
+            max_pending: Upper bound of rows held in memory
+            overflow: "block" (producers wait) or "drop" (oldest rows dropped)
+                when max_pending is reached
+            max_retries: Flush attempts on close() before rows are given up
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        self._session_factory = session_factory
+        self._max_batch = max_batch
+        self._flush_interval = flush_interval
+        self._max_pending = max_pending
+        self._overflow = overflow
+        self._max_retries = max_retries
+
+        self._inserts: list[tuple[Table, dict[str, Any]]] = []
+        # (table, key column, key) -> column values
+        self._updates: OrderedDict[tuple[Table, str, Any], dict[str, Any]] = OrderedDict()
+        self._callbacks: list[Callable[[], None]] = []
+        # Rows the database rejected: (table name, row or update values, error type)
+        self.dead_letters: deque[tuple[str, dict[str, Any], str]] = deque(maxlen=self.DEAD_LETTER_SIZE)
+
+        self._flush_lock = asyncio.Lock()
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task[None]] = None
+        self._closed = False
+
+    def __len__(self) -> int:
+        return len(self._inserts) + len(self._updates)
+
+    # =========================================================================
+    # Producers
+    # =========================================================================
+
+    async def insert(
+        self,
+        table: Table,
+        row: dict[str, Any],
+        on_flush: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """
+        Queue a row for insertion.
+
+        Args:
+            table: Target table
+            row: Column values (Core column keys)
+            on_flush: Called after the row is committed
+        """
+        await self._reserve()
+        self._inserts.append((table, row))
+        self._queued(on_flush)
+
+    async def update(
+        self,
+        table: Table,
+        key: Any,
+        values: dict[str, Any],
+        key_column: str = "id",
+        on_flush: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """
+        Queue an update of one row, merged with pending updates of that row.
+
+        Args:
+            table: Target table
+            key: Value of key_column identifying the row
+            values: Column values to set
+            key_column: Column identifying the row
+            on_flush: Called after the update is committed
+        """
+        pending_key = (table, key_column, key)
+        if pending_key in self._updates:
+            self._updates[pending_key].update(values)
+        else:
+            await self._reserve()
+            self._updates[pending_key] = dict(values)
+        self._queued(on_flush)
+
+    def pending_inserts(self, table: Table, **match: Any) -> list[dict[str, Any]]:
+        """Pending rows of a table whose columns equal ``match`` (read-your-writes)."""
+        return [
+            row for t, row in self._inserts
+            if t is table and all(row.get(k) == v for k, v in match.items())
+        ]
+
+    def pending_update(self, table: Table, key: Any, key_column: str = "id") -> Optional[dict[str, Any]]:
+        """Pending values for a row, if an update is queued (read-your-writes)."""
+        values = self._updates.get((table, key_column, key))
+        return dict(values) if values is not None else None
+
+    def _queued(self, on_flush: Optional[Callable[[], None]]) -> None:
+        if on_flush is not None:
+            self._callbacks.append(on_flush)
+        WRITE_BEHIND_PENDING.set(len(self))
+        if len(self) >= self._max_batch:
+            self._wake.set()
+        self._ensure_started()
+
+    async def _reserve(self) -> None:
+        """Make room for one more row according to the overflow policy."""
+        if self._closed:
+            raise RuntimeError("Write-behind buffer is closed")
+        if self._overflow == "drop":
+            self._drop_overflow(self._max_pending - 1)
+            return
+        while len(self) >= self._max_pending:
+            if await self.flush() == 0:
+                # Database unavailable: wait for it instead of losing rows
+                await asyncio.sleep(self._flush_interval)
+
+    def _drop_overflow(self, limit: int) -> None:
+        """Drop the oldest pending rows above limit."""
+        while len(self) > limit:
+            if self._inserts:
+                table, _ = self._inserts.pop(0)
+            else:
+                (table, _, _), _ = self._updates.popitem(last=False)
+            WRITE_BEHIND_ROWS.labels(table.name, "dropped").inc()
+            logger.warning(f"Write-behind buffer full, dropped oldest {table.name} row")
+
+    # =========================================================================
+    # Flushing
+    # =========================================================================
+
+    def _ensure_started(self) -> None:
+        if self._task is not None or self._closed:
+            return
+        try:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        except RuntimeError:
+            pass  # No running loop: flushes happen on size or close()
+
+    async def _run(self) -> None:
+        while not self._closed:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self._flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            if not self._closed:
+                await self.flush()
+
+    async def flush(self) -> int:
+        """
+        Write all pending rows in one transaction.
+
+        Returns:
+            Number of rows written (0 if nothing was pending or the write failed)
+        """
+        async with self._flush_lock:
+            inserts, updates, callbacks = self._inserts, self._updates, self._callbacks
+            if not inserts and not updates:
+                return 0
+            self._inserts, self._updates, self._callbacks = [], OrderedDict(), []
+
+            start = time.perf_counter()
+            try:
+                await self._write(inserts, updates)
+            except ROW_ERRORS as e:
+                logger.warning(
+                    f"Write-behind flush of {len(inserts) + len(updates)} rows rejected, "
+                    f"isolating bad rows: {type(e).__name__}"
+                )
+                written, inserts, updates = await self._write_isolating(inserts, updates)
+                if inserts or updates:
+                    self._requeue(inserts, updates, callbacks)
+                    callbacks = []
+            except Exception as e:
+                self._requeue(inserts, updates, callbacks)
+                logger.warning(
+                    f"Write-behind flush of {len(inserts) + len(updates)} rows failed, "
+                    f"will retry: {type(e).__name__}"
+                )
+                return 0
+            else:
+                written = len(inserts) + len(updates)
+                for table, _ in inserts:
+                    WRITE_BEHIND_ROWS.labels(table.name, "written").inc()
+                for table, _, _ in updates:
+                    WRITE_BEHIND_ROWS.labels(table.name, "written").inc()
+            finally:
+                WRITE_BEHIND_FLUSH_SECONDS.observe(time.perf_counter() - start)
+                WRITE_BEHIND_PENDING.set(len(self))
+
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.warning(f"Write-behind flush callback failed: {type(e).__name__}")
+        return written
+
+    async def _write_isolating(self, inserts: Inserts, updates: Updates) -> tuple[int, Inserts, Updates]:
+        """
+        Write a rejected batch in halves, dead-lettering the rows that fail alone.
+
+        Each half is its own transaction. A transient error stops the split:
+        the rows not yet written are returned for requeueing.
+
+        Returns:
+            (rows written, inserts left, updates left)
+        """
+        written = 0
+        left_inserts: Inserts = []
+        left_updates: Updates = OrderedDict()
+        chunks: deque[tuple[Inserts, Updates]] = deque([(inserts, updates)])
+        while chunks:
+            chunk_inserts, chunk_updates = chunks.popleft()
+            if left_inserts or left_updates:
+                left_inserts += chunk_inserts
+                left_updates.update(chunk_updates)
+                continue
+            size = len(chunk_inserts) + len(chunk_updates)
+            try:
+                await self._write(chunk_inserts, chunk_updates)
+            except ROW_ERRORS as e:
+                if size == 1:
+                    self._dead_letter(chunk_inserts, chunk_updates, e)
+                else:
+                    chunks.extendleft(reversed(_halves(chunk_inserts, chunk_updates)))
+                continue
+            except Exception as e:
+                logger.warning(f"Write-behind row isolation interrupted: {type(e).__name__}")
+                left_inserts += chunk_inserts
+                left_updates.update(chunk_updates)
+                continue
+            written += size
+            for table, _ in chunk_inserts:
+                WRITE_BEHIND_ROWS.labels(table.name, "written").inc()
+            for table, _, _ in chunk_updates:
+                WRITE_BEHIND_ROWS.labels(table.name, "written").inc()
+        return written, left_inserts, left_updates
+
+    def _dead_letter(self, inserts: Inserts, updates: Updates, error: Exception) -> None:
+        """Give up a row the database rejects (kept in dead_letters)."""
+        rows = [(table, row) for table, row in inserts] + [
+            (table, {**values, key_column: key}) for (table, key_column, key), values in updates.items()
+        ]
+        for table, row in rows:
+            self.dead_letters.append((table.name, row, type(error).__name__))
+            WRITE_BEHIND_ROWS.labels(table.name, "dead_lettered").inc()
+            logger.error(f"Write-behind row of {table.name} rejected, dead-lettered: {type(error).__name__}")
+
+    def _requeue(
+        self,
+        inserts: Inserts,
+        updates: Updates,
+        callbacks: list[Callable[[], None]],
+    ) -> None:
+        """Put the rows of a failed flush back in front of newer ones."""
+        for table, _ in inserts:
+            WRITE_BEHIND_ROWS.labels(table.name, "requeued").inc()
+        self._inserts = inserts + self._inserts
+        for key, values in self._updates.items():
+            # Newer pending values win over the failed ones
+            updates.setdefault(key, {}).update(values)
+        self._updates = updates
+        self._callbacks = callbacks + self._callbacks
+        if self._overflow == "drop":
+            self._drop_overflow(self._max_pending)
+
+    async def _write(self, inserts: Inserts, updates: Updates) -> None:
+        """One transaction: a multi-row INSERT per table and column set, then updates."""
+        insert_groups: dict[tuple[Table, tuple[str, ...]], list[dict[str, Any]]] = {}
+        for table, row in inserts:
+            insert_groups.setdefault((table, tuple(sorted(row))), []).append(row)
+
+        update_groups: dict[tuple[Table, str, tuple[str, ...]], list[dict[str, Any]]] = {}
+        for (table, key_column, key), values in updates.items():
+            group = (table, key_column, tuple(sorted(values)))
+            update_groups.setdefault(group, []).append({**values, "row_key": key})
+
+        async with session_scope(self._session_factory) as session:
+            async with unit_of_work(session):
+                for (table, _columns), rows in insert_groups.items():
+                    await session.execute(insert(table), rows)
+                for (table, key_column, columns), rows in update_groups.items():
+                    stmt = (
+                        update(table)
+                        .where(table.c[key_column] == bindparam("row_key"))
+                        .values({c: bindparam(c) for c in columns})
+                    )
+                    await session.execute(stmt, rows)
+
+        logger.debug(
+            f"Write-behind flushed {len(inserts)} inserts / {len(updates)} updates "
+            f"in {len(insert_groups) + len(update_groups)} statements"
+        )
+
+    async def close(self) -> int:
+        """
+        Stop the background flusher and write everything pending (shutdown).
+
+        Returns:
+            Number of rows that could not be written
+        """
+        self._closed = True
+        self._wake.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+
+        delay = 0.1
+        for attempt in range(self._max_retries):
+            await self.flush()
+            if not len(self):
+                return 0
+            if attempt < self._max_retries - 1:
+                await asyncio.sleep(delay)
+                delay *= 2
+        lost = len(self)
+        logger.error(f"Write-behind buffer closed with {lost} unwritten rows")
+        return lost
+
+
+def _halves(inserts: Inserts, updates: Updates) -> list[tuple[Inserts, Updates]]:
+    """Split a batch in two, keeping the order of its rows."""
+    items = [("insert", row) for row in inserts] + [("update", item) for item in updates.items()]
+    middle = len(items) // 2
+    halves = []
+    for part in (items[:middle], items[middle:]):
+        halves.append((
+            [row for kind, row in part if kind == "insert"],
+            OrderedDict(item for kind, item in part if kind == "update"),
+        ))
+    return halves
+
+
+# Global buffer instance
+_write_behind: Optional[WriteBehindBuffer] = None
+
+
+def get_write_behind_buffer() -> WriteBehindBuffer:
+    """
+    Get the global write-behind buffer (on the shared database engine).
+
+    Returns:
+        The global WriteBehindBuffer instance
+    """
+    global _write_behind
+    if _write_behind is None:
+        _write_behind = WriteBehindBuffer()
+    return _write_behind
+
+
+def current_write_behind_buffer() -> Optional[WriteBehindBuffer]:
+    """
+    Get the global write-behind buffer if one is installed (never creates one).
+
+    Services default their writer to this: with no buffer installed (tests,
+    scripts) they commit per write.
+
+    Returns:
+        The global WriteBehindBuffer, or None
+    """
+    return _write_behind
+
+
+def set_write_behind_buffer(buffer: Optional[WriteBehindBuffer]) -> None:
+    """
+    Set the global write-behind buffer.
+
+    Args:
+        buffer: The WriteBehindBuffer to use globally (None to reset)
+    """
+    global _write_behind
+    _write_behind = buffer
+
+
+async def close_write_behind_buffer() -> int:
+    """
+    Flush and close the global buffer, if one was created (shutdown).
+
+    Returns:
+        Number of rows that could not be written
+    """
+    global _write_behind
+    buffer, _write_behind = _write_behind, None
+    if buffer is None:
+        return 0
+    return await buffer.close()
+
+
+__all__ = [
+    "WriteBehindBuffer",
+    "OVERFLOW_POLICIES",
+    "WRITE_BEHIND_ROWS",
+    "WRITE_BEHIND_FLUSH_SECONDS",
+    "WRITE_BEHIND_PENDING",
+    "get_write_behind_buffer",
+    "current_write_behind_buffer",
+    "set_write_behind_buffer",
+    "close_write_behind_buffer",
+]
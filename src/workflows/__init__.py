@@ -9,37 +9,116 @@ Reference:
 - ARCHITECTURE.md SW-1 (Daily Cycle)
 """
 
-from src.workflows.daily_workflow import (
-    DailyWorkflow,
-    DailyWorkflowState,
-    DailyWorkflowResult,
-    WorkflowTrigger,
-    SegmentTimingConfig,
-    get_daily_workflow,
-)
-
-from src.workflows.daily_graph import (
-    DailyGraphState,
-    GraphNode,
-    EdgeRoute,
-    build_daily_graph,
-    run_daily_graph,
-    get_segment_adaptive_schedule,
-)
-
-__all__ = [
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .daily_workflow import (
+        DailyWorkflow,
+        DailyWorkflowState,
+        DailyWorkflowResult,
+        WorkflowTrigger,
+        SegmentTimingConfig,
+        get_daily_workflow,
+    )
+    from .daily_graph import (
+        DailyGraphState,
+        GraphNode,
+        EdgeRoute,
+        build_daily_graph,
+        get_daily_graph,
+        invalidate_daily_graph,
+        run_daily_graph,
+        run_daily_graph_batch,
+        DailyBatchSummary,
+        get_segment_adaptive_schedule,
+    )
+    from .checkpoint import (
+        DailyGraphCheckpointer,
+        daily_thread_id,
+        get_daily_checkpointer,
+        set_daily_checkpointer,
+    )
+    from .hook_runner import HookResult, HookRunner
+    from .prerender import (
+        MorningPrerenderer,
+        MorningRenderStore,
+        PrerenderedMorning,
+        get_morning_store,
+        prerender_upcoming_mornings,
+        set_morning_store,
+    )
+    from .scheduler import (
+        DailyEventScheduler,
+        NightlyJob,
+        ScheduledEventKind,
+        DueEvent,
+        TimingWheel,
+        get_event_scheduler,
+        set_event_scheduler,
+    )
+
+
+# Public name -> submodule that defines it. Submodules are imported on first
+# attribute access (PEP 562), so importing this package stays cheap.
+_LAZY_EXPORTS: dict[str, str] = {
     # Daily Workflow Engine
-    "DailyWorkflow",
-    "DailyWorkflowState",
-    "DailyWorkflowResult",
-    "WorkflowTrigger",
-    "SegmentTimingConfig",
-    "get_daily_workflow",
+    "DailyWorkflow": ".daily_workflow",
+    "DailyWorkflowState": ".daily_workflow",
+    "DailyWorkflowResult": ".daily_workflow",
+    "WorkflowTrigger": ".daily_workflow",
+    "SegmentTimingConfig": ".daily_workflow",
+    "get_daily_workflow": ".daily_workflow",
     # Daily Graph
-    "DailyGraphState",
-    "GraphNode",
-    "EdgeRoute",
-    "build_daily_graph",
-    "run_daily_graph",
-    "get_segment_adaptive_schedule",
-]
+    "DailyGraphState": ".daily_graph",
+    "GraphNode": ".daily_graph",
+    "EdgeRoute": ".daily_graph",
+    "build_daily_graph": ".daily_graph",
+    "get_daily_graph": ".daily_graph",
+    "invalidate_daily_graph": ".daily_graph",
+    "run_daily_graph": ".daily_graph",
+    "run_daily_graph_batch": ".daily_graph",
+    "DailyBatchSummary": ".daily_graph",
+    "get_segment_adaptive_schedule": ".daily_graph",
+    # Checkpointing
+    "DailyGraphCheckpointer": ".checkpoint",
+    "daily_thread_id": ".checkpoint",
+    "get_daily_checkpointer": ".checkpoint",
+    "set_daily_checkpointer": ".checkpoint",
+    # Hook Runner
+    "HookResult": ".hook_runner",
+    "HookRunner": ".hook_runner",
+    # Morning Pre-render
+    "MorningPrerenderer": ".prerender",
+    "MorningRenderStore": ".prerender",
+    "PrerenderedMorning": ".prerender",
+    "get_morning_store": ".prerender",
+    "prerender_upcoming_mornings": ".prerender",
+    "set_morning_store": ".prerender",
+    # Event Scheduler
+    "DailyEventScheduler": ".scheduler",
+    "NightlyJob": ".scheduler",
+    "ScheduledEventKind": ".scheduler",
+    "DueEvent": ".scheduler",
+    "TimingWheel": ".scheduler",
+    "get_event_scheduler": ".scheduler",
+    "set_event_scheduler": ".scheduler",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule that defines ``name`` on first access."""
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
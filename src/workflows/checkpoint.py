@@ -0,0 +1,497 @@
+"""
+Daily Graph Checkpointing for Aurora Sun V1.
+
+The daily graph runs morning → preflight → planning → midday → evening →
+reflect over many hours. DailyGraphCheckpointer is a LangGraph checkpoint
+saver that persists the graph state after every node, so a worker restart
+or scale-down resumes the run at the last completed node instead of
+recomputing earlier stages.
+
+Storage layout (per run, thread_id "daily:<user>:<date>"):
+
+    aurora:checkpoint:<thread>          hash, field <ns>: latest checkpoint,
+                                        metadata and parent checkpoint id
+    aurora:checkpoint:<thread>:w:<ns>   hash, field <task_id>:<idx>: pending
+                                        writes of the latest checkpoint
+
+Only the latest checkpoint is kept (the daily graph never replays history),
+encoded with the LangGraph msgpack serializer and zlib-compressed above a
+small threshold. Saving a checkpoint drops the writes of the one it
+replaces, and every write refreshes the TTL, so runs that are
+finished or abandoned are garbage-collected by expiry. Without Redis (or on
+Redis errors) the same layout is kept in process memory.
+
+Write latency and encoded size are exported as Prometheus histograms.
+
+Reference: ARCHITECTURE.md Section 3 (Daily Workflow Engine)
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+import zlib
+from collections.abc import AsyncIterator, Sequence
+from typing import Any, Optional
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from prometheus_client import Histogram
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Metrics
+# =============================================================================
+
+CHECKPOINT_WRITE_SECONDS = Histogram(
+    "aurora_daily_checkpoint_write_seconds",
+    "Time to persist a daily graph checkpoint or pending writes",
+    ["kind", "backend"],  # kind: checkpoint | writes; backend: redis | memory
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1),
+)
+CHECKPOINT_BYTES = Histogram(
+    "aurora_daily_checkpoint_bytes",
+    "Encoded size of a daily graph checkpoint",
+    buckets=(256, 512, 1024, 2048, 4096, 8192, 16384),
+)
+
+
+# =============================================================================
+# Encoding
+# =============================================================================
+
+# Non-builtin types in DailyGraphState that checkpoints may deserialize
+DAILY_GRAPH_TYPES = (
+    ("src.workflows.daily_graph", "GraphNode"),
+    ("src.workflows.daily_graph", "EdgeRoute"),
+)
+
+_RAW = 0
+_ZLIB = 1
+
+
+def encode_record(serde: Any, value: Any, compress_above: int) -> bytes:
+    """
+    Encode a value: header byte, type tag, serialized (maybe compressed) payload.
+
+    Args:
+        serde: LangGraph serializer (dumps_typed / loads_typed)
+        value: Value to encode
+        compress_above: Payloads larger than this many bytes are compressed
+
+    Returns:
+        Encoded bytes
+    """
+    type_tag, payload = serde.dumps_typed(value)
+    tag = type_tag.encode("ascii")
+    flag = _RAW
+    if len(payload) > compress_above:
+        compressed = zlib.compress(payload, 6)
+        if len(compressed) < len(payload):
+            payload, flag = compressed, _ZLIB
+    return bytes((flag, len(tag))) + tag + payload
+
+
+def decode_record(serde: Any, data: bytes) -> Any:
+    """
+    Decode bytes built by encode_record().
+
+    Args:
+        serde: LangGraph serializer
+        data: Encoded bytes
+
+    Returns:
+        The decoded value
+    """
+    flag, tag_len = data[0], data[1]
+    type_tag = data[2:2 + tag_len].decode("ascii")
+    payload = data[2 + tag_len:]
+    if flag == _ZLIB:
+        payload = zlib.decompress(payload)
+    return serde.loads_typed((type_tag, payload))
+
+
+# =============================================================================
+# Backends
+# =============================================================================
+
+class MemoryHashStore:
+    """Process-local stand-in for the Redis hash commands the saver uses."""
+
+    def __init__(self):
+        # key -> (fields, expires_at)
+        self._data: dict[str, tuple[dict[str, bytes], float]] = {}
+
+    async def hset(self, key: str, mapping: dict[str, bytes]) -> None:
+        fields, expires_at = self._live(key) or ({}, float("inf"))
+        fields.update(mapping)
+        self._data[key] = (fields, expires_at)
+
+    async def expire(self, key: str, ttl: int) -> None:
+        entry = self._live(key)
+        if entry is not None:
+            self._data[key] = (entry[0], time.time() + ttl)
+
+    async def hgetall(self, key: str) -> dict[str, bytes]:
+        entry = self._live(key)
+        return dict(entry[0]) if entry is not None else {}
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._data.pop(key, None)
+
+    def _live(self, key: str) -> Optional[tuple[dict[str, bytes], float]]:
+        entry = self._data.get(key)
+        if entry is not None and entry[1] <= time.time():
+            del self._data[key]
+            return None
+        return entry
+
+    def purge_expired(self) -> int:
+        """Drop expired runs. Returns the number removed."""
+        now = time.time()
+        expired = [key for key, (_, expires_at) in self._data.items() if expires_at <= now]
+        for key in expired:
+            del self._data[key]
+        return len(expired)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# =============================================================================
+# Checkpoint Saver
+# =============================================================================
+
+class DailyGraphCheckpointer(BaseCheckpointSaver):
+    """
+    LangGraph checkpoint saver keeping the latest checkpoint per daily run.
+
+    Async only: the daily graph is always run with ainvoke().
+
+    Usage:
+        checkpointer = DailyGraphCheckpointer.from_url(settings.redis_url)
+        set_daily_checkpointer(checkpointer)
+        await run_daily_graph(user_id, date, segment_code)  # resumes if interrupted
+    """
+
+    KEY_PREFIX = "aurora:checkpoint:"
+    TTL = 2 * 24 * 3600  # A day's run is useless after the next day
+    COMPRESS_ABOVE = 512
+
+    def __init__(
+        self,
+        redis_client: Any = None,
+        ttl: int = TTL,
+        compress_above: int = COMPRESS_ABOVE,
+        serde: Any = None,
+    ):
+        """
+        Initialize the saver.
+
+        Args:
+            redis_client: redis.asyncio client created with
+                decode_responses=False (None: process memory only)
+            ttl: Seconds a run's checkpoints live after its last write
+            compress_above: Payloads larger than this are zlib-compressed
+            serde: LangGraph serializer (defaults to JsonPlusSerializer
+                restricted to the daily graph's types)
+        """
+        super().__init__(serde=serde or JsonPlusSerializer(
+            allowed_msgpack_modules=DAILY_GRAPH_TYPES,
+        ))
+        self._redis = redis_client
+        self._memory = MemoryHashStore()
+        self._ttl = ttl
+        self._compress_above = compress_above
+
+    @classmethod
+    def from_url(cls, redis_url: str, **kwargs: Any) -> "DailyGraphCheckpointer":
+        """
+        Create a saver with its own binary Redis client.
+
+        The shared client from get_redis_client() decodes responses to str,
+        which would corrupt the binary checkpoint encoding.
+
+        Args:
+            redis_url: Redis URL
+            **kwargs: Passed to the constructor
+        """
+        import redis.asyncio as redis
+        return cls(redis_client=redis.from_url(redis_url, decode_responses=False), **kwargs)
+
+    @property
+    def memory(self) -> MemoryHashStore:
+        """In-process store (used without Redis and as the error fallback)."""
+        return self._memory
+
+    # =========================================================================
+    # Storage helpers
+    # =========================================================================
+
+    def _key(self, thread_id: str) -> str:
+        return f"{self.KEY_PREFIX}{thread_id}"
+
+    def _writes_key(self, thread_id: str, checkpoint_ns: str) -> str:
+        return f"{self.KEY_PREFIX}{thread_id}:w:{checkpoint_ns}"
+
+    async def _write(self, ops: list[tuple[Any, ...]], kind: str) -> None:
+        """Apply (command, *args) ops, pipelined in one round trip on Redis."""
+        start = time.perf_counter()
+        if self._redis is not None:
+            try:
+                pipe = self._redis.pipeline(transaction=False)
+                for command, *args in ops:
+                    if command == "hset":
+                        pipe.hset(args[0], mapping=args[1])
+                    else:
+                        getattr(pipe, command)(*args)
+                await pipe.execute()
+                CHECKPOINT_WRITE_SECONDS.labels(kind, "redis").observe(time.perf_counter() - start)
+                return
+            except Exception as e:
+                logger.warning(f"Checkpoint write to Redis failed, keeping it in memory: {type(e).__name__}")
+        for command, *args in ops:
+            await getattr(self._memory, command)(*args)
+        CHECKPOINT_WRITE_SECONDS.labels(kind, "memory").observe(time.perf_counter() - start)
+
+    async def _read(self, key: str) -> list[dict[str, bytes]]:
+        """
+        A hash from Redis and from process memory (non-empty copies only).
+
+        Both can hold a run: memory takes the writes made while Redis was
+        failing, Redis the ones before and after.
+        """
+        copies = []
+        if self._redis is not None:
+            try:
+                fields = await self._redis.hgetall(key)
+                if fields:
+                    copies.append({
+                        (f.decode() if isinstance(f, bytes) else f): v
+                        for f, v in fields.items()
+                    })
+            except Exception as e:
+                logger.warning(f"Checkpoint read from Redis failed, trying memory: {type(e).__name__}")
+        fields = await self._memory.hgetall(key)
+        if fields:
+            copies.append(fields)
+        return copies
+
+    async def _load(self, thread_id: str, checkpoint_ns: str) -> Optional[CheckpointTuple]:
+        # Newest checkpoint of the Redis and memory copies (IDs sort by time)
+        records = [
+            decode_record(self.serde, copy[checkpoint_ns])
+            for copy in await self._read(self._key(thread_id))
+            if checkpoint_ns in copy
+        ]
+        if not records:
+            return None
+        checkpoint, metadata, parent_id = max(records, key=lambda record: record[0]["id"])
+
+        pending: list[tuple[str, int, str, Any]] = []
+        seen: set[tuple[str, int]] = set()
+        for copy in await self._read(self._writes_key(thread_id, checkpoint_ns)):
+            for value in copy.values():
+                checkpoint_id, task_id, idx, channel, payload = decode_record(self.serde, value)
+                if checkpoint_id == checkpoint["id"] and (task_id, idx) not in seen:
+                    seen.add((task_id, idx))
+                    pending.append((task_id, idx, channel, payload))
+        pending.sort(key=lambda w: (w[0], w[1]))
+
+        def config_for(checkpoint_id: str) -> RunnableConfig:
+            return {
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint_id,
+                }
+            }
+
+        return CheckpointTuple(
+            config=config_for(checkpoint["id"]),
+            checkpoint=checkpoint,
+            metadata=metadata,
+            parent_config=config_for(parent_id) if parent_id else None,
+            pending_writes=[(task_id, channel, payload) for task_id, _, channel, payload in pending],
+        )
+
+    # =========================================================================
+    # BaseCheckpointSaver (async)
+    # =========================================================================
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        """Load the latest checkpoint of a run (or the requested one if it is the latest)."""
+        configurable = config["configurable"]
+        thread_id = configurable["thread_id"]
+        checkpoint_ns = configurable.get("checkpoint_ns", "")
+        result = await self._load(thread_id, checkpoint_ns)
+        requested = get_checkpoint_id(config)
+        if result is not None and requested and result.checkpoint["id"] != requested:
+            return None
+        return result
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        """List checkpoints of a run (at most the latest one is kept)."""
+        if config is None or limit == 0:
+            return
+        result = await self.aget_tuple(config)
+        if result is None:
+            return
+        if before is not None and result.checkpoint["id"] >= get_checkpoint_id(before):
+            return
+        if filter and any(result.metadata.get(k) != v for k, v in filter.items()):
+            return
+        yield result
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Persist a checkpoint, replacing the run's previous one."""
+        configurable = config["configurable"]
+        thread_id = configurable["thread_id"]
+        checkpoint_ns = configurable.get("checkpoint_ns", "")
+        record = encode_record(
+            self.serde,
+            (checkpoint, get_checkpoint_metadata(config, metadata), configurable.get("checkpoint_id")),
+            self._compress_above,
+        )
+        CHECKPOINT_BYTES.observe(len(record))
+        key = self._key(thread_id)
+        await self._write(
+            [
+                ("hset", key, {checkpoint_ns: record}),
+                ("expire", key, self._ttl),
+                # Writes of the replaced checkpoint are obsolete
+                ("delete", self._writes_key(thread_id, checkpoint_ns)),
+            ],
+            "checkpoint",
+        )
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """Persist a task's writes against the latest checkpoint."""
+        configurable = config["configurable"]
+        checkpoint_ns = configurable.get("checkpoint_ns", "")
+        checkpoint_id = configurable["checkpoint_id"]
+        mapping = {}
+        for idx, (channel, value) in enumerate(writes):
+            idx = WRITES_IDX_MAP.get(channel, idx)
+            mapping[f"{task_id}:{idx}"] = encode_record(
+                self.serde,
+                (checkpoint_id, task_id, idx, channel, value),
+                self._compress_above,
+            )
+        if mapping:
+            key = self._writes_key(configurable["thread_id"], checkpoint_ns)
+            await self._write([("hset", key, mapping), ("expire", key, self._ttl)], "writes")
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        """Delete all checkpoints of a run."""
+        key = self._key(thread_id)
+        namespaces = list({ns for copy in await self._read(key) for ns in copy}) or [""]
+        keys = [key] + [self._writes_key(thread_id, ns) for ns in namespaces]
+        await self._memory.delete(*keys)
+        if self._redis is not None:
+            try:
+                await self._redis.delete(*keys)
+            except Exception as e:
+                logger.warning(f"Checkpoint delete in Redis failed: {type(e).__name__}")
+
+
+    async def purge_memory(self) -> int:
+        """
+        Drop expired runs from process memory (nightly job).
+
+        Redis expires its keys itself; runs written to memory while Redis
+        was failing would otherwise stay until read again.
+
+        Returns:
+            Number of expired hashes removed
+        """
+        purged = self._memory.purge_expired()
+        logger.info(f"Purged {purged} expired in-memory checkpoints")
+        return purged
+
+    async def aclose(self) -> None:
+        """Close the saver's Redis client, if any (shutdown)."""
+        if self._redis is not None:
+            await self._redis.aclose()
+
+
+def daily_thread_id(user_id: int, date: str) -> str:
+    """LangGraph thread ID of a user's daily run."""
+    return f"daily:{user_id}:{date}"
+
+
+# Global checkpointer (None: the daily graph runs without checkpoints)
+_daily_checkpointer: Optional[DailyGraphCheckpointer] = None
+
+
+def get_daily_checkpointer() -> Optional[DailyGraphCheckpointer]:
+    """
+    Get the checkpointer used by run_daily_graph().
+
+    Returns:
+        The global DailyGraphCheckpointer, or None if checkpointing is off
+    """
+    return _daily_checkpointer
+
+
+def set_daily_checkpointer(checkpointer: Optional[DailyGraphCheckpointer]) -> None:
+    """
+    Set (or clear) the checkpointer used by run_daily_graph().
+
+    Args:
+        checkpointer: Saver to use, or None to disable checkpointing
+    """
+    global _daily_checkpointer
+    _daily_checkpointer = checkpointer
+
+
+__all__ = [
+    "DailyGraphCheckpointer",
+    "MemoryHashStore",
+    "daily_thread_id",
+    "encode_record",
+    "decode_record",
+    "get_daily_checkpointer",
+    "set_daily_checkpointer",
+    "CHECKPOINT_WRITE_SECONDS",
+    "CHECKPOINT_BYTES",
+]
@@ -28,10 +28,16 @@ Reference:
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Optional, TypedDict
+from typing import Any, Iterable, Mapping, Optional, TypedDict
 
+from src.core.module_registry import ModuleRegistry, get_registry
 from src.core.segment_context import WorkingStyleCode
 
 logger = logging.getLogger(__name__)
@@ -118,7 +124,7 @@ class EdgeRoute(str, Enum):
 # LangGraph Builder Functions
 # =============================================================================
 
-def build_daily_graph():
+def build_daily_graph(checkpointer: Any = None):
     """
     Build the Daily Workflow LangGraph.
 
@@ -178,6 +184,10 @@ def build_daily_graph():
     | feed Aurora         |
     +--------------------+
 
+    Args:
+        checkpointer: LangGraph checkpoint saver persisting state after
+            each node (None: no checkpoints)
+
     Returns:
         Compiled LangGraph StateGraph
     """
@@ -237,7 +247,7 @@ def build_daily_graph():
     workflow.add_edge(GraphNode.REFLECT, GraphNode.END)
 
     # Compile the graph
-    compiled = workflow.compile()
+    compiled = workflow.compile(checkpointer=checkpointer)
 
     logger.info("Daily Workflow LangGraph built successfully")
     return compiled
@@ -560,6 +570,76 @@ async def end_node(state: DailyGraphState) -> dict[str, Any]:
     }
 
 
+# =============================================================================
+# Compiled Graph Cache
+# =============================================================================
+
+# (registry, registry.version, checkpointer, compiled graph): the graph is
+# compiled once per process and rebuilt only when module hooks or the
+# checkpointer change
+_compiled_graph: Optional[tuple[ModuleRegistry, int, Any, Any]] = None
+_compile_lock = threading.Lock()
+
+
+def _daily_checkpointer() -> Any:
+    """The daily checkpointer, or None (checkpoint imports LangGraph, so lazily)."""
+    try:
+        from src.workflows.checkpoint import get_daily_checkpointer
+    except ImportError:
+        return None
+    return get_daily_checkpointer()
+
+
+def get_daily_graph(registry: Optional[ModuleRegistry] = None) -> Any:
+    """
+    Get the compiled Daily Workflow graph, compiling it on first use.
+
+    The compiled graph is cached per process and rebuilt when the module
+    registry changes (modules, and so daily workflow hooks, added or removed)
+    or a different checkpointer is set.
+
+    Args:
+        registry: Module registry providing the hooks (defaults to the global registry)
+
+    Returns:
+        Compiled LangGraph StateGraph, or None if LangGraph is not installed
+    """
+    global _compiled_graph
+    if registry is None:
+        registry = get_registry()
+    checkpointer = _daily_checkpointer()
+
+    def cached_graph() -> Any:
+        cached = _compiled_graph
+        if (
+            cached is not None
+            and cached[0] is registry
+            and cached[1] == registry.version
+            and cached[2] is checkpointer
+        ):
+            return cached[3]
+        return None
+
+    graph = cached_graph()
+    if graph is not None:
+        return graph
+
+    with _compile_lock:
+        graph = cached_graph()
+        if graph is not None:
+            return graph
+        version = registry.version
+        graph = build_daily_graph(checkpointer)
+        _compiled_graph = (registry, version, checkpointer, graph)
+        return graph
+
+
+def invalidate_daily_graph() -> None:
+    """Drop the cached compiled graph (rebuilt on the next run)."""
+    global _compiled_graph
+    _compiled_graph = None
+
+
 # =============================================================================
 # Graph Execution
 # =============================================================================
@@ -575,6 +655,10 @@ async def run_daily_graph(
     """
     Run the Daily Workflow LangGraph.
 
+    With a checkpointer set, state is saved after every node under the
+    user's daily thread. An interrupted run resumes at the last completed
+    node, and a finished run returns its final state without re-running.
+
     Args:
         user_id: The user ID
         date: The date for this workflow (YYYY-MM-DD)
@@ -586,8 +670,7 @@ async def run_daily_graph(
     Returns:
         Final graph state
     """
-    # Try to build the graph
-    graph = build_daily_graph()
+    graph = get_daily_graph()
 
     if graph is None:
         logger.warning("LangGraph not available, returning empty state")
@@ -621,13 +704,142 @@ async def run_daily_graph(
         "redirect_reason": None,
     }
 
+    config = None
+    if _daily_checkpointer() is not None:
+        from src.workflows.checkpoint import daily_thread_id
+        config = {"configurable": {"thread_id": daily_thread_id(user_id, date)}}
+        snapshot = await graph.aget_state(config)
+        if snapshot.values:
+            if not snapshot.next:
+                logger.info(f"Daily graph already finished for user {user_id}")
+                return snapshot.values
+            logger.info(
+                f"Resuming daily graph for user {user_id} at {', '.join(snapshot.next)}"
+            )
+            return await graph.ainvoke(None, config)
+
     # Run the graph
-    result = await graph.ainvoke(initial_state)
+    result = await graph.ainvoke(initial_state, config)
 
     logger.info(f"Daily graph completed for user {user_id}")
     return result
 
 
+@dataclass
+class DailyBatchSummary:
+    """Outcome of a daily graph run over many users.
+
+    Attributes:
+        total: Users processed
+        completed: Runs that finished (including redirects)
+        redirected: Runs that took the gentle redirect (overload detected)
+        timed_out: Runs cancelled after the per-user timeout
+        failed: Runs that raised
+        duration_seconds: Wall-clock time of the batch
+        final_stages: Count of runs by the stage they ended in
+        stage_counts: Count of runs that completed each stage
+        errors: Error type by user ID (failed and timed out runs)
+    """
+
+    total: int = 0
+    completed: int = 0
+    redirected: int = 0
+    timed_out: int = 0
+    failed: int = 0
+    duration_seconds: float = 0.0
+    final_stages: dict[str, int] = field(default_factory=dict)
+    stage_counts: dict[str, int] = field(default_factory=dict)
+    errors: dict[int, str] = field(default_factory=dict)
+
+    @property
+    def users_per_minute(self) -> float:
+        """Throughput of the batch."""
+        if self.duration_seconds <= 0:
+            return 0.0
+        return self.total / self.duration_seconds * 60
+
+
+async def run_daily_graph_batch(
+    user_ids: Iterable[int],
+    date: str,
+    segments: Optional[Mapping[int, WorkingStyleCode]] = None,
+    trigger: str = "scheduled",
+    max_concurrency: int = 50,
+    timeout: float = 30.0,
+) -> DailyBatchSummary:
+    """
+    Run the Daily Workflow graph for many users.
+
+    A fixed pool of `max_concurrency` workers pulls user IDs from
+    `user_ids`, so memory stays flat for large populations. Each run is
+    cancelled after `timeout` seconds; one user's failure or timeout does
+    not affect the others.
+
+    Args:
+        user_ids: Users to run (any iterable, consumed lazily)
+        date: The date for this workflow (YYYY-MM-DD)
+        segments: Segment code by user ID (missing users default to NT)
+        trigger: What triggered this workflow
+        max_concurrency: Maximum runs in flight
+        timeout: Per-user timeout in seconds
+
+    Returns:
+        DailyBatchSummary of stage outcomes
+    """
+    segments = segments or {}
+    summary = DailyBatchSummary()
+    final_stages: Counter[str] = Counter()
+    stage_counts: Counter[str] = Counter()
+    pending = iter(user_ids)
+
+    # Compile once up front instead of in the first worker
+    get_daily_graph()
+
+    async def worker() -> None:
+        for user_id in pending:
+            summary.total += 1
+            try:
+                result = await asyncio.wait_for(
+                    run_daily_graph(
+                        user_id=user_id,
+                        date=date,
+                        segment_code=segments.get(user_id, "NT"),
+                        trigger=trigger,
+                    ),
+                    timeout,
+                )
+            except asyncio.TimeoutError:
+                summary.timed_out += 1
+                summary.errors[user_id] = "timeout"
+                logger.warning(f"Daily graph timed out for user {user_id}")
+                continue
+            except Exception as e:
+                summary.failed += 1
+                summary.errors[user_id] = type(e).__name__
+                logger.error(f"Daily graph failed for user {user_id}: {type(e).__name__}")
+                continue
+
+            summary.completed += 1
+            if result.get("redirect_triggered"):
+                summary.redirected += 1
+            final_stages[GraphNode(result.get("current_stage", GraphNode.END)).value] += 1
+            for stage in result.get("completed_stages", []):
+                stage_counts[GraphNode(stage).value] += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(max_concurrency)))
+    summary.duration_seconds = time.perf_counter() - start
+    summary.final_stages = dict(final_stages)
+    summary.stage_counts = dict(stage_counts)
+
+    logger.info(
+        f"Daily graph batch: {summary.completed}/{summary.total} completed, "
+        f"{summary.redirected} redirected, {summary.timed_out} timed out, "
+        f"{summary.failed} failed in {summary.duration_seconds:.1f}s"
+    )
+    return summary
+
+
 # =============================================================================
 # Convenience Functions
 # =============================================================================
@@ -666,6 +878,10 @@ __all__ = [
     "GraphNode",
     "EdgeRoute",
     "build_daily_graph",
+    "get_daily_graph",
+    "invalidate_daily_graph",
     "run_daily_graph",
+    "run_daily_graph_batch",
+    "DailyBatchSummary",
     "get_segment_adaptive_schedule",
 ]
@@ -22,13 +22,19 @@ import logging
 from dataclasses import dataclass, field
 from datetime import date, datetime, time, timedelta
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from src.core.daily_workflow_hooks import DailyWorkflowHooks
+from src.core.module_context import ModuleContext
 from src.core.module_response import ModuleResponse
 from src.core.segment_context import SegmentContext, WorkingStyleCode
+from src.workflows.hook_runner import HookResult, HookRunner
+from src.workflows.prerender import MorningRenderStore, PrerenderedMorning, get_morning_store
 
 if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from src.services.neurostate.snapshot import NeurostateSnapshotLoader
     from src.models.user import User
     from src.models.daily_plan import DailyPlan
     from src.models.vision import Vision
@@ -224,6 +230,9 @@ SEGMENT_TIMING_CONFIGS: dict[WorkingStyleCode, SegmentTimingConfig] = {
     ),
 }
 
+# Midday check-in (no stage of its own: a nudge back into the day's plan)
+MIDDAY_CHECKIN_TEXT = "Quick check-in: how is your day going?"
+
 
 # =============================================================================
 # Daily Workflow Engine
@@ -254,9 +263,29 @@ class DailyWorkflow:
     - Feed Aurora narrative update
     """
 
-    def __init__(self):
-        """Initialize the Daily Workflow Engine."""
+    def __init__(
+        self,
+        hook_runner: Optional[HookRunner] = None,
+        morning_store: Optional[MorningRenderStore] = None,
+        neurostate_loader: Optional["NeurostateSnapshotLoader"] = None,
+        session_factory: Optional[Callable[[], "AsyncSession"]] = None,
+    ):
+        """Initialize the Daily Workflow Engine.
+
+        Args:
+            hook_runner: Runs module hooks per stage (defaults to HookRunner())
+            morning_store: Pre-rendered mornings (defaults to the global store)
+            neurostate_loader: Loads the neurostate snapshot for the pre-flight
+                (None: pre-flight reports the tier only)
+            session_factory: Sessions for reading past plans (None: no
+                database reads, e.g. no yesterday's wins)
+        """
         self._hooks: dict[str, DailyWorkflowHooks] = {}
+        self._hooks_version = 0
+        self._hook_runner = hook_runner or HookRunner()
+        self._morning_store = morning_store or get_morning_store()
+        self._neurostate_loader = neurostate_loader
+        self._session_factory = session_factory
         logger.info("DailyWorkflow engine initialized")
 
     def register_module_hooks(self, module_name: str, hooks: DailyWorkflowHooks) -> None:
@@ -267,8 +296,14 @@ class DailyWorkflow:
             hooks: DailyWorkflowHooks from the module
         """
         self._hooks[module_name] = hooks
+        self._hooks_version += 1
         logger.debug(f"Registered daily workflow hooks from module: {module_name}")
 
+    @property
+    def hooks_version(self) -> int:
+        """Counter bumped whenever module hooks change (invalidates pre-renders)."""
+        return self._hooks_version
+
     def get_timing_config(self, segment_code: WorkingStyleCode) -> SegmentTimingConfig:
         """Get segment-adaptive timing configuration.
 
@@ -406,10 +441,40 @@ class DailyWorkflow:
         logger.info(f"Daily workflow completed for user {user_id}: {result.completed_stages}")
         return result
 
+    async def run_scheduled_event(
+        self,
+        user_id: int,
+        kind: str,
+        segment_code: WorkingStyleCode,
+        for_date: date,
+    ) -> str:
+        """
+        Render the message of a scheduled morning, midday or evening event.
+
+        Called for the due events of the DailyEventScheduler.
+
+        Args:
+            user_id: The user ID
+            kind: "morning", "midday" or "evening"
+            segment_code: User's segment code
+            for_date: User-local date the event is for
+
+        Returns:
+            Message text to send
+        """
+        if kind == "morning":
+            message, _ = await self.run_morning_activation(user_id, segment_code, for_date=for_date)
+            return message
+        if kind == "evening":
+            return (await self.run_evening_review(user_id)).text
+        return MIDDAY_CHECKIN_TEXT
+
     async def run_morning_activation(
         self,
         user_id: int,
         segment_code: WorkingStyleCode,
+        energy_level: Optional[int] = None,
+        for_date: Optional[date] = None,
     ) -> tuple[str, list[str]]:
         """
         Run morning activation stage.
@@ -419,34 +484,131 @@ class DailyWorkflow:
         - Energy check (tiered based on segment)
         - Yesterday's wins (if available)
 
+        A message pre-rendered overnight (MorningPrerenderer) is used when it
+        is still fresh; otherwise the parts are rendered now.
+
         Args:
             user_id: The user ID
             segment_code: User's segment code
+            energy_level: Latest energy check (1-5), adjusts the message
+            for_date: User-local date (defaults to today)
 
         Returns:
             Tuple of (message, list of interventions delivered)
         """
-        interventions: list[str] = []
+        for_date = for_date or date.today()
 
-        # Build morning message
-        messages: list[str] = []
-
-        # TODO: Get yesterday's wins from DailyPlan
-        # yesterday_wins = await self._get_yesterday_wins(user_id)
-
-        # TODO: Call morning hooks from registered modules
-        # for module_name, hooks in self._hooks.items():
-        #     if hooks.morning:
-        #         hook_result = await hooks.morning(module_ctx)
-        #         if hook_result:
-        #             messages.append(hook_result)
+        rendered = await self._morning_store.get(user_id)
+        prerendered = rendered is not None and rendered.is_fresh(
+            for_date, segment_code, self.hooks_version
+        )
+        if not prerendered:
+            rendered = await self.render_morning(user_id, segment_code, for_date)
 
-        message = "\n".join(messages) if messages else "Good morning! Let's start your day."
+        message, interventions = rendered.compose(energy_level)
 
         # F-010: Log metadata only, not message content
-        logger.info(f"Morning activation for user {user_id}: message_len={len(message)}, interventions={len(interventions)}")
+        logger.info(
+            f"Morning activation for user {user_id}: message_len={len(message)}, "
+            f"interventions={len(interventions)}, prerendered={prerendered}"
+        )
         return message, interventions
 
+    async def render_morning(
+        self,
+        user_id: int,
+        segment_code: WorkingStyleCode,
+        for_date: date,
+    ) -> PrerenderedMorning:
+        """
+        Compute the parts of a morning message (vision, goals, wins, hooks).
+
+        Args:
+            user_id: The user ID
+            segment_code: User's segment code
+            for_date: User-local date the message is for
+
+        Returns:
+            PrerenderedMorning (not stored)
+        """
+        hooks_version = self.hooks_version
+        visions, goals = await self.run_vision_display(user_id)
+        wins = await self.get_yesterday_wins(user_id, for_date)
+
+        # Morning hooks from registered modules run concurrently; late
+        # ones are skipped (or served from their last result)
+        hook_texts: list[tuple[str, str]] = []
+        for hook_result in await self.run_stage_hooks("morning", user_id, segment_code):
+            if not hook_result.has_value:
+                continue
+            value = hook_result.value
+            text = value.text if isinstance(value, ModuleResponse) else value
+            if isinstance(text, str) and text:
+                hook_texts.append((hook_result.module_name, text))
+
+        return PrerenderedMorning(
+            user_id=user_id,
+            for_date=for_date.isoformat(),
+            segment_code=segment_code,
+            hooks_version=hooks_version,
+            vision_texts=list(visions),
+            goal_titles=[getattr(goal, "title", None) or str(goal) for goal in goals],
+            yesterday_wins=wins,
+            hook_texts=hook_texts,
+        )
+
+    async def get_yesterday_wins(self, user_id: int, for_date: date) -> list[str]:
+        """
+        Get wins from the previous day's plan.
+
+        Args:
+            user_id: The user ID
+            for_date: The date whose previous day is read
+
+        Returns:
+            Short descriptions of completed priorities
+        """
+        if self._session_factory is None:
+            return []
+        from sqlalchemy import func, select
+        from sqlalchemy.exc import SQLAlchemyError
+
+        from src.models.daily_plan import DailyPlan
+        from src.models.task import Task
+
+        plans, tasks = DailyPlan.__table__, Task.__table__
+        yesterday = for_date - timedelta(days=1)
+        plan = (plans.c.user_id == user_id) & (plans.c.date == yesterday)
+        # One row even without a plan: each column is a scalar subquery
+        query = select(
+            select(func.count())
+            .select_from(tasks)
+            .where(
+                (tasks.c.user_id == user_id)
+                & (tasks.c.committed_date == yesterday)
+                & (tasks.c.status == "completed")
+            )
+            .scalar_subquery(),
+            select(plans.c.priorities_selected).where(plan).scalar_subquery(),
+            select(plans.c.tasks_committed).where(plan).scalar_subquery(),
+        )
+        try:
+            async with self._session_factory() as session:
+                completed, priorities_selected, tasks_committed = (await session.execute(query)).one()
+        except SQLAlchemyError as e:
+            # Wins are a nicety: the morning is sent without them
+            logger.warning(f"Yesterday's wins unavailable for user {user_id}: {type(e).__name__}")
+            return []
+
+        wins = []
+        if completed:
+            wins.append(f"{completed} {'priority' if completed == 1 else 'priorities'} done")
+        if priorities_selected:
+            wins.append("priorities chosen")
+        if tasks_committed:
+            wins.append("tasks committed")
+        return wins
+
     async def run_neurostate_preflight(
         self,
         user_id: int,
@@ -504,6 +666,14 @@ class DailyWorkflow:
             "burnout_risk": None,
         }
 
+        # One cached round-trip for all six neurostate services
+        if self._neurostate_loader is not None:
+            try:
+                state = await self._neurostate_loader.load(user_id)
+                snapshot.update(state.to_preflight())
+            except Exception as e:
+                logger.warning(f"Neurostate snapshot load failed for user {user_id}: {type(e).__name__}")
+
         # Determine if overload is detected
         overload_detected = snapshot.get("burnout_risk", 0) > 0.8 if snapshot.get("burnout_risk") else False
 
@@ -677,6 +847,39 @@ class DailyWorkflow:
         logger.info(f"Saving daily plan for user {user_id} on {date}")
         raise NotImplementedError("Database session not yet implemented")
 
+    async def run_stage_hooks(
+        self,
+        stage: str,
+        user_id: int,
+        segment_code: WorkingStyleCode,
+        language: str = "en",
+    ) -> list[HookResult]:
+        """Run all module hooks of a stage concurrently with a deadline.
+
+        Args:
+            stage: The workflow stage (morning, planning_enrichment, midday_check, evening_review)
+            user_id: The user ID
+            segment_code: User's segment code
+            language: User's language code
+
+        Returns:
+            One HookResult per hook, in priority order
+        """
+        hooks = self.get_hooks_for_stage(stage)
+        if not hooks:
+            return []
+        ctx = ModuleContext(
+            user_id=user_id,
+            segment_context=SegmentContext.from_code(segment_code),
+            state=stage,
+            session_id=f"daily:{user_id}:{date.today().isoformat()}",
+            language=language,
+            module_name="daily_workflow",
+            is_daily_workflow_active=True,
+            daily_workflow_stage=stage,
+        )
+        return await self._hook_runner.run_stage(stage, hooks, ctx)
+
     def get_hooks_for_stage(self, stage: str) -> list[tuple[str, DailyWorkflowHooks]]:
         """Get all hooks for a specific workflow stage.
 
@@ -714,12 +917,21 @@ _daily_workflow: Optional[DailyWorkflow] = None
 def get_daily_workflow() -> DailyWorkflow:
     """Get the global DailyWorkflow instance.
 
+    The global instance runs the pre-flight on the neurostate snapshot
+    (shared engine, global snapshot cache) and reads past plans through
+    the shared engine.
+
     Returns:
         The global DailyWorkflow instance
     """
     global _daily_workflow
     if _daily_workflow is None:
-        _daily_workflow = DailyWorkflow()
+        from src.models.database import get_session_factory
+        from src.services.neurostate.snapshot import NeurostateSnapshotLoader
+        _daily_workflow = DailyWorkflow(
+            neurostate_loader=NeurostateSnapshotLoader(),
+            session_factory=get_session_factory(),
+        )
     return _daily_workflow
 
 
@@ -0,0 +1,260 @@
+"""
+Daily Workflow Hook Runner for Aurora Sun V1.
+
+Runs the module hooks of one daily workflow stage (morning,
+planning_enrichment, midday_check, evening_review) concurrently, so the
+stage takes as long as its slowest hook up to a deadline instead of the sum
+of all hooks.
+
+- Each hook gets the same deadline. A hook that misses it is skipped for
+  this run (the last cached result for the user is used, if any), but keeps
+  running in the background for a grace period; when it finishes, its result
+  is cached for the next run.
+- A failing hook is logged and skipped; it never fails the stage.
+- Per-module hook latency and outcomes are exported as Prometheus metrics,
+  late hooks included, so slow modules show up.
+
+Reference: ARCHITECTURE.md Section 3 (Daily Workflow Engine)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional, Sequence
+
+from prometheus_client import Counter, Histogram
+
+from src.core.daily_workflow_hooks import DailyWorkflowHooks
+from src.core.module_context import ModuleContext
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Metrics
+# =============================================================================
+
+HOOK_SECONDS = Histogram(
+    "aurora_daily_hook_seconds",
+    "Daily workflow hook latency by stage and module",
+    ["stage", "module"],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 30),
+)
+HOOK_OUTCOMES = Counter(
+    "aurora_daily_hook_total",
+    "Daily workflow hook runs by outcome",
+    ["stage", "module", "outcome"],  # ok | late | failed
+)
+
+HOOK_STAGES = ("morning", "planning_enrichment", "midday_check", "evening_review")
+
+
+@dataclass
+class HookResult:
+    """Outcome of one module hook in a stage.
+
+    Attributes:
+        module_name: Module providing the hook
+        stage: Workflow stage
+        status: "ok", "cached" (late, previous result used), "late" (late,
+            nothing cached) or "failed"
+        value: Hook return value (None unless ok or cached)
+        latency_seconds: Time until the hook finished or the deadline passed
+    """
+
+    module_name: str
+    stage: str
+    status: str
+    value: Any = None
+    latency_seconds: float = 0.0
+
+    @property
+    def has_value(self) -> bool:
+        """True if the result carries usable hook output."""
+        return self.status in ("ok", "cached") and self.value is not None
+
+
+class HookRunner:
+    """
+    Runs a stage's hooks concurrently with a per-hook deadline.
+
+    Usage:
+        runner = HookRunner(deadline=2.0)
+        results = await runner.run_stage("morning", workflow.get_hooks_for_stage("morning"), ctx)
+        messages = [r.value for r in results if r.has_value]
+    """
+
+    DEADLINE = 2.0  # Seconds a stage waits for its hooks
+    LATE_GRACE = 30.0  # Seconds a late hook may keep running to fill the cache
+    CACHE_TTL = 24 * 3600
+    CACHE_SIZE = 50_000
+
+    def __init__(
+        self,
+        deadline: float = DEADLINE,
+        late_grace: float = LATE_GRACE,
+        cache_ttl: float = CACHE_TTL,
+        cache_size: int = CACHE_SIZE,
+    ):
+        """
+        Initialize the runner.
+
+        Args:
+            deadline: Per-hook deadline in seconds
+            late_grace: Extra seconds a late hook may run before it is cancelled
+            cache_ttl: Seconds a cached hook result stays usable
+            cache_size: Maximum cached results (least recently stored evicted)
+        """
+        self._deadline = deadline
+        self._late_grace = late_grace
+        self._cache_ttl = cache_ttl
+        self._cache_size = cache_size
+        # (stage, module, user_id) -> (value, stored_at)
+        self._cache: OrderedDict[tuple[str, str, int], tuple[Any, float]] = OrderedDict()
+        self._background: set[asyncio.Task[Any]] = set()
+
+    def _store(self, key: tuple[str, str, int], value: Any) -> None:
+        self._cache[key] = (value, time.monotonic())
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+    def cached(self, stage: str, module_name: str, user_id: int) -> Any:
+        """Last result of a hook for a user, or None if missing or expired."""
+        entry = self._cache.get((stage, module_name, user_id))
+        if entry is None or time.monotonic() - entry[1] > self._cache_ttl:
+            return None
+        return entry[0]
+
+    @staticmethod
+    async def _call(hook: Any, ctx: ModuleContext, stage: str, module_name: str) -> tuple[Any, float]:
+        """Run a hook (sync or async); returns (value, latency)."""
+        start = time.perf_counter()
+        try:
+            result = hook(ctx)
+            if inspect.isawaitable(result):
+                result = await result
+            return result, time.perf_counter() - start
+        finally:
+            HOOK_SECONDS.labels(stage, module_name).observe(time.perf_counter() - start)
+
+    def _finished(
+        self,
+        task: asyncio.Task[Any],
+        stage: str,
+        module_name: str,
+        user_id: int,
+    ) -> Optional[HookResult]:
+        """Record a finished hook; returns its result (None if it failed)."""
+        if task.cancelled():
+            return None
+        error = task.exception()
+        if error is not None:
+            HOOK_OUTCOMES.labels(stage, module_name, "failed").inc()
+            logger.warning(
+                f"Daily hook {stage}/{module_name} failed for user {user_id}: {type(error).__name__}"
+            )
+            return None
+        value, latency = task.result()
+        if value is not None:
+            self._store((stage, module_name, user_id), value)
+        return HookResult(module_name, stage, "ok", value, latency)
+
+    async def _finish_late(
+        self,
+        task: asyncio.Task[Any],
+        stage: str,
+        module_name: str,
+        user_id: int,
+    ) -> None:
+        """Let a late hook finish within the grace period to fill the cache."""
+        done, _ = await asyncio.wait({task}, timeout=self._late_grace)
+        if not done:
+            task.cancel()
+            logger.warning(f"Daily hook {stage}/{module_name} cancelled after grace period")
+            return
+        self._finished(task, stage, module_name, user_id)
+
+    async def run_stage(
+        self,
+        stage: str,
+        hooks: Sequence[tuple[str, DailyWorkflowHooks]],
+        ctx: ModuleContext,
+    ) -> list[HookResult]:
+        """
+        Run all hooks of a stage concurrently.
+
+        Args:
+            stage: Workflow stage (one of HOOK_STAGES)
+            hooks: (module_name, DailyWorkflowHooks) pairs in priority order
+            ctx: Module context for the user
+
+        Returns:
+            One HookResult per hook, in the order given
+        """
+        if stage not in HOOK_STAGES:
+            raise ValueError(f"Unknown daily workflow stage: {stage}")
+
+        tasks: list[tuple[str, asyncio.Task[Any]]] = []
+        for module_name, module_hooks in hooks:
+            hook = getattr(module_hooks, stage)
+            if hook is not None:
+                task = asyncio.ensure_future(self._call(hook, ctx, stage, module_name))
+                tasks.append((module_name, task))
+        if not tasks:
+            return []
+
+        start = time.perf_counter()
+        await asyncio.wait([task for _, task in tasks], timeout=self._deadline)
+
+        results: list[HookResult] = []
+        for module_name, task in tasks:
+            if task.done():
+                result = self._finished(task, stage, module_name, ctx.user_id)
+                if result is None:
+                    result = HookResult(
+                        module_name, stage, "failed", latency_seconds=time.perf_counter() - start,
+                    )
+                else:
+                    HOOK_OUTCOMES.labels(stage, module_name, "ok").inc()
+                results.append(result)
+                continue
+
+            HOOK_OUTCOMES.labels(stage, module_name, "late").inc()
+            cached = self.cached(stage, module_name, ctx.user_id)
+            results.append(HookResult(
+                module_name,
+                stage,
+                "cached" if cached is not None else "late",
+                cached,
+                self._deadline,
+            ))
+            logger.info(
+                f"Daily hook {stage}/{module_name} missed the {self._deadline}s deadline "
+                f"for user {ctx.user_id}"
+            )
+            background = asyncio.ensure_future(
+                self._finish_late(task, stage, module_name, ctx.user_id)
+            )
+            self._background.add(background)
+            background.add_done_callback(self._background.discard)
+        return results
+
+    async def drain(self) -> None:
+        """Wait for late hooks still running in the background (shutdown, tests)."""
+        if self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
+
+
+__all__ = [
+    "HookResult",
+    "HookRunner",
+    "HOOK_STAGES",
+    "HOOK_SECONDS",
+    "HOOK_OUTCOMES",
+]
@@ -0,0 +1,367 @@
+"""
+Pre-rendered Morning Messages for Aurora Sun V1.
+
+Morning activations land in the same segment-defined windows for everyone
+(08:00-09:00 local), which makes a daily CPU and LLM peak. The expensive
+parts of a morning message -- vision text, 90-day goals, yesterday's wins
+and module morning hooks -- do not depend on the moment of sending, so
+MorningPrerenderer computes them during the night in small, throttled
+batches and stores one PrerenderedMorning per user.
+
+At send time run_morning_activation only checks freshness (same local date,
+same segment, same set of module hooks, not invalidated by an edit) and
+applies the neurostate delta (today's energy); anything stale is rendered
+live as before.
+
+Storage: Redis (JSON, TTL) with an in-process fallback. Vision text and goal
+titles are Art. 9 data, encrypted per user at rest, so each rendered morning
+is stored encrypted with the user's key (ART_9_SPECIAL); without an
+encryption service nothing is stored and mornings are rendered live.
+
+Reference: ARCHITECTURE.md Section 3 (Daily Workflow Engine)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import date
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+
+from src.core.segment_context import WorkingStyleCode
+from src.lib.json_ttl_store import JsonTTLStore
+from src.lib.encryption import (
+    DataClassification,
+    EncryptedField,
+    EncryptionService,
+    EncryptionServiceError,
+    get_encryption_service,
+)
+
+if TYPE_CHECKING:
+    from src.workflows.daily_workflow import DailyWorkflow
+    from src.workflows.scheduler import DailyEventScheduler
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_MORNING_MESSAGE = "Good morning! Let's start your day."
+
+# Energy at or below this (1-5 scale) is a red day: no goals push in the
+# morning message (mirrors the tiered pre-flight)
+RED_ENERGY = 1
+
+
+@dataclass
+class PrerenderedMorning:
+    """Morning message parts computed ahead of the send window.
+
+    Attributes:
+        user_id: The user ID
+        for_date: User-local date the message is for (YYYY-MM-DD)
+        segment_code: Segment the parts were rendered for
+        hooks_version: DailyWorkflow.hooks_version at render time
+        vision_texts: Vision statements
+        goal_titles: 90-day goal titles
+        yesterday_wins: Wins from yesterday's plan
+        hook_texts: (module name, text) from morning hooks
+        rendered_at: Unix timestamp of rendering
+    """
+
+    user_id: int
+    for_date: str
+    segment_code: WorkingStyleCode
+    hooks_version: int
+    vision_texts: list[str] = field(default_factory=list)
+    goal_titles: list[str] = field(default_factory=list)
+    yesterday_wins: list[str] = field(default_factory=list)
+    hook_texts: list[tuple[str, str]] = field(default_factory=list)
+    rendered_at: float = field(default_factory=time.time)
+
+    def is_fresh(self, for_date: date, segment_code: WorkingStyleCode, hooks_version: int) -> bool:
+        """Check the parts are still valid for sending."""
+        return (
+            self.for_date == for_date.isoformat()
+            and self.segment_code == segment_code
+            and self.hooks_version == hooks_version
+        )
+
+    def compose(self, energy_level: Optional[int] = None) -> tuple[str, list[str]]:
+        """
+        Build the message, adjusted for today's energy.
+
+        Args:
+            energy_level: Latest energy check (1-5), if known
+
+        Returns:
+            Tuple of (message, list of interventions delivered)
+        """
+        lines: list[str] = []
+        if self.yesterday_wins:
+            lines.append("Yesterday's wins: " + ", ".join(self.yesterday_wins))
+        if self.vision_texts:
+            lines.append(self.vision_texts[0])
+        red_day = energy_level is not None and energy_level <= RED_ENERGY
+        if self.goal_titles and not red_day:
+            lines.append("Your 90-day goals: " + ", ".join(self.goal_titles))
+        lines.extend(text for _, text in self.hook_texts)
+        interventions = [f"hook:{module_name}" for module_name, _ in self.hook_texts]
+        message = "\n".join(lines) if lines else DEFAULT_MORNING_MESSAGE
+        return message, interventions
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, data: str) -> "PrerenderedMorning":
+        fields = json.loads(data)
+        fields["hook_texts"] = [tuple(pair) for pair in fields.get("hook_texts", [])]
+        return cls(**fields)
+
+
+# =============================================================================
+# Store
+# =============================================================================
+
+class MorningRenderStore(JsonTTLStore[PrerenderedMorning]):
+    """Pre-rendered mornings by user ID, encrypted (Redis with in-process fallback)."""
+
+    KEY_PREFIX = "aurora:morning:"
+    TTL = 36 * 3600  # Rendered at night, sent the same morning
+    NAME = "Morning store"
+    FIELD_NAME = "prerendered_morning"
+
+    def __init__(
+        self,
+        redis_client: Any = None,
+        ttl: int = TTL,
+        encryption: Optional[EncryptionService] = None,
+    ):
+        """
+        Args:
+            redis_client: redis.asyncio client (None: process memory only)
+            ttl: Lifetime of a rendered morning in seconds
+            encryption: Per-user encryption (defaults to the global service)
+        """
+        super().__init__(redis_client, ttl)
+        self._encryption = encryption
+
+    def _encode(self, rendered: PrerenderedMorning) -> Optional[str]:
+        """Encrypt a rendered morning with its user's key (None without encryption)."""
+        if self._encryption is None:
+            self._encryption = get_encryption_service()
+        try:
+            encrypted = self._encryption.encrypt_field(
+                rendered.to_json(),
+                rendered.user_id,
+                DataClassification.ART_9_SPECIAL,
+                field_name=self.FIELD_NAME,
+            )
+        except EncryptionServiceError as e:
+            # Never store Art. 9 data in plaintext: the morning renders live
+            logger.warning(f"Morning pre-render not stored, encryption unavailable: {type(e).__name__}")
+            return None
+        return json.dumps(encrypted.to_db_dict(), separators=(",", ":"))
+
+    def _decode(self, user_id: int, data: str) -> PrerenderedMorning:
+        """Decrypt a stored morning (raises ValueError on malformed or foreign data)."""
+        if self._encryption is None:
+            self._encryption = get_encryption_service()
+        encrypted = EncryptedField.from_db_dict(json.loads(data))
+        try:
+            plaintext = self._encryption.decrypt_field(encrypted, user_id, field_name=self.FIELD_NAME)
+        except EncryptionServiceError as e:
+            raise ValueError(f"Cannot decrypt: {type(e).__name__}") from e
+        return PrerenderedMorning.from_json(plaintext)
+
+    async def invalidate(self, user_id: int) -> None:
+        """
+        Drop a user's rendered morning (vision, goals or plan changed).
+
+        Args:
+            user_id: The user ID
+        """
+        await self.delete(user_id)
+
+
+# =============================================================================
+# Pre-render Pipeline
+# =============================================================================
+
+@dataclass
+class PrerenderSummary:
+    """Outcome of a pre-render run."""
+
+    rendered: int = 0
+    failed: int = 0
+    duration_seconds: float = 0.0
+
+
+class MorningPrerenderer:
+    """
+    Renders morning messages for many users at low priority.
+
+    Users are processed in batches by a few workers; between batches the
+    pipeline sleeps so foreground traffic (night owls, crisis flows) keeps
+    the event loop and the LLM quota.
+
+    Usage:
+        prerenderer = MorningPrerenderer(get_daily_workflow())
+        await prerenderer.run(users_due_tomorrow, tomorrow)
+    """
+
+    BATCH_SIZE = 100
+    CONCURRENCY = 4
+    PAUSE_SECONDS = 0.5
+
+    def __init__(
+        self,
+        workflow: "DailyWorkflow",
+        store: Optional[MorningRenderStore] = None,
+        batch_size: int = BATCH_SIZE,
+        concurrency: int = CONCURRENCY,
+        pause_seconds: float = PAUSE_SECONDS,
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            workflow: DailyWorkflow providing the rendering
+            store: Where rendered mornings go (defaults to the global store)
+            batch_size: Users per batch
+            concurrency: Users rendered at once within a batch
+            pause_seconds: Sleep between batches
+        """
+        self._workflow = workflow
+        self._store = store or get_morning_store()
+        self._batch_size = batch_size
+        self._concurrency = concurrency
+        self._pause_seconds = pause_seconds
+
+    async def run(
+        self,
+        users: Iterable[tuple[int, WorkingStyleCode]],
+        for_date: date,
+    ) -> PrerenderSummary:
+        """
+        Render and store morning messages.
+
+        Args:
+            users: (user_id, segment_code) pairs, consumed lazily
+            for_date: User-local date the messages are for
+
+        Returns:
+            PrerenderSummary
+        """
+        summary = PrerenderSummary()
+        semaphore = asyncio.Semaphore(self._concurrency)
+        start = time.perf_counter()
+
+        async def render(user_id: int, segment_code: WorkingStyleCode) -> None:
+            async with semaphore:
+                try:
+                    rendered = await self._workflow.render_morning(user_id, segment_code, for_date)
+                    await self._store.put(rendered)
+                    summary.rendered += 1
+                except Exception as e:
+                    summary.failed += 1
+                    logger.warning(f"Morning pre-render failed for user {user_id}: {type(e).__name__}")
+
+        batch: list[tuple[int, WorkingStyleCode]] = []
+        first = True
+        for user in users:
+            batch.append(user)
+            if len(batch) == self._batch_size:
+                if not first:
+                    await asyncio.sleep(self._pause_seconds)
+                await asyncio.gather(*(render(*u) for u in batch))
+                batch, first = [], False
+        if batch:
+            if not first:
+                await asyncio.sleep(self._pause_seconds)
+            await asyncio.gather(*(render(*u) for u in batch))
+
+        summary.duration_seconds = time.perf_counter() - start
+        logger.info(
+            f"Morning pre-render for {for_date}: {summary.rendered} rendered, "
+            f"{summary.failed} failed in {summary.duration_seconds:.1f}s"
+        )
+        return summary
+
+
+async def prerender_upcoming_mornings(
+    scheduler: Optional["DailyEventScheduler"] = None,
+    prerenderer: Optional[MorningPrerenderer] = None,
+    now: Optional[float] = None,
+) -> PrerenderSummary:
+    """
+    Pre-render the next morning of every scheduled user (nightly job).
+
+    Each user's morning is rendered for the local date of their next
+    morning event.
+
+    Args:
+        scheduler: Knows the scheduled users (defaults to the global scheduler)
+        prerenderer: Pipeline to run (defaults to one on the global workflow)
+        now: Current Unix timestamp (defaults to the scheduler's clock)
+
+    Returns:
+        PrerenderSummary over all dates
+    """
+    if scheduler is None:
+        from src.workflows.scheduler import get_event_scheduler
+        scheduler = get_event_scheduler()
+    if prerenderer is None:
+        from src.workflows.daily_workflow import get_daily_workflow
+        prerenderer = MorningPrerenderer(get_daily_workflow())
+
+    total = PrerenderSummary()
+    for for_date, users in sorted((await scheduler.upcoming_mornings(now)).items()):
+        summary = await prerenderer.run(users, for_date)
+        total.rendered += summary.rendered
+        total.failed += summary.failed
+        total.duration_seconds += summary.duration_seconds
+    return total
+
+
+# Global store instance
+_morning_store: Optional[MorningRenderStore] = None
+
+
+def get_morning_store() -> MorningRenderStore:
+    """
+    Get the global pre-rendered morning store (process memory until set).
+
+    Returns:
+        The global MorningRenderStore instance
+    """
+    global _morning_store
+    if _morning_store is None:
+        _morning_store = MorningRenderStore()
+    return _morning_store
+
+
+def set_morning_store(store: MorningRenderStore) -> None:
+    """
+    Set the global pre-rendered morning store.
+
+    Args:
+        store: The MorningRenderStore to use globally
+    """
+    global _morning_store
+    _morning_store = store
+
+
+__all__ = [
+    "PrerenderedMorning",
+    "MorningRenderStore",
+    "MorningPrerenderer",
+    "prerender_upcoming_mornings",
+    "PrerenderSummary",
+    "DEFAULT_MORNING_MESSAGE",
+    "get_morning_store",
+    "set_morning_store",
+]
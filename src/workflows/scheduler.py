@@ -0,0 +1,790 @@
+"""
+Daily Event Scheduler for Aurora Sun V1.
+
+Schedules the segment-adaptive morning, midday and evening events of the
+Daily Workflow (SEGMENT_TIMING_CONFIGS) for every user in their timezone.
+
+- One entry per (user, event kind) in a Redis sorted set scored by the due
+  time; user profiles (segment, timezone) in a Redis hash. Both survive
+  restarts, so events missed while down are caught up on the next poll
+  (events older than the catch-up window are skipped and rescheduled).
+- When Redis is unavailable, events go to an in-process hierarchical
+  timing wheel instead (same interface, not durable).
+- Due events are popped in batches. Fixed-time events get a stable per-user
+  jitter so 08:00 is spread over several minutes instead of one burst.
+- Interval check-ins (ADHD, AuDHD, NT) have no timer per user: each
+  interaction re-scores the user's midday entry to
+  last_interaction_at + interval.
+- System-wide nightly jobs (e.g. energy baseline reconciliation) share the
+  same sorted set under "job:<name>", so with Redis one process runs each
+  night's job. They run in the background and are not skipped when late.
+
+References:
+    - ARCHITECTURE.md Section 3 (Daily Workflow Engine, CheckinScheduler)
+    - ARCHITECTURE.md SW-1 (Daily Cycle)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import logging
+import time as time_module
+import zlib
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from enum import Enum
+from typing import Any, Awaitable, Callable, Iterable, Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from src.core.segment_context import WorkingStyleCode
+from src.workflows.daily_workflow import SEGMENT_TIMING_CONFIGS, SegmentTimingConfig
+
+logger = logging.getLogger(__name__)
+
+
+class ScheduledEventKind(str, Enum):
+    """Daily Workflow events the scheduler fires."""
+
+    MORNING = "morning"
+    MIDDAY = "midday"
+    EVENING = "evening"
+
+
+@dataclass(frozen=True)
+class DueEvent:
+    """A scheduled event that is due.
+
+    Attributes:
+        user_id: The user ID
+        kind: Event kind
+        due_at: When the event was due (Unix timestamp)
+        fired_at: When the scheduler popped it (Unix timestamp)
+        segment_code: User's segment code
+        timezone: User's IANA timezone
+    """
+
+    user_id: int
+    kind: ScheduledEventKind
+    due_at: float
+    fired_at: float
+    segment_code: WorkingStyleCode
+    timezone: str
+
+    @property
+    def lateness(self) -> float:
+        """Seconds between due time and firing (catch-up after downtime)."""
+        return max(0.0, self.fired_at - self.due_at)
+
+    @property
+    def local_date(self) -> date:
+        """The user's local date the event was due on."""
+        return datetime.fromtimestamp(self.due_at, DailyEventScheduler._zone(self.timezone)).date()
+
+
+@dataclass
+class SchedulerStats:
+    """Scheduler counters."""
+
+    fired: int = 0
+    skipped_stale: int = 0  # Missed by more than the catch-up window
+    redis_errors: int = 0
+    jobs_run: int = 0
+
+
+# =============================================================================
+# Hierarchical Timing Wheel (in-process fallback)
+# =============================================================================
+
+class TimingWheel:
+    """
+    Hierarchical timing wheel: seconds, minutes, hours, plus an overflow
+    bucket for entries more than a day ahead.
+
+    Adding, replacing and removing an entry is O(1). Advancing the clock
+    cascades each coarser slot down once when its period starts.
+    """
+
+    # (slots, ticks per slot) per level
+    LEVELS = ((60, 1), (60, 60), (24, 3600))
+
+    def __init__(self, now: float):
+        """
+        Initialize an empty wheel.
+
+        Args:
+            now: Current Unix timestamp
+        """
+        self._tick = int(now)
+        self._slots: list[list[dict[str, float]]] = [
+            [{} for _ in range(size)] for size, _ in self.LEVELS
+        ]
+        self._overflow: dict[str, float] = {}
+        # member -> slot dict holding it
+        self._where: dict[str, dict[str, float]] = {}
+        # (due, member) of entries whose time has come
+        self._ready: list[tuple[float, str]] = []
+        self._ready_members: dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._where) + len(self._ready_members)
+
+    def add(self, member: str, due: float) -> None:
+        """Schedule (or reschedule) an entry."""
+        self.remove(member)
+        self._place(member, due)
+
+    def remove(self, member: str) -> bool:
+        """Unschedule an entry. Returns True if it was scheduled."""
+        bucket = self._where.pop(member, None)
+        if bucket is not None:
+            del bucket[member]
+            return True
+        # Ready heap entries are dropped lazily in pop_due()
+        return self._ready_members.pop(member, None) is not None
+
+    def pop_due(self, now: float, limit: int) -> list[tuple[str, float]]:
+        """
+        Remove and return up to `limit` entries due at `now`, earliest first.
+
+        Args:
+            now: Current Unix timestamp
+            limit: Maximum number of entries
+
+        Returns:
+            (member, due) pairs
+        """
+        self._advance(int(now))
+        popped: list[tuple[str, float]] = []
+        while self._ready and len(popped) < limit:
+            due, member = heapq.heappop(self._ready)
+            if self._ready_members.get(member) == due:
+                del self._ready_members[member]
+                popped.append((member, due))
+        return popped
+
+    def _place(self, member: str, due: float) -> None:
+        delta = int(due) - self._tick
+        if delta <= 0:
+            heapq.heappush(self._ready, (due, member))
+            self._ready_members[member] = due
+            return
+        for level, (size, span) in enumerate(self.LEVELS):
+            if delta < size * span:
+                bucket = self._slots[level][(int(due) // span) % size]
+                break
+        else:
+            bucket = self._overflow
+        bucket[member] = due
+        self._where[member] = bucket
+
+    def _cascade(self, bucket: dict[str, float]) -> None:
+        entries = list(bucket.items())
+        bucket.clear()
+        for member, due in entries:
+            del self._where[member]
+            self._place(member, due)
+
+    def _advance(self, now_tick: int) -> None:
+        if not self._where:
+            # Nothing pending: jump instead of ticking through idle time
+            self._tick = max(self._tick, now_tick)
+            return
+        while self._tick < now_tick:
+            self._tick += 1
+            tick = self._tick
+            if tick % 3600 == 0:
+                self._cascade(self._overflow)
+                self._cascade(self._slots[2][(tick // 3600) % 24])
+            if tick % 60 == 0:
+                self._cascade(self._slots[1][(tick // 60) % 60])
+            self._cascade(self._slots[0][tick % 60])
+            if not self._where:
+                self._tick = now_tick
+                return
+
+
+# =============================================================================
+# Redis Store
+# =============================================================================
+
+# Atomically pop up to ARGV[2] members scored <= ARGV[1]
+_POP_DUE_SCRIPT = """
+local items = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'WITHSCORES', 'LIMIT', 0, ARGV[2])
+for i = 1, #items, 2 do
+    redis.call('ZREM', KEYS[1], items[i])
+end
+return items
+"""
+
+
+class RedisScheduleStore:
+    """Due events in a Redis sorted set, user profiles in a hash."""
+
+    DUE_KEY = "aurora:schedule:due"
+    PROFILE_KEY = "aurora:schedule:profiles"
+
+    def __init__(self, client: Any):
+        """
+        Args:
+            client: redis.asyncio client
+        """
+        self._client = client
+
+    async def add(self, member: str, due: float) -> None:
+        await self._client.zadd(self.DUE_KEY, {member: due})
+
+    async def remove(self, *members: str) -> None:
+        await self._client.zrem(self.DUE_KEY, *members)
+
+    async def pop_due(self, now: float, limit: int) -> list[tuple[str, float]]:
+        items = await self._client.eval(_POP_DUE_SCRIPT, 1, self.DUE_KEY, now, limit)
+        return [(items[i], float(items[i + 1])) for i in range(0, len(items), 2)]
+
+    async def set_profile(self, user_id: int, profile: str) -> None:
+        await self._client.hset(self.PROFILE_KEY, str(user_id), profile)
+
+    async def delete_profile(self, user_id: int) -> None:
+        await self._client.hdel(self.PROFILE_KEY, str(user_id))
+
+    async def get_profiles(self, user_ids: list[int]) -> dict[int, str]:
+        values = await self._client.hmget(self.PROFILE_KEY, [str(u) for u in user_ids])
+        return {u: v for u, v in zip(user_ids, values) if v is not None}
+
+    async def all_profiles(self) -> dict[int, str]:
+        stored = await self._client.hgetall(self.PROFILE_KEY)
+        return {int(u): v for u, v in stored.items()}
+
+
+# =============================================================================
+# Scheduler
+# =============================================================================
+
+EventHandler = Callable[[list[DueEvent]], Awaitable[Any]]
+
+# A system-wide job run once a night, e.g. reconcile_energy_baselines
+NightlyJob = Callable[[], Awaitable[Any]]
+
+JOB_PREFIX = "job:"
+NIGHTLY_JOB_TIME = time(3, 0)  # UTC; the quietest hour across segments
+
+
+class DailyEventScheduler:
+    """
+    Segment-adaptive scheduler for morning, midday and evening events.
+
+    Usage:
+        scheduler = DailyEventScheduler(redis_client=await get_redis_client())
+        await scheduler.schedule_user(user.id, "AD", "Europe/Berlin")
+        await scheduler.record_interaction(user.id, ctx.last_interaction_at)
+        await scheduler.run(handle_due_events)
+    """
+
+    JITTER_SECONDS = 600  # Fixed-time events spread over 10 minutes
+    BATCH_SIZE = 500
+    CATCH_UP_WINDOW = 3 * 3600  # Missed longer than this: skip, reschedule
+    POLL_INTERVAL = 1.0
+
+    def __init__(
+        self,
+        redis_client: Any = None,
+        jitter_seconds: int = JITTER_SECONDS,
+        batch_size: int = BATCH_SIZE,
+        catch_up_window: float = CATCH_UP_WINDOW,
+        clock: Callable[[], float] = time_module.time,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            redis_client: redis.asyncio client (None: timing wheel only)
+            jitter_seconds: Window over which fixed-time events are spread
+            batch_size: Maximum events popped per poll
+            catch_up_window: Oldest missed event still delivered, in seconds
+            clock: Returns the current Unix timestamp
+        """
+        self._redis = RedisScheduleStore(redis_client) if redis_client is not None else None
+        self._jitter_seconds = jitter_seconds
+        self._batch_size = batch_size
+        self._catch_up_window = catch_up_window
+        self._clock = clock
+        self._wheel = TimingWheel(clock())
+        # user_id -> (segment_code, timezone); mirrors the Redis hash
+        self._profiles: dict[int, tuple[WorkingStyleCode, str]] = {}
+        # job name -> (job, UTC time of day)
+        self._jobs: dict[str, tuple[NightlyJob, time]] = {}
+        self._job_tasks: set[asyncio.Task[None]] = set()
+        self.stats = SchedulerStats()
+
+    # =========================================================================
+    # Timing
+    # =========================================================================
+
+    @staticmethod
+    def _config(segment_code: WorkingStyleCode) -> SegmentTimingConfig:
+        return SEGMENT_TIMING_CONFIGS.get(segment_code, SEGMENT_TIMING_CONFIGS["NT"])
+
+    @staticmethod
+    def _zone(tz_name: str) -> ZoneInfo:
+        try:
+            return ZoneInfo(tz_name)
+        except (ZoneInfoNotFoundError, ValueError):
+            logger.warning(f"Unknown timezone {tz_name!r}, using UTC")
+            return ZoneInfo("UTC")
+
+    @staticmethod
+    def _interval_minutes(config: SegmentTimingConfig) -> Optional[int]:
+        """Check-in interval for interval-based segments (None for exact time)."""
+        if config.midday_strategy == "exact_time":
+            return None
+        return config.midday_interval_minutes
+
+    def jitter(self, user_id: int, kind: ScheduledEventKind) -> int:
+        """Stable per-user offset in seconds (same minute every day)."""
+        if self._jitter_seconds <= 0:
+            return 0
+        return zlib.crc32(f"{user_id}:{kind.value}".encode()) % self._jitter_seconds
+
+    def _local_time(self, kind: ScheduledEventKind, config: SegmentTimingConfig) -> Optional[time]:
+        if kind is ScheduledEventKind.MORNING:
+            return time(config.morning_hour, config.morning_minute)
+        if kind is ScheduledEventKind.EVENING:
+            return time(config.evening_hour, config.evening_minute)
+        if config.midday_strategy == "exact_time" and config.midday_exact_hour is not None:
+            return time(config.midday_exact_hour, config.midday_exact_minute or 0)
+        return None
+
+    def next_due(
+        self,
+        user_id: int,
+        kind: ScheduledEventKind,
+        segment_code: WorkingStyleCode,
+        tz_name: str,
+        after: float,
+    ) -> Optional[float]:
+        """
+        Next due time of a fixed-time event strictly after `after`.
+
+        Args:
+            user_id: The user ID (for jitter)
+            kind: Event kind
+            segment_code: User's segment code
+            tz_name: User's IANA timezone
+            after: Unix timestamp
+
+        Returns:
+            Unix timestamp, or None if the event is not time-based for the
+            segment (interval check-ins)
+        """
+        local_time = self._local_time(kind, self._config(segment_code))
+        if local_time is None:
+            return None
+        zone = self._zone(tz_name)
+        day = datetime.fromtimestamp(after, zone).date()
+        jitter = self.jitter(user_id, kind)
+        for offset in range(3):
+            candidate = datetime.combine(day + timedelta(days=offset), local_time, zone)
+            due = candidate.timestamp() + jitter
+            if due > after:
+                return due
+        return None  # unreachable: a later day always exists
+
+    @staticmethod
+    def _next_job_due(at: time, after: float) -> float:
+        """Next occurrence of a UTC time of day strictly after `after`."""
+        day = datetime.fromtimestamp(after, timezone.utc).date()
+        due = datetime.combine(day, at, timezone.utc).timestamp()
+        return due if due > after else due + 24 * 3600
+
+    # =========================================================================
+    # Storage (Redis with timing wheel fallback)
+    # =========================================================================
+
+    @staticmethod
+    def _member(user_id: int, kind: ScheduledEventKind) -> str:
+        return f"{user_id}:{kind.value}"
+
+    def _redis_failed(self, operation: str, error: Exception) -> None:
+        self.stats.redis_errors += 1
+        logger.warning(
+            f"Scheduler Redis {operation} failed, using timing wheel: {type(error).__name__}"
+        )
+
+    async def _add(self, user_id: int, kind: ScheduledEventKind, due: float) -> None:
+        await self._add_member(self._member(user_id, kind), due)
+
+    async def _add_member(self, member: str, due: float) -> None:
+        if self._redis is not None:
+            try:
+                await self._redis.add(member, due)
+                self._wheel.remove(member)
+                return
+            except Exception as e:
+                self._redis_failed("add", e)
+        self._wheel.add(member, due)
+
+    async def _remove(self, user_id: int, kinds: Iterable[ScheduledEventKind]) -> None:
+        members = [self._member(user_id, kind) for kind in kinds]
+        for member in members:
+            self._wheel.remove(member)
+        if self._redis is not None:
+            try:
+                await self._redis.remove(*members)
+            except Exception as e:
+                self._redis_failed("remove", e)
+
+    async def _pop_due(self, now: float) -> list[tuple[str, float]]:
+        popped: list[tuple[str, float]] = []
+        if self._redis is not None:
+            try:
+                popped = await self._redis.pop_due(now, self._batch_size)
+            except Exception as e:
+                self._redis_failed("pop", e)
+        if len(popped) < self._batch_size:
+            popped += self._wheel.pop_due(now, self._batch_size - len(popped))
+        return popped
+
+    async def _load_profiles(self, user_ids: set[int]) -> None:
+        """Fetch profiles missing locally (e.g. after a restart) from Redis."""
+        missing = [u for u in user_ids if u not in self._profiles]
+        if not missing or self._redis is None:
+            return
+        try:
+            stored = await self._redis.get_profiles(missing)
+        except Exception as e:
+            self._redis_failed("profile lookup", e)
+            return
+        self._set_profiles(stored)
+
+    async def _load_all_profiles(self) -> None:
+        """Fetch every scheduled user's profile from Redis (all processes)."""
+        if self._redis is None:
+            return
+        try:
+            stored = await self._redis.all_profiles()
+        except Exception as e:
+            self._redis_failed("profile scan", e)
+            return
+        self._set_profiles(stored)
+
+    def _set_profiles(self, stored: dict[int, str]) -> None:
+        for user_id, profile in stored.items():
+            segment_code, _, tz_name = profile.partition("|")
+            self._profiles[user_id] = (segment_code, tz_name or "UTC")
+
+    # =========================================================================
+    # Public API
+    # =========================================================================
+
+    async def schedule_user(
+        self,
+        user_id: int,
+        segment_code: WorkingStyleCode,
+        tz_name: str = "UTC",
+        now: Optional[float] = None,
+    ) -> None:
+        """
+        (Re)schedule a user's daily events, e.g. after onboarding or a
+        segment or timezone change.
+
+        Args:
+            user_id: The user ID
+            segment_code: User's segment code
+            tz_name: User's IANA timezone
+            now: Current Unix timestamp (defaults to the clock)
+        """
+        now = self._clock() if now is None else now
+        self._profiles[user_id] = (segment_code, tz_name)
+        if self._redis is not None:
+            try:
+                await self._redis.set_profile(user_id, f"{segment_code}|{tz_name}")
+            except Exception as e:
+                self._redis_failed("profile write", e)
+
+        await self._remove(user_id, [ScheduledEventKind.MIDDAY])
+        for kind in ScheduledEventKind:
+            due = self.next_due(user_id, kind, segment_code, tz_name, now)
+            if due is not None:
+                await self._add(user_id, kind, due)
+
+    async def ensure_user(
+        self,
+        user_id: int,
+        segment_code: WorkingStyleCode,
+        tz_name: str = "UTC",
+    ) -> bool:
+        """
+        Schedule a user unless already scheduled with this segment and
+        timezone (cheap enough to call on every message).
+
+        Args:
+            user_id: The user ID
+            segment_code: User's current segment code
+            tz_name: User's current IANA timezone
+
+        Returns:
+            True if the user's events were (re)scheduled
+        """
+        await self._load_profiles({user_id})
+        if self._profiles.get(user_id) == (segment_code, tz_name):
+            return False
+        await self.schedule_user(user_id, segment_code, tz_name)
+        return True
+
+    async def upcoming_mornings(
+        self,
+        now: Optional[float] = None,
+    ) -> dict[date, list[tuple[int, WorkingStyleCode]]]:
+        """
+        Scheduled users grouped by the local date of their next morning event.
+
+        Used to pre-render morning messages overnight (users in different
+        timezones wake up on different dates).
+
+        Args:
+            now: Current Unix timestamp (defaults to the clock)
+
+        Returns:
+            {local date: [(user_id, segment_code), ...]}
+        """
+        now = self._clock() if now is None else now
+        await self._load_all_profiles()
+        mornings: dict[date, list[tuple[int, WorkingStyleCode]]] = {}
+        for user_id, (segment_code, tz_name) in self._profiles.items():
+            due = self.next_due(user_id, ScheduledEventKind.MORNING, segment_code, tz_name, now)
+            if due is None:
+                continue
+            local_date = datetime.fromtimestamp(due, self._zone(tz_name)).date()
+            mornings.setdefault(local_date, []).append((user_id, segment_code))
+        return mornings
+
+    async def schedule_nightly_job(
+        self,
+        name: str,
+        job: NightlyJob,
+        at: time = NIGHTLY_JOB_TIME,
+        now: Optional[float] = None,
+    ) -> float:
+        """
+        Run a system-wide job once a day (e.g. at startup, for every process).
+
+        Registering the same name again replaces the job and its time.
+
+        Args:
+            name: Unique job name
+            job: Coroutine function without arguments
+            at: UTC time of day
+            now: Current Unix timestamp (defaults to the clock)
+
+        Returns:
+            The first due time
+        """
+        now = self._clock() if now is None else now
+        self._jobs[name] = (job, at)
+        due = self._next_job_due(at, now)
+        await self._add_member(f"{JOB_PREFIX}{name}", due)
+        return due
+
+    async def _start_job(self, name: str, now: float) -> None:
+        """Reschedule a due job for the next night and run it in the background."""
+        entry = self._jobs.get(name)
+        if entry is None:
+            logger.warning(f"Dropping unregistered nightly job {name!r}")
+            return
+        job, at = entry
+        await self._add_member(f"{JOB_PREFIX}{name}", self._next_job_due(at, now))
+        self.stats.jobs_run += 1
+        task = asyncio.create_task(self._run_job(name, job))
+        self._job_tasks.add(task)
+        task.add_done_callback(self._job_tasks.discard)
+
+    @staticmethod
+    async def _run_job(name: str, job: NightlyJob) -> None:
+        try:
+            await job()
+        except Exception as e:
+            logger.error(f"Nightly job {name} failed: {type(e).__name__}", exc_info=True)
+
+    async def unschedule_user(self, user_id: int) -> None:
+        """Remove all of a user's events (e.g. account frozen or deleted)."""
+        self._profiles.pop(user_id, None)
+        await self._remove(user_id, ScheduledEventKind)
+        if self._redis is not None:
+            try:
+                await self._redis.delete_profile(user_id)
+            except Exception as e:
+                self._redis_failed("profile delete", e)
+
+    async def record_interaction(
+        self,
+        user_id: int,
+        last_interaction_at: datetime,
+    ) -> Optional[float]:
+        """
+        Re-score an interval-based check-in after a user interaction.
+
+        Typically called with ModuleContext.last_interaction_at. The check-in
+        moves to last_interaction_at + interval; it is dropped if that falls
+        after the user's evening event.
+
+        Args:
+            user_id: The user ID
+            last_interaction_at: Time of the interaction (naive means UTC)
+
+        Returns:
+            The new due time, or None if no check-in is scheduled
+        """
+        profile = self._profiles.get(user_id)
+        if profile is None:
+            await self._load_profiles({user_id})
+            profile = self._profiles.get(user_id)
+        if profile is None:
+            return None
+        segment_code, tz_name = profile
+
+        interval = self._interval_minutes(self._config(segment_code))
+        if not interval:
+            return None
+
+        if last_interaction_at.tzinfo is None:
+            last_interaction_at = last_interaction_at.replace(tzinfo=timezone.utc)
+        due = last_interaction_at.timestamp() + interval * 60
+
+        # No check-ins after the evening event of the interaction's day
+        zone = self._zone(tz_name)
+        config = self._config(segment_code)
+        local_day = last_interaction_at.astimezone(zone).date()
+        evening = datetime.combine(
+            local_day, time(config.evening_hour, config.evening_minute), zone
+        ).timestamp()
+        if due >= evening:
+            await self._remove(user_id, [ScheduledEventKind.MIDDAY])
+            return None
+
+        await self._add(user_id, ScheduledEventKind.MIDDAY, due)
+        return due
+
+    async def poll(self, now: Optional[float] = None) -> list[DueEvent]:
+        """
+        Pop one batch of due events and schedule their next occurrence.
+
+        Events missed by more than the catch-up window are skipped (and
+        rescheduled), so a long outage does not replay old messages.
+
+        Args:
+            now: Current Unix timestamp (defaults to the clock)
+
+        Returns:
+            Due events, earliest first
+        """
+        now = self._clock() if now is None else now
+        popped = await self._pop_due(now)
+        if not popped:
+            return []
+
+        parsed: list[tuple[int, ScheduledEventKind, float]] = []
+        for member, due in popped:
+            if member.startswith(JOB_PREFIX):
+                # Late jobs still run: a missed reconciliation is still useful
+                await self._start_job(member[len(JOB_PREFIX):], now)
+                continue
+            user_id, _, kind = member.partition(":")
+            try:
+                parsed.append((int(user_id), ScheduledEventKind(kind), due))
+            except ValueError:
+                logger.warning(f"Dropping malformed schedule entry {member!r}")
+        await self._load_profiles({user_id for user_id, _, _ in parsed})
+
+        events: list[DueEvent] = []
+        for user_id, kind, due in sorted(parsed, key=lambda p: p[2]):
+            profile = self._profiles.get(user_id)
+            if profile is None:
+                # Unscheduled while the event was pending
+                continue
+            segment_code, tz_name = profile
+
+            next_due = self.next_due(user_id, kind, segment_code, tz_name, now)
+            if next_due is not None:
+                await self._add(user_id, kind, next_due)
+
+            if kind is ScheduledEventKind.MORNING:
+                # Interval segments: first check-in counts from the morning message
+                interval = self._interval_minutes(self._config(segment_code))
+                if interval:
+                    await self._add(user_id, ScheduledEventKind.MIDDAY, max(due, now) + interval * 60)
+
+            if now - due > self._catch_up_window:
+                self.stats.skipped_stale += 1
+                continue
+            self.stats.fired += 1
+            events.append(DueEvent(
+                user_id=user_id,
+                kind=kind,
+                due_at=due,
+                fired_at=now,
+                segment_code=segment_code,
+                timezone=tz_name,
+            ))
+        return events
+
+    async def run(self, handler: EventHandler, poll_interval: float = POLL_INTERVAL) -> None:
+        """
+        Poll forever, handing each batch of due events to `handler`.
+
+        Full batches are followed immediately by the next poll, so a backlog
+        (e.g. catch-up after a restart) drains without waiting.
+
+        Args:
+            handler: Coroutine function receiving a list of DueEvents
+            poll_interval: Seconds between polls when idle
+        """
+        while True:
+            events = await self.poll()
+            if events:
+                try:
+                    await handler(events)
+                except Exception as e:
+                    logger.error(f"Scheduled event handler failed: {type(e).__name__}", exc_info=True)
+            if len(events) < self._batch_size:
+                await asyncio.sleep(poll_interval)
+
+
+# Global scheduler instance
+_event_scheduler: Optional[DailyEventScheduler] = None
+
+
+def get_event_scheduler() -> DailyEventScheduler:
+    """
+    Get the global event scheduler (timing wheel only until set at startup).
+
+    Returns:
+        The global DailyEventScheduler instance
+    """
+    global _event_scheduler
+    if _event_scheduler is None:
+        _event_scheduler = DailyEventScheduler()
+    return _event_scheduler
+
+
+def set_event_scheduler(scheduler: DailyEventScheduler) -> None:
+    """
+    Set the global event scheduler.
+
+    Args:
+        scheduler: The DailyEventScheduler to use globally
+    """
+    global _event_scheduler
+    _event_scheduler = scheduler
+
+
+__all__ = [
+    "ScheduledEventKind",
+    "DueEvent",
+    "SchedulerStats",
+    "TimingWheel",
+    "RedisScheduleStore",
+    "DailyEventScheduler",
+    "NightlyJob",
+    "get_event_scheduler",
+    "set_event_scheduler",
+]
@@ -0,0 +1,51 @@
+"""
+Shared test fixtures for Aurora Sun V1.
+
+- fake_redis: in-memory async Redis (get/mget/set with TTL/delete)
+- broken_redis: async Redis whose every call fails
+"""
+
+import pytest
+
+
+class FakeRedis:
+    """Async get/mget/set/delete, recording the TTL of each key and MGET calls."""
+
+    def __init__(self):
+        self.data: dict[str, str] = {}
+        self.ttls: dict[str, int] = {}
+        self.mgets: list[list[str]] = []
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def mget(self, keys):
+        self.mgets.append(list(keys))
+        return [self.data.get(key) for key in keys]
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+        self.ttls[key] = ex
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+        self.ttls.pop(key, None)
+
+
+class BrokenRedis:
+    """Every call fails."""
+
+    def __getattr__(self, name):
+        async def fail(*args, **kwargs):
+            raise ConnectionError("redis down")
+        return fail
+
+
+@pytest.fixture
+def fake_redis() -> FakeRedis:
+    return FakeRedis()
+
+
+@pytest.fixture
+def broken_redis() -> BrokenRedis:
+    return BrokenRedis()
@@ -0,0 +1 @@
+# Test package for Aurora Sun V1
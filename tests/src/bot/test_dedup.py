@@ -0,0 +1,108 @@
+"""
+Unit tests for update_id deduplication.
+
+These tests verify:
+- Replays are detected by the local ring buffer
+- The ring buffer is bounded
+- The shared Redis layer catches replays seen by other workers
+- Redis errors fail open
+- Replays are dropped before rate limiting
+"""
+
+from types import SimpleNamespace
+
+from src.bot.dedup import UpdateDeduplicator
+from src.bot.webhook import TelegramWebhookHandler, WebhookServices
+
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+class FakeRedis:
+    """RedisService stand-in implementing set_if_absent."""
+
+    def __init__(self, fail: bool = False):
+        self.keys: dict[str, int] = {}
+        self.fail = fail
+
+    async def set_if_absent(self, key, value, ttl):
+        if self.fail:
+            raise ConnectionError("redis down")
+        if key in self.keys:
+            return False
+        self.keys[key] = ttl
+        return True
+
+
+# =============================================================================
+# TestUpdateDeduplicator
+# =============================================================================
+
+class TestUpdateDeduplicator:
+    """Test the two dedup layers."""
+
+    async def test_local_replay_detected(self):
+        """A second delivery of the same update_id is a duplicate."""
+        dedup = UpdateDeduplicator()
+
+        assert await dedup.is_duplicate(1) is False
+        assert await dedup.is_duplicate(1) is True
+        assert dedup.duplicates_local == 1
+
+    async def test_ring_buffer_bounded(self):
+        """The oldest update_ids are forgotten beyond capacity."""
+        dedup = UpdateDeduplicator(capacity=2)
+        for update_id in (1, 2, 3):
+            await dedup.is_duplicate(update_id)
+
+        assert await dedup.is_duplicate(1) is False
+        assert await dedup.is_duplicate(3) is True
+
+    async def test_redis_layer_shared_across_workers(self):
+        """A replay delivered to another worker is caught via Redis."""
+        redis = FakeRedis()
+        worker_a = UpdateDeduplicator(redis=redis, ttl=60)
+        worker_b = UpdateDeduplicator(redis=redis, ttl=60)
+
+        assert await worker_a.is_duplicate(42) is False
+        assert await worker_b.is_duplicate(42) is True
+        assert worker_b.duplicates_redis == 1
+        assert redis.keys == {"aurora:update:42": 60}
+
+    async def test_redis_failure_fails_open(self):
+        """If Redis errors, the update is processed."""
+        dedup = UpdateDeduplicator(redis=FakeRedis(fail=True))
+
+        assert await dedup.is_duplicate(7) is False
+
+    async def test_replay_dropped_before_rate_limit(self):
+        """The handler drops replays before touching the rate limiter."""
+        calls = []
+
+        class RecordingLimiter:
+            @staticmethod
+            async def check_rate_limit(user_id, action="chat"):
+                calls.append(user_id)
+                return False
+
+        async def reply_text(text, **kwargs):
+            return None
+
+        message = SimpleNamespace(text="hi", reply_text=reply_text)
+        update = SimpleNamespace(
+            update_id=5,
+            message=message,
+            effective_message=message,
+            effective_user=SimpleNamespace(id=1),
+            callback_query=None,
+        )
+        handler = TelegramWebhookHandler(services=WebhookServices(
+            rate_limiter=RecordingLimiter,
+            deduplicator=UpdateDeduplicator(),
+        ))
+
+        await handler.handle_update(update)
+        await handler.handle_update(update)
+
+        assert calls == [1]
@@ -0,0 +1,198 @@
+"""
+Unit tests for fast-path update parsing.
+
+These tests verify:
+- Text messages and callbacks become LiteUpdates with the right fields
+- Media, edits and other shapes fall back to telegram.Update
+- A LiteUpdate expands to the same Update as the full parser
+- The handler and dispatcher accept LiteUpdates
+- Button presses are dispatched to their module without intent detection
+"""
+
+import json
+from types import SimpleNamespace
+
+from telegram import Update
+
+from benchmarks.update_corpus import UPDATE_CORPUS
+from src.bot.fast_update import LiteUpdate, parse_lite, parse_update
+from src.bot.webhook import TelegramWebhookHandler, UserMailboxDispatcher, WebhookServices
+from src.core.callback_router import CallbackRouter
+from src.core.module_registry import ModuleRegistry
+from src.core.module_response import ModuleResponse
+from src.lib.encryption import HashService
+
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+def text_update(text: str = "Let's plan my day", update_id: int = 1) -> dict:
+    return {
+        "update_id": update_id,
+        "message": {
+            "message_id": 10,
+            "from": {"id": 7, "is_bot": False, "first_name": "A", "language_code": "de"},
+            "chat": {"id": 70, "type": "private"},
+            "date": 1760000000,
+            "text": text,
+        },
+    }
+
+
+class FakeBot:
+    """Records send_message calls."""
+
+    def __init__(self):
+        self.sent: list[tuple[int, str]] = []
+        self.answered: list[str] = []
+
+    async def send_message(self, chat_id, text, **kwargs):
+        self.sent.append((chat_id, text))
+
+    async def answer_callback_query(self, callback_query_id, text=None):
+        self.answered.append(callback_query_id)
+
+
+class AllowingLimiter:
+    @staticmethod
+    async def check_rate_limit(user_id, action="chat"):
+        return True
+
+
+# =============================================================================
+# TestParseUpdate
+# =============================================================================
+
+class TestParseUpdate:
+    """Test fast-path extraction and fallback."""
+
+    def test_text_message_fields(self):
+        """A text message yields a LiteUpdate with its fields."""
+        update = parse_update(json.dumps(text_update()).encode())
+
+        assert isinstance(update, LiteUpdate)
+        assert (update.update_id, update.user_id, update.chat_id) == (1, 7, 70)
+        assert update.text == "Let's plan my day"
+        assert update.language_code == "de"
+        assert update.callback_data is None
+        assert not update.is_callback
+
+    def test_callback_fields(self):
+        """A chat callback query yields its data and query ID."""
+        payload = {"update_id": 2, **UPDATE_CORPUS[8][0]}
+        update = parse_update(payload)
+
+        assert isinstance(update, LiteUpdate)
+        assert update.is_callback
+        assert update.callback_data == "segment_AD"
+        assert update.callback_query_id == "4382bfdwdsb323b2d9"
+        assert update.text is None
+
+    def test_corpus_routing(self):
+        """Every recorded shape takes the expected path."""
+        for i, (payload, fast) in enumerate(UPDATE_CORPUS):
+            update = parse_update({"update_id": i, **payload})
+            assert isinstance(update, LiteUpdate) is fast, payload
+            if not fast:
+                assert isinstance(update, Update)
+
+    def test_malformed_falls_back(self):
+        """Payloads missing required fields are left to the full parser."""
+        payload = text_update()
+        del payload["message"]["chat"]
+
+        assert parse_lite(payload) is None
+
+    def test_to_update_matches_full_parse(self):
+        """Expanding a LiteUpdate gives the same Update as de_json."""
+        payload = text_update()
+        full = parse_update(payload).to_update()
+
+        assert full == Update.de_json(payload, None)
+        assert full.effective_user.language_code == "de"
+
+
+# =============================================================================
+# TestLiteUpdateHandling
+# =============================================================================
+
+class TestLiteUpdateHandling:
+    """Test the handler and dispatcher with LiteUpdates."""
+
+    def test_mailbox_key(self):
+        """LiteUpdates go to their user's mailbox."""
+        assert UserMailboxDispatcher.mailbox_key(parse_update(text_update())) == 7
+
+    async def test_rate_limited_reply_sent_to_chat(self):
+        """The rate-limit reply goes to the update's chat via the bot."""
+        calls = []
+
+        class DenyingLimiter:
+            @staticmethod
+            async def check_rate_limit(user_id, action="chat"):
+                calls.append((user_id, action))
+                return False
+
+        bot = FakeBot()
+        handler = TelegramWebhookHandler(services=WebhookServices(
+            rate_limiter=DenyingLimiter,
+            hash_service=HashService(hash_salt=b"0" * 32),
+        ))
+
+        await handler.handle_update(parse_update(text_update(), bot))
+
+        assert calls == [(7, "chat")]
+        assert bot.sent[0][0] == 70
+
+    async def test_callback_dispatched_without_intent_detection(self):
+        """A module button press reaches the module; the NLI is not consulted."""
+        calls = []
+
+        class PlanningModule:
+            name = "planning"
+            intents = ["planning.start"]
+
+            async def handle(self, message, ctx):
+                calls.append((message, ctx.metadata["callback_args"]))
+                return ModuleResponse(text="Priority set")
+
+        class FailingRouter:
+            async def classify(self, text):
+                raise AssertionError("intent detection must be skipped")
+
+        router = CallbackRouter(store={})
+        router.register("planning", 1, ["pick_priority"])
+        registry = ModuleRegistry()
+        registry.register(PlanningModule())
+        handler = TelegramWebhookHandler(
+            nli_service=FailingRouter(),
+            services=WebhookServices(
+                rate_limiter=AllowingLimiter,
+                hash_service=HashService(hash_salt=b"0" * 32),
+                registry=registry,
+                callback_router=router,
+            ),
+        )
+
+        async def existing_user(telegram_id_hash):
+            return SimpleNamespace(id=1, language="en", working_style_code="AD")
+
+        handler._get_user_by_telegram_hash = existing_user
+        payload = {
+            "update_id": 3,
+            "callback_query": {
+                "id": "q1",
+                "from": {"id": 7, "is_bot": False, "first_name": "A"},
+                "message": text_update()["message"],
+                "chat_instance": "1",
+                "data": router.encode("planning", "pick_priority", 42),
+            },
+        }
+        bot = FakeBot()
+
+        await handler.handle_update(parse_update(payload, bot))
+
+        assert calls == [("pick_priority", (42,))]
+        assert bot.answered == ["q1"]
+        assert bot.sent == [(70, "Priority set")]
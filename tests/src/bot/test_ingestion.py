@@ -0,0 +1,230 @@
+"""
+Unit tests for the webhook ingestion server.
+
+These tests verify:
+- Updates are acknowledged before they are processed
+- A full queue rejects with 503 (backpressure) or sheds the oldest update
+- The Telegram secret token is enforced (also against non-ASCII headers),
+  and required outside dev mode
+- Queue metrics are served on /metrics of the internal listener only
+- serve_webhook hands updates to the dispatcher without waiting for them
+"""
+
+import asyncio
+import socket
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from src.bot import webhook
+from src.bot.ingestion import (
+    IngestionConfig,
+    IngestionConfigError,
+    OverflowPolicy,
+    WebhookIngestionServer,
+    serve_webhook,
+)
+from src.bot.webhook import UserMailboxDispatcher
+
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+class BlockingProcessor:
+    """Processor that holds every update until released."""
+
+    def __init__(self):
+        self.release = asyncio.Event()
+        self.started: list[int] = []
+        self.done: list[int] = []
+
+    async def __call__(self, payload):
+        self.started.append(payload["update_id"])
+        await self.release.wait()
+        self.done.append(payload["update_id"])
+
+
+def make_config(**overrides) -> IngestionConfig:
+    overrides.setdefault("port", 0)
+    overrides.setdefault("metrics_port", None)
+    return IngestionConfig(host="127.0.0.1", **overrides)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+async def make_server(monkeypatch):
+    """Start servers on a free port (dev mode) and stop them after the test."""
+    monkeypatch.setenv("AURORA_DEV_MODE", "1")
+    servers: list[WebhookIngestionServer] = []
+
+    async def _make(processor, **overrides):
+        server = WebhookIngestionServer(processor, make_config(**overrides))
+        await server.start()
+        servers.append(server)
+        return server
+
+    yield _make
+    for server in servers:
+        await server.stop(drain=False)
+
+
+def url(server: WebhookIngestionServer, path: str = "/telegram/webhook") -> str:
+    return f"http://127.0.0.1:{server.port}{path}"
+
+
+# =============================================================================
+# TestWebhookIngestion
+# =============================================================================
+
+class TestWebhookIngestion:
+    """Test ack-first ingestion with a bounded queue."""
+
+    async def test_ack_before_processing(self, make_server):
+        """The POST returns 200 while the update is still being processed."""
+        processor = BlockingProcessor()
+        server = await make_server(processor, workers=1)
+
+        async with httpx.AsyncClient() as client:
+            response = await client.post(url(server), json={"update_id": 1})
+
+        assert response.status_code == 200
+        assert processor.done == []
+
+        processor.release.set()
+        await server.stop()
+        assert processor.done == [1]
+        assert server.stats.processed == 1
+
+    async def test_full_queue_rejects_with_503(self, make_server):
+        """With the REJECT policy, a full queue answers 503 so Telegram retries."""
+        processor = BlockingProcessor()
+        server = await make_server(processor, workers=1, max_queue_size=1)
+
+        async with httpx.AsyncClient() as client:
+            codes = []
+            for update_id in range(3):
+                codes.append((await client.post(url(server), json={"update_id": update_id})).status_code)
+                await asyncio.sleep(0.01)
+
+        # 0 is being processed, 1 waits in the queue, 2 is rejected
+        assert codes == [200, 200, 503]
+        assert server.stats.rejected == 1
+        assert server.queue_depth == 1
+
+    async def test_shed_oldest_keeps_newest(self, make_server):
+        """With SHED_OLDEST, the oldest queued update is dropped."""
+        processor = BlockingProcessor()
+        server = await make_server(
+            processor, workers=1, max_queue_size=1, overflow_policy=OverflowPolicy.SHED_OLDEST
+        )
+
+        async with httpx.AsyncClient() as client:
+            for update_id in range(3):
+                response = await client.post(url(server), json={"update_id": update_id})
+                assert response.status_code == 200
+                await asyncio.sleep(0.01)
+
+        processor.release.set()
+        await server.stop()
+        assert processor.done == [0, 2]
+        assert server.stats.shed == 1
+
+    async def test_secret_token_required(self, make_server):
+        """Requests without the configured secret token are refused."""
+        server = await make_server(BlockingProcessor(), secret_token="s3cret")
+
+        async with httpx.AsyncClient() as client:
+            missing = await client.post(url(server), json={"update_id": 1})
+            valid = await client.post(
+                url(server),
+                json={"update_id": 2},
+                headers={"X-Telegram-Bot-Api-Secret-Token": "s3cret"},
+            )
+
+        assert missing.status_code == 401
+        assert valid.status_code == 200
+
+    async def test_non_ascii_secret_header_refused(self, make_server):
+        """A non-ASCII secret header is a 401, not a crashed connection."""
+        server = await make_server(BlockingProcessor(), secret_token="s3cret")
+
+        async with httpx.AsyncClient() as client:
+            response = await client.post(
+                url(server),
+                json={"update_id": 1},
+                headers={"X-Telegram-Bot-Api-Secret-Token": "s3crét".encode("latin-1")},
+            )
+
+        assert response.status_code == 401
+
+    async def test_secret_required_outside_dev_mode(self, monkeypatch):
+        """Without a secret token the server refuses to start unless in dev mode."""
+        monkeypatch.delenv("AURORA_DEV_MODE", raising=False)
+        monkeypatch.setenv("AURORA_WEBHOOK_SECRET", "")
+        server = WebhookIngestionServer(BlockingProcessor(), IngestionConfig.from_env())
+
+        with pytest.raises(IngestionConfigError):
+            await server.start()
+        assert server.port == IngestionConfig.port
+
+    async def test_metrics_endpoint(self, make_server):
+        """Queue metrics are exported on the internal listener, not the webhook port."""
+        server = await make_server(BlockingProcessor(), metrics_port=0)
+
+        async with httpx.AsyncClient() as client:
+            public = await client.get(url(server, "/metrics"))
+            response = await client.get(f"http://127.0.0.1:{server.metrics_port}/metrics")
+
+        assert public.status_code == 404
+        assert response.status_code == 200
+        assert "aurora_webhook_queue_depth" in response.text
+        assert "aurora_webhook_queue_wait_seconds" in response.text
+
+    async def test_serve_webhook_does_not_wait_on_handlers(self, monkeypatch):
+        """One worker keeps dispatching while an earlier update is still being handled."""
+        monkeypatch.setenv("AURORA_DEV_MODE", "1")
+        processor = BlockingProcessor()
+        dispatcher = UserMailboxDispatcher(lambda update: processor({"update_id": update.update_id}))
+        monkeypatch.setattr(webhook, "_dispatcher", dispatcher)
+        shutdowns: list[int] = []
+
+        async def initialize():
+            pass
+
+        async def shutdown():
+            shutdowns.append(1)
+
+        application = SimpleNamespace(
+            bot=None, post_init=None, post_shutdown=None, initialize=initialize, shutdown=shutdown
+        )
+        config = make_config(port=free_port(), workers=1)
+        task = asyncio.create_task(serve_webhook(application, config))
+
+        try:
+            async with httpx.AsyncClient() as client:
+                for _ in range(50):
+                    try:
+                        await client.post(f"http://127.0.0.1:{config.port}{config.path}", json={"update_id": 1})
+                        break
+                    except httpx.ConnectError:
+                        await asyncio.sleep(0.01)
+                await client.post(f"http://127.0.0.1:{config.port}{config.path}", json={"update_id": 2})
+            await asyncio.sleep(0.05)
+
+            # Update 1 is being handled, update 2 already waits in its mailbox
+            assert processor.started == [1]
+            assert dispatcher.pending_updates == 1
+        finally:
+            processor.release.set()
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        assert processor.done == [1, 2]
+        assert shutdowns == [1]
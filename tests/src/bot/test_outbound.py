@@ -0,0 +1,149 @@
+"""
+Unit tests for the outbound send scheduler.
+
+These tests verify:
+- Higher priority classes are sent first
+- Per-chat buckets space messages to one chat without blocking others
+- 429 RetryAfter pauses the chat and retries afterwards
+- Permanent errors fail without retrying
+- stop() gives up after the drain timeout or a dead scheduler, failing the rest
+"""
+
+import asyncio
+
+from telegram.error import BadRequest, RetryAfter
+
+from src.bot.outbound import OutboundSender, SendPriority, TokenBucket
+
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+class RecordingAPI:
+    """Fake send function recording (chat_id, text, time)."""
+
+    def __init__(self, errors=None):
+        self.sent: list[tuple[int, str, float]] = []
+        self.errors = list(errors or [])
+
+    async def __call__(self, chat_id, text, options):
+        if self.errors:
+            raise self.errors.pop(0)
+        self.sent.append((chat_id, text, asyncio.get_running_loop().time()))
+
+
+# =============================================================================
+# TestTokenBucket
+# =============================================================================
+
+class TestTokenBucket:
+    """Test token bucket refill and blocking."""
+
+    def test_refill_and_delay(self):
+        """An empty bucket reports the time until the next token."""
+        bucket = TokenBucket(rate=2.0, capacity=1, now=0.0)
+
+        assert bucket.delay(0.0) == 0.0
+        bucket.consume()
+        assert bucket.delay(0.0) == 0.5
+        assert bucket.delay(0.5) == 0.0
+
+    def test_block(self):
+        """A blocked bucket waits until the block ends."""
+        bucket = TokenBucket(rate=1.0, capacity=1, now=0.0)
+        bucket.block(3.0)
+
+        assert bucket.delay(1.0) == 2.0
+
+
+# =============================================================================
+# TestOutboundSender
+# =============================================================================
+
+class TestOutboundSender:
+    """Test scheduling, priorities and retries."""
+
+    async def test_priority_order(self):
+        """Crisis messages overtake queued proactive ones."""
+        api = RecordingAPI()
+        sender = OutboundSender(api, global_rate=100, per_chat_rate=100, max_in_flight=1)
+
+        futures = [sender.enqueue(i, f"proactive{i}", SendPriority.PROACTIVE) for i in range(3)]
+        futures.append(sender.enqueue(99, "crisis", SendPriority.CRISIS))
+        await sender.start()
+        await asyncio.gather(*futures)
+        await sender.stop()
+
+        assert api.sent[0][1] == "crisis"
+
+    async def test_per_chat_spacing(self):
+        """A busy chat is paced while other chats keep flowing."""
+        api = RecordingAPI()
+        sender = OutboundSender(api, global_rate=1000, per_chat_rate=20, per_chat_burst=1)
+        await sender.start()
+
+        futures = [sender.enqueue(1, f"a{i}") for i in range(3)]
+        futures.append(sender.enqueue(2, "b0"))
+        await asyncio.gather(*futures)
+        await sender.stop()
+
+        chat1 = [t for chat, _, t in api.sent if chat == 1]
+        assert chat1[1] - chat1[0] >= 0.045
+        assert chat1[2] - chat1[1] >= 0.045
+        assert [text for _, text, _ in api.sent].index("b0") < 2
+
+    async def test_retry_after_honored(self):
+        """After a 429, the message is resent once retry_after has passed."""
+        api = RecordingAPI(errors=[RetryAfter(0.05)])
+        sender = OutboundSender(api, global_rate=1000, per_chat_rate=1000)
+        await sender.start()
+
+        start = asyncio.get_running_loop().time()
+        assert await sender.enqueue(1, "hello") is True
+        await sender.stop()
+
+        assert api.sent[0][2] - start >= 0.05
+        assert sender.stats.rate_limited == 1
+        assert sender.stats.retried == 1
+
+    async def test_permanent_error_not_retried(self):
+        """BadRequest fails the message immediately."""
+        api = RecordingAPI(errors=[BadRequest("chat not found")])
+        sender = OutboundSender(api, global_rate=1000, per_chat_rate=1000)
+        await sender.start()
+
+        assert await sender.enqueue(1, "hello") is False
+        await sender.stop()
+
+        assert sender.stats.failed == 1
+        assert sender.stats.retried == 0
+
+    async def test_stop_with_dead_scheduler(self):
+        """A crashed scheduler does not hang stop(); queued messages fail."""
+        class CrashingSender(OutboundSender):
+            async def _run(self):
+                raise RuntimeError("scheduler bug")
+
+        sender = CrashingSender(RecordingAPI())
+        await sender.start()
+        future = sender.enqueue(1, "hello")
+
+        await asyncio.wait_for(sender.stop(), 1)
+
+        assert await future is False
+        assert sender.pending == 0
+
+    async def test_stop_drain_timeout(self):
+        """A send that never returns is cancelled after the drain timeout."""
+        async def hanging(chat_id, text, options):
+            await asyncio.Event().wait()
+
+        sender = OutboundSender(hanging, global_rate=1000, per_chat_rate=1000)
+        await sender.start()
+        futures = [sender.enqueue(1, "a"), sender.enqueue(2, "b")]
+        await asyncio.sleep(0.01)
+
+        await asyncio.wait_for(sender.stop(drain_timeout=0.05), 1)
+
+        assert await asyncio.gather(*futures) == [False, False]
@@ -0,0 +1,447 @@
+"""
+Unit tests for the webhook update dispatcher.
+
+These tests verify:
+- Updates of one user are handled strictly in order
+- Different users are handled concurrently, up to the cap
+- Mailboxes are reclaimed once drained
+- A failing update does not block the user's later updates
+- The application-scoped handler keeps state and awaits the rate limiter
+- Startup keeps energy baselines and masking aggregates in Redis and
+  schedules the baselines' reconciliation
+- Startup runs the event scheduler until shutdown; due events are sent
+- Startup installs the daily graph checkpointer and purges it nightly
+- Startup shares pre-rendered mornings through Redis and renders them nightly
+- Routed messages keep the user scheduled and re-score interval check-ins
+- AuDHD users' messages update their channel dominance scores once each
+- The application routes inline button presses to the handler
+- Services built while the handler runs batch their writes, flushed on shutdown
+- Shutdown disposes the shared database engine
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from telegram.ext import CallbackQueryHandler
+
+from src.bot import outbound, webhook
+from src.bot.outbound import SendPriority
+from src.bot.webhook import TelegramWebhookHandler, UserMailboxDispatcher, WebhookServices
+from src.lib.encryption import HashService
+from src.models import database
+from src.models.base import Base
+from src.models.neurostate import MaskingLog
+from src.services.effectiveness import EffectivenessService
+from src.services.neurostate import channel_scores, energy_baseline, masking_aggregate
+from src.services.neurostate.energy import EnergyPredictor
+from src.services.neurostate.masking import MaskingLoadTracker
+from src.services.neurostate.masking_aggregate import MaskingLoadStore
+from src.services.neurostate.sensory import SensoryStateAssessment
+from src.services.write_behind import current_write_behind_buffer
+from src.workflows import checkpoint, prerender, scheduler
+from src.workflows.daily_workflow import MIDDAY_CHECKIN_TEXT
+
+NOW = datetime(2026, 6, 8, 12, 0, tzinfo=timezone.utc)
+
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+def make_update(user_id: int, update_id: int) -> SimpleNamespace:
+    """Minimal stand-in for telegram.Update."""
+    return SimpleNamespace(
+        update_id=update_id,
+        effective_user=SimpleNamespace(id=user_id),
+        effective_chat=None,
+    )
+
+
+class FakeRateLimiter:
+    """Async rate limiter stub that records calls."""
+
+    def __init__(self, allowed: bool = True):
+        self.allowed = allowed
+        self.calls: list[tuple[int, str]] = []
+
+    async def check_rate_limit(self, user_id, action="chat"):
+        self.calls.append((user_id, action))
+        return self.allowed
+
+
+def make_message_update(user_id: int, text: str, replies: list[str]) -> SimpleNamespace:
+    """Text update whose replies are collected in `replies`."""
+    async def reply_text(text, **kwargs):
+        replies.append(text)
+
+    message = SimpleNamespace(text=text, reply_text=reply_text, chat_id=user_id)
+    return SimpleNamespace(
+        update_id=0,
+        message=message,
+        effective_message=message,
+        effective_user=SimpleNamespace(id=user_id, language_code="en", first_name="A"),
+        effective_chat=SimpleNamespace(id=user_id),
+        callback_query=None,
+    )
+
+
+class FakeRedisService:
+    """RedisService stub handing out a fixed client."""
+
+    client = None  # Nothing to close on shutdown
+
+    def __init__(self, redis_client=None):
+        self.redis_client = redis_client
+
+    async def get_client(self):
+        return self.redis_client
+
+
+class FakeSender:
+    """Outbound sender stub that records enqueued messages."""
+
+    def __init__(self):
+        self.sent: list[tuple[int, str, SendPriority]] = []
+
+    def enqueue(self, chat_id, text, priority=SendPriority.RESPONSE, **kwargs):
+        self.sent.append((chat_id, text, priority))
+
+
+def make_started_services(redis_client=None, **kwargs) -> WebhookServices:
+    """Services for startup() that need no Telegram, database or keys."""
+    kwargs.setdefault("event_scheduler", scheduler.DailyEventScheduler())
+    return WebhookServices(
+        redis=FakeRedisService(redis_client),
+        encryption=object(),
+        hash_service=HashService(hash_salt=b"0" * 32),
+        intent_router=object(),
+        **kwargs,
+    )
+
+
+def make_handler(rate_limiter) -> TelegramWebhookHandler:
+    return TelegramWebhookHandler(services=WebhookServices(
+        rate_limiter=rate_limiter,
+        hash_service=HashService(hash_salt=b"0" * 32),
+    ))
+
+
+# =============================================================================
+# TestTelegramWebhookHandler
+# =============================================================================
+
+class TestTelegramWebhookHandler:
+    """Test the application-scoped webhook handler."""
+
+    async def test_rate_limit_checked_with_chat_tier(self):
+        """The rate limiter is awaited with the chat tier and blocks when exceeded."""
+        limiter = FakeRateLimiter(allowed=False)
+        replies: list[str] = []
+
+        await make_handler(limiter).handle_update(make_message_update(7, "hi", replies))
+
+        assert limiter.calls == [(7, "chat")]
+        assert len(replies) == 1
+        assert "too quickly" in replies[0]
+
+    async def test_onboarding_state_survives_between_updates(self):
+        """One handler serves all updates, so onboarding is not restarted."""
+        handler = make_handler(FakeRateLimiter())
+        replies: list[str] = []
+
+        await handler.handle_update(make_message_update(7, "hi", replies))
+        user_hash = handler._services.hash_service.hash_pii("7")
+        state = await handler._onboarding_flow.get_state(user_hash)
+        await handler.handle_update(make_message_update(7, "hi", replies))
+
+        assert state is not None
+        assert await handler._onboarding_flow.get_state(user_hash) is not None
+
+    async def test_startup_wires_energy_baselines(self, monkeypatch, fake_redis):
+        """Baseline and masking stores get the Redis client; reconciliation runs nightly."""
+        monkeypatch.setattr(energy_baseline, "_baseline_store", None)
+        monkeypatch.setattr(masking_aggregate, "_masking_store", None)
+        monkeypatch.setattr(scheduler, "_event_scheduler", None)
+        monkeypatch.setattr(prerender, "_morning_store", None)
+        handler = TelegramWebhookHandler(services=make_started_services(fake_redis))
+
+        await handler.startup()
+        await handler.shutdown()
+
+        assert energy_baseline.get_energy_baseline_store()._redis is fake_redis
+        assert masking_aggregate.get_masking_load_store()._redis is fake_redis
+        assert "reconcile_energy_baselines" in scheduler.get_event_scheduler()._jobs
+
+    async def test_scheduler_loop_runs_until_shutdown(self, monkeypatch, fake_redis):
+        """Startup installs a Redis-backed scheduler and polls it until shutdown."""
+        monkeypatch.setattr(energy_baseline, "_baseline_store", None)
+        monkeypatch.setattr(masking_aggregate, "_masking_store", None)
+        monkeypatch.setattr(scheduler, "_event_scheduler", None)
+        monkeypatch.setattr(prerender, "_morning_store", None)
+        handler = TelegramWebhookHandler(services=make_started_services(fake_redis, event_scheduler=None))
+
+        await handler.startup()
+        event_scheduler = scheduler.get_event_scheduler()
+        task = handler._scheduler_task
+        await asyncio.sleep(0)
+        await handler.shutdown()
+
+        assert event_scheduler._redis is not None
+        assert task.cancelled()
+        assert handler._scheduler_task is None
+
+    async def test_checkpointer_installed_until_shutdown(self, monkeypatch):
+        """Without Redis, runs are checkpointed in memory, purged nightly and released at shutdown."""
+        monkeypatch.setattr(energy_baseline, "_baseline_store", None)
+        monkeypatch.setattr(masking_aggregate, "_masking_store", None)
+        monkeypatch.setattr(scheduler, "_event_scheduler", None)
+        monkeypatch.setattr(prerender, "_morning_store", None)
+        monkeypatch.setattr(checkpoint, "_daily_checkpointer", None)
+        handler = TelegramWebhookHandler(services=make_started_services())
+
+        await handler.startup()
+        saver = checkpoint.get_daily_checkpointer()
+        jobs = scheduler.get_event_scheduler()._jobs
+        await handler.shutdown()
+
+        assert isinstance(saver, checkpoint.DailyGraphCheckpointer)
+        assert jobs["purge_checkpoint_memory"][0] == saver.purge_memory
+        assert checkpoint.get_daily_checkpointer() is None
+
+    async def test_startup_schedules_morning_prerender(self, monkeypatch, fake_redis):
+        """Pre-rendered mornings go to Redis; the pre-render runs nightly."""
+        monkeypatch.setattr(energy_baseline, "_baseline_store", None)
+        monkeypatch.setattr(masking_aggregate, "_masking_store", None)
+        monkeypatch.setattr(scheduler, "_event_scheduler", None)
+        monkeypatch.setattr(prerender, "_morning_store", None)
+        handler = TelegramWebhookHandler(services=make_started_services(fake_redis))
+
+        await handler.startup()
+        await handler.shutdown()
+
+        assert prerender.get_morning_store()._redis is fake_redis
+        jobs = scheduler.get_event_scheduler()._jobs
+        assert jobs["prerender_mornings"][0] is prerender.prerender_upcoming_mornings
+
+    async def test_due_events_sent_as_scheduled_messages(self, monkeypatch):
+        """Due events are rendered by the Daily Workflow and queued for the user's chat."""
+        sender = FakeSender()
+        monkeypatch.setattr(outbound, "_outbound_sender", sender)
+        handler = make_handler(FakeRateLimiter())
+        event = scheduler.DueEvent(
+            user_id=7,
+            kind=scheduler.ScheduledEventKind.MIDDAY,
+            due_at=NOW.timestamp(),
+            fired_at=NOW.timestamp(),
+            segment_code="AD",
+            timezone="Europe/Berlin",
+        )
+
+        await handler._handle_due_events([event])
+
+        assert sender.sent == [(7, MIDDAY_CHECKIN_TEXT, SendPriority.SCHEDULED)]
+
+    async def test_messages_schedule_user_and_record_interaction(self, monkeypatch):
+        """Each routed message keeps the user scheduled and re-scores the check-in."""
+        class RecordingScheduler(scheduler.DailyEventScheduler):
+            interactions: list[tuple[int, datetime]] = []
+
+            async def record_interaction(self, user_id, last_interaction_at):
+                self.interactions.append((user_id, last_interaction_at))
+                return await super().record_interaction(user_id, last_interaction_at)
+
+        event_scheduler = RecordingScheduler()
+        monkeypatch.setattr(scheduler, "_event_scheduler", event_scheduler)
+        intent_router = SimpleNamespace(
+            classify=lambda text: asyncio.sleep(0, SimpleNamespace(intent=None, source="regex")),
+            needs_clarification=lambda match: True,
+        )
+        handler = TelegramWebhookHandler(nli_service=intent_router)
+        record = SimpleNamespace(id=1, working_style_code="AD", timezone="UTC", language="en")
+        replies: list[str] = []
+
+        async def reply(text):
+            replies.append(text)
+
+        await handler._route_text("hi", 7, 7, "en", reply, record)
+
+        assert event_scheduler._profiles[7] == ("AD", "UTC")
+        assert event_scheduler._wheel.remove("7:morning")
+        assert [user_id for user_id, _ in event_scheduler.interactions] == [7]
+        assert len(replies) == 1
+
+    async def test_audhd_messages_observed_for_channels(self, monkeypatch):
+        """Each AuDHD message updates the channel scores once; other segments are skipped."""
+        store = channel_scores.ChannelScoreStore()
+        monkeypatch.setattr(channel_scores, "_channel_store", store)
+        monkeypatch.setattr(scheduler, "_event_scheduler", scheduler.DailyEventScheduler())
+        intent_router = SimpleNamespace(
+            classify=lambda text: asyncio.sleep(0, SimpleNamespace(intent=None, source="regex")),
+            needs_clarification=lambda match: True,
+        )
+        handler = TelegramWebhookHandler(nli_service=intent_router)
+
+        async def reply(text):
+            pass
+
+        audhd = SimpleNamespace(id=1, working_style_code="AH", timezone="UTC", language="en")
+        adhd = SimpleNamespace(id=2, working_style_code="AD", timezone="UTC", language="en")
+        await handler._route_text("new idea", 7, 7, "en", reply, audhd)
+        await handler._route_text("new idea", 8, 8, "en", reply, adhd)
+
+        scores = await store.get(1)
+        assert scores is not None
+        assert sum(scores.hits.values()) == 2
+        assert await store.get(2) is None
+
+    def test_app_routes_button_presses(self, monkeypatch):
+        """create_app() hands callback queries to the webhook handler."""
+        monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "123:test")
+        monkeypatch.setattr(webhook, "_webhook_handler", None)
+
+        application = webhook.create_app(make_started_services())
+
+        assert any(
+            isinstance(handler, CallbackQueryHandler) and handler.callback is webhook.webhook_handler
+            for handler in application.handlers[0]
+        )
+
+    async def test_write_behind_flushed_on_shutdown(self, monkeypatch):
+        """Services built while running share the buffer; it is flushed once at shutdown."""
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all, tables=[MaskingLog.__table__])
+        commits: list[int] = []
+        event.listens_for(engine.sync_engine, "commit")(lambda *args: commits.append(1))
+        factory = async_sessionmaker(engine, expire_on_commit=False)
+
+        monkeypatch.setattr(energy_baseline, "_baseline_store", None)
+        monkeypatch.setattr(masking_aggregate, "_masking_store", None)
+        monkeypatch.setattr(scheduler, "_event_scheduler", None)
+        monkeypatch.setattr(prerender, "_morning_store", None)
+        handler = TelegramWebhookHandler(services=make_started_services(session_factory=factory))
+        await handler.startup()
+        buffer = current_write_behind_buffer()
+        buffer._flush_interval = 60  # Only the shutdown flush
+
+        async with factory() as session:
+            services = [
+                MaskingLoadTracker(session, load_store=MaskingLoadStore()),
+                SensoryStateAssessment(session),
+                EnergyPredictor(session, baseline_store=energy_baseline.EnergyBaselineStore()),
+                EffectivenessService(session),
+            ]
+            writer = services[0]._writer
+            for context in ("work", "social", "work"):
+                await writer.insert(MaskingLog.__table__, {
+                    "user_id": 7, "context": context, "masking_type": "social_scripting",
+                    "load_score": 20.0, "duration_minutes": None, "notes": None,
+                    "logged_at": NOW, "created_at": NOW,
+                })
+        commits.clear()
+        await handler.shutdown()
+
+        async with factory() as session:
+            rows = await session.scalar(select(func.count()).select_from(MaskingLog.__table__))
+        await engine.dispose()
+        assert all(service._writer is buffer for service in services)
+        assert rows == 3
+        assert commits == [1]
+        assert current_write_behind_buffer() is None
+
+    async def test_shutdown_disposes_engine(self, monkeypatch):
+        """The shared engine's pool is closed and forgotten at shutdown."""
+        disposed: list[bool] = []
+
+        async def dispose() -> None:
+            disposed.append(True)
+
+        monkeypatch.setattr(database, "_engine", SimpleNamespace(dispose=dispose))
+        monkeypatch.setattr(database, "_session_factory", object())
+        monkeypatch.setattr(energy_baseline, "_baseline_store", None)
+        monkeypatch.setattr(masking_aggregate, "_masking_store", None)
+        monkeypatch.setattr(scheduler, "_event_scheduler", None)
+        monkeypatch.setattr(prerender, "_morning_store", None)
+        handler = TelegramWebhookHandler(services=make_started_services())
+
+        await handler.startup()
+        await handler.shutdown()
+
+        assert disposed == [True]
+        assert database._engine is None
+        assert database._session_factory is None
+
+
+# =============================================================================
+# TestUserMailboxDispatcher
+# =============================================================================
+
+class TestUserMailboxDispatcher:
+    """Test per-user ordering and cross-user concurrency."""
+
+    async def test_per_user_order(self):
+        """One user's updates are handled one at a time, in order."""
+        handled: list[int] = []
+        in_flight = 0
+
+        async def handler(update):
+            nonlocal in_flight
+            in_flight += 1
+            assert in_flight == 1
+            await asyncio.sleep(0.001 * (5 - update.update_id))
+            handled.append(update.update_id)
+            in_flight -= 1
+
+        dispatcher = UserMailboxDispatcher(handler)
+        futures = [dispatcher.submit(make_update(1, i)) for i in range(5)]
+        await asyncio.gather(*futures)
+
+        assert handled == [0, 1, 2, 3, 4]
+
+    async def test_users_run_concurrently_up_to_cap(self):
+        """Different users overlap, but never more than max_concurrency."""
+        running = 0
+        peak = 0
+
+        async def handler(update):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        dispatcher = UserMailboxDispatcher(handler, max_concurrency=3)
+        futures = [dispatcher.submit(make_update(user, 0)) for user in range(10)]
+        await asyncio.gather(*futures)
+
+        assert peak == 3
+
+    async def test_mailboxes_reclaimed_when_drained(self):
+        """No mailbox remains once all updates are handled."""
+        async def handler(update):
+            await asyncio.sleep(0)
+
+        dispatcher = UserMailboxDispatcher(handler)
+        for user in range(20):
+            dispatcher.submit(make_update(user, 0))
+
+        assert dispatcher.active_mailboxes == 20
+        await dispatcher.join()
+        assert dispatcher.active_mailboxes == 0
+        assert dispatcher.pending_updates == 0
+
+    async def test_failure_does_not_block_user(self):
+        """A failing update resolves False and later updates still run."""
+        async def handler(update):
+            if update.update_id == 0:
+                raise RuntimeError("boom")
+
+        dispatcher = UserMailboxDispatcher(handler)
+        first = dispatcher.submit(make_update(1, 0))
+        second = dispatcher.submit(make_update(1, 1))
+
+        assert await first is False
+        assert await second is True
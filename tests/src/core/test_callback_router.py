@@ -0,0 +1,280 @@
+"""
+Unit tests for the callback router.
+
+These tests verify:
+- Payloads round-trip through callback_data within 64 bytes
+- Oversized payloads are stored under a token and expire
+- Tokens live in Redis, written without blocking the event loop; a failed
+  token write is an error, not a dead button
+- Foreign and malformed callback_data is ignored
+- Module IDs cannot be reused
+- Presses are dispatched to the owning module without intent detection
+"""
+
+import json
+
+import pytest
+
+from src.core.buttons import Button
+from src.core.callback_router import (
+    CALLBACK_DATA_LIMIT,
+    CallbackAction,
+    CallbackRouter,
+    CallbackTokenError,
+    RedisCallbackStore,
+    pack_payload,
+    unpack_payload,
+)
+from src.core.module_registry import ModuleRegistry
+from src.core.module_response import ModuleResponse
+from src.core.segment_context import SegmentContext
+from src.core.module_context import ModuleContext
+
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+class DictStore:
+    """TTL store stand-in (expiry simulated by deleting keys)."""
+
+    def __init__(self):
+        self.data: dict[str, bytes] = {}
+        self.ttls: dict[str, int] = {}
+
+    def set(self, key, value, ttl=None):
+        self.data[key] = value
+        self.ttls[key] = ttl
+        return True
+
+    async def get(self, key):
+        return self.data.get(key)
+
+
+class LocalStore(DictStore):
+    """State store stand-in for RedisCallbackStore's fallback (sync API)."""
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def delete(self, key):
+        return self.data.pop(key, None) is not None
+
+
+class FakeRedisService:
+    """RedisService stand-in (available=False: no Redis)."""
+
+    def __init__(self, available: bool = True):
+        self.available = available
+        self.data: dict[str, str] = {}
+        self.sync_calls = 0
+
+    async def set(self, key, value, ttl=None):
+        if not self.available:
+            return False
+        self.data[key] = json.dumps(value)
+        return True
+
+    async def get(self, key):
+        return self.data.get(key) if self.available else None
+
+    def set_sync(self, key, value, ttl=None):
+        self.sync_calls += 1
+        if not self.available:
+            return False
+        self.data[key] = json.dumps(value)
+        return True
+
+
+class FullStore(LocalStore):
+    """TTL store that rejects every write (full)."""
+
+    def set(self, key, value, ttl=None):
+        return False
+
+
+class RecordingModule:
+    """Module stub recording handle/on_enter calls."""
+
+    name = "planning"
+    intents = ["planning.start"]
+    pillar = "vision_to_task"
+
+    def __init__(self):
+        self.calls: list[tuple[str, tuple]] = []
+
+    async def handle(self, message, ctx):
+        self.calls.append((message, ctx.metadata["callback_args"]))
+        return ModuleResponse(text=f"handled {message}")
+
+    async def on_enter(self, ctx):
+        self.calls.append(("enter", ctx.metadata["callback_args"]))
+        return ModuleResponse(text="entered")
+
+
+def make_router(store=None) -> CallbackRouter:
+    router = CallbackRouter(store=store or DictStore())
+    router.register("planning", 1, ["pick_priority", "snooze"])
+    return router
+
+
+def make_ctx() -> ModuleContext:
+    return ModuleContext(
+        user_id=1,
+        segment_context=SegmentContext.from_code("AD"),
+        state="idle",
+        session_id="s",
+        language="en",
+        module_name="planning",
+    )
+
+
+# =============================================================================
+# TestCodec
+# =============================================================================
+
+class TestCodec:
+    """Test the binary payload codec."""
+
+    def test_pack_roundtrip(self):
+        """Ints (incl. negative and large) and strings round-trip."""
+        args = (0, 1, -1, 300, -70000, 2**40, "", "täsk")
+        assert unpack_payload(pack_payload(3, 7, args)) == (3, 7, args)
+
+    def test_small_payload_is_compact(self):
+        """Module, action and a task ID fit in a few bytes."""
+        assert len(pack_payload(1, 2, (12345,))) == 5
+
+    def test_truncated_payload_rejected(self):
+        """A truncated string argument raises ValueError."""
+        data = pack_payload(1, 1, ("hello",))[:-2]
+        with pytest.raises(ValueError):
+            unpack_payload(data)
+
+    def test_unsupported_arg_type(self):
+        """Only int and str arguments are accepted."""
+        with pytest.raises(TypeError):
+            pack_payload(1, 1, (1.5,))
+
+
+# =============================================================================
+# TestCallbackRouter
+# =============================================================================
+
+class TestCallbackRouter:
+    """Test encoding, decoding and dispatch."""
+
+    async def test_encode_decode_inline(self):
+        """Small payloads travel inline in callback_data."""
+        router = make_router()
+        data = router.encode("planning", "pick_priority", 42, "today")
+
+        assert data.startswith("~")
+        assert len(data.encode()) <= CALLBACK_DATA_LIMIT
+        assert await router.decode(data) == CallbackAction("planning", "pick_priority", (42, "today"))
+
+    async def test_oversized_payload_uses_token(self):
+        """Payloads over 64 bytes are stored server-side under a token."""
+        store = DictStore()
+        router = make_router(store)
+        data = router.encode("planning", "snooze", "x" * 100)
+
+        assert data.startswith("#")
+        assert len(data.encode()) <= CALLBACK_DATA_LIMIT
+        assert list(store.ttls.values()) == [CallbackRouter.TOKEN_TTL]
+        assert (await router.decode(data)).args == ("x" * 100,)
+
+    async def test_expired_token(self):
+        """A token whose payload expired decodes to None."""
+        store = DictStore()
+        router = make_router(store)
+        data = router.encode("planning", "snooze", "x" * 100)
+        store.data.clear()
+
+        assert await router.decode(data) is None
+
+    async def test_tokens_in_redis_shared_across_routers(self):
+        """A token written by one worker decodes in another (same Redis)."""
+        redis = FakeRedisService()
+        store = RedisCallbackStore(redis, fallback=LocalStore())
+        data = make_router(store).encode("planning", "snooze", "x" * 100)
+        await store.flush()
+
+        other = make_router(RedisCallbackStore(redis, fallback=LocalStore()))
+
+        assert (await other.decode(data)).args == ("x" * 100,)
+        assert store._local().data == {}  # Local copy dropped once in Redis
+        assert redis.sync_calls == 0  # Never blocks the event loop
+
+    async def test_redis_unavailable_falls_back_locally(self):
+        """Without Redis the payload is kept in the local store."""
+        fallback = LocalStore()
+        store = RedisCallbackStore(FakeRedisService(available=False), fallback=fallback)
+        router = make_router(store)
+
+        data = router.encode("planning", "snooze", "x" * 100)
+        await store.flush()
+
+        assert len(fallback.data) == 1
+        assert (await router.decode(data)).args == ("x" * 100,)
+
+    def test_sync_write_outside_event_loop(self):
+        """Without a running loop the payload is written through the sync client."""
+        redis = FakeRedisService()
+        fallback = LocalStore()
+
+        make_router(RedisCallbackStore(redis, fallback=fallback)).encode("planning", "snooze", "x" * 100)
+
+        assert (redis.sync_calls, len(redis.data), fallback.data) == (1, 1, {})
+
+    def test_failed_token_write_raises(self):
+        """A token whose payload was not stored is never emitted."""
+        router = make_router(RedisCallbackStore(FakeRedisService(available=False), fallback=FullStore()))
+
+        with pytest.raises(CallbackTokenError):
+            router.encode("planning", "snooze", "x" * 100)
+
+    async def test_foreign_and_malformed_data_ignored(self):
+        """Legacy strings, bad base64 and unknown IDs decode to None."""
+        router = make_router()
+
+        assert await router.decode("lang_en") is None
+        assert await router.decode("~!!!") is None
+        assert await router.decode("~" + "AQk") is None  # action 9 not registered
+        assert await router.decode(None) is None
+
+    def test_module_id_not_reused(self):
+        """A module ID belongs to one module."""
+        router = make_router()
+        with pytest.raises(ValueError):
+            router.register("review", 1)
+
+    async def test_button_action(self, monkeypatch):
+        """Button.action encodes through the global router."""
+        import src.core.callback_router as callback_router
+
+        router = make_router()
+        monkeypatch.setattr(callback_router, "_callback_router", router)
+        button = Button.action("Do it", "planning", "pick_priority", 5)
+
+        assert (await router.decode(button.callback_data)).args == (5,)
+
+    def test_inline_button_limit(self):
+        """Raw callback_data over 64 bytes is rejected."""
+        with pytest.raises(ValueError):
+            Button.inline("Too long", "x" * 65)
+
+    async def test_dispatch_to_module(self):
+        """Actions go to handle(), the enter action to on_enter()."""
+        router = make_router()
+        registry = ModuleRegistry()
+        module = RecordingModule()
+        registry.register(module)
+
+        response = await router.dispatch(
+            await router.decode(router.encode("planning", "pick_priority", 42)), make_ctx(), registry
+        )
+        await router.dispatch(await router.decode(router.encode("planning", "enter")), make_ctx(), registry)
+
+        assert response.text == "handled pick_priority"
+        assert module.calls == [("pick_priority", (42,)), ("enter", ())]
@@ -0,0 +1,226 @@
+"""
+Unit tests for the Intent Router.
+
+These tests verify:
+- The compiled fast path against a labelled corpus (confusion matrix)
+- The LLM fallback is only called on a fast-path miss
+- Fallback results are cached by normalized text
+- Waiters on a shared LLM call are released if the caller is cancelled
+- Router intents are restricted to registered modules and follow registry changes
+- classify() normalizes the message once
+"""
+
+import asyncio
+from collections import Counter
+
+import pytest
+
+from benchmarks.intent_corpus import INTENT_CORPUS
+from src.core.intent_router import (
+    HaikuIntentClassifier,
+    IntentCache,
+    IntentRouter,
+    build_intent_router,
+    normalize_text,
+)
+from src.core.module_registry import ModuleRegistry
+from src.modules import register_builtin_modules
+
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+class FakeLLM:
+    """Async LLM fallback stub that records its calls."""
+
+    def __init__(self, result=("review.start", 0.9)):
+        self.result = result
+        self.calls: list[str] = []
+
+    async def __call__(self, text, intents):
+        self.calls.append(text)
+        return self.result
+
+
+@pytest.fixture
+def router():
+    """Router over the default patterns, without LLM fallback."""
+    return IntentRouter()
+
+
+# =============================================================================
+# TestFastPath
+# =============================================================================
+
+class TestFastPath:
+    """Test the compiled regex fast path."""
+
+    def test_confusion_matrix(self, router):
+        """Every corpus message maps to its labelled intent (no confusions)."""
+        confusion: Counter = Counter()
+        for text, expected in INTENT_CORPUS:
+            confusion[(expected, router.match_fast_path(text).intent)] += 1
+
+        errors = {pair: n for pair, n in confusion.items() if pair[0] != pair[1]}
+        assert errors == {}
+
+    def test_slash_command_has_full_confidence(self, router):
+        """Slash command aliases route with confidence 1.0."""
+        match = router.match_fast_path("/review")
+
+        assert match.intent == "review.start"
+        assert match.confidence == 1.0
+        assert match.source == "regex"
+
+    async def test_classify_normalizes_once(self, router, monkeypatch):
+        """The fast path reuses the text classify() already normalized."""
+        from src.core import intent_router
+
+        calls: list[str] = []
+
+        def counting_normalize(text):
+            calls.append(text)
+            return normalize_text(text)
+
+        monkeypatch.setattr(intent_router, "normalize_text", counting_normalize)
+
+        match = await router.classify("  Let's PLAN my day ")
+
+        assert match.intent == "planning.start"
+        assert calls == ["  Let's PLAN my day "]
+
+    def test_normalization(self):
+        """Normalization casefolds, NFKC-normalizes and collapses whitespace."""
+        assert normalize_text("  Plan   MY\tＤay ") == "plan my day"
+
+
+# =============================================================================
+# TestFallback
+# =============================================================================
+
+class TestFallback:
+    """Test the cached LLM fallback."""
+
+    async def test_llm_not_called_on_fast_path_hit(self):
+        """A regex hit never reaches the LLM."""
+        llm = FakeLLM()
+        router = IntentRouter(llm_classifier=llm)
+
+        match = await router.classify("let's plan my day")
+
+        assert match.source == "regex"
+        assert llm.calls == []
+
+    async def test_llm_result_cached_by_normalized_text(self):
+        """Repeated phrasings are answered from the cache."""
+        llm = FakeLLM()
+        router = IntentRouter(llm_classifier=llm)
+
+        first = await router.classify("Ugh, today was rough")
+        second = await router.classify("ugh,   TODAY was rough")
+
+        assert first.source == "llm"
+        assert second.source == "cache"
+        assert second.intent == "review.start"
+        assert len(llm.calls) == 1
+
+    async def test_unknown_llm_intent_is_a_miss(self):
+        """LLM answers outside the router's intents are discarded."""
+        router = IntentRouter(llm_classifier=FakeLLM(("weather.forecast", 0.9)))
+
+        match = await router.classify("will it rain")
+
+        assert match.intent is None
+        assert router.needs_clarification(match)
+
+    async def test_low_confidence_needs_clarification(self):
+        """Low-confidence LLM answers ask a clarifying question."""
+        router = IntentRouter(llm_classifier=FakeLLM(("review.start", 0.4)))
+
+        match = await router.classify("meh")
+
+        assert match.intent == "review.start"
+        assert router.needs_clarification(match)
+
+    async def test_cancelled_llm_call_releases_waiters(self):
+        """Concurrent identical messages do not hang when the first is cancelled."""
+        started = asyncio.Event()
+
+        async def slow_llm(text, intents):
+            started.set()
+            await asyncio.sleep(60)
+
+        router = IntentRouter(llm_classifier=slow_llm)
+        leader = asyncio.create_task(router.classify("hmm, no idea"))
+        await started.wait()
+        waiter = asyncio.create_task(router.classify("hmm, no idea"))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        match = await asyncio.wait_for(waiter, timeout=1)
+
+        assert match.intent is None
+        assert router._inflight == {}
+
+    def test_cache_evicts_least_recently_used(self):
+        """The cache is bounded."""
+        cache = IntentCache(max_size=2)
+        cache.set("a", "x.a", 0.9)
+        cache.set("b", "x.b", 0.9)
+        cache.get("a")
+        cache.set("c", "x.c", 0.9)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == ("x.a", 0.9)
+        assert len(cache) == 2
+
+    def test_haiku_answer_parsing(self):
+        """Model answers are parsed into (intent, confidence)."""
+        assert HaikuIntentClassifier.parse("planning.start 0.8") == ("planning.start", 0.8)
+        assert HaikuIntentClassifier.parse("none") is None
+
+
+# =============================================================================
+# TestBuildFromRegistry
+# =============================================================================
+
+class TestBuildFromRegistry:
+    """Test building a router from the module registry."""
+
+    def test_only_registered_intents(self):
+        """Patterns for unregistered intents are dropped."""
+        registry = register_builtin_modules(ModuleRegistry())
+        router = build_intent_router(registry)
+
+        assert set(router.intents) <= set(registry.list_intents())
+        assert router.match_fast_path("/help").intent is None
+        assert router.match_fast_path("/plan").intent == "planning.start"
+        assert not any(registry.is_loaded(name) for name in registry.list_modules())
+
+    async def test_recompiled_when_registry_changes(self):
+        """Registering or clearing modules later updates the fast path and LLM candidates."""
+        registry = register_builtin_modules(ModuleRegistry())
+        llm = FakeLLM(("meta.help", 0.9))
+        router = build_intent_router(registry, llm_classifier=llm)
+        assert router.match_fast_path("/help").intent is None
+
+        registry.register_lazy("meta", "tests.fake_meta:MetaModule", ["meta.help"])
+
+        assert router.match_fast_path("/help").intent == "meta.help"
+        assert "meta.help" in router.intents
+        registry.clear()
+        assert (await router.classify("/plan")).intent is None
+        assert router.intents == []
+
+    def test_global_router_uses_haiku_with_api_key(self, monkeypatch):
+        """get_intent_router() wires the LLM fallback when a key is configured."""
+        from src.core import intent_router
+
+        monkeypatch.setattr(intent_router, "_intent_router", None)
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+        assert isinstance(intent_router.get_intent_router()._llm_classifier, HaikuIntentClassifier)
+
+        monkeypatch.setattr(intent_router, "_intent_router", None)
+        monkeypatch.delenv("ANTHROPIC_API_KEY")
+        assert intent_router.get_intent_router()._llm_classifier is None
@@ -0,0 +1,181 @@
+"""
+Unit tests for the module registry.
+
+These tests verify:
+- Eager and lazy module registration
+- Lazy modules are only imported on first routed intent
+- Intent/name conflict detection across eager and lazy modules
+- Built-in module intent declarations match the module classes
+- Import-time regression: importing packages does not pull in heavy libraries
+"""
+
+import sys
+import types
+
+import pytest
+
+from benchmarks.bench_import_time import measure_import
+from src.core.daily_workflow_hooks import DailyWorkflowHooks
+from src.core.module_registry import ModuleRegistry
+
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+FAKE_MODULE_PATH = "tests_fake_lazy_module"
+
+
+class FakeModule:
+    """Minimal Module implementation for registry tests."""
+
+    name = "fake"
+    intents = ["fake.start", "fake.stop"]
+    pillar = "second_brain"
+    instances = 0
+
+    def __init__(self, greeting: str = "hi"):
+        FakeModule.instances += 1
+        self.greeting = greeting
+
+    def get_daily_workflow_hooks(self) -> DailyWorkflowHooks:
+        return DailyWorkflowHooks(morning=lambda ctx: self.greeting, hook_name=self.name)
+
+
+@pytest.fixture
+def fake_module_path(monkeypatch):
+    """Install FakeModule under an importable module path."""
+    FakeModule.instances = 0
+    fake = types.ModuleType(FAKE_MODULE_PATH)
+    fake.FakeModule = FakeModule
+    monkeypatch.setitem(sys.modules, FAKE_MODULE_PATH, fake)
+    return f"{FAKE_MODULE_PATH}:FakeModule"
+
+
+@pytest.fixture
+def registry():
+    """Create an empty registry."""
+    return ModuleRegistry()
+
+
+# =============================================================================
+# TestLazyRegistration
+# =============================================================================
+
+class TestLazyRegistration:
+    """Test lazy registration by import path."""
+
+    def test_lazy_module_not_built_on_register(self, registry, fake_module_path):
+        """Registering lazily does not instantiate the module."""
+        registry.register_lazy("fake", fake_module_path, ["fake.start", "fake.stop"])
+
+        assert FakeModule.instances == 0
+        assert registry.is_registered("fake")
+        assert not registry.is_loaded("fake")
+        assert registry.list_intents() == {"fake.start": "fake", "fake.stop": "fake"}
+
+    def test_route_builds_module_once(self, registry, fake_module_path):
+        """The first routed intent builds the module; later routes reuse it."""
+        registry.register_lazy("fake", fake_module_path, ["fake.start", "fake.stop"])
+
+        first = registry.route("fake.start")
+        second = registry.route("fake.stop")
+
+        assert isinstance(first, FakeModule)
+        assert first is second
+        assert FakeModule.instances == 1
+        assert registry.is_loaded("fake")
+
+    def test_init_kwargs_passed_to_module(self, registry, fake_module_path):
+        """Keyword arguments are forwarded to the module class."""
+        registry.register_lazy("fake", fake_module_path, ["fake.start"], greeting="hello")
+
+        assert registry.get_module("fake").greeting == "hello"
+
+    def test_unknown_intent_does_not_build(self, registry, fake_module_path):
+        """Routing an unknown intent returns None without importing anything."""
+        registry.register_lazy("fake", fake_module_path, ["fake.start"])
+
+        assert registry.route("other.start") is None
+        assert FakeModule.instances == 0
+
+    def test_name_mismatch_raises(self, registry, fake_module_path):
+        """A lazy spec resolving to a differently named module is rejected."""
+        registry.register_lazy("other", fake_module_path, ["other.start"])
+
+        with pytest.raises(ValueError):
+            registry.route("other.start")
+
+    def test_intent_conflict_between_lazy_and_eager(self, registry, fake_module_path):
+        """Lazy intents conflict with eagerly registered ones."""
+        registry.register(FakeModule())
+
+        with pytest.raises(ValueError):
+            registry.register_lazy("fake2", fake_module_path, ["fake.start"])
+
+    def test_deregister_lazy_module(self, registry, fake_module_path):
+        """Deregistering a lazy module removes its intents without building it."""
+        registry.register_lazy("fake", fake_module_path, ["fake.start"])
+
+        assert registry.deregister("fake") is True
+        assert registry.route("fake.start") is None
+        assert registry.module_count == 0
+        assert FakeModule.instances == 0
+
+    def test_daily_hooks_build_lazy_modules(self, registry, fake_module_path):
+        """Collecting daily hooks builds lazy modules to read their hooks."""
+        registry.register_lazy("fake", fake_module_path, ["fake.start"])
+
+        hooks = registry.get_daily_hooks()
+
+        assert len(hooks["morning"]) == 1
+        assert registry.is_loaded("fake")
+
+
+# =============================================================================
+# TestBuiltinModules
+# =============================================================================
+
+class TestBuiltinModules:
+    """Test the built-in lazy module declarations."""
+
+    def test_declared_intents_match_module_classes(self):
+        """BUILTIN_MODULES intents must match each module's `intents`."""
+        from src.modules import BUILTIN_MODULES, register_builtin_modules
+
+        registry = register_builtin_modules(ModuleRegistry())
+
+        for name, _import_path, intents in BUILTIN_MODULES:
+            module = registry.get_module(name)
+            assert module.name == name
+            assert list(module.intents) == intents
+
+
+# =============================================================================
+# TestImportTime
+# =============================================================================
+
+class TestImportTime:
+    """Import-time regression checks (python -X importtime)."""
+
+    @pytest.mark.parametrize(
+        "package",
+        ["src.bot", "src.lib", "src.modules", "src.services", "src.workflows"],
+    )
+    def test_package_import_is_lightweight(self, package):
+        """Importing a package must not import heavy third-party libraries."""
+        timing = measure_import(package)
+
+        assert timing.heavy_imports == [], (
+            f"{package} eagerly imports {timing.heavy_imports}; "
+            f"use lazy exports in its __init__"
+        )
+
+    def test_lazy_export_imports_only_its_submodule(self):
+        """Using one export imports only the submodule that defines it."""
+        timing = measure_import(
+            "src.services",
+            "from src.services import TensionEngine",
+        )
+
+        assert timing.heavy_imports == []
@@ -0,0 +1,196 @@
+"""
+Unit tests for the concurrent side effect executor.
+
+These tests verify:
+- DB effects are coalesced into one bulk write per priority level
+- By default same-priority effects keep their order; consecutive DB effects
+  share one write
+- Independent effect groups run concurrently when the caller opts in
+- Priority levels run in order and results stay per effect
+- A failed bulk write fails every coalesced effect
+- Effect types the bulk writer does not support use their handlers
+"""
+
+import asyncio
+
+from src.core.side_effects import (
+    ConcurrentSideEffectExecutor,
+    SideEffect,
+    SideEffectBatch,
+    SideEffectType,
+)
+
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+class RecordingBulkWriter:
+    """Bulk writer stub that records each transaction."""
+
+    def __init__(self, fail: bool = False, supported=None):
+        self.fail = fail
+        self.supported = supported
+        self.transactions: list[list[SideEffect]] = []
+
+    def supports(self, effect_type):
+        return self.supported is None or effect_type in self.supported
+
+    async def __call__(self, user_id, effects):
+        self.transactions.append(list(effects))
+        if self.fail:
+            raise RuntimeError("db down")
+
+
+def _batch(*effects: SideEffect) -> SideEffectBatch:
+    return SideEffectBatch(effects=list(effects), user_id=1)
+
+
+# =============================================================================
+# TestConcurrentExecutor
+# =============================================================================
+
+class TestConcurrentExecutor:
+    """Test ConcurrentSideEffectExecutor.execute_batch."""
+
+    async def test_db_effects_coalesced_into_one_transaction(self):
+        """Five SAVE_TASK effects are one bulk write."""
+        writer = RecordingBulkWriter()
+        executor = ConcurrentSideEffectExecutor(bulk_writer=writer)
+
+        results = await executor.execute_batch(
+            _batch(*(SideEffect.save_task({"title": f"t{i}"}) for i in range(5)))
+        )
+
+        assert results == [True] * 5
+        assert len(writer.transactions) == 1
+        assert len(writer.transactions[0]) == 5
+
+    async def test_same_priority_effects_keep_order(self):
+        """Without opting in, effects run in list order; only adjacent DB writes merge."""
+        order: list[str] = []
+
+        class OrderedWriter(RecordingBulkWriter):
+            async def __call__(self, user_id, effects):
+                order.append("db:" + ",".join(e.payload["title"] for e in effects))
+                await super().__call__(user_id, effects)
+
+        async def handler(effect, user_id):
+            await asyncio.sleep(0)
+            order.append(effect.payload["name"])
+            return True
+
+        executor = ConcurrentSideEffectExecutor(
+            handlers={SideEffectType.CUSTOM: handler},
+            bulk_writer=OrderedWriter(),
+        )
+
+        results = await executor.execute_batch(_batch(
+            SideEffect.save_task({"title": "a"}),
+            SideEffect.custom("notify", {"name": "notify"}),
+            SideEffect.save_task({"title": "b"}),
+            SideEffect.save_task({"title": "c"}),
+        ))
+
+        assert results == [True] * 4
+        assert order == ["db:a", "notify", "db:b,c"]
+
+    async def test_independent_groups_run_concurrently(self):
+        """Different effect types at one priority overlap in time when opted in."""
+        running = 0
+        peak = 0
+
+        async def slow_handler(effect, user_id):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return True
+
+        executor = ConcurrentSideEffectExecutor(
+            handlers={
+                SideEffectType.COMPLETE_HABIT: slow_handler,
+                SideEffectType.SCHEDULE_NOTIFICATION: slow_handler,
+            },
+            concurrent_groups=True,
+        )
+
+        results = await executor.execute_batch(_batch(
+            SideEffect.complete_habit("h1"),
+            SideEffect(SideEffectType.SCHEDULE_NOTIFICATION),
+        ))
+
+        assert results == [True, True]
+        assert peak == 2
+
+    async def test_priority_levels_run_in_order(self):
+        """Lower priority levels finish before higher ones start."""
+        order: list[str] = []
+
+        async def handler(effect, user_id):
+            order.append(effect.payload["name"])
+            return True
+
+        writer = RecordingBulkWriter()
+        executor = ConcurrentSideEffectExecutor(
+            handlers={SideEffectType.CUSTOM: handler},
+            bulk_writer=writer,
+        )
+
+        batch = _batch(
+            SideEffect.custom("late", {"name": "late"}, priority=2),
+            SideEffect.save_task({"title": "first"}, priority=0),
+            SideEffect.custom("middle", {"name": "middle"}, priority=1),
+        )
+        results = await executor.execute_batch(batch)
+
+        assert [e.priority for e in batch.effects] == [0, 1, 2]
+        assert results == [True, True, True]
+        assert order == ["middle", "late"]
+
+    async def test_failed_bulk_write_fails_all_db_effects(self):
+        """A rolled-back transaction marks each coalesced effect failed."""
+        executor = ConcurrentSideEffectExecutor(
+            handlers={SideEffectType.COMPLETE_HABIT: lambda e, u: asyncio.sleep(0, True)},
+            bulk_writer=RecordingBulkWriter(fail=True),
+        )
+
+        results = await executor.execute_batch(_batch(
+            SideEffect.save_task({"title": "a"}),
+            SideEffect.complete_habit("h1"),
+            SideEffect.save_transaction({"amount": 5}),
+        ))
+
+        assert results == [False, True, False]
+
+    async def test_missing_handler_fails_effect(self):
+        """Effects without a handler fail without affecting the others."""
+        executor = ConcurrentSideEffectExecutor(bulk_writer=RecordingBulkWriter())
+
+        results = await executor.execute_batch(_batch(
+            SideEffect.complete_habit("h1"),
+            SideEffect.save_task({"title": "a"}),
+        ))
+
+        assert results == [False, True]
+
+    async def test_unsupported_db_effects_use_handlers(self):
+        """A type the writer has no table for does not roll back the others."""
+        writer = RecordingBulkWriter(supported={SideEffectType.SAVE_TASK})
+        executor = ConcurrentSideEffectExecutor(
+            handlers={SideEffectType.SAVE_CAPTURED_ITEM: lambda e, u: asyncio.sleep(0, True)},
+            bulk_writer=writer,
+            concurrent_groups=True,
+        )
+
+        results = await executor.execute_batch(_batch(
+            SideEffect.save_task({"title": "a"}),
+            SideEffect(effect_type=SideEffectType.SAVE_CAPTURED_ITEM, payload={"content": "idea"}),
+            SideEffect.save_task({"title": "b"}),
+        ))
+
+        assert results == [True, True, True]
+        assert [[e.effect_type for e in t] for t in writer.transactions] == [
+            [SideEffectType.SAVE_TASK, SideEffectType.SAVE_TASK]
+        ]
@@ -0,0 +1,162 @@
+"""
+Unit tests for the Redis JSON store with TTL.
+
+These tests verify:
+- Values round-trip through Redis with the store TTL
+- With Redis failing, values are kept in process memory
+- The in-memory fallback is a bounded LRU and honours the TTL
+- A successful Redis write drops the local copy
+- Malformed values are discarded
+- get_many() reads stores sharing a client with one MGET, falling back locally
+"""
+
+import json
+from dataclasses import asdict, dataclass
+
+from src.lib.json_ttl_store import JsonTTLStore, get_many
+
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+@dataclass
+class Counter:
+    user_id: int
+    count: int = 0
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_json(cls, data: str) -> "Counter":
+        return cls(**json.loads(data))
+
+
+class CounterStore(JsonTTLStore[Counter]):
+    KEY_PREFIX = "test:counter:"
+    TTL = 60
+    NAME = "Counter"
+
+    def _decode(self, user_id: int, data: str) -> Counter:
+        return Counter.from_json(data)
+
+
+class OtherCounterStore(CounterStore):
+    KEY_PREFIX = "test:other:"
+    NAME = "Other counter"
+
+
+# =============================================================================
+# TestRedis
+# =============================================================================
+
+class TestRedis:
+    """Test storage in Redis."""
+
+    async def test_round_trip_with_ttl(self, fake_redis):
+        """Values are stored under the key prefix with the store TTL."""
+        store = CounterStore(redis_client=fake_redis)
+
+        await store.put(Counter(1, 5))
+
+        assert fake_redis.ttls["test:counter:1"] == 60
+        assert await store.get(1) == Counter(1, 5)
+        assert len(store._local) == 0
+
+    async def test_delete(self, fake_redis):
+        """delete() drops the value in Redis and locally."""
+        store = CounterStore(redis_client=fake_redis)
+        await store.put(Counter(1))
+
+        await store.delete(1)
+
+        assert await store.get(1) is None
+
+    async def test_malformed_discarded(self, fake_redis):
+        """A value that does not decode reads as missing."""
+        store = CounterStore(redis_client=fake_redis)
+        fake_redis.data["test:counter:1"] = "{not json"
+
+        assert await store.get(1) is None
+
+
+# =============================================================================
+# TestFallback
+# =============================================================================
+
+class TestFallback:
+    """Test the in-process fallback."""
+
+    async def test_redis_errors_fall_back(self, broken_redis):
+        """With Redis failing, values are kept in process memory."""
+        store = CounterStore(redis_client=broken_redis)
+
+        await store.put(Counter(1, 3))
+
+        assert await store.get(1) == Counter(1, 3)
+        await store.delete(1)
+        assert await store.get(1) is None
+
+    async def test_redis_recovery_drops_local_copy(self, fake_redis, broken_redis):
+        """Once Redis accepts a write, the local copy is released."""
+        store = CounterStore(redis_client=broken_redis)
+        await store.put(Counter(1, 1))
+
+        store._redis = fake_redis
+        await store.put(Counter(1, 2))
+
+        assert len(store._local) == 0
+        assert await store.get(1) == Counter(1, 2)
+
+    async def test_bounded_lru(self):
+        """Above max_local the least recently used value is evicted."""
+        store = CounterStore(max_local=2)
+        await store.put(Counter(1))
+        await store.put(Counter(2))
+        await store.get(1)
+
+        await store.put(Counter(3))
+
+        assert len(store._local) == 2
+        assert await store.get(2) is None
+        assert await store.get(1) == Counter(1)
+
+    async def test_expired_values_dropped(self):
+        """Values past their TTL read as missing."""
+        store = CounterStore(ttl=-1)
+
+        await store.put(Counter(1))
+
+        assert await store.get(1) is None
+        assert len(store._local) == 0
+
+
+# =============================================================================
+# TestGetMany
+# =============================================================================
+
+class TestGetMany:
+    """Test reading several stores at once."""
+
+    async def test_one_mget_per_client(self, fake_redis):
+        """Stores sharing a client are read in one MGET; order is kept."""
+        counters = CounterStore(redis_client=fake_redis)
+        others = OtherCounterStore(redis_client=fake_redis)
+        local = CounterStore()
+        await counters.put(Counter(1, 1))
+        await others.put(Counter(1, 2))
+        await local.put(Counter(1, 3))
+
+        values = await get_many((counters, 1), (local, 1), (others, 1), (others, 2))
+
+        assert values == [Counter(1, 1), Counter(1, 3), Counter(1, 2), None]
+        assert fake_redis.mgets == [["test:counter:1", "test:other:1", "test:other:2"]]
+
+    async def test_redis_errors_fall_back(self, broken_redis):
+        """With Redis failing, values come from process memory."""
+        counters = CounterStore(redis_client=broken_redis)
+        others = OtherCounterStore(redis_client=broken_redis)
+        await counters.put(Counter(1, 1))
+
+        assert await get_many((counters, 1), (others, 1)) == [Counter(1, 1), None]
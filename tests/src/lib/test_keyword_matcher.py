@@ -0,0 +1,57 @@
+"""
+Unit tests for the compiled keyword matcher.
+
+These tests verify:
+- Counts match per-keyword substring checks, overlapping keywords included
+- Matching is case-insensitive and counts each keyword once per text
+- Keywords shared between categories count for each of them
+"""
+
+import random
+
+from src.lib.keyword_matcher import KeywordMatcher
+
+
+# =============================================================================
+# TestKeywordMatcher
+# =============================================================================
+
+class TestKeywordMatcher:
+    """Test the Aho-Corasick matcher."""
+
+    def test_overlapping_keywords(self):
+        """Keywords inside other keywords and across them are all found."""
+        matcher = KeywordMatcher({"physical": ["now", "do"], "learning": ["know", "how"]})
+
+        assert matcher.counts("I know how to do it") == {"physical": 2, "learning": 2}
+        assert matcher.matches("knowhow") == {"know", "now", "how"}
+
+    def test_case_and_repeats(self):
+        """Upper case text matches; a repeated keyword counts once."""
+        matcher = KeywordMatcher({"focus": ["Plan", "what if"]})
+
+        assert matcher.counts("PLAN, plan, plan. What if?") == {"focus": 2}
+        assert matcher.counts("") == {"focus": 0}
+
+    def test_shared_keywords(self):
+        """A keyword listed in two categories counts for both."""
+        matcher = KeywordMatcher({"a": ["rest", "sleep"], "b": ["rest"]})
+
+        assert len(matcher) == 2
+        assert matcher.counts("need rest") == {"a": 1, "b": 1}
+
+    def test_matches_substring_checks(self):
+        """Random keyword sets agree with `kw in text` on random texts."""
+        rng = random.Random(3)
+        for _ in range(200):
+            categories = {
+                name: ["".join(rng.choice("abc ") for _ in range(rng.randint(1, 4))) for _ in range(5)]
+                for name in ("x", "y")
+            }
+            text = "".join(rng.choice("abcd ") for _ in range(rng.randint(0, 40)))
+
+            expected = {
+                name: sum(1 for kw in dict.fromkeys(keywords) if kw in text)
+                for name, keywords in categories.items()
+            }
+            assert KeywordMatcher(categories).counts(text) == expected
@@ -0,0 +1,176 @@
+"""
+Unit tests for the keyword lexicon registry.
+
+These tests verify:
+- Category counts match the per-keyword checks the heuristics used before
+- A language's categories include the default (English) keywords
+- Unknown languages fall back to the default lexicons
+- reload() replaces categories and drops cached results
+- reload_if_changed() follows the lexicon file; bad files keep the current set
+- Inertia scores from lexicon hits match the former substring scoring
+"""
+
+import json
+import os
+import random
+
+import pytest
+
+from src.lib.lexicon import DEFAULT_LEXICONS, LexiconRegistry
+from src.services.neurostate.inertia import InertiaDetector
+
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+WORDS = (
+    "i should plan a call with a friend but i am stuck and overwhelmed maybe later "
+    "tomorrow i want to learn and explore new values talk about core purpose can't start "
+    "noise stress walk present interview focus complex want can"
+).split()
+
+
+def texts(n: int, seed: int = 5) -> list[str]:
+    rng = random.Random(seed)
+    return [" ".join(rng.choices(WORDS, k=rng.randint(1, 15))) for _ in range(n)]
+
+
+@pytest.fixture
+def lexicon_file(tmp_path):
+    path = tmp_path / "lexicons.json"
+    path.write_text(json.dumps({"sr": {"spoons.social": ["poziv", "prijatelj"]}}), encoding="utf-8")
+    return path
+
+
+# =============================================================================
+# TestCounts
+# =============================================================================
+
+class TestCounts:
+    """Test one-pass category counts."""
+
+    def test_counts_match_keyword_checks(self):
+        """Every category counts `kw in text` over its keywords."""
+        registry = LexiconRegistry()
+        for text in texts(200):
+            hits = registry.counts(text)
+
+            for category, keywords in DEFAULT_LEXICONS["en"].items():
+                assert hits[category] == sum(1 for kw in dict.fromkeys(keywords) if kw in text), category
+
+    def test_language_includes_default(self):
+        """German hits add to the English keywords of a category."""
+        registry = LexiconRegistry()
+
+        hits = registry.counts("Treffen mit Freund, danach call", "de")
+
+        assert hits["spoons.social"] == 3
+        assert registry.counts("Treffen mit Freund")["spoons.social"] == 0
+        assert registry.counts("meet", "de")["spoons.social"] == 1
+
+    def test_unknown_language_uses_default(self):
+        """Languages without lexicons get the default categories."""
+        registry = LexiconRegistry()
+
+        assert registry.counts("stuck, later", "xx") == registry.counts("stuck, later")
+        assert registry.categories("xx") == registry.categories(None)
+
+
+# =============================================================================
+# TestReload
+# =============================================================================
+
+class TestReload:
+    """Test hot reload."""
+
+    def test_reload_replaces_category(self):
+        """A reloaded category applies at once; cached results are dropped."""
+        registry = LexiconRegistry()
+        assert registry.counts("dentist")["spoons.sensory"] == 0
+
+        registry.reload({"en": {"spoons.sensory": ["dentist"]}})
+
+        assert registry.counts("dentist")["spoons.sensory"] == 1
+        assert registry.counts("noise")["spoons.sensory"] == 0
+        assert registry.counts("talk")["spoons.social"] == 1
+
+    def test_reload_if_changed(self, lexicon_file):
+        """The file is read once per modification."""
+        registry = LexiconRegistry(path=str(lexicon_file))
+        assert "sr" in registry.languages
+        assert registry.counts("poziv", "sr")["spoons.social"] == 1
+        assert registry.reload_if_changed() is False
+
+        lexicon_file.write_text(json.dumps({"sr": {"spoons.social": ["sastanak"]}}), encoding="utf-8")
+        stat = lexicon_file.stat()
+        os.utime(lexicon_file, (stat.st_atime, stat.st_mtime + 10))
+
+        assert registry.reload_if_changed() is True
+        assert registry.counts("poziv", "sr")["spoons.social"] == 0
+        assert registry.counts("sastanak", "sr")["spoons.social"] == 1
+
+    def test_bad_file_keeps_lexicons(self, lexicon_file):
+        """A malformed or missing file leaves the loaded lexicons in place."""
+        registry = LexiconRegistry(path=str(lexicon_file))
+
+        lexicon_file.write_text("{not json", encoding="utf-8")
+        stat = lexicon_file.stat()
+        os.utime(lexicon_file, (stat.st_atime, stat.st_mtime + 10))
+        assert registry.reload_if_changed() is False
+        lexicon_file.unlink()
+        assert registry.reload_if_changed() is False
+
+        assert registry.counts("poziv", "sr")["spoons.social"] == 1
+
+
+# =============================================================================
+# TestInertiaScoring
+# =============================================================================
+
+def legacy_scores(messages: list[str]) -> tuple[float, float, float]:
+    """The substring scoring InertiaDetector used before."""
+    autistic = sum(
+        InertiaDetector.INERTIA_KEYWORD_WEIGHT
+        for msg in messages for kw in InertiaDetector.AUTISTIC_INERTIA_KEYWORDS if kw in msg
+    )
+    if sum(1 for msg in messages if "want" in msg and "can" in msg) >= 2:
+        autistic += InertiaDetector.PATTERN_WEIGHT
+
+    activation = sum(
+        InertiaDetector.INERTIA_KEYWORD_WEIGHT
+        for msg in messages for kw in InertiaDetector.ACTIVATION_DEFICIT_KEYWORDS if kw in msg
+    )
+    should = sum(1 for msg in messages if "should" in msg)
+    later = sum(1 for msg in messages if "later" in msg or "tomorrow" in msg)
+    if should >= 2 and later >= 1:
+        activation += InertiaDetector.PATTERN_WEIGHT
+
+    double = sum(0.5 for msg in messages for kw in InertiaDetector.DOUBLE_BLOCK_KEYWORDS if kw in msg)
+    if (any(kw in msg for msg in messages for kw in InertiaDetector.AUTISTIC_INERTIA_KEYWORDS)
+            and any(kw in msg for msg in messages for kw in InertiaDetector.ACTIVATION_DEFICIT_KEYWORDS)):
+        double += InertiaDetector.PATTERN_WEIGHT
+
+    n = len(messages)
+    return min(1.0, autistic / n), min(1.0, activation / n), min(1.0, double)
+
+
+class TestInertiaScoring:
+    """Test that inertia scores keep their meaning on lexicon hits."""
+
+    def test_scores_match_substring_scoring(self):
+        """Random conversations score as with the former keyword loops."""
+        registry = LexiconRegistry()
+        detector = InertiaDetector(db=None, lexicons=registry)
+        rng = random.Random(11)
+        for _ in range(100):
+            messages = texts(rng.randint(1, 6), seed=rng.random())
+            hits = [registry.counts(msg) for msg in messages]
+
+            scores = (
+                detector._score_autistic_inertia(hits),
+                detector._score_activation_deficit(hits),
+                detector._score_double_block(hits),
+            )
+
+            assert scores == pytest.approx(legacy_scores(messages))
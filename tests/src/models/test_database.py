@@ -0,0 +1,118 @@
+"""
+Unit tests for the shared database engine.
+
+These tests verify:
+- Pool and statement cache settings reach the engine (PostgreSQL only)
+- Settings are read from the environment
+- A unit of work commits on success and rolls back on error
+- Nested units commit once, with the outermost unit
+"""
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, func, insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.models.database import DatabaseConfig, session_scope, unit_of_work
+
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+METADATA = MetaData()
+NOTES = Table(
+    "notes",
+    METADATA,
+    Column("id", Integer, primary_key=True),
+    Column("text", String(50)),
+)
+
+
+@pytest.fixture
+async def factory():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(METADATA.create_all)
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def count(factory) -> int:
+    async with session_scope(factory) as session:
+        return await session.scalar(select(func.count()).select_from(NOTES))
+
+
+# =============================================================================
+# TestConfig
+# =============================================================================
+
+class TestConfig:
+    """Test engine settings."""
+
+    def test_postgres_pool_and_statement_cache(self):
+        """PostgreSQL gets pool sizing and both statement caches."""
+        config = DatabaseConfig(pool_size=5, max_overflow=2, statement_cache_size=100)
+
+        kwargs = config.engine_kwargs()
+
+        assert (kwargs["pool_size"], kwargs["max_overflow"]) == (5, 2)
+        assert kwargs["pool_pre_ping"]
+        assert kwargs["connect_args"] == {"statement_cache_size": 100}
+        assert config.engine_url().query["prepared_statement_cache_size"] == "100"
+
+    def test_sqlite_has_no_pool_sizing(self):
+        """SQLite engines are created without server pool settings."""
+        kwargs = DatabaseConfig(url="sqlite+aiosqlite://").engine_kwargs()
+
+        assert "pool_size" not in kwargs
+        assert "connect_args" not in kwargs
+
+    def test_from_env(self, monkeypatch):
+        """Settings come from AURORA_DATABASE_URL and AURORA_DB_*."""
+        monkeypatch.setenv("AURORA_DATABASE_URL", "postgresql+asyncpg://u@db/aurora")
+        monkeypatch.setenv("AURORA_DB_POOL_SIZE", "20")
+        monkeypatch.setenv("AURORA_DB_STATEMENT_CACHE_SIZE", "0")
+
+        config = DatabaseConfig.from_env()
+
+        assert config.url == "postgresql+asyncpg://u@db/aurora"
+        assert config.pool_size == 20
+        assert config.statement_cache_size == 0
+
+
+# =============================================================================
+# TestUnitOfWork
+# =============================================================================
+
+class TestUnitOfWork:
+    """Test commit and rollback."""
+
+    async def test_commits_on_success(self, factory):
+        """Work in the unit is committed at the end."""
+        async with session_scope(factory) as session:
+            async with unit_of_work(session):
+                await session.execute(insert(NOTES).values(text="a"))
+
+        assert await count(factory) == 1
+
+    async def test_rolls_back_on_error(self, factory):
+        """An error inside the unit discards its work."""
+        async with session_scope(factory) as session:
+            with pytest.raises(ValueError):
+                async with unit_of_work(session):
+                    await session.execute(insert(NOTES).values(text="a"))
+                    raise ValueError("invalid")
+
+        assert await count(factory) == 0
+
+    async def test_nested_units_commit_once(self, factory):
+        """An inner unit joins the outer one; a later error rolls back both."""
+        async with session_scope(factory) as session:
+            with pytest.raises(ValueError):
+                async with unit_of_work(session):
+                    async with unit_of_work(session):
+                        await session.execute(insert(NOTES).values(text="inner"))
+                    raise ValueError("outer fails")
+            assert session.info["unit_of_work_depth"] == 0
+
+        assert await count(factory) == 0
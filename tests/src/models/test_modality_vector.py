@@ -0,0 +1,238 @@
+"""
+Unit tests for the packed sensory modality vector.
+
+These tests verify:
+- Vectors pack to 20 bytes and read back rounded to 4 decimals
+- The column type binds dicts and vectors and still loads legacy JSON rows
+- modality_vector_hex() compiles per dialect and decodes in the snapshot format
+- Legacy JSON rows decode in every path, even when exactly 20 bytes long
+- The migration turns a JSON text column into packed vectors and back
+- SensoryStateAssessment applies several deltas at once, clamped to 0-100
+"""
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import LargeBinary, create_engine, insert, inspect, select, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.models.base import Base
+from src.models.neurostate import (
+    SENSORY_MODALITIES,
+    SensoryProfile,
+    modalities_from_bytes,
+    modalities_from_dict,
+    modalities_from_hex,
+    modalities_to_dict,
+    modality_vector_hex,
+    pack_modalities,
+    unpack_modalities,
+)
+from src.services.neurostate.sensory import SensoryStateAssessment
+
+SENSORY = SensoryProfile.__table__
+NOW = datetime(2026, 6, 8, 12, 0, tzinfo=timezone.utc)
+MIGRATIONS = Path(__file__).resolve().parents[3] / "migrations"
+
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+@pytest.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[SENSORY])
+    yield engine
+    await engine.dispose()
+
+
+def profile_row(user_id: int, loads) -> dict:
+    return {
+        "user_id": user_id, "modality_loads": loads, "overall_load": 0.0,
+        "last_assessed": NOW, "segment_code": "AU", "created_at": NOW, "updated_at": NOW,
+    }
+
+
+def alembic_config(url: str) -> Config:
+    """Alembic config for the repo's migrations (no ini: leaves logging alone)."""
+    config = Config()
+    config.set_main_option("script_location", str(MIGRATIONS))
+    config.set_main_option("sqlalchemy.url", url)
+    return config
+
+
+# =============================================================================
+# TestPacking
+# =============================================================================
+
+class TestPacking:
+    """Test the packed representation."""
+
+    def test_round_trip(self):
+        """Five float32 loads take 20 bytes and keep their decimal value."""
+        vector = (12.3, 0.0, 99.9, 45.5, 100.0)
+
+        data = pack_modalities(vector)
+
+        assert len(data) == 20
+        assert unpack_modalities(data) == vector
+
+    def test_dict_conversion(self):
+        """Dicts map onto the fixed order; unknown modalities are ignored."""
+        vector = modalities_from_dict({"auditory": 40.0, "taste": 10.0})
+
+        assert vector == (0.0, 40.0, 0.0, 0.0, 0.0)
+        assert list(modalities_to_dict(vector)) == list(SENSORY_MODALITIES)
+
+
+# =============================================================================
+# TestColumnType
+# =============================================================================
+
+class TestColumnType:
+    """Test binding and loading through the column type."""
+
+    async def test_binds_dicts_and_vectors(self, engine):
+        """Both forms are stored packed and load as vectors."""
+        async with engine.begin() as conn:
+            await conn.execute(insert(SENSORY), [
+                profile_row(1, {"visual": 70.0}),
+                profile_row(2, (1.0, 2.0, 3.0, 4.0, 5.0)),
+            ])
+            rows = (await conn.execute(select(SENSORY.c.modality_loads).order_by(SENSORY.c.user_id))).all()
+            raw = (await conn.execute(text("SELECT length(modality_loads) FROM sensory_profiles"))).scalars().all()
+
+        assert [row[0] for row in rows] == [(70.0, 0.0, 0.0, 0.0, 0.0), (1.0, 2.0, 3.0, 4.0, 5.0)]
+        assert raw == [20, 20]
+
+    async def test_loads_legacy_json(self, engine):
+        """Rows written as JSON text before the packed format still load."""
+        async with engine.begin() as conn:
+            await conn.execute(
+                text(
+                    "INSERT INTO sensory_profiles (user_id, modality_loads, overall_load, "
+                    "last_assessed, created_at, updated_at) VALUES (1, :loads, 0, :now, :now, :now)"
+                ),
+                {"loads": '{"tactile": 33.0}', "now": NOW},
+            )
+            vector = (await conn.execute(select(SENSORY.c.modality_loads))).scalar_one()
+
+        assert vector == (0.0, 0.0, 33.0, 0.0, 0.0)
+
+    async def test_hex_for_snapshot(self, engine):
+        """The hex form decodes to the stored vector."""
+        async with engine.begin() as conn:
+            await conn.execute(insert(SENSORY), [profile_row(1, {"olfactory": 12.5})])
+            payload = (await conn.execute(select(modality_vector_hex(SENSORY.c.modality_loads)))).scalar_one()
+
+        assert modalities_from_hex(payload) == (0.0, 0.0, 0.0, 12.5, 0.0)
+        assert modalities_from_hex("not hex") is None
+
+    async def test_hex_decodes_legacy_json(self, engine):
+        """Snapshots read legacy JSON rows too, including 20-byte ones."""
+        legacy = '{"tactile": 33.0000}'
+        assert len(legacy) == 20
+        async with engine.begin() as conn:
+            await conn.execute(
+                text(
+                    "INSERT INTO sensory_profiles (user_id, modality_loads, overall_load, "
+                    "last_assessed, created_at, updated_at) VALUES (1, :loads, 0, :now, :now, :now)"
+                ),
+                {"loads": legacy, "now": NOW},
+            )
+            vector = (await conn.execute(select(SENSORY.c.modality_loads))).scalar_one()
+            payload = (await conn.execute(select(modality_vector_hex(SENSORY.c.modality_loads)))).scalar_one()
+
+        assert vector == (0.0, 0.0, 33.0, 0.0, 0.0)
+        assert modalities_from_hex(payload) == (0.0, 0.0, 33.0, 0.0, 0.0)
+
+    def test_malformed_bytes(self):
+        """Neither JSON nor a packed vector decodes to None."""
+        assert modalities_from_bytes(b"{not json}") is None
+        assert modalities_from_bytes(b"short") is None
+
+    def test_hex_compiles_per_dialect(self):
+        """SQLite uses hex(), PostgreSQL encode(..., 'hex')."""
+        expr = modality_vector_hex(SENSORY.c.modality_loads)
+
+        assert "hex(" in str(expr.compile(dialect=sqlite.dialect()))
+        assert "encode(" in str(expr.compile(dialect=postgresql.dialect()))
+
+
+# =============================================================================
+# TestMigration
+# =============================================================================
+
+class TestMigration:
+    """Test the modality_loads migration on SQLite."""
+
+    def test_upgrade_packs_and_downgrade_restores(self, tmp_path, monkeypatch):
+        """JSON text rows become packed vectors, and JSON again on downgrade."""
+        url = f"sqlite:///{tmp_path / 'legacy.db'}"
+        monkeypatch.setenv("DATABASE_URL", url)
+        engine = create_engine(url)
+        with engine.begin() as conn:
+            conn.execute(text(
+                "CREATE TABLE sensory_profiles (id INTEGER PRIMARY KEY, user_id INTEGER NOT NULL, "
+                "modality_loads TEXT, overall_load FLOAT NOT NULL)"
+            ))
+            conn.execute(
+                text("INSERT INTO sensory_profiles VALUES (:id, 1, :loads, 0)"),
+                [{"id": 1, "loads": '{"visual": 70.0}'}, {"id": 2, "loads": None}],
+            )
+
+        command.upgrade(alembic_config(url), "head")
+        with engine.connect() as conn:
+            column = next(c for c in inspect(conn).get_columns("sensory_profiles") if c["name"] == "modality_loads")
+            raw = conn.execute(text("SELECT modality_loads FROM sensory_profiles ORDER BY id")).scalars().all()
+
+        assert isinstance(column["type"], LargeBinary)
+        assert raw == [pack_modalities((70.0, 0.0, 0.0, 0.0, 0.0)), None]
+
+        command.downgrade(alembic_config(url), "base")
+        with engine.connect() as conn:
+            raw = conn.execute(text("SELECT modality_loads FROM sensory_profiles ORDER BY id")).scalars().all()
+        engine.dispose()
+
+        assert json.loads(raw[0])["visual"] == 70.0
+        assert raw[1] is None
+
+
+# =============================================================================
+# TestBatchedUpdate
+# =============================================================================
+
+class TestBatchedUpdate:
+    """Test the vector arithmetic behind update_modalities()."""
+
+    def test_apply_deltas_clamps(self):
+        """Several deltas apply at once and stay within 0-100."""
+        vector = SensoryStateAssessment._apply_deltas(
+            (50.0, 95.0, 10.0, 0.0, 0.0), {"visual": 20.0, "auditory": 20.0, "tactile": -30.0}
+        )
+
+        assert vector == (70.0, 100.0, 0.0, 0.0, 0.0)
+
+    async def test_invalid_modality_rejected(self):
+        """An unknown modality fails before any database work."""
+        service = SensoryStateAssessment(db=None)
+
+        with pytest.raises(ValueError):
+            await service.update_modalities(1, {"visual": 5.0, "taste": 5.0}, "test")
+
+    def test_state_from_vector(self):
+        """Overload flags follow the highest modality."""
+        service = SensoryStateAssessment(db=None)
+
+        state = service._state(1, modalities_to_dict((10.0, 85.0, 0.0, 0.0, 0.0)), NOW, None)
+
+        assert state.overall_load == 85.0
+        assert state.is_overloaded and not state.is_critical
+        assert state.segment_code == "AU"
@@ -0,0 +1,190 @@
+"""
+Unit tests for burnout trajectory features and cached classification.
+
+These tests verify:
+- Vectorized features match the scalar definitions (variance, slope, trend)
+- Drops and boom-bust swings are counted per trajectory
+- A batch of mixed-length trajectories gives the per-trajectory features
+- Classification rules per segment are unchanged
+- classify_many() reads segments in one query and reuses cached results
+- A new energy point drops the user's cached classification
+"""
+
+import statistics
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.models.base import Base
+from src.models.neurostate import BurnoutType
+from src.models.user import User
+from src.services.neurostate.burnout import (
+    BurnoutClassificationCache,
+    BurnoutClassifier,
+    invalidate_burnout_classification,
+    set_burnout_cache,
+    trajectory_features,
+)
+
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+NOW = datetime(2026, 6, 8, 12, 0, tzinfo=timezone.utc)
+BOOM_BUST = [50.0, 90.0, 20.0, 85.0, 15.0, 90.0, 10.0]
+OVERLOAD = [80.0, 70.0, 38.0, 35.0, 30.0, 25.0, 20.0, 18.0, 15.0]
+STEADY = [60.0, 62.0, 61.0, 63.0, 60.0]
+
+
+@pytest.fixture
+async def factory():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[User.__table__])
+        await conn.execute(insert(User.__table__), [
+            {"id": user_id, "telegram_id": f"hash{user_id}", "language": "en", "timezone": "UTC",
+             "working_style_code": code, "created_at": NOW, "updated_at": NOW}
+            for user_id, code in [(1, "AD"), (2, "AU"), (3, "AH")]
+        ])
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+def count_statements(session) -> list[str]:
+    statements: list[str] = []
+    event.listen(
+        session.bind.sync_engine, "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+    return statements
+
+
+# =============================================================================
+# TestFeatures
+# =============================================================================
+
+class TestFeatures:
+    """Test the vectorized trajectory features."""
+
+    def test_matches_scalar_definitions(self):
+        """Variance, slope and trend halves match their scalar versions."""
+        trajectory = [70.0, 64.0, 66.0, 50.0, 45.0, 48.0, 30.0, 28.0, 35.0]
+
+        features = trajectory_features([trajectory])[0]
+
+        assert features.variance == pytest.approx(statistics.variance(trajectory))
+        assert features.slope == pytest.approx(np.polyfit(range(len(trajectory)), trajectory, 1)[0])
+        recent = trajectory[-7:]
+        assert features.early_avg == pytest.approx(statistics.mean(recent[:3]))
+        assert features.late_avg == pytest.approx(statistics.mean(recent[3:]))
+        assert (features.min_last3, features.max_last7) == (28.0, 66.0)
+
+    def test_drops_and_swings(self):
+        """Falls above the threshold count as drops; a rise then a fall as a swing."""
+        features = trajectory_features([BOOM_BUST], swing_threshold=10.0)[0]
+
+        assert features.drops == 3
+        assert features.boom_bust_swings == 3
+        assert trajectory_features([STEADY])[0].drops == 0
+
+    def test_batch_matches_single(self):
+        """Padding shorter trajectories does not change their features."""
+        trajectories = [BOOM_BUST, OVERLOAD, STEADY, [40.0, 42.0, 20.0]]
+
+        batch = trajectory_features(trajectories)
+
+        assert batch == [trajectory_features([t])[0] for t in trajectories]
+        assert [f.length for f in batch] == [7, 9, 5, 3]
+        assert trajectory_features([]) == []
+
+
+# =============================================================================
+# TestClassification
+# =============================================================================
+
+class TestClassification:
+    """Test the per-segment rules on features."""
+
+    def test_segment_rules(self):
+        """Boom-bust for AD, overload for AU, triple for AH when both apply."""
+        classifier = BurnoutClassifier(db=None, cache=BurnoutClassificationCache())
+        [boom_bust, overload] = trajectory_features([BOOM_BUST, OVERLOAD])
+
+        adhd = classifier._classify_features("AD", boom_bust)
+        autism = classifier._classify_features("AU", overload)
+        triple = classifier._classify_features("AH", boom_bust)
+
+        assert (adhd.burnout_type, adhd.confidence, adhd.trajectory_pattern) == (
+            BurnoutType.AD_BOOM_BUST, 0.85, "volatile",
+        )
+        assert (autism.burnout_type, autism.confidence) == (BurnoutType.AU_OVERLOAD, 0.85)
+        assert (triple.burnout_type, triple.confidence) == (BurnoutType.AH_TRIPLE, 0.8)
+        assert adhd.indicators["boom_bust_swings"] == 3
+
+    def test_pattern(self):
+        """Stable trajectories stay stable; a 7-day fall is declining."""
+        classifier = BurnoutClassifier(db=None, cache=BurnoutClassificationCache())
+
+        assert classifier._analyze_trajectory(STEADY) == "stable"
+        assert classifier._analyze_trajectory([90.0, 85.0, 80.0, 50.0, 45.0, 40.0]) == "declining"
+        assert classifier._analyze_trajectory([50.0, 60.0]) == "insufficient_data"
+
+
+# =============================================================================
+# TestBatchAndCache
+# =============================================================================
+
+class TestBatchAndCache:
+    """Test classify_many() and the per-user cache."""
+
+    async def test_classify_many_one_query(self, factory):
+        """Segments for all users come from one query; results match classify()."""
+        trajectories = {1: BOOM_BUST, 2: OVERLOAD, 3: BOOM_BUST, 4: STEADY, 5: [50.0]}
+        async with factory() as session:
+            statements = count_statements(session)
+            results = await BurnoutClassifier(session, cache=BurnoutClassificationCache()).classify_many(
+                trajectories
+            )
+            assert len(statements) == 1
+
+            single = BurnoutClassifier(session, cache=BurnoutClassificationCache())
+            for user_id, trajectory in trajectories.items():
+                assert await single.classify(user_id, trajectory) == results[user_id]
+
+        assert results[2].burnout_type == BurnoutType.AU_OVERLOAD
+        assert results[3].burnout_type == BurnoutType.AH_TRIPLE
+        assert results[5].trajectory_pattern == "insufficient_data"
+
+    async def test_cached_until_new_energy_point(self, factory):
+        """Repeated classification skips the database until the user is invalidated."""
+        cache = BurnoutClassificationCache()
+        set_burnout_cache(cache)
+        async with factory() as session:
+            statements = count_statements(session)
+            classifier = BurnoutClassifier(session)
+
+            first = await classifier.classify(1, BOOM_BUST)
+            assert await classifier.classify(1, BOOM_BUST) is first
+            assert (await classifier.classify_many({1: BOOM_BUST}))[1] is first
+            assert len(statements) == 1
+
+            invalidate_burnout_classification(1)
+            await classifier.classify(1, BOOM_BUST)
+            assert len(statements) == 2
+
+    def test_other_trajectory_misses(self):
+        """A cached result is only returned for the trajectory it was made from."""
+        cache = BurnoutClassificationCache(max_size=1)
+        classification = BurnoutClassifier._insufficient_data()
+        cache.put(1, BOOM_BUST, classification)
+
+        assert cache.get(1, BOOM_BUST) is classification
+        assert cache.get(1, BOOM_BUST + [40.0]) is None
+
+        cache.put(2, STEADY, classification)
+        assert len(cache) == 1
+        assert cache.get(1, BOOM_BUST) is None
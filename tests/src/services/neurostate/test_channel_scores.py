@@ -0,0 +1,180 @@
+"""
+Unit tests for the incremental channel scores.
+
+These tests verify:
+- One-pass keyword hits match the per-keyword scan of a message window
+- Hits decay per half-life, so recent messages outweigh older ones
+- Scores fade to "no signal" and the detector falls back to the default
+- Aggregates round-trip through JSON
+- detect() reads the aggregate without touching the database
+- Replaying the history reproduces the stored scores; drift is reported
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.models.neurostate import ChannelType
+from src.services.neurostate.channel import ChannelDominanceDetector
+from src.services.neurostate.channel_scores import (
+    CHANNEL_HALF_LIFE,
+    CHANNEL_SIGNALS,
+    ChannelScoreStore,
+    DecayedChannelScores,
+    channel_hits,
+    replay_channel_scores,
+    scores_from_hits,
+    verify_channel_scores,
+)
+
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+NOW = datetime(2026, 6, 8, 12, 0, tzinfo=timezone.utc)
+HISTORY = [
+    {"text": "I need a plan with specific steps and a deadline", "is_user": True,
+     "timestamp": NOW - timedelta(hours=8)},
+    {"text": "Sounds good", "is_user": False, "timestamp": NOW - timedelta(hours=7)},
+    {"text": "Maybe a new idea: what if we explore options?", "is_user": True,
+     "timestamp": NOW - timedelta(hours=1)},
+    {"text": "Let's just go and move now", "is_user": True, "timestamp": NOW},
+]
+
+
+def scan_window(messages: list[dict]) -> dict[ChannelType, float]:
+    """The per-keyword window scan detect() used before."""
+    hits = {ch: 0.0 for ch in CHANNEL_SIGNALS}
+    for msg in (m["text"].lower() for m in messages if m.get("is_user", False)):
+        for channel, keywords in CHANNEL_SIGNALS.items():
+            hits[channel] += sum(1 for kw in keywords if kw in msg)
+    return scores_from_hits(hits)
+
+
+# =============================================================================
+# TestHits
+# =============================================================================
+
+class TestHits:
+    """Test the one-pass keyword hits."""
+
+    def test_window_analysis_unchanged(self):
+        """_analyze_messages() gives the scores of the per-keyword scan."""
+        detector = ChannelDominanceDetector(db=None, score_store=ChannelScoreStore())
+
+        assert detector._analyze_messages(HISTORY) == scan_window(HISTORY)
+
+    def test_message_hits(self):
+        """Each channel's distinct keywords in a message are counted."""
+        hits = channel_hits("Why? I want to understand how to learn this")
+
+        assert hits[ChannelType.LEARNING] == 4
+        assert hits[ChannelType.SOCIAL] == 0
+
+
+# =============================================================================
+# TestDecayedChannelScores
+# =============================================================================
+
+class TestDecayedChannelScores:
+    """Test the per-user decayed hits."""
+
+    def test_decay_and_recency(self):
+        """Hits halve per half-life; the latest messages dominate."""
+        aggregate = DecayedChannelScores(user_id=1)
+        aggregate.observe({ChannelType.FOCUS: 4}, NOW - CHANNEL_HALF_LIFE)
+        aggregate.observe({ChannelType.CREATIVE: 3}, NOW)
+
+        totals = aggregate.totals(NOW)
+
+        assert totals[ChannelType.FOCUS] == pytest.approx(2.0)
+        assert max(aggregate.scores(NOW).items(), key=lambda x: x[1])[0] == ChannelType.CREATIVE
+
+    def test_out_of_order_matches_in_order(self):
+        """A late message gives the same totals as one in order."""
+        in_order = DecayedChannelScores(user_id=1)
+        shuffled = DecayedChannelScores(user_id=1)
+        events = [({ChannelType.SOCIAL: 2}, NOW - timedelta(hours=3)), ({ChannelType.SOCIAL: 1}, NOW)]
+        for counts, at in events:
+            in_order.observe(counts, at)
+        for counts, at in reversed(events):
+            shuffled.observe(counts, at)
+
+        assert shuffled.totals(NOW) == pytest.approx(in_order.totals(NOW))
+
+    def test_signal_fades(self):
+        """After enough half-lives there is no current signal."""
+        aggregate = DecayedChannelScores(user_id=1)
+        aggregate.observe({ChannelType.FOCUS: 2}, NOW)
+
+        assert aggregate.scores(NOW + 3 * CHANNEL_HALF_LIFE) is None
+
+    def test_json_round_trip(self):
+        """Serialized aggregates keep hits and time."""
+        aggregate = replay_channel_scores(1, HISTORY)
+
+        assert DecayedChannelScores.from_json(aggregate.to_json()) == aggregate
+
+
+# =============================================================================
+# TestDetector
+# =============================================================================
+
+class TestDetector:
+    """Test detect() on the aggregate."""
+
+    async def test_detect_reads_aggregate(self, fake_redis):
+        """Observed messages drive detect() without any query (db is None)."""
+        store = ChannelScoreStore(redis_client=fake_redis)
+        detector = ChannelDominanceDetector(db=None, score_store=store, clock=lambda: NOW)
+        for message in HISTORY:
+            if message["is_user"]:
+                await detector.observe_message(1, message["text"], message["timestamp"])
+
+        result = await detector.detect(1)
+
+        assert result.dominant_channel == ChannelType.CREATIVE
+        assert result.is_adhd_dominant
+
+    async def test_faded_scores_fall_back(self, broken_redis):
+        """Without a current signal detect() uses the stored state (none here)."""
+        store = ChannelScoreStore(redis_client=broken_redis)
+        await store.observe(1, {ChannelType.FOCUS: 3}, NOW - 10 * CHANNEL_HALF_LIFE)
+        detector = ChannelDominanceDetector(db=None, score_store=store, clock=lambda: NOW)
+
+        async def no_state(user_id):
+            return None
+        detector.get_current_state = no_state
+
+        result = await detector.detect(1)
+
+        assert result.channel_scores == {ch: 50.0 for ch in detector.CHANNELS}
+
+
+# =============================================================================
+# TestReplay
+# =============================================================================
+
+class TestReplay:
+    """Test rebuilding scores from history."""
+
+    async def test_replay_matches_incremental(self):
+        """Replaying the history gives the incrementally kept scores."""
+        store = ChannelScoreStore()
+        detector = ChannelDominanceDetector(db=None, score_store=store)
+        for message in HISTORY:
+            if message["is_user"]:
+                await detector.observe_message(1, message["text"], message["timestamp"])
+
+        assert await verify_channel_scores(1, HISTORY, store, NOW) == {}
+
+    async def test_verify_reports_drift(self):
+        """A stored aggregate that missed a message is reported."""
+        store = ChannelScoreStore()
+        await store.put(replay_channel_scores(1, HISTORY[:2]))
+
+        mismatches = await verify_channel_scores(1, HISTORY, store, NOW)
+
+        assert ChannelType.PHYSICAL in mismatches
+        assert await verify_channel_scores(2, HISTORY, store, NOW) == {}
@@ -0,0 +1,175 @@
+"""
+Unit tests for the incremental energy baseline.
+
+These tests verify:
+- The rolling mean matches the 7-day average and drops expired hours
+- The EWMA decays with elapsed time
+- Baselines round-trip through JSON; observe() updates stored ones
+- EnergyPredictor rebuilds a missing baseline once, then reads no records
+- Nightly reconciliation rebuilds every active user's baseline
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.models.base import Base
+from src.models.neurostate import EnergyLevelRecord
+from src.services.neurostate.energy import EnergyPredictor
+from src.services.neurostate.energy_baseline import (
+    EnergyBaselineStore,
+    RollingEnergyBaseline,
+    reconcile_energy_baselines,
+)
+
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+NOW = datetime(2026, 6, 8, 12, 0, tzinfo=timezone.utc)
+
+
+def hours_ago(hours: float) -> datetime:
+    return NOW - timedelta(hours=hours)
+
+
+@pytest.fixture
+async def factory():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[EnergyLevelRecord.__table__])
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def add_records(factory, rows: list[tuple[int, float, datetime]]) -> None:
+    async with factory() as session, session.begin():
+        await session.execute(insert(EnergyLevelRecord.__table__), [
+            {"user_id": user_id, "energy_level": "baseline", "energy_score": score,
+             "predicted_at": at, "created_at": at}
+            for user_id, score, at in rows
+        ])
+
+
+# =============================================================================
+# TestRollingEnergyBaseline
+# =============================================================================
+
+class TestRollingEnergyBaseline:
+    """Test the incremental window and EWMA."""
+
+    def test_mean_over_window(self):
+        """Scores older than 7 days leave the mean."""
+        baseline = RollingEnergyBaseline(user_id=1)
+        baseline.observe(90.0, hours_ago(8 * 24))
+        baseline.observe(40.0, hours_ago(30))
+        baseline.observe(60.0, hours_ago(1))
+
+        assert baseline.mean(NOW) == 50.0
+        assert len(baseline.buckets) == 2
+        assert baseline.mean(NOW + timedelta(days=8)) is None
+
+    def test_out_of_order_scores(self):
+        """Late scores land in their own hour and keep buckets sorted."""
+        baseline = RollingEnergyBaseline(user_id=1)
+        baseline.observe(60.0, hours_ago(1))
+        baseline.observe(20.0, hours_ago(5))
+
+        assert list(baseline.buckets) == sorted(baseline.buckets)
+        assert baseline.mean(NOW) == 40.0
+
+    def test_ewma_decays_with_time(self):
+        """After one half-life a new score moves the EWMA halfway."""
+        baseline = RollingEnergyBaseline(user_id=1)
+        baseline.observe(80.0, hours_ago(72))
+        baseline.observe(40.0, NOW)
+
+        assert baseline.ewma == pytest.approx(60.0)
+
+    def test_json_round_trip(self):
+        """Serialized baselines keep buckets, totals and EWMA."""
+        baseline = RollingEnergyBaseline.from_records(1, [(30.0, hours_ago(3)), (50.0, hours_ago(2))])
+
+        restored = RollingEnergyBaseline.from_json(baseline.to_json())
+
+        assert restored == baseline
+        assert restored.mean(NOW) == 40.0
+
+
+# =============================================================================
+# TestStore
+# =============================================================================
+
+class TestStore:
+    """Test observe() on the store."""
+
+    async def test_redis_and_observe(self, fake_redis):
+        """observe() updates a stored baseline; unknown users are skipped."""
+        store = EnergyBaselineStore(redis_client=fake_redis)
+        await store.put(RollingEnergyBaseline(user_id=1))
+
+        await store.observe(1, 70.0, NOW)
+        await store.observe(2, 70.0, NOW)
+
+        assert (await store.get(1)).mean(NOW) == 70.0
+        assert await store.get(2) is None
+
+
+# =============================================================================
+# TestPredictor
+# =============================================================================
+
+class TestPredictor:
+    """Test the predictor's baseline reads."""
+
+    async def test_rebuilds_once_then_no_queries(self, factory):
+        """A cold baseline is rebuilt from records; later reads skip the database."""
+        await add_records(factory, [(1, 30.0, datetime.now(timezone.utc) - timedelta(hours=2))])
+        statements: list[str] = []
+        async with factory() as session:
+            event.listen(
+                session.bind.sync_engine, "before_cursor_execute",
+                lambda *args: statements.append(args[2]),
+            )
+            predictor = EnergyPredictor(session, baseline_store=EnergyBaselineStore())
+
+            assert await predictor._get_user_baseline(1) == 30.0
+            assert await predictor._get_user_baseline(1) == 30.0
+
+        assert len(statements) == 1
+
+    async def test_no_history_uses_default(self, factory):
+        """Users without records get the neutral baseline."""
+        async with factory() as session:
+            predictor = EnergyPredictor(session, baseline_store=EnergyBaselineStore())
+
+            assert await predictor._get_user_baseline(9) == EnergyPredictor.ENERGY_BASELINE
+
+
+# =============================================================================
+# TestReconciliation
+# =============================================================================
+
+class TestReconciliation:
+    """Test the nightly rebuild."""
+
+    async def test_rebuilds_all_users(self, factory):
+        """Each user with recent records gets a fresh baseline; stale drift is replaced."""
+        await add_records(factory, [
+            (1, 20.0, hours_ago(3)),
+            (1, 40.0, hours_ago(2)),
+            (2, 80.0, hours_ago(1)),
+            (3, 10.0, hours_ago(10 * 24)),
+        ])
+        store = EnergyBaselineStore()
+        await store.put(RollingEnergyBaseline.from_records(1, [(99.0, hours_ago(1))]))
+
+        written = await reconcile_energy_baselines(store, factory, now=NOW, batch_size=2)
+
+        assert written == 2
+        assert (await store.get(1)).mean(NOW) == 30.0
+        assert (await store.get(2)).mean(NOW) == 80.0
+        assert await store.get(3) is None
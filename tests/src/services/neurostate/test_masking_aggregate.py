@@ -0,0 +1,244 @@
+"""
+Unit tests for the time-decayed masking aggregates.
+
+These tests verify:
+- Context loads accumulate per event and halve every half-life
+- Contexts expire lazily 24 hours after their last update
+- Out-of-order events and reductions give the same loads as the log
+- Aggregates round-trip through JSON; observe() updates stored ones
+- MaskingLoadTracker rebuilds a missing aggregate once, then reads no log rows
+- verify_masking_loads() reports drift from the log
+- The snapshot loader uses the aggregate, rebuilding and storing a cold one
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.models.base import Base
+from src.models.neurostate import (
+    BurnoutAssessment,
+    ChannelState,
+    EnergyLevelRecord,
+    InertiaEvent,
+    MaskingLog,
+    SensoryProfile,
+)
+from src.services.neurostate.masking import MaskingLoadTracker
+from src.services.neurostate.masking_aggregate import (
+    DECAY_HALF_LIFE,
+    DecayedMaskingLoad,
+    MaskingLoadStore,
+    rebuild_masking_load,
+    verify_masking_loads,
+)
+from src.services.neurostate.snapshot import NeurostateSnapshotCache, NeurostateSnapshotLoader
+
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+NOW = datetime(2026, 6, 8, 12, 0, tzinfo=timezone.utc)
+HALF_LIFE_HOURS = DECAY_HALF_LIFE.total_seconds() / 3600
+
+
+def hours_ago(hours: float, now: datetime = NOW) -> datetime:
+    return now - timedelta(hours=hours)
+
+
+@pytest.fixture
+async def factory():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[
+            SensoryProfile.__table__, MaskingLog.__table__, BurnoutAssessment.__table__,
+            ChannelState.__table__, InertiaEvent.__table__, EnergyLevelRecord.__table__,
+        ])
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def log_events(factory, rows: list[tuple[int, str, float, datetime]]) -> None:
+    async with factory() as session, session.begin():
+        await session.execute(insert(MaskingLog.__table__), [
+            {"user_id": user_id, "context": context, "masking_type": "social_camouflaging",
+             "load_score": load, "duration_minutes": None, "notes": None,
+             "logged_at": at, "created_at": at}
+            for user_id, context, load, at in rows
+        ])
+
+
+# =============================================================================
+# TestDecayedMaskingLoad
+# =============================================================================
+
+class TestDecayedMaskingLoad:
+    """Test the per-context running totals."""
+
+    def test_accumulates_and_decays(self):
+        """Loads add up per context and halve after one half-life."""
+        aggregate = DecayedMaskingLoad(user_id=1)
+        aggregate.observe("work", 20.0, NOW)
+        aggregate.observe("work", 10.0, NOW)
+        aggregate.observe("family", 8.0, NOW)
+
+        assert aggregate.loads(NOW) == {"work": 30.0, "family": 8.0}
+        later = aggregate.loads(NOW + DECAY_HALF_LIFE)
+        assert later["work"] == pytest.approx(15.0)
+        assert later["family"] == pytest.approx(4.0)
+
+    def test_contexts_expire_lazily(self):
+        """A context untouched for 24 hours is dropped on read and restarts on its next event."""
+        aggregate = DecayedMaskingLoad(user_id=1)
+        aggregate.observe("work", 40.0, hours_ago(25))
+        aggregate.observe("family", 10.0, hours_ago(1))
+
+        assert set(aggregate.loads(NOW)) == {"family"}
+        assert "work" not in aggregate.contexts
+
+        aggregate.observe("social", 50.0, hours_ago(30))
+        aggregate.observe("social", 5.0, NOW)
+        assert aggregate.loads(NOW)["social"] == 5.0
+
+    def test_out_of_order_matches_in_order(self):
+        """Late events give the same loads as events in order."""
+        events = [("work", 20.0, hours_ago(6)), ("work", 10.0, hours_ago(2)), ("work", -5.0, hours_ago(1))]
+        in_order = DecayedMaskingLoad.from_events(1, events)
+        shuffled = DecayedMaskingLoad.from_events(1, [events[1], events[2], events[0]])
+
+        assert shuffled.loads(NOW)["work"] == pytest.approx(in_order.loads(NOW)["work"])
+
+    def test_reductions_never_go_negative(self):
+        """A reduction larger than the load reads as zero."""
+        aggregate = DecayedMaskingLoad.from_events(1, [("work", 10.0, hours_ago(1)), ("work", -50.0, NOW)])
+
+        assert aggregate.loads(NOW) == {"work": 0.0}
+
+    def test_json_round_trip(self):
+        """Serialized aggregates keep loads and timestamps."""
+        aggregate = DecayedMaskingLoad.from_events(1, [("work", 12.5, hours_ago(3))])
+
+        restored = DecayedMaskingLoad.from_json(aggregate.to_json())
+
+        assert restored == aggregate
+
+
+# =============================================================================
+# TestStore
+# =============================================================================
+
+class TestStore:
+    """Test observe() on the store."""
+
+    async def test_redis_and_observe(self, fake_redis):
+        """observe() updates a stored aggregate; unknown users are skipped."""
+        store = MaskingLoadStore(redis_client=fake_redis)
+        await store.put(DecayedMaskingLoad(user_id=1))
+
+        await store.observe(1, "work", 15.0, NOW)
+        await store.observe(2, "work", 15.0, NOW)
+
+        assert (await store.get(1)).loads(NOW) == {"work": 15.0}
+        assert await store.get(2) is None
+
+
+# =============================================================================
+# TestTracker
+# =============================================================================
+
+class TestTracker:
+    """Test the tracker's reads."""
+
+    async def test_rebuilds_once_then_no_queries(self, factory):
+        """A cold aggregate is rebuilt from the log; later reads skip the database."""
+        now = datetime.now(timezone.utc)
+        await log_events(factory, [(1, "work", 20.0, hours_ago(1, now)), (2, "work", 90.0, now)])
+        store = MaskingLoadStore()
+        statements: list[str] = []
+        async with factory() as session:
+            event.listen(
+                session.bind.sync_engine, "before_cursor_execute",
+                lambda *args: statements.append(args[2]),
+            )
+            tracker = MaskingLoadTracker(session, load_store=store)
+
+            first = await tracker._get_context_loads(1)
+            await store.observe(1, "family", 5.0, datetime.now(timezone.utc))
+            second = await tracker._get_context_loads(1)
+
+        assert first["work"] == pytest.approx(20.0 * 0.5 ** (1 / HALF_LIFE_HOURS), rel=1e-3)
+        assert set(second) == {"work", "family"}
+        assert len(statements) == 1
+
+
+# =============================================================================
+# TestRebuildAndVerify
+# =============================================================================
+
+class TestRebuildAndVerify:
+    """Test the rebuild-from-log path."""
+
+    async def test_rebuild_matches_incremental(self, factory):
+        """Replaying the log gives the incrementally kept loads."""
+        events = [
+            ("work", 20.0, hours_ago(30)),
+            ("work", 15.0, hours_ago(10)),
+            ("family", 12.0, hours_ago(3)),
+            ("work", -5.0, hours_ago(1)),
+        ]
+        await log_events(factory, [(1, ctx, load, at) for ctx, load, at in events])
+        incremental = DecayedMaskingLoad(user_id=1)
+        for ctx, load, at in events:
+            incremental.observe(ctx, load, at)
+
+        async with factory() as session:
+            rebuilt = await rebuild_masking_load(session, 1, NOW)
+
+        assert rebuilt.loads(NOW) == pytest.approx(incremental.loads(NOW))
+
+    async def test_verify_reports_drift(self, factory):
+        """A stored aggregate that misses an event is reported."""
+        await log_events(factory, [(1, "work", 20.0, hours_ago(2)), (1, "social", 30.0, hours_ago(1))])
+        store = MaskingLoadStore()
+        await store.put(DecayedMaskingLoad.from_events(1, [("work", 20.0, hours_ago(2))]))
+
+        async with factory() as session:
+            mismatches = await verify_masking_loads(session, 1, store, NOW)
+            assert set(mismatches) == {"social"}
+            assert mismatches["social"][0] == 0.0
+
+            await store.observe(1, "social", 30.0, hours_ago(1))
+            assert await verify_masking_loads(session, 1, store, NOW) == {}
+
+
+# =============================================================================
+# TestSnapshot
+# =============================================================================
+
+class TestSnapshot:
+    """Test the snapshot's masking source."""
+
+    async def test_cold_store_rebuilt_in_snapshot(self, factory):
+        """A cold store is rebuilt from the snapshot query and kept; no raw 24-hour sum."""
+        await log_events(factory, [(1, "work", 40.0, hours_ago(HALF_LIFE_HOURS))])
+        store = MaskingLoadStore()
+        loader = NeurostateSnapshotLoader(
+            factory, cache=NeurostateSnapshotCache(), clock=lambda: NOW, masking_store=store
+        )
+
+        assert (await loader.load(1, use_cache=False)).masking_loads == {"work": pytest.approx(20.0)}
+        assert (await store.get(1)).loads(NOW) == {"work": pytest.approx(20.0)}
+
+    async def test_snapshot_uses_stored_aggregate(self, factory):
+        """With a warm store the stored decayed loads are used, not the log."""
+        await log_events(factory, [(1, "work", 40.0, hours_ago(HALF_LIFE_HOURS))])
+        store = MaskingLoadStore()
+        await store.put(DecayedMaskingLoad.from_events(1, [("family", 10.0, NOW)]))
+        loader = NeurostateSnapshotLoader(
+            factory, cache=NeurostateSnapshotCache(), clock=lambda: NOW, masking_store=store
+        )
+
+        assert (await loader.load(1, use_cache=False)).masking_loads == {"family": 10.0}
@@ -0,0 +1,174 @@
+"""
+Unit tests for read-time sensory and spoon recovery.
+
+These tests verify:
+- Sensory load holds during the segment's delay, then halves per half-life
+- Unknown segments fall back to a default configuration
+- Spoons regain whole spoons per hour and carry partial progress in the anchor
+- SensoryStateAssessment reads recovered loads (stored and pending)
+- The snapshot loader recovers sensory loads to its clock
+"""
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.core.segment_context import SegmentContext
+from src.models.base import Base
+from src.models.neurostate import (
+    BurnoutAssessment,
+    ChannelState,
+    EnergyLevelRecord,
+    InertiaEvent,
+    MaskingLog,
+    SensoryProfile,
+)
+from src.services.neurostate.recovery import (
+    MAX_SPOONS,
+    elapsed_hours,
+    recover_sensory,
+    recover_spoons,
+    segment_neurostate,
+    sensory_recovery_factor,
+)
+from src.services.neurostate.sensory import SensoryStateAssessment
+from src.services.neurostate.snapshot import NeurostateSnapshotCache, NeurostateSnapshotLoader
+from src.services.write_behind import WriteBehindBuffer
+
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+NOW = datetime(2026, 6, 8, 12, 0, tzinfo=timezone.utc)
+AU = SegmentContext.from_code("AU").neuro
+AD = SegmentContext.from_code("AD").neuro
+AH = SegmentContext.from_code("AH").neuro
+
+
+def hours_later(hours: float) -> datetime:
+    return NOW + timedelta(hours=hours)
+
+
+def profile(vector, last_assessed=NOW, segment_code="AU") -> SimpleNamespace:
+    return SimpleNamespace(
+        id=1, modality_vector=vector, last_assessed=last_assessed, segment_code=segment_code
+    )
+
+
+# =============================================================================
+# TestSensoryRecovery
+# =============================================================================
+
+class TestSensoryRecovery:
+    """Test the sensory recovery curve."""
+
+    def test_delay_then_half_life(self):
+        """AU load holds for the delay, then halves every half-life."""
+        assert sensory_recovery_factor(AU.sensory_recovery_delay_hours, AU) == 1.0
+
+        hours = AU.sensory_recovery_delay_hours + AU.sensory_recovery_half_life_hours
+        assert sensory_recovery_factor(hours, AU) == pytest.approx(0.5)
+
+    def test_recover_vector(self):
+        """Every modality decays by the same factor; no time elapsed keeps the vector."""
+        vector = (80.0, 40.0, 0.0, 0.0, 20.0)
+
+        assert recover_sensory(vector, NOW, NOW, AD) == vector
+        assert recover_sensory(vector, NOW, hours_later(AD.sensory_recovery_half_life_hours), AD) == (
+            40.0, 20.0, 0.0, 0.0, 10.0,
+        )
+
+    def test_naive_and_future_times(self):
+        """Naive stored times are UTC; times after now count as no elapsed time."""
+        assert elapsed_hours(NOW.replace(tzinfo=None), hours_later(2)) == pytest.approx(2.0)
+        assert elapsed_hours(hours_later(1), NOW) == 0.0
+        assert elapsed_hours(None, NOW) == 0.0
+
+    def test_unknown_segment_uses_default(self):
+        """Missing or unknown segment codes get the default configuration."""
+        assert segment_neurostate(None) == AU
+        assert segment_neurostate("XX", default="AD") == AD
+
+
+# =============================================================================
+# TestSpoonRecovery
+# =============================================================================
+
+class TestSpoonRecovery:
+    """Test the spoon recovery rate and anchor."""
+
+    def test_whole_spoons_capped(self):
+        """Each pool regains whole spoons per hour, up to the maximum."""
+        pools, anchor = recover_spoons((2, 9, 10, 0, 5, 7), NOW, hours_later(3.5), AU)
+
+        assert pools == (5, MAX_SPOONS, MAX_SPOONS, 3, 8, MAX_SPOONS)
+        assert anchor == hours_later(3)
+
+    def test_partial_progress_is_carried(self):
+        """Reading often regains as much as reading once."""
+        pools, anchor = (0,) * 6, NOW
+        for step in range(1, 9):
+            pools, anchor = recover_spoons(pools, anchor, hours_later(step * 0.5), AH)
+
+        assert pools == recover_spoons((0,) * 6, NOW, hours_later(4), AH)[0] == (2,) * 6
+
+    def test_full_or_unknown_restarts_at_now(self):
+        """Full drawers and drawers without a timestamp anchor at now."""
+        assert recover_spoons((10,) * 6, NOW, hours_later(5), AU) == ((10,) * 6, hours_later(5))
+        assert recover_spoons((3,) * 6, None, NOW, AU) == ((3,) * 6, NOW)
+
+
+# =============================================================================
+# TestServices
+# =============================================================================
+
+class TestServices:
+    """Test recovery as seen through the services."""
+
+    def test_sensory_reads_recovered_loads(self):
+        """Stored loads are recovered to the service's clock."""
+        service = SensoryStateAssessment(db=None, clock=lambda: hours_later(9))
+
+        vector, last_assessed = service._current_vector(profile((90.0, 0.0, 0.0, 0.0, 0.0)), service._clock())
+
+        assert vector == (45.0, 0.0, 0.0, 0.0, 0.0)
+        assert last_assessed == NOW
+
+    async def test_pending_update_recovers_from_its_time(self):
+        """An update still in the buffer recovers from when it was made."""
+        writer = WriteBehindBuffer(session_factory=None)
+        await writer.update(
+            SensoryProfile.__table__, 1,
+            {"modality_loads": (0.0, 60.0, 0.0, 0.0, 0.0), "last_assessed": hours_later(1)},
+        )
+        service = SensoryStateAssessment(db=None, writer=writer)
+
+        vector, _ = service._current_vector(profile((90.0,) * 5, segment_code="AD"), hours_later(3))
+
+        assert vector == (0.0, 30.0, 0.0, 0.0, 0.0)
+
+    async def test_snapshot_recovers_to_clock(self):
+        """The snapshot's sensory loads are recovered to the loader's clock."""
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all, tables=[
+                SensoryProfile.__table__, MaskingLog.__table__, BurnoutAssessment.__table__,
+                ChannelState.__table__, InertiaEvent.__table__, EnergyLevelRecord.__table__,
+            ])
+            await conn.execute(insert(SensoryProfile.__table__), [{
+                "user_id": 1, "modality_loads": {"auditory": 80.0}, "overall_load": 80.0,
+                "last_assessed": NOW, "segment_code": "AU", "created_at": NOW, "updated_at": NOW,
+            }])
+        loader = NeurostateSnapshotLoader(
+            async_sessionmaker(engine), cache=NeurostateSnapshotCache(), clock=lambda: hours_later(9)
+        )
+
+        snapshot = await loader.load(1, use_cache=False)
+        await engine.dispose()
+
+        assert snapshot.sensory_loads["auditory"] == 40.0
+        assert snapshot.sensory_load == 40.0
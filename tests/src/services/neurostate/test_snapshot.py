@@ -0,0 +1,300 @@
+"""
+Unit tests for the neurostate snapshot loader.
+
+These tests verify:
+- All six neurostate tables are read in a single round-trip
+- Only current rows count (unresolved burnout, open channel, ongoing inertia,
+  undecayed masking)
+- The energy baseline comes from the baseline store (rebuilt when cold)
+- Snapshots are cached per user and invalidated by writes
+- A load racing a write does not cache stale data, with bounded bookkeeping
+- Both Redis stores are read in one round trip before the query
+- The pre-flight uses the snapshot for overload detection
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.models.base import Base
+from src.models.neurostate import (
+    BurnoutAssessment,
+    ChannelState,
+    EnergyLevelRecord,
+    InertiaEvent,
+    MaskingLog,
+    SENSORY_MODALITIES,
+    SensoryProfile,
+)
+from src.services.neurostate.energy_baseline import EnergyBaselineStore, RollingEnergyBaseline
+from src.services.neurostate.masking_aggregate import DECAY_HALF_LIFE, MaskingLoadStore
+from src.services.neurostate.snapshot import (
+    NeurostateSnapshot,
+    NeurostateSnapshotCache,
+    NeurostateSnapshotLoader,
+)
+from src.workflows.daily_workflow import DailyWorkflow
+
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+NOW = datetime(2026, 6, 1, 12, 0)
+TABLES = [
+    SensoryProfile.__table__,
+    MaskingLog.__table__,
+    BurnoutAssessment.__table__,
+    ChannelState.__table__,
+    InertiaEvent.__table__,
+    EnergyLevelRecord.__table__,
+]
+
+
+@pytest.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=TABLES)
+    yield engine
+    await engine.dispose()
+
+
+def count_statements(engine) -> list[str]:
+    statements: list[str] = []
+    event.listen(
+        engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2])
+    )
+    return statements
+
+
+async def seed(engine, user_id: int = 1) -> None:
+    ts = {"created_at": NOW, "updated_at": NOW}
+    async with engine.begin() as conn:
+        await conn.execute(insert(SensoryProfile.__table__), [{
+            "user_id": user_id, "modality_loads": {"auditory": 85.0},
+            "overall_load": 85.0, "last_assessed": NOW, "segment_code": "AU", **ts,
+        }])
+        await conn.execute(insert(MaskingLog.__table__), [
+            {"user_id": user_id, "context": "work", "masking_type": "social",
+             "load_score": 20.0, "logged_at": NOW - timedelta(hours=1), "created_at": NOW},
+            {"user_id": user_id, "context": "work", "masking_type": "social",
+             "load_score": 10.0, "logged_at": NOW - timedelta(hours=2), "created_at": NOW},
+            {"user_id": user_id, "context": "family", "masking_type": "social",
+             "load_score": 50.0, "logged_at": NOW - timedelta(days=2), "created_at": NOW},
+        ])
+        await conn.execute(insert(BurnoutAssessment.__table__), [
+            {"user_id": user_id, "burnout_type": "adhd_boom_bust", "severity_score": 40.0,
+             "assessed_at": NOW - timedelta(days=3), "resolved_at": NOW - timedelta(days=1), **ts},
+            {"user_id": user_id, "burnout_type": "autistic_burnout", "severity_score": 90.0,
+             "assessed_at": NOW - timedelta(hours=5), "resolved_at": None, **ts},
+        ])
+        await conn.execute(insert(ChannelState.__table__), [{
+            "user_id": user_id, "dominant_channel": "adhd", "channel_scores": {"adhd": 70.0},
+            "confidence": 0.8, "period_start": NOW, "created_at": NOW,
+        }])
+        await conn.execute(insert(InertiaEvent.__table__), [
+            {"user_id": user_id, "inertia_type": "double_block", "severity": 60.0,
+             "outcome": "resolved", "detected_at": NOW, **ts},
+        ])
+        await conn.execute(insert(EnergyLevelRecord.__table__), [
+            {"user_id": user_id, "energy_level": "yellow", "energy_score": 40.0,
+             "predicted_at": NOW - timedelta(hours=3), "created_at": NOW},
+            {"user_id": user_id, "energy_level": "red", "energy_score": 20.0,
+             "predicted_at": NOW - timedelta(hours=1), "created_at": NOW},
+        ])
+
+
+def make_loader(engine, cache=None, baseline_store=None) -> NeurostateSnapshotLoader:
+    return NeurostateSnapshotLoader(
+        async_sessionmaker(engine),
+        cache if cache is not None else NeurostateSnapshotCache(),
+        clock=lambda: NOW,
+        masking_store=MaskingLoadStore(),
+        baseline_store=baseline_store if baseline_store is not None else EnergyBaselineStore(),
+    )
+
+
+# =============================================================================
+# TestLoader
+# =============================================================================
+
+class TestLoader:
+    """Test the single-query load."""
+
+    async def test_one_round_trip(self, engine):
+        """All tables are read with one statement."""
+        await seed(engine)
+        statements = count_statements(engine)
+
+        await make_loader(engine).load(1)
+
+        assert len(statements) == 1
+        assert "UNION ALL" in statements[0]
+
+    async def test_current_rows_only(self, engine):
+        """The snapshot holds the current state of every service."""
+        await seed(engine)
+        await seed(engine, user_id=2)
+
+        snapshot = await make_loader(engine).load(1)
+
+        assert snapshot.sensory_load == 85.0
+        assert snapshot.sensory_loads == dict.fromkeys(SENSORY_MODALITIES, 0.0) | {"auditory": 85.0}
+        half_lives = 3600 / DECAY_HALF_LIFE.total_seconds()
+        assert snapshot.masking_loads == {
+            "work": pytest.approx(20.0 * 0.5 ** half_lives + 10.0 * 0.5 ** (2 * half_lives))
+        }
+        assert (snapshot.burnout_type, snapshot.burnout_severity) == ("autistic_burnout", 90.0)
+        assert snapshot.dominant_channel == "adhd"
+        assert snapshot.channel_scores == {"adhd": 70.0}
+        assert snapshot.inertia_type is None
+        assert (snapshot.energy_level, snapshot.energy_score) == ("red", 20.0)
+        assert snapshot.energy_baseline == 30.0
+
+    async def test_energy_baseline_from_store(self, engine):
+        """A stored baseline is used as is; a cold one is rebuilt and stored."""
+        await seed(engine)
+        store = EnergyBaselineStore()
+        stored = RollingEnergyBaseline(user_id=1)
+        stored.observe(55.0, NOW - timedelta(hours=1))
+        await store.put(stored)
+        statements = count_statements(engine)
+
+        warm = await make_loader(engine, baseline_store=store).load(1)
+        await store.delete(1)
+        cold = await make_loader(engine, baseline_store=store).load(1)
+
+        assert warm.energy_baseline == 55.0
+        assert statements[0].count("FROM energy_level_records") == 1  # Latest row only
+        assert cold.energy_baseline == 30.0
+        assert (await store.get(1)).mean(NOW) == 30.0
+
+    async def test_stores_read_in_one_round_trip(self, engine, fake_redis):
+        """Masking aggregate and energy baseline share one MGET."""
+        await seed(engine)
+        loader = NeurostateSnapshotLoader(
+            async_sessionmaker(engine),
+            NeurostateSnapshotCache(),
+            clock=lambda: NOW,
+            masking_store=MaskingLoadStore(redis_client=fake_redis),
+            baseline_store=EnergyBaselineStore(redis_client=fake_redis),
+        )
+
+        await loader.load(1)
+        snapshot = await loader.load(1, use_cache=False)
+
+        assert fake_redis.mgets == [["aurora:masking:load:1", "aurora:energy:baseline:1"]] * 2
+        assert set(snapshot.masking_loads) == {"work"}
+        assert snapshot.energy_baseline == 30.0
+
+    async def test_empty_user(self, engine):
+        """A user without rows gets an empty snapshot."""
+        snapshot = await make_loader(engine).load(7)
+
+        assert snapshot.sensory_load is None
+        assert snapshot.burnout_risk is None
+        assert snapshot.masking_load == 0.0
+        assert snapshot.to_preflight()["masking_cost"] is None
+
+
+# =============================================================================
+# TestCache
+# =============================================================================
+
+class TestCache:
+    """Test caching and write invalidation."""
+
+    async def test_cached_until_invalidated(self, engine):
+        """A second load hits the cache; a write forces a reload."""
+        await seed(engine)
+        cache = NeurostateSnapshotCache()
+        loader = make_loader(engine, cache)
+        statements = count_statements(engine)
+
+        first = await loader.load(1)
+        assert await loader.load(1) is first
+        assert len(statements) == 1
+
+        cache.invalidate(1)
+        await loader.load(1)
+        assert len(statements) == 2
+
+    def test_load_racing_write_not_cached(self):
+        """A snapshot loaded before an invalidation is not stored."""
+        cache = NeurostateSnapshotCache()
+        generation = cache.generation(1)
+        cache.invalidate(1)
+
+        cache.put(NeurostateSnapshot(user_id=1), generation)
+
+        assert cache.get(1) is None
+
+    def test_invalidation_bookkeeping_bounded(self):
+        """Only max_size users' invalidations are kept; forgotten ones still refuse stale loads."""
+        cache = NeurostateSnapshotCache(max_size=2)
+        generation = cache.generation(1)
+        for user_id in range(1, 5):
+            cache.invalidate(user_id)
+
+        cache.put(NeurostateSnapshot(user_id=1), generation)
+        cache.put(NeurostateSnapshot(user_id=4), cache.generation(4))
+
+        assert len(cache._invalidated) == 2
+        assert cache.get(1) is None
+        assert cache.get(4) is not None
+
+    def test_ttl_and_size(self):
+        """Expired snapshots are dropped; the oldest is evicted when full."""
+        cache = NeurostateSnapshotCache(ttl=-1)
+        cache.put(NeurostateSnapshot(user_id=1))
+        assert cache.get(1) is None
+
+        cache = NeurostateSnapshotCache(max_size=2)
+        for user_id in range(3):
+            cache.put(NeurostateSnapshot(user_id=user_id))
+        assert len(cache) == 2
+        assert cache.get(0) is None
+
+
+# =============================================================================
+# TestPreflight
+# =============================================================================
+
+class TestPreflight:
+    """Test the pre-flight integration."""
+
+    async def test_preflight_detects_overload(self, engine):
+        """The active burnout severity drives overload detection."""
+        await seed(engine)
+        workflow = DailyWorkflow(neurostate_loader=make_loader(engine))
+
+        snapshot, overload = await workflow.run_neurostate_preflight(1, "AU")
+
+        assert overload
+        assert snapshot["energy_level"] == "red"
+        assert snapshot["sensory_load"] == 85.0
+        assert snapshot["burnout_risk"] == 0.9
+
+    async def test_preflight_survives_load_failure(self):
+        """A failing database leaves the tier-only snapshot."""
+        def broken_session():
+            raise ConnectionError("db down")
+
+        loader = NeurostateSnapshotLoader(broken_session, NeurostateSnapshotCache())
+        workflow = DailyWorkflow(neurostate_loader=loader)
+
+        snapshot, overload = await workflow.run_neurostate_preflight(1, "AU")
+
+        assert not overload
+        assert snapshot["burnout_risk"] is None
+
+    def test_global_workflow_uses_snapshot(self, monkeypatch):
+        """The global DailyWorkflow runs the pre-flight on the snapshot loader."""
+        from src.workflows import daily_workflow
+
+        monkeypatch.setattr(daily_workflow, "_daily_workflow", None)
+
+        assert isinstance(daily_workflow.get_daily_workflow()._neurostate_loader, NeurostateSnapshotLoader)
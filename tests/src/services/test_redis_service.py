@@ -0,0 +1,78 @@
+"""
+Unit tests for the Redis service.
+
+These tests verify:
+- Connection attempts back off exponentially while Redis is down
+- A successful connection resets the backoff
+"""
+
+import redis.asyncio as redis
+
+from src.services import redis_service
+from src.services.redis_service import RedisService
+
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+class FakeClient:
+    """redis.asyncio client whose ping fails while `up` is False."""
+
+    up = False
+
+    async def ping(self):
+        if not FakeClient.up:
+            raise redis.ConnectionError("Connection refused")
+        return True
+
+
+def install_fake_redis(monkeypatch, clock: list[float]) -> list[str]:
+    """Route from_url() to FakeClient and time.monotonic() to `clock`."""
+    attempts: list[str] = []
+
+    def from_url(url, **kwargs):
+        attempts.append(url)
+        return FakeClient()
+
+    FakeClient.up = False
+    monkeypatch.setattr(redis_service.redis, "from_url", from_url)
+    monkeypatch.setattr(redis_service.time, "monotonic", lambda: clock[0])
+    return attempts
+
+
+# =============================================================================
+# TestReconnectBackoff
+# =============================================================================
+
+class TestReconnectBackoff:
+    """Test reconnect attempts while Redis is unavailable."""
+
+    async def test_attempts_back_off_while_down(self, monkeypatch):
+        """Calls within the backoff window do not try to connect."""
+        clock = [100.0]
+        attempts = install_fake_redis(monkeypatch, clock)
+        service = RedisService()
+
+        assert await service.get("k") is None
+        assert await service.get("k") is None
+        clock[0] += 1.0
+        assert await service.get_client() is None
+        clock[0] += 1.0
+        assert await service.get_client() is None  # Backoff is now 2s
+        clock[0] += 1.0
+        assert await service.get_client() is None
+
+        assert len(attempts) == 3
+
+    async def test_success_resets_backoff(self, monkeypatch):
+        """Once connected, the next outage starts at the initial backoff again."""
+        clock = [100.0]
+        install_fake_redis(monkeypatch, clock)
+        service = RedisService()
+        await service.get_client()
+        clock[0] += 1.0
+        FakeClient.up = True
+
+        assert isinstance(await service.get_client(), FakeClient)
+        assert service._backoff == RedisService.RECONNECT_BACKOFF
@@ -0,0 +1,132 @@
+"""
+Unit tests for the bulk side effect writer (SQLite file database).
+
+These tests verify:
+- Inserts and updates of one batch are executemany statements in one commit
+- Updates only touch rows owned by the batch user
+- A failing statement rolls back the whole batch
+- The executor marks every coalesced effect of a failed batch as failed
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+
+from src.core.side_effects import (
+    ConcurrentSideEffectExecutor,
+    SideEffect,
+    SideEffectBatch,
+    SideEffectType,
+)
+from src.models.base import Base
+from src.models.task import Task
+from src.services.side_effect_writer import SQLAlchemyBulkWriter
+
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+NOW = datetime(2026, 6, 1, 9, 0, tzinfo=timezone.utc)
+TASKS = Task.__table__
+
+
+@pytest.fixture
+def db(tmp_path):
+    """File database with the task table; records statements and commits."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'effects.db'}")
+    Base.metadata.create_all(engine, tables=[TASKS])
+    log = {"statements": [], "commits": 0}
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        log["statements"].append((statement.split()[0], executemany))
+
+    @event.listens_for(engine, "commit")
+    def commit(conn):
+        log["commits"] += 1
+
+    yield engine, sessionmaker(engine), log
+    engine.dispose()
+
+
+def save_task(title: str) -> SideEffect:
+    return SideEffect.save_task({
+        "title": title, "status": "pending", "created_at": NOW, "updated_at": NOW,
+    })
+
+
+def update_task(task_id: int, **values) -> SideEffect:
+    return SideEffect(
+        effect_type=SideEffectType.UPDATE_TASK,
+        payload={"id": task_id, "updated_at": NOW, **values},
+    )
+
+
+def rows(engine) -> list[tuple]:
+    with engine.connect() as conn:
+        return conn.execute(
+            select(TASKS.c.user_id, TASKS.c.title, TASKS.c.status).order_by(TASKS.c.id)
+        ).all()
+
+
+# =============================================================================
+# TestSQLAlchemyBulkWriter
+# =============================================================================
+
+class TestSQLAlchemyBulkWriter:
+    """Test coalesced writes against a real database."""
+
+    async def test_coalesced_insert_and_update(self, db):
+        """Three inserts are one executemany, three updates another; one commit each."""
+        engine, factory, log = db
+        writer = SQLAlchemyBulkWriter(factory)
+        await writer(2, [save_task("other")])
+        log["statements"].clear()
+        log["commits"] = 0
+
+        await writer(1, [save_task("a"), save_task("b"), save_task("c")])
+        await writer(1, [
+            update_task(2, status="completed"),
+            update_task(3, status="completed"),
+            update_task(1, status="completed"),  # User 2's row: untouched
+        ])
+
+        assert rows(engine) == [
+            (2, "other", "pending"),
+            (1, "a", "completed"),
+            (1, "b", "completed"),
+            (1, "c", "pending"),
+        ]
+        assert [s for s in log["statements"] if s[0] in ("INSERT", "UPDATE")] == [
+            ("INSERT", True),
+            ("UPDATE", True),
+        ]
+        assert log["commits"] == 2
+
+    async def test_failure_rolls_back_batch(self, db):
+        """A constraint violation undoes the batch's earlier inserts."""
+        engine, factory, log = db
+        writer = SQLAlchemyBulkWriter(factory)
+        await writer(1, [save_task("kept")])
+
+        with pytest.raises(IntegrityError):
+            await writer(1, [save_task("a"), save_task("b"), update_task(1, status=None)])
+
+        assert rows(engine) == [(1, "kept", "pending")]
+
+    async def test_executor_fails_coalesced_effects(self, db):
+        """Behind the executor, a rolled-back batch fails each of its effects."""
+        engine, factory, log = db
+        executor = ConcurrentSideEffectExecutor(bulk_writer=SQLAlchemyBulkWriter(factory))
+
+        results = await executor.execute_batch(SideEffectBatch(
+            effects=[save_task("a"), update_task(1, status=None), save_task("b")],
+            user_id=1,
+        ))
+
+        assert results == [False, False, False]
+        assert rows(engine) == []
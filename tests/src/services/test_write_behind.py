@@ -0,0 +1,314 @@
+"""
+Unit tests for the write-behind buffer.
+
+These tests verify:
+- Pending inserts are written as one multi-row INSERT in one commit
+- Flushes run on the size threshold, the time threshold and close()
+- Updates of one row coalesce (last write wins)
+- Rows of a failed flush are requeued, not lost
+- Rows the database rejects are dead-lettered; the rest of the batch is written
+- The overflow policies block (no loss) or drop the oldest rows (bounded loss)
+- Services read their own pending writes
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import event, insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.models.base import Base
+from src.models.neurostate import EnergyLevelRecord, MaskingLog, SensoryProfile
+from src.services.neurostate.masking import MaskingLoadTracker
+from src.services.neurostate.sensory import SensoryStateAssessment
+from src.services.write_behind import (
+    WriteBehindBuffer,
+    close_write_behind_buffer,
+    set_write_behind_buffer,
+)
+
+ENERGY = EnergyLevelRecord.__table__
+SENSORY = SensoryProfile.__table__
+NOW = datetime(2026, 6, 8, 12, 0, tzinfo=timezone.utc)
+
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+@pytest.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all,
+            tables=[ENERGY, SENSORY, MaskingLog.__table__],
+        )
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def factory(engine):
+    return async_sessionmaker(engine, expire_on_commit=False)
+
+
+@pytest.fixture
+def counts(engine):
+    """Statements and commits issued on the engine."""
+    seen = {"statements": 0, "commits": 0}
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def on_execute(*args):
+        seen["statements"] += 1
+
+    @event.listens_for(engine.sync_engine, "commit")
+    def on_commit(*args):
+        seen["commits"] += 1
+
+    return seen
+
+
+def energy_row(user_id: int, score: float = 50.0) -> dict:
+    return {
+        "user_id": user_id,
+        "energy_level": "baseline",
+        "energy_score": score,
+        "predicted_at": NOW,
+        "created_at": NOW,
+    }
+
+
+async def energy_rows(factory) -> list:
+    async with factory() as session:
+        result = await session.execute(select(ENERGY.c.user_id, ENERGY.c.energy_score))
+        return list(result)
+
+
+class FailingOnce:
+    """Session factory whose first session fails on use."""
+
+    def __init__(self, factory):
+        self.factory = factory
+        self.failed = False
+
+    def __call__(self):
+        if not self.failed:
+            self.failed = True
+            raise ConnectionError("database down")
+        return self.factory()
+
+
+# =============================================================================
+# TestBatching
+# =============================================================================
+
+class TestBatching:
+    """Test that pending rows are written together."""
+
+    async def test_inserts_written_in_one_commit(self, factory, counts):
+        """100 inserts are one INSERT statement and one commit."""
+        buffer = WriteBehindBuffer(factory, max_batch=1000, flush_interval=60)
+        for user_id in range(100):
+            await buffer.insert(ENERGY, energy_row(user_id))
+
+        assert len(buffer) == 100
+        assert await buffer.flush() == 100
+
+        assert counts["commits"] == 1
+        assert counts["statements"] == 1
+        assert len(await energy_rows(factory)) == 100
+        await buffer.close()
+
+    async def test_size_threshold_triggers_flush(self, factory):
+        """Reaching max_batch wakes the background flusher."""
+        buffer = WriteBehindBuffer(factory, max_batch=10, flush_interval=60)
+        for user_id in range(10):
+            await buffer.insert(ENERGY, energy_row(user_id))
+        await asyncio.sleep(0.1)
+
+        assert len(buffer) == 0
+        assert len(await energy_rows(factory)) == 10
+        await buffer.close()
+
+    async def test_time_threshold_triggers_flush(self, factory):
+        """Pending rows are written after flush_interval."""
+        buffer = WriteBehindBuffer(factory, max_batch=1000, flush_interval=0.05)
+        await buffer.insert(ENERGY, energy_row(1))
+        await asyncio.sleep(0.2)
+
+        assert len(await energy_rows(factory)) == 1
+        await buffer.close()
+
+    async def test_close_flushes_and_rejects_new_rows(self, factory):
+        """close() writes everything pending; later inserts fail."""
+        buffer = WriteBehindBuffer(factory, max_batch=1000, flush_interval=60)
+        await buffer.insert(ENERGY, energy_row(1))
+
+        assert await buffer.close() == 0
+        assert len(await energy_rows(factory)) == 1
+        with pytest.raises(RuntimeError):
+            await buffer.insert(ENERGY, energy_row(2))
+
+    async def test_on_flush_runs_after_commit(self, factory):
+        """Callbacks run once the rows are written."""
+        buffer = WriteBehindBuffer(factory, max_batch=1000, flush_interval=60)
+        called = []
+        await buffer.insert(ENERGY, energy_row(1), on_flush=lambda: called.append(1))
+        assert called == []
+
+        await buffer.flush()
+        assert called == [1]
+        await buffer.close()
+
+
+# =============================================================================
+# TestUpdates
+# =============================================================================
+
+class TestUpdates:
+    """Test coalesced updates."""
+
+    async def test_updates_coalesce(self, factory, counts):
+        """Several updates of one row are one UPDATE with the last values."""
+        async with factory() as session, session.begin():
+            await session.execute(insert(SENSORY), {
+                "id": 1, "user_id": 1, "modality_loads": (0.0, 0.0, 0.0, 0.0, 0.0),
+                "overall_load": 0.0, "segment_code": "AU", "last_assessed": NOW,
+                "created_at": NOW, "updated_at": NOW,
+            })
+        counts["statements"] = 0
+
+        buffer = WriteBehindBuffer(factory, max_batch=1000, flush_interval=60)
+        for load in (10.0, 20.0, 30.0):
+            await buffer.update(SENSORY, 1, {"modality_loads": (load, 0.0, 0.0, 0.0, 0.0), "overall_load": load})
+        await buffer.update(SENSORY, 1, {"last_assessed": NOW, "updated_at": NOW})
+
+        assert len(buffer) == 1
+        assert buffer.pending_update(SENSORY, 1)["overall_load"] == 30.0
+        await buffer.flush()
+        assert counts["statements"] == 1
+
+        async with factory() as session:
+            row = (await session.execute(select(SENSORY))).one()
+        assert row.overall_load == 30.0
+        assert row.modality_loads == (30.0, 0.0, 0.0, 0.0, 0.0)
+        await buffer.close()
+
+
+# =============================================================================
+# TestFailureAndOverflow
+# =============================================================================
+
+class TestFailureAndOverflow:
+    """Test requeueing and the bounded-loss configuration."""
+
+    async def test_failed_flush_requeues_rows(self, factory):
+        """Rows survive a failed flush and are written by the next one."""
+        buffer = WriteBehindBuffer(FailingOnce(factory), max_batch=1000, flush_interval=60)
+        await buffer.insert(ENERGY, energy_row(1))
+
+        assert await buffer.flush() == 0
+        assert len(buffer) == 1
+        await buffer.insert(ENERGY, energy_row(2))
+        assert await buffer.flush() == 2
+
+        assert sorted(r.user_id for r in await energy_rows(factory)) == [1, 2]
+        await buffer.close()
+
+    async def test_rejected_row_is_dead_lettered(self, factory):
+        """A NOT NULL violation does not hold back the valid rows around it."""
+        buffer = WriteBehindBuffer(factory, max_batch=1000, flush_interval=60)
+        await buffer.insert(ENERGY, energy_row(None))
+        for user_id in range(1, 6):
+            await buffer.insert(ENERGY, energy_row(user_id))
+        await buffer.update(SENSORY, 1, {"overall_load": 3.0, "updated_at": NOW}, key_column="user_id")
+
+        assert await buffer.flush() == 6
+        assert len(buffer) == 0
+        assert [(table, error) for table, _, error in buffer.dead_letters] == [
+            ("energy_level_records", "IntegrityError")
+        ]
+        assert sorted(r.user_id for r in await energy_rows(factory)) == [1, 2, 3, 4, 5]
+
+        await buffer.insert(ENERGY, energy_row(6))
+        assert await buffer.flush() == 1
+
+    async def test_shutdown_closes_global_buffer(self, factory):
+        """close_write_behind_buffer() writes what is pending."""
+        buffer = WriteBehindBuffer(factory, max_batch=1000, flush_interval=60)
+        set_write_behind_buffer(buffer)
+        await buffer.insert(ENERGY, energy_row(1))
+
+        assert await close_write_behind_buffer() == 0
+        assert await close_write_behind_buffer() == 0
+        assert [r.user_id for r in await energy_rows(factory)] == [1]
+
+    async def test_drop_policy_bounds_pending_rows(self, factory):
+        """overflow="drop" keeps max_pending rows, dropping the oldest."""
+        buffer = WriteBehindBuffer(
+            factory, max_batch=1000, flush_interval=60, max_pending=3, overflow="drop"
+        )
+        for user_id in range(5):
+            await buffer.insert(ENERGY, energy_row(user_id))
+
+        assert len(buffer) == 3
+        await buffer.close()
+        assert sorted(r.user_id for r in await energy_rows(factory)) == [2, 3, 4]
+
+    async def test_block_policy_loses_nothing(self, factory):
+        """overflow="block" flushes instead of dropping."""
+        buffer = WriteBehindBuffer(factory, max_batch=1000, flush_interval=60, max_pending=3)
+        for user_id in range(5):
+            await buffer.insert(ENERGY, energy_row(user_id))
+        await buffer.close()
+
+        assert sorted(r.user_id for r in await energy_rows(factory)) == [0, 1, 2, 3, 4]
+
+    def test_unknown_overflow_policy_rejected(self):
+        """Only block and drop are accepted."""
+        with pytest.raises(ValueError):
+            WriteBehindBuffer(overflow="ignore")
+
+
+# =============================================================================
+# TestReadYourWrites
+# =============================================================================
+
+class TestReadYourWrites:
+    """Test that services see their own pending rows."""
+
+    async def test_masking_sees_pending_events(self, factory):
+        """Pending masking events inside the window are visible to the tracker."""
+        buffer = WriteBehindBuffer(factory, max_batch=1000, flush_interval=60)
+        async with factory() as session:
+            tracker = MaskingLoadTracker(session, writer=buffer)
+            for user_id, logged_at in ((1, NOW), (1, NOW - timedelta(days=2)), (2, NOW)):
+                await buffer.insert(MaskingLog.__table__, {
+                    "user_id": user_id, "context": "work", "masking_type": "social_scripting",
+                    "load_score": 20.0, "duration_minutes": None, "notes": None,
+                    "logged_at": logged_at, "created_at": logged_at,
+                })
+
+            pending = tracker._pending_events(1, NOW - timedelta(hours=24))
+            assert [row["logged_at"] for row in pending] == [NOW]
+            await buffer.flush()
+            assert tracker._pending_events(1, NOW - timedelta(hours=24)) == []
+        await buffer.close()
+
+    async def test_sensory_reads_pending_update(self, factory):
+        """Sensory loads overlay the update still in the buffer."""
+        buffer = WriteBehindBuffer(factory, max_batch=1000, flush_interval=60)
+        async with factory() as session:
+            service = SensoryStateAssessment(session, writer=buffer)
+            profile = SimpleNamespace(id=1, modality_vector=None, last_assessed=None, segment_code="AU")
+            assert service._current_vector(profile, NOW) == ((0.0, 0.0, 0.0, 0.0, 0.0), None)
+
+            await buffer.update(SENSORY, 1, {
+                "modality_loads": (40.0, 0.0, 0.0, 0.0, 0.0), "overall_load": 40.0,
+                "last_assessed": NOW, "updated_at": NOW,
+            })
+            assert service._current_vector(profile, NOW) == ((40.0, 0.0, 0.0, 0.0, 0.0), NOW)
+        await buffer.close()
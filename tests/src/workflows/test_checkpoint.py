@@ -0,0 +1,286 @@
+"""
+Unit tests for daily graph checkpointing.
+
+These tests verify:
+- Records round-trip through the compact encoding, compressed when large
+- A run interrupted mid-graph resumes at the last completed node
+- A finished run is not executed again
+- Only the latest checkpoint per run is kept and runs expire
+- The Redis layout round-trips and Redis errors fall back to memory
+- The newer of the Redis and memory copies wins; expired memory is purged
+"""
+
+import pytest
+
+from src.workflows import daily_graph
+from src.workflows.checkpoint import (
+    DailyGraphCheckpointer,
+    daily_thread_id,
+    decode_record,
+    encode_record,
+    get_daily_checkpointer,
+    set_daily_checkpointer,
+)
+from src.workflows.daily_graph import GraphNode, invalidate_daily_graph, run_daily_graph
+
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+DATE = "2026-06-01"
+
+
+@pytest.fixture
+def checkpointer():
+    saver = DailyGraphCheckpointer()
+    set_daily_checkpointer(saver)
+    invalidate_daily_graph()
+    yield saver
+    set_daily_checkpointer(None)
+    invalidate_daily_graph()
+
+
+class FakeRedis:
+    """Binary async Redis hash commands with a non-transactional pipeline."""
+
+    def __init__(self):
+        self.data: dict[str, dict[bytes, bytes]] = {}
+        self.ttls: dict[str, int] = {}
+
+    def pipeline(self, transaction=True):
+        redis = self
+
+        class Pipeline:
+            def __init__(self):
+                self.ops = []
+
+            def __getattr__(self, name):
+                return lambda *args, **kwargs: self.ops.append((name, args, kwargs))
+
+            async def execute(self):
+                for name, args, kwargs in self.ops:
+                    await getattr(redis, name)(*args, **kwargs)
+
+        return Pipeline()
+
+    async def hset(self, key, mapping):
+        self.data.setdefault(key, {}).update({k.encode(): v for k, v in mapping.items()})
+
+    async def expire(self, key, ttl):
+        self.ttls[key] = ttl
+
+    async def hgetall(self, key):
+        return dict(self.data.get(key, {}))
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+
+class FlakyRedis(FakeRedis):
+    """FakeRedis that fails every call while down."""
+
+    def __init__(self):
+        super().__init__()
+        self.down = False
+
+    def pipeline(self, transaction=True):
+        if self.down:
+            raise ConnectionError("redis down")
+        return super().pipeline(transaction)
+
+    async def hgetall(self, key):
+        if self.down:
+            raise ConnectionError("redis down")
+        return await super().hgetall(key)
+
+
+class BrokenRedis:
+    """Every call fails."""
+
+    def pipeline(self, transaction=True):
+        raise ConnectionError("redis down")
+
+    async def hgetall(self, key):
+        raise ConnectionError("redis down")
+
+    async def delete(self, *keys):
+        raise ConnectionError("redis down")
+
+
+# =============================================================================
+# TestEncoding
+# =============================================================================
+
+class TestEncoding:
+    """Test the compact record encoding."""
+
+    def test_round_trip_and_compression(self):
+        """Small records stay raw, large ones are compressed; both decode."""
+        serde = DailyGraphCheckpointer().serde
+        small = {"stage": GraphNode.PLANNING, "n": 1}
+        large = {"stages": [GraphNode.PLANNING.value] * 200}
+
+        small_record = encode_record(serde, small, compress_above=512)
+        large_record = encode_record(serde, large, compress_above=512)
+
+        assert small_record[0] == 0 and large_record[0] == 1
+        assert len(large_record) < 200
+        assert decode_record(serde, small_record) == small
+        assert decode_record(serde, large_record) == large
+
+
+# =============================================================================
+# TestResume
+# =============================================================================
+
+class TestResume:
+    """Test resuming and skipping runs."""
+
+    async def test_resume_after_crash(self, checkpointer, monkeypatch):
+        """After a failure in during_day, the rerun starts at during_day."""
+        calls = []
+        original_morning = daily_graph.morning_activate_node
+        original_during_day = daily_graph.during_day_node
+
+        async def counting_morning(state):
+            calls.append("morning")
+            return await original_morning(state)
+
+        async def crashing_during_day(state):
+            raise RuntimeError("worker died")
+
+        monkeypatch.setattr(daily_graph, "morning_activate_node", counting_morning)
+        monkeypatch.setattr(daily_graph, "during_day_node", crashing_during_day)
+        invalidate_daily_graph()
+        with pytest.raises(RuntimeError):
+            await run_daily_graph(1, DATE, "AD")
+
+        monkeypatch.setattr(daily_graph, "during_day_node", original_during_day)
+        invalidate_daily_graph()
+        result = await run_daily_graph(1, DATE, "AD")
+
+        assert calls == ["morning"]
+        assert result["current_stage"] == GraphNode.END
+        assert result["completed_stages"].count(GraphNode.PLANNING) == 1
+        assert GraphNode.DURING_DAY in result["completed_stages"]
+
+    async def test_finished_run_not_repeated(self, checkpointer, monkeypatch):
+        """A second run on the same day returns the saved final state."""
+        first = await run_daily_graph(1, DATE, "AD")
+
+        async def fail(state):
+            raise AssertionError("must not run again")
+
+        monkeypatch.setattr(daily_graph, "morning_activate_node", fail)
+        invalidate_daily_graph()
+
+        assert await run_daily_graph(1, DATE, "AD") == first
+
+    async def test_latest_checkpoint_only_and_expiry(self):
+        """One record per run is kept and expires after the TTL."""
+        saver = DailyGraphCheckpointer(ttl=0)
+        set_daily_checkpointer(saver)
+        invalidate_daily_graph()
+        try:
+            await run_daily_graph(1, DATE, "AD")
+        finally:
+            set_daily_checkpointer(None)
+            invalidate_daily_graph()
+
+        assert await saver.memory.hgetall(saver._key(daily_thread_id(1, DATE))) == {}
+        assert saver.memory.purge_expired() == 0
+        assert len(saver.memory) == 0
+
+
+# =============================================================================
+# TestBackends
+# =============================================================================
+
+class TestBackends:
+    """Test the Redis layout and fallback."""
+
+    async def test_redis_round_trip(self):
+        """Checkpoints are stored in Redis with a TTL and survive a new saver."""
+        redis = FakeRedis()
+        set_daily_checkpointer(DailyGraphCheckpointer(redis_client=redis))
+        invalidate_daily_graph()
+        try:
+            first = await run_daily_graph(1, DATE, "AD")
+            key = DailyGraphCheckpointer.KEY_PREFIX + daily_thread_id(1, DATE)
+            assert list(redis.data[key]) == [b""]
+            assert redis.ttls[key] == DailyGraphCheckpointer.TTL
+
+            # A fresh saver (new worker) sees the finished run
+            set_daily_checkpointer(DailyGraphCheckpointer(redis_client=redis))
+            invalidate_daily_graph()
+            assert await run_daily_graph(1, DATE, "AD") == first
+
+            await get_daily_checkpointer().adelete_thread(daily_thread_id(1, DATE))
+            assert key not in redis.data
+        finally:
+            set_daily_checkpointer(None)
+            invalidate_daily_graph()
+
+    async def test_redis_errors_fall_back_to_memory(self):
+        """With Redis failing, checkpoints are kept in process memory."""
+        saver = DailyGraphCheckpointer(redis_client=BrokenRedis())
+        set_daily_checkpointer(saver)
+        invalidate_daily_graph()
+        try:
+            result = await run_daily_graph(1, DATE, "AD")
+        finally:
+            set_daily_checkpointer(None)
+            invalidate_daily_graph()
+
+        assert result["current_stage"] == GraphNode.END
+        assert len(saver.memory) == 1
+
+    async def test_newer_memory_copy_wins(self, monkeypatch):
+        """A run finished in memory during an outage beats the stale Redis copy."""
+        redis = FlakyRedis()
+        saver = DailyGraphCheckpointer(redis_client=redis)
+        set_daily_checkpointer(saver)
+        original_during_day = daily_graph.during_day_node
+
+        async def crashing_during_day(state):
+            raise RuntimeError("worker died")
+
+        async def fail(state):
+            raise AssertionError("must not run again")
+
+        try:
+            # Crash mid-run with Redis up, finish the run while it is down
+            monkeypatch.setattr(daily_graph, "during_day_node", crashing_during_day)
+            invalidate_daily_graph()
+            with pytest.raises(RuntimeError):
+                await run_daily_graph(1, DATE, "AD")
+            redis.down = True
+            monkeypatch.setattr(daily_graph, "during_day_node", original_during_day)
+            invalidate_daily_graph()
+            finished = await run_daily_graph(1, DATE, "AD")
+
+            # Redis is back with the interrupted copy; memory holds the finished one
+            redis.down = False
+            monkeypatch.setattr(daily_graph, "during_day_node", fail)
+            monkeypatch.setattr(daily_graph, "morning_activate_node", fail)
+            invalidate_daily_graph()
+            assert await run_daily_graph(1, DATE, "AD") == finished
+        finally:
+            set_daily_checkpointer(None)
+            invalidate_daily_graph()
+
+    async def test_purge_memory(self):
+        """The nightly purge drops expired runs kept in memory."""
+        saver = DailyGraphCheckpointer(redis_client=BrokenRedis(), ttl=0)
+        set_daily_checkpointer(saver)
+        invalidate_daily_graph()
+        try:
+            await run_daily_graph(1, DATE, "AD")
+        finally:
+            set_daily_checkpointer(None)
+            invalidate_daily_graph()
+
+        assert await saver.purge_memory() == 1
+        assert len(saver.memory) == 0
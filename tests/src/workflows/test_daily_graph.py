@@ -0,0 +1,134 @@
+"""
+Unit tests for the daily graph cache and fleet runner.
+
+These tests verify:
+- The compiled graph is reused across runs
+- Registry changes invalidate the compiled graph
+- Without LangGraph the graph is None and runs return an empty state
+- Batch runs bound concurrency, time out slow users and isolate failures
+- The batch summary counts stage outcomes
+"""
+
+import asyncio
+import builtins
+
+import pytest
+
+from src.core.module_registry import ModuleRegistry
+from src.workflows import daily_graph
+from src.workflows.daily_graph import (
+    get_daily_graph,
+    invalidate_daily_graph,
+    run_daily_graph_batch,
+)
+
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+class StubModule:
+    name = "stub"
+    intents = ["stub.start"]
+
+
+@pytest.fixture(autouse=True)
+def fresh_graph_cache():
+    invalidate_daily_graph()
+    yield
+    invalidate_daily_graph()
+
+
+# =============================================================================
+# TestCompiledGraphCache
+# =============================================================================
+
+class TestCompiledGraphCache:
+    """Test per-process caching of the compiled graph."""
+
+    def test_graph_reused(self, monkeypatch):
+        """The graph is compiled once for repeated runs."""
+        builds = []
+        monkeypatch.setattr(daily_graph, "build_daily_graph", lambda checkpointer=None: builds.append(1) or object())
+        registry = ModuleRegistry()
+
+        first = get_daily_graph(registry)
+        second = get_daily_graph(registry)
+
+        assert first is second
+        assert len(builds) == 1
+
+    def test_registry_change_invalidates(self, monkeypatch):
+        """Registering a module rebuilds the graph on the next run."""
+        monkeypatch.setattr(daily_graph, "build_daily_graph", lambda checkpointer=None: object())
+        registry = ModuleRegistry()
+
+        first = get_daily_graph(registry)
+        registry.register(StubModule())
+
+        assert get_daily_graph(registry) is not first
+
+    async def test_without_langgraph(self, monkeypatch):
+        """Missing LangGraph (checkpointer included) degrades instead of failing."""
+        real_import = builtins.__import__
+
+        def no_langgraph(name, *args, **kwargs):
+            if name.startswith(("langgraph", "langchain_core", "src.workflows.checkpoint")):
+                raise ImportError(name)
+            return real_import(name, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "__import__", no_langgraph)
+
+        assert get_daily_graph(ModuleRegistry()) is None
+        assert await daily_graph.run_daily_graph(1, "2026-06-01", "AD") == {}
+
+
+# =============================================================================
+# TestRunDailyGraphBatch
+# =============================================================================
+
+class TestRunDailyGraphBatch:
+    """Test the concurrent fleet runner."""
+
+    async def test_summary_counts_stages(self):
+        """Every user completes all stages of the default path."""
+        summary = await run_daily_graph_batch(range(20), "2026-10-18", {1: "AD"})
+
+        assert summary.total == summary.completed == 20
+        assert summary.final_stages == {"end": 20}
+        assert summary.stage_counts["planning"] == 20
+        assert summary.users_per_minute > 0
+
+    async def test_timeout_and_failure_isolated(self, monkeypatch):
+        """Slow and failing users are recorded without stopping the batch."""
+        async def fake_run(user_id, **kwargs):
+            if user_id == 1:
+                await asyncio.sleep(1)
+            if user_id == 2:
+                raise RuntimeError("boom")
+            return {"current_stage": "end", "completed_stages": ["end"]}
+
+        monkeypatch.setattr(daily_graph, "run_daily_graph", fake_run)
+        summary = await run_daily_graph_batch(range(5), "2026-10-18", timeout=0.05)
+
+        assert summary.completed == 3
+        assert summary.timed_out == 1
+        assert summary.failed == 1
+        assert summary.errors == {1: "timeout", 2: "RuntimeError"}
+
+    async def test_concurrency_bounded(self, monkeypatch):
+        """No more than max_concurrency runs are in flight."""
+        running = peak = 0
+
+        async def fake_run(user_id, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+            return {}
+
+        monkeypatch.setattr(daily_graph, "run_daily_graph", fake_run)
+        await run_daily_graph_batch(range(30), "2026-10-18", max_concurrency=4)
+
+        assert peak == 4
@@ -0,0 +1,155 @@
+"""
+Unit tests for concurrent daily workflow hooks.
+
+These tests verify:
+- A stage's hooks run concurrently and keep priority order in the results
+- Late hooks are skipped, finish in the background and are cached
+- Failing hooks do not fail the stage
+- Latency is recorded per module
+- Morning activation includes hook output
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.core.daily_workflow_hooks import DailyWorkflowHooks
+from src.core.module_context import ModuleContext
+from src.core.segment_context import SegmentContext
+from src.workflows.daily_workflow import DailyWorkflow
+from src.workflows.hook_runner import HOOK_SECONDS, HookRunner
+
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+def make_ctx(user_id: int = 1) -> ModuleContext:
+    return ModuleContext(
+        user_id=user_id,
+        segment_context=SegmentContext.from_code("AD"),
+        state="morning",
+        session_id="s",
+        language="en",
+        module_name="daily_workflow",
+    )
+
+
+def sleeping_hook(seconds: float, value):
+    async def hook(ctx):
+        await asyncio.sleep(seconds)
+        return value
+    return hook
+
+
+def latency_count(stage: str, module: str) -> float:
+    return HOOK_SECONDS.labels(stage, module)._sum.get()
+
+
+# =============================================================================
+# TestHookRunner
+# =============================================================================
+
+class TestHookRunner:
+    """Test concurrency, deadlines, caching and failures."""
+
+    async def test_hooks_run_concurrently(self):
+        """Three 50ms hooks take about 50ms, results in the given order."""
+        runner = HookRunner(deadline=1.0)
+        hooks = [
+            (f"m{i}", DailyWorkflowHooks(morning=sleeping_hook(0.05, f"v{i}")))
+            for i in range(3)
+        ]
+
+        start = time.perf_counter()
+        results = await runner.run_stage("morning", hooks, make_ctx())
+
+        assert time.perf_counter() - start < 0.12
+        assert [r.value for r in results] == ["v0", "v1", "v2"]
+        assert all(r.status == "ok" for r in results)
+
+    async def test_late_hook_skipped_then_cached(self):
+        """A late hook is skipped now and its result is used next time."""
+        runner = HookRunner(deadline=0.02)
+        hooks = [
+            ("fast", DailyWorkflowHooks(morning=sleeping_hook(0, "fast"))),
+            ("slow", DailyWorkflowHooks(morning=sleeping_hook(0.05, "slow"))),
+        ]
+
+        first = await runner.run_stage("morning", hooks, make_ctx())
+        assert [(r.module_name, r.status) for r in first] == [("fast", "ok"), ("slow", "late")]
+        assert not first[1].has_value
+
+        await runner.drain()
+        second = await runner.run_stage("morning", hooks, make_ctx())
+
+        assert second[1].status == "cached"
+        assert second[1].value == "slow"
+        # The cache is per user
+        assert runner.cached("morning", "slow", 2) is None
+
+    async def test_late_hook_cancelled_after_grace(self):
+        """Hooks still running after the grace period are cancelled."""
+        runner = HookRunner(deadline=0.01, late_grace=0.01)
+        hooks = [("stuck", DailyWorkflowHooks(morning=sleeping_hook(10, "never")))]
+
+        results = await runner.run_stage("morning", hooks, make_ctx())
+        await runner.drain()
+
+        assert results[0].status == "late"
+        assert runner.cached("morning", "stuck", 1) is None
+
+    async def test_failures_and_sync_hooks(self):
+        """A failing hook is reported; sync hooks work too."""
+        def broken(ctx):
+            raise RuntimeError("boom")
+
+        runner = HookRunner()
+        hooks = [
+            ("broken", DailyWorkflowHooks(evening_review=broken)),
+            ("sync", DailyWorkflowHooks(evening_review=lambda ctx: "ok")),
+            ("none", DailyWorkflowHooks(morning=lambda ctx: "other stage")),
+        ]
+
+        results = await runner.run_stage("evening_review", hooks, make_ctx())
+
+        assert [(r.module_name, r.status) for r in results] == [("broken", "failed"), ("sync", "ok")]
+
+    async def test_latency_recorded_per_module(self):
+        """Each module's hook latency lands in its own histogram series."""
+        before = latency_count("midday_check", "timed")
+        runner = HookRunner()
+        hooks = [("timed", DailyWorkflowHooks(midday_check=sleeping_hook(0.02, None)))]
+
+        await runner.run_stage("midday_check", hooks, make_ctx())
+
+        assert latency_count("midday_check", "timed") - before >= 0.02
+
+    async def test_unknown_stage(self):
+        """Unknown stages are rejected."""
+        with pytest.raises(ValueError):
+            await HookRunner().run_stage("lunch", [], make_ctx())
+
+
+# =============================================================================
+# TestMorningActivation
+# =============================================================================
+
+class TestMorningActivation:
+    """Test hooks in the morning activation."""
+
+    async def test_morning_message_includes_hooks(self):
+        """Hook texts are part of the morning message; late ones are left out."""
+        workflow = DailyWorkflow(hook_runner=HookRunner(deadline=0.02))
+        workflow.register_module_hooks(
+            "habits", DailyWorkflowHooks(morning=sleeping_hook(0, "Meditate"), priority=1)
+        )
+        workflow.register_module_hooks(
+            "slow", DailyWorkflowHooks(morning=sleeping_hook(0.2, "Too late"), priority=2)
+        )
+
+        message, interventions = await workflow.run_morning_activation(1, "AD")
+
+        assert message == "Meditate"
+        assert interventions == ["hook:habits"]
@@ -0,0 +1,237 @@
+"""
+Unit tests for pre-rendered morning messages.
+
+These tests verify:
+- Pre-rendered mornings are used at send time without running hooks
+- Stale renders (other date, segment, hook set, or invalidated) are re-rendered live
+- Today's energy adjusts the message
+- The batch pipeline renders every user and isolates failures
+- The nightly job renders each scheduled user's next local morning
+- Yesterday's wins are read from the previous day's plan and tasks
+- Renders round-trip through the Redis store with the store TTL
+- Stored mornings are encrypted with the user's key, never plaintext
+"""
+
+import os
+from datetime import date, datetime, timezone
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.core.daily_workflow_hooks import DailyWorkflowHooks
+from src.lib.encryption import EncryptionService, EncryptionServiceError
+from src.models.base import Base
+from src.models.daily_plan import DailyPlan
+from src.models.task import Task
+from src.workflows.daily_workflow import DailyWorkflow
+from src.workflows.prerender import (
+    MorningPrerenderer,
+    MorningRenderStore,
+    PrerenderedMorning,
+    prerender_upcoming_mornings,
+)
+from src.workflows.scheduler import DailyEventScheduler
+
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+TODAY = date(2026, 6, 1)
+NOW = datetime(2026, 6, 1, 3, 0, tzinfo=timezone.utc)
+ENCRYPTION = EncryptionService(master_key=os.urandom(32))
+
+
+def make_workflow() -> tuple[DailyWorkflow, MorningRenderStore, list[int]]:
+    store = MorningRenderStore(encryption=ENCRYPTION)
+    workflow = DailyWorkflow(morning_store=store)
+    calls: list[int] = []
+
+    def habits(ctx):
+        calls.append(ctx.user_id)
+        return f"Habits for {ctx.user_id}"
+
+    workflow.register_module_hooks("habits", DailyWorkflowHooks(morning=habits))
+    return workflow, store, calls
+
+
+# =============================================================================
+# TestSendTime
+# =============================================================================
+
+class TestSendTime:
+    """Test the freshness check at send time."""
+
+    async def test_prerendered_message_used(self):
+        """A fresh render is sent without running the hooks again."""
+        workflow, store, calls = make_workflow()
+        await MorningPrerenderer(workflow, store).run([(1, "AD")], TODAY)
+        assert calls == [1]
+
+        message, interventions = await workflow.run_morning_activation(1, "AD", for_date=TODAY)
+
+        assert message == "Habits for 1"
+        assert interventions == ["hook:habits"]
+        assert calls == [1]
+
+    async def test_stale_renders_rerendered(self):
+        """Another date, segment or hook set falls back to live rendering."""
+        workflow, store, calls = make_workflow()
+        await MorningPrerenderer(workflow, store).run([(1, "AD")], TODAY)
+
+        await workflow.run_morning_activation(1, "AD", for_date=date(2026, 6, 2))
+        await workflow.run_morning_activation(1, "AU", for_date=TODAY)
+        workflow.register_module_hooks("capture", DailyWorkflowHooks(morning=lambda ctx: None))
+        await workflow.run_morning_activation(1, "AD", for_date=TODAY)
+
+        assert calls == [1, 1, 1, 1]
+
+    async def test_invalidate(self):
+        """An invalidated render is not used."""
+        workflow, store, calls = make_workflow()
+        await MorningPrerenderer(workflow, store).run([(1, "AD")], TODAY)
+        await store.invalidate(1)
+
+        await workflow.run_morning_activation(1, "AD", for_date=TODAY)
+
+        assert calls == [1, 1]
+
+    def test_red_energy_omits_goals(self):
+        """On a red day the goals line is left out."""
+        rendered = PrerenderedMorning(
+            user_id=1,
+            for_date=TODAY.isoformat(),
+            segment_code="AD",
+            hooks_version=0,
+            vision_texts=["Calm, creative life"],
+            goal_titles=["Finish thesis"],
+        )
+
+        assert "Finish thesis" in rendered.compose(energy_level=4)[0]
+        assert rendered.compose(energy_level=1)[0] == "Calm, creative life"
+        assert PrerenderedMorning(1, "x", "AD", 0).compose()[0].startswith("Good morning")
+
+
+# =============================================================================
+# TestPipeline
+# =============================================================================
+
+class TestPipeline:
+    """Test the batch pipeline and storage."""
+
+    async def test_batches_and_failures(self):
+        """All users are rendered across batches; one failure is counted."""
+        workflow, store, calls = make_workflow()
+
+        async def flaky_wins(user_id, for_date):
+            if user_id == 3:
+                raise RuntimeError("db down")
+            return []
+
+        workflow.get_yesterday_wins = flaky_wins
+        prerenderer = MorningPrerenderer(workflow, store, batch_size=2, pause_seconds=0)
+
+        summary = await prerenderer.run(((u, "AD") for u in range(5)), TODAY)
+
+        assert (summary.rendered, summary.failed) == (4, 1)
+        assert await store.get(3) is None
+        assert (await store.get(4)).hook_texts == [("habits", "Habits for 4")]
+
+    async def test_redis_round_trip(self, fake_redis):
+        """Renders are stored as JSON with a TTL."""
+        store = MorningRenderStore(redis_client=fake_redis, encryption=ENCRYPTION)
+        rendered = PrerenderedMorning(1, TODAY.isoformat(), "AD", 0, hook_texts=[("habits", "Hi")])
+
+        await store.put(rendered)
+
+        assert fake_redis.ttls["aurora:morning:1"] == MorningRenderStore.TTL
+        assert await store.get(1) == rendered
+
+    async def test_stored_encrypted(self, fake_redis):
+        """Vision and goals are not readable in Redis; another user cannot open them."""
+        store = MorningRenderStore(redis_client=fake_redis, encryption=ENCRYPTION)
+        rendered = PrerenderedMorning(
+            1, TODAY.isoformat(), "AD", 0, vision_texts=["Calm life"], goal_titles=["Thesis"]
+        )
+
+        await store.put(rendered)
+        fake_redis.data["aurora:morning:2"] = fake_redis.data["aurora:morning:1"]
+
+        assert "Calm life" not in fake_redis.data["aurora:morning:1"]
+        assert "Thesis" not in fake_redis.data["aurora:morning:1"]
+        assert await store.get(1) == rendered
+        assert await store.get(2) is None
+
+    async def test_no_encryption_stores_nothing(self):
+        """Without an encryption service the morning is rendered live instead."""
+        class NoEncryption:
+            def encrypt_field(self, *args, **kwargs):
+                raise EncryptionServiceError("No master key found")
+
+        store = MorningRenderStore(encryption=NoEncryption())
+
+        await store.put(PrerenderedMorning(1, TODAY.isoformat(), "AD", 0))
+
+        assert await store.get(1) is None
+
+
+# =============================================================================
+# TestNightlyJob
+# =============================================================================
+
+class TestNightlyJob:
+    """Test the nightly pre-render job and its inputs."""
+
+    async def test_renders_next_local_morning(self):
+        """Each scheduled user is rendered for the date of their next morning."""
+        workflow, store, calls = make_workflow()
+        scheduler = DailyEventScheduler(jitter_seconds=0)
+        await scheduler.schedule_user(1, "AD", "Europe/Berlin", now=NOW.timestamp())
+        await scheduler.schedule_user(2, "AD", "Asia/Tokyo", now=NOW.timestamp())
+        prerenderer = MorningPrerenderer(workflow, store, pause_seconds=0)
+
+        summary = await prerender_upcoming_mornings(scheduler, prerenderer, now=NOW.timestamp())
+
+        assert (summary.rendered, summary.failed) == (2, 0)
+        assert (await store.get(1)).for_date == "2026-06-01"
+        assert (await store.get(2)).for_date == "2026-06-02"
+
+    async def test_yesterday_wins_from_plan(self):
+        """Completed committed tasks and plan steps of the previous day are wins."""
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(
+                Base.metadata.create_all, tables=[DailyPlan.__table__, Task.__table__]
+            )
+            await conn.execute(DailyPlan.__table__.insert(), [{
+                "user_id": 7, "date": date(2026, 5, 31), "priorities_selected": True,
+                "tasks_committed": False, "created_at": NOW, "updated_at": NOW,
+            }])
+            await conn.execute(Task.__table__.insert(), [
+                {"user_id": 7, "status": status, "committed_date": committed,
+                 "created_at": NOW, "updated_at": NOW}
+                for status, committed in [
+                    ("completed", date(2026, 5, 31)),
+                    ("completed", date(2026, 5, 31)),
+                    ("pending", date(2026, 5, 31)),
+                    ("completed", date(2026, 5, 30)),
+                ]
+            ])
+        workflow = DailyWorkflow(
+            morning_store=MorningRenderStore(encryption=ENCRYPTION),
+            session_factory=async_sessionmaker(engine),
+        )
+
+        try:
+            assert await workflow.get_yesterday_wins(7, TODAY) == ["2 priorities done", "priorities chosen"]
+            assert await workflow.get_yesterday_wins(7, date(2026, 6, 3)) == []
+            message, _ = await workflow.run_morning_activation(7, "AD", for_date=TODAY)
+        finally:
+            await engine.dispose()
+
+        assert message == "Yesterday's wins: 2 priorities done, priorities chosen"
+
+    async def test_no_database_no_wins(self):
+        """Without a session factory no wins are read."""
+        workflow, _, _ = make_workflow()
+
+        assert await workflow.get_yesterday_wins(7, TODAY) == []
@@ -0,0 +1,337 @@
+"""
+Unit tests for the daily event scheduler.
+
+These tests verify:
+- The timing wheel pops entries at their due time, in order
+- Fixed-time events land at the segment's local time plus a stable jitter
+- Due events are popped in batches and rescheduled for the next day
+- Interval check-ins follow the last interaction and stop at the evening
+- Users are rescheduled only when their segment or timezone changes
+- Scheduled users are grouped by the local date of their next morning
+- Events survive a restart through Redis and are caught up (or skipped if stale)
+- Redis errors fall back to the timing wheel
+- Nightly jobs run once a night in the background, also when late
+"""
+
+import asyncio
+import random
+from datetime import date, datetime, time, timezone
+from zoneinfo import ZoneInfo
+
+from src.workflows.scheduler import (
+    DailyEventScheduler,
+    ScheduledEventKind,
+    TimingWheel,
+)
+
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+BERLIN = ZoneInfo("Europe/Berlin")
+
+
+def ts(hour: int, minute: int = 0, day: int = 1, tz=BERLIN) -> float:
+    return datetime(2026, 6, day, hour, minute, tzinfo=tz).timestamp()
+
+
+def make_scheduler(**kwargs) -> DailyEventScheduler:
+    kwargs.setdefault("jitter_seconds", 0)
+    return DailyEventScheduler(clock=lambda: ts(6), **kwargs)
+
+
+class FakeRedis:
+    """Minimal async Redis: one sorted set and one hash."""
+
+    def __init__(self):
+        self.zset: dict[str, float] = {}
+        self.hash: dict[str, str] = {}
+
+    async def zadd(self, key, mapping):
+        self.zset.update(mapping)
+
+    async def zrem(self, key, *members):
+        for member in members:
+            self.zset.pop(member, None)
+
+    async def eval(self, script, numkeys, key, now, limit):
+        due = sorted((s, m) for m, s in self.zset.items() if s <= now)[:limit]
+        items = []
+        for score, member in due:
+            del self.zset[member]
+            items += [member, str(score)]
+        return items
+
+    async def hset(self, key, field, value):
+        self.hash[field] = value
+
+    async def hdel(self, key, field):
+        self.hash.pop(field, None)
+
+    async def hmget(self, key, fields):
+        return [self.hash.get(f) for f in fields]
+
+    async def hgetall(self, key):
+        return dict(self.hash)
+
+
+# =============================================================================
+# TestTimingWheel
+# =============================================================================
+
+class TestTimingWheel:
+    """Test the hierarchical timing wheel."""
+
+    def test_matches_sorted_order(self):
+        """Entries across all levels pop exactly when due."""
+        rng = random.Random(7)
+        start = 1_000_000.0
+        wheel = TimingWheel(start)
+        expected = {}
+        for i in range(500):
+            due = start + rng.uniform(0, 3 * 86400)
+            wheel.add(f"m{i}", due)
+            expected[f"m{i}"] = due
+
+        popped = {}
+        now = start
+        while now < start + 3 * 86400 + 1:
+            now += rng.uniform(1, 4000)
+            for member, due in wheel.pop_due(now, limit=1000):
+                assert due <= now
+                popped[member] = due
+            assert all(d > now for m, d in expected.items() if m not in popped)
+
+        assert popped == expected
+        assert len(wheel) == 0
+
+    def test_reschedule_and_remove(self):
+        """Re-adding moves an entry; removed entries never pop."""
+        wheel = TimingWheel(0.0)
+        wheel.add("a", 100.0)
+        wheel.add("a", 5000.0)
+        wheel.add("b", 50.0)
+        assert wheel.remove("b")
+
+        assert wheel.pop_due(200.0, limit=10) == []
+        assert wheel.pop_due(5000.0, limit=10) == [("a", 5000.0)]
+
+
+# =============================================================================
+# TestSchedule
+# =============================================================================
+
+class TestSchedule:
+    """Test due time computation and jitter."""
+
+    def test_morning_in_user_timezone(self):
+        """Without jitter, an ADHD morning is due at 08:00 local time."""
+        scheduler = make_scheduler()
+
+        due = scheduler.next_due(1, ScheduledEventKind.MORNING, "AD", "Europe/Berlin", ts(6))
+        assert due == ts(8)
+        # Already past today's morning: tomorrow
+        due = scheduler.next_due(1, ScheduledEventKind.MORNING, "AD", "Europe/Berlin", ts(9))
+        assert due == ts(8, day=2)
+
+    def test_interval_segments_have_no_fixed_midday(self):
+        """Only exact-time segments get a fixed midday event."""
+        scheduler = make_scheduler()
+
+        assert scheduler.next_due(1, ScheduledEventKind.MIDDAY, "AD", "UTC", ts(6)) is None
+        assert scheduler.next_due(
+            1, ScheduledEventKind.MIDDAY, "AU", "Europe/Berlin", ts(6)
+        ) == ts(13)
+
+    def test_jitter_spreads_and_is_stable(self):
+        """Mornings spread across the jitter window, same offset every day."""
+        scheduler = DailyEventScheduler(jitter_seconds=600)
+        dues = [
+            scheduler.next_due(u, ScheduledEventKind.MORNING, "AD", "Europe/Berlin", ts(6))
+            for u in range(2000)
+        ]
+
+        assert all(ts(8) <= d < ts(8, 10) for d in dues)
+        assert len({int(d - ts(8)) // 60 for d in dues}) == 10
+        assert scheduler.jitter(5, ScheduledEventKind.MORNING) == scheduler.jitter(
+            5, ScheduledEventKind.MORNING
+        )
+
+
+# =============================================================================
+# TestPoll
+# =============================================================================
+
+class TestPoll:
+    """Test batch popping, rescheduling and interval check-ins."""
+
+    async def test_fires_in_batches_and_reschedules(self):
+        """Due mornings are popped in batches and come back the next day."""
+        scheduler = make_scheduler(batch_size=3)
+        for user_id in range(5):
+            await scheduler.schedule_user(user_id, "AU", "Europe/Berlin", now=ts(6))
+
+        assert await scheduler.poll(ts(8)) == []
+        first = await scheduler.poll(ts(9))
+        second = await scheduler.poll(ts(9))
+
+        assert len(first) == 3 and len(second) == 2
+        assert {e.kind for e in first + second} == {ScheduledEventKind.MORNING}
+        assert await scheduler.poll(ts(12)) == []
+        assert len(await scheduler.poll(ts(13))) == 3  # AU exact-time midday
+        assert scheduler.next_due(0, ScheduledEventKind.MORNING, "AU", "Europe/Berlin", ts(9)) == ts(9, day=2)
+
+    async def test_interval_checkin_follows_interaction(self):
+        """ADHD check-ins run interval minutes after the last interaction."""
+        scheduler = make_scheduler()
+        await scheduler.schedule_user(1, "AD", "Europe/Berlin", now=ts(6))
+
+        events = await scheduler.poll(ts(8))
+        assert [e.kind for e in events] == [ScheduledEventKind.MORNING]
+
+        # Interaction at 09:00 pushes the check-in from 09:30 to 10:30
+        last = datetime.fromtimestamp(ts(9), timezone.utc).replace(tzinfo=None)
+        assert await scheduler.record_interaction(1, last) == ts(10, 30)
+        assert await scheduler.poll(ts(10)) == []
+        events = await scheduler.poll(ts(10, 30))
+        assert [e.kind for e in events] == [ScheduledEventKind.MIDDAY]
+
+    async def test_no_checkin_after_evening(self):
+        """Interactions late in the day do not schedule a check-in."""
+        scheduler = make_scheduler()
+        await scheduler.schedule_user(1, "AD", "Europe/Berlin", now=ts(6))
+
+        late = datetime.fromtimestamp(ts(19), BERLIN)
+        assert await scheduler.record_interaction(1, late) is None
+        assert await scheduler.record_interaction(2, late) is None  # Unknown user
+
+    async def test_exact_time_segment_ignores_interactions(self):
+        """Autism middays stay at their fixed time."""
+        scheduler = make_scheduler()
+        await scheduler.schedule_user(1, "AU", "Europe/Berlin", now=ts(6))
+
+        assert await scheduler.record_interaction(1, datetime.fromtimestamp(ts(10), BERLIN)) is None
+
+    async def test_unschedule(self):
+        """Unscheduled users receive no further events."""
+        scheduler = make_scheduler()
+        await scheduler.schedule_user(1, "AD", "Europe/Berlin", now=ts(6))
+        await scheduler.unschedule_user(1)
+
+        assert await scheduler.poll(ts(23)) == []
+
+    async def test_ensure_user_reschedules_on_change_only(self):
+        """ensure_user() is a no-op until the segment or timezone changes."""
+        scheduler = make_scheduler()
+
+        assert await scheduler.ensure_user(1, "AD", "Europe/Berlin") is True
+        assert await scheduler.ensure_user(1, "AD", "Europe/Berlin") is False
+        assert await scheduler.ensure_user(1, "AU", "Europe/Berlin") is True
+
+        events = await scheduler.poll(ts(9, 30))
+        assert [(e.kind, e.segment_code) for e in events] == [(ScheduledEventKind.MORNING, "AU")]
+        assert events[0].local_date.isoformat() == "2026-06-01"
+
+
+    async def test_upcoming_mornings_by_local_date(self):
+        """Users scheduled by any process are grouped by their next local morning."""
+        redis = FakeRedis()
+        other = make_scheduler(redis_client=redis)
+        await other.schedule_user(2, "AU", "Asia/Tokyo", now=ts(6))
+        scheduler = make_scheduler(redis_client=redis)
+        await scheduler.schedule_user(1, "AD", "Europe/Berlin", now=ts(6))
+
+        # 03:00 UTC: 05:00 in Berlin, already 12:00 in Tokyo
+        mornings = await scheduler.upcoming_mornings(ts(3, tz=timezone.utc))
+
+        assert mornings == {date(2026, 6, 1): [(1, "AD")], date(2026, 6, 2): [(2, "AU")]}
+
+
+# =============================================================================
+# TestDurability
+# =============================================================================
+
+class TestDurability:
+    """Test restart catch-up and Redis fallback."""
+
+    async def test_catch_up_after_restart(self):
+        """A new scheduler on the same Redis delivers events missed while down."""
+        redis = FakeRedis()
+        before = make_scheduler(redis_client=redis)
+        await before.schedule_user(1, "AD", "Europe/Berlin", now=ts(6))
+
+        after = make_scheduler(redis_client=redis)
+        events = await after.poll(ts(9))
+
+        assert [(e.user_id, e.kind) for e in events] == [(1, ScheduledEventKind.MORNING)]
+        assert events[0].lateness == 3600
+        assert events[0].segment_code == "AD"
+        assert redis.zset["1:morning"] == ts(8, day=2)
+
+    async def test_stale_events_skipped(self):
+        """Events missed by more than the catch-up window are not replayed."""
+        redis = FakeRedis()
+        scheduler = make_scheduler(redis_client=redis, catch_up_window=3600)
+        await scheduler.schedule_user(1, "AU", "Europe/Berlin", now=ts(6))
+
+        events = await scheduler.poll(ts(14))
+
+        assert [e.kind for e in events] == [ScheduledEventKind.MIDDAY]
+        assert scheduler.stats.skipped_stale == 1
+        assert redis.zset["1:morning"] == ts(9, day=2)
+
+    async def test_redis_errors_fall_back_to_wheel(self, broken_redis):
+        """With Redis failing, events are kept and fired in-process."""
+        scheduler = make_scheduler(redis_client=broken_redis)
+        await scheduler.schedule_user(1, "AD", "Europe/Berlin", now=ts(6))
+
+        events = await scheduler.poll(ts(8))
+
+        assert [e.kind for e in events] == [ScheduledEventKind.MORNING]
+        assert scheduler.stats.redis_errors > 0
+
+
+# =============================================================================
+# TestNightlyJobs
+# =============================================================================
+
+class TestNightlyJobs:
+    """Test system-wide nightly jobs."""
+
+    async def test_runs_once_and_reschedules(self):
+        """A due job runs in the background and comes back the next night."""
+        redis = FakeRedis()
+        scheduler = make_scheduler(redis_client=redis)
+        runs: list[int] = []
+
+        async def job():
+            runs.append(1)
+
+        due = await scheduler.schedule_nightly_job("reconcile", job, at=time(3, 0), now=ts(6))
+        assert due == ts(3, day=2, tz=timezone.utc)
+
+        assert await scheduler.poll(due - 1) == []
+        assert await scheduler.poll(due + 5 * 3600) == []
+        await asyncio.sleep(0)
+
+        assert runs == [1]
+        assert scheduler.stats.jobs_run == 1
+        assert redis.zset["job:reconcile"] == ts(3, day=3, tz=timezone.utc)
+
+    async def test_failing_job_keeps_schedule(self):
+        """A failing job is logged; user events of the same poll still fire."""
+        scheduler = make_scheduler()
+
+        async def job():
+            raise RuntimeError("db down")
+
+        due = await scheduler.schedule_nightly_job("reconcile", job, now=ts(6))
+        await scheduler.schedule_user(1, "AD", "UTC", now=due - 60)
+
+        events = await scheduler.poll(ts(9, day=2, tz=timezone.utc))
+        await asyncio.sleep(0)
+
+        assert [e.kind for e in events] == [ScheduledEventKind.MORNING]
+        await scheduler.poll(due + 24 * 3600)
+        assert scheduler.stats.jobs_run == 2